@@ -0,0 +1,36 @@
+"""incremental error budgets
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Watermark: last SLI sample included in burned_minutes
+    op.add_column('error_budgets', sa.Column('evaluated_through', sa.DateTime, nullable=True))
+
+    # NULL for raw measurements, bucket size (e.g. "1h") for aggregated burn rows
+    op.add_column('slo_history', sa.Column('resolution', sa.String(10), nullable=True))
+
+    # Create index for loading an SLO's burn buckets
+    op.create_index(
+        'idx_slo_history_slo_resolution_timestamp',
+        'slo_history',
+        ['slo_id', 'resolution', 'timestamp'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_slo_history_slo_resolution_timestamp', table_name='slo_history')
+    op.drop_column('slo_history', 'resolution')
+    op.drop_column('error_budgets', 'evaluated_through')
@@ -0,0 +1,23 @@
+"""error budget updated_at index
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Create index for burn rate window lookups (earliest/latest budget per SLO)
+    op.create_index('idx_error_budgets_slo_updated', 'error_budgets', ['slo_id', 'updated_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_error_budgets_slo_updated', table_name='error_budgets')
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Build the precompiled alert template index.
+
+Compiles the awesome-prometheus-alerts templates into
+src/nthlayer/alerts/templates/index.pickle, which AlertTemplateLoader
+loads instead of parsing every YAML file. Run after editing templates;
+sync_awesome_alerts.py rebuilds it automatically.
+
+Usage:
+    python scripts/build_alert_index.py [--templates-dir DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from nthlayer.alerts.index import load_index, write_index
+
+
+def main() -> int:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Build the precompiled alert template index")
+    parser.add_argument(
+        "--templates-dir",
+        type=Path,
+        help="Templates directory (default: bundled templates)",
+    )
+    args = parser.parse_args()
+
+    path = write_index(args.templates_dir)
+    index = load_index(path.parent)
+    if index is None:
+        print(f"Error: could not read back {path}", file=sys.stderr)
+        return 1
+
+    rule_count = sum(len(rules) for rules in index.rules.values())
+    print(f"Wrote {rule_count} alert rules from {len(index.rules)} templates to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,7 @@ The script will:
 2. Parse and convert to Prometheus alert format
 3. Apply NthLayer validation fixes (label refs, min duration)
 4. Write to src/nthlayer/alerts/templates/
+5. Rebuild the precompiled template index
 """
 
 from __future__ import annotations
@@ -342,6 +343,12 @@ def sync_alerts(
     # Write stats file for badge
     write_stats_file(stats, output_dir, dry_run)
 
+    # Rebuild the precompiled index so the loader does not fall back to YAML
+    if not dry_run:
+        from nthlayer.alerts.index import write_index
+
+        print(f"  Index: {write_index(output_dir)}")
+
     return stats
 
 
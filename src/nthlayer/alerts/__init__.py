@@ -10,8 +10,14 @@ Features:
 - Multi-platform support (Prometheus, Datadog, CloudWatch)
 """
 
-from .loader import AlertTemplateLoader
+from .loader import AlertTemplateLoader, get_default_loader
 from .models import AlertRule
 from .validator import ValidationResult, validate_and_fix_alert
 
-__all__ = ["AlertRule", "AlertTemplateLoader", "ValidationResult", "validate_and_fix_alert"]
+__all__ = [
+    "AlertRule",
+    "AlertTemplateLoader",
+    "ValidationResult",
+    "get_default_loader",
+    "validate_and_fix_alert",
+]
@@ -0,0 +1,204 @@
+"""
+Precompiled Alert Template Index
+
+Parsing the awesome-prometheus-alerts YAML costs far more than generating
+alerts from it, and every process used to pay it again. ``write_index``
+compiles all bundled templates into one pickle holding ready-built
+``AlertRule`` fields (category included) and the output labels of every
+rule expression; ``AlertTemplateLoader`` loads it with a single read.
+
+The index records the size of every template and a digest of the YAML
+it was built from. Loading only stats the templates and compares sizes;
+the full digest is checked only for templates outside an installed
+package (a source checkout), since installed files change only with a
+reinstall that ships a matching index. When the templates are customized
+or re-synced without rebuilding, the loader falls back to parsing YAML.
+
+Rebuild after changing templates:
+
+    python scripts/build_alert_index.py
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import pickle
+import sysconfig
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from .models import AlertRule
+from .validator import extract_promql_output_labels
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.pickle"
+INDEX_FORMAT_VERSION = 2
+PICKLE_PROTOCOL = 5
+
+
+def default_templates_dir() -> Path:
+    """Directory of the bundled templates."""
+    return Path(__file__).parent / "templates"
+
+
+def template_files(templates_dir: Path) -> List[Path]:
+    """Template files ordered by category, then technology."""
+    return sorted(templates_dir.glob("*/*.yaml"))
+
+
+def templates_digest(templates_dir: Path, files: Optional[Sequence[Path]] = None) -> str:
+    """SHA-256 over the relative paths and contents of the template files."""
+    digest = hashlib.sha256()
+    for path in template_files(templates_dir) if files is None else files:
+        digest.update(path.relative_to(templates_dir).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def template_sizes(templates_dir: Path, files: Optional[Sequence[Path]] = None) -> Dict[str, int]:
+    """Size in bytes of each template file, by relative path."""
+    return {
+        path.relative_to(templates_dir).as_posix(): path.stat().st_size
+        for path in (template_files(templates_dir) if files is None else files)
+    }
+
+
+def _is_installed(templates_dir: Path) -> bool:
+    """Whether ``templates_dir`` lives in an installed package (site-packages)."""
+    resolved = templates_dir.resolve()
+    paths = sysconfig.get_paths()
+    return any(
+        resolved.is_relative_to(Path(paths[key]).resolve())
+        for key in ("purelib", "platlib")
+        if key in paths
+    )
+
+
+@dataclass
+class TemplateIndex:
+    """
+    Compiled templates for one templates directory.
+
+    Attributes:
+        digest: ``templates_digest`` of the YAML the index was built from
+        sizes: ``template_sizes`` of the YAML the index was built from
+        rules: Template path (relative, in search order) -> ``AlertRule``
+            fields for each alert, without ``technology``
+        output_labels: Rule expression -> sorted output labels, or None
+            when all labels are preserved
+    """
+
+    digest: str
+    sizes: Dict[str, int]
+    rules: Dict[str, List[Dict[str, Any]]]
+    output_labels: Dict[str, Optional[List[str]]]
+
+    def template_files(self, templates_dir: Path) -> List[Path]:
+        return [templates_dir / relative for relative in self.rules]
+
+    def load_rules(self, relative: str, technology: str) -> List[AlertRule]:
+        """Build fresh ``AlertRule`` objects for one template file."""
+        return [
+            AlertRule(
+                **{
+                    **fields,
+                    "labels": dict(fields["labels"]),
+                    "annotations": dict(fields["annotations"]),
+                },
+                technology=technology,
+            )
+            for fields in self.rules.get(relative, [])
+        ]
+
+
+def build_index(templates_dir: Path) -> TemplateIndex:
+    """Parse every template under ``templates_dir`` into an index."""
+    from .loader import AlertTemplateLoader
+
+    loader = AlertTemplateLoader(templates_dir, use_index=False)
+    files = template_files(templates_dir)
+
+    rules: Dict[str, List[Dict[str, Any]]] = {}
+    output_labels: Dict[str, Optional[List[str]]] = {}
+    for path in files:
+        alerts = loader._load_from_file(path, path.stem)
+        rules[path.relative_to(templates_dir).as_posix()] = [
+            {key: value for key, value in asdict(alert).items() if key != "technology"}
+            for alert in alerts
+        ]
+        for alert in alerts:
+            labels = extract_promql_output_labels(alert.expr)
+            output_labels[alert.expr] = None if labels is None else sorted(labels)
+
+    return TemplateIndex(
+        digest=templates_digest(templates_dir, files),
+        sizes=template_sizes(templates_dir, files),
+        rules=rules,
+        output_labels=output_labels,
+    )
+
+
+def write_index(templates_dir: Optional[Path] = None) -> Path:
+    """Build the index for ``templates_dir`` and write it next to the templates."""
+    templates_dir = Path(templates_dir) if templates_dir else default_templates_dir()
+    index = build_index(templates_dir)
+    payload = {
+        "format": INDEX_FORMAT_VERSION,
+        "digest": index.digest,
+        "sizes": index.sizes,
+        "rules": index.rules,
+        "output_labels": index.output_labels,
+    }
+
+    path = templates_dir / INDEX_FILE
+    path.write_bytes(pickle.dumps(payload, protocol=PICKLE_PROTOCOL))
+    return path
+
+
+class _PlainUnpickler(pickle.Unpickler):
+    """Unpickler that only accepts builtin containers and scalars."""
+
+    def find_class(self, module: str, name: str) -> Any:
+        raise pickle.UnpicklingError(f"unexpected object in alert index: {module}.{name}")
+
+
+def load_index(templates_dir: Path) -> Optional[TemplateIndex]:
+    """
+    Load the index for ``templates_dir``.
+
+    Returns None (so callers parse YAML) when there is no index, it cannot
+    be read, it has another format version, or the templates changed since
+    it was built: their sizes are always compared, their contents only
+    outside an installed package.
+    """
+    path = templates_dir / INDEX_FILE
+    if not path.is_file():
+        return None
+
+    try:
+        data = _PlainUnpickler(io.BytesIO(path.read_bytes())).load()
+        if data.get("format") != INDEX_FORMAT_VERSION:
+            return None
+        index = TemplateIndex(
+            digest=data["digest"],
+            sizes=data["sizes"],
+            rules=data["rules"],
+            output_labels=data["output_labels"],
+        )
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, KeyError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable alert index {path}: {e}")
+        return None
+
+    files = template_files(templates_dir)
+    if index.sizes != template_sizes(templates_dir, files) or (
+        not _is_installed(templates_dir) and index.digest != templates_digest(templates_dir, files)
+    ):
+        logger.info(f"Alert index {path} is out of date, parsing templates")
+        return None
+    return index
@@ -1,7 +1,8 @@
 """
 Alert Template Loader
 
-Loads alerting rules from awesome-prometheus-alerts templates.
+Loads alerting rules from awesome-prometheus-alerts templates, from the
+precompiled index when it matches the templates and from YAML otherwise.
 """
 
 import logging
@@ -10,7 +11,15 @@ from typing import Dict, List, Optional
 
 import yaml
 
+from .index import (
+    TemplateIndex,
+    default_templates_dir,
+    load_index,
+    template_files,
+    templates_digest,
+)
 from .models import AlertRule
+from .validator import register_output_labels
 
 logger = logging.getLogger(__name__)
 
@@ -31,19 +40,24 @@ class AlertTemplateLoader:
         # Returns List[AlertRule] for PostgreSQL
     """
 
-    def __init__(self, templates_dir: Optional[Path] = None):
+    def __init__(self, templates_dir: Optional[Path] = None, use_index: bool = True):
         """
         Initialize loader.
 
         Args:
             templates_dir: Path to templates directory.
                           Defaults to ./templates relative to this file.
+            use_index: Load the precompiled index (``index.pickle``) when it
+                       is up to date with the templates.
         """
         if templates_dir is None:
-            templates_dir = Path(__file__).parent / "templates"
+            templates_dir = default_templates_dir()
 
         self.templates_dir = Path(templates_dir)
         self.cache: Dict[str, List[AlertRule]] = {}
+        self.index: Optional[TemplateIndex] = load_index(self.templates_dir) if use_index else None
+        if self.index is not None:
+            register_output_labels(self.index.output_labels)
 
         logger.info(f"Initialized AlertTemplateLoader with templates_dir={self.templates_dir}")
 
@@ -71,8 +85,12 @@ class AlertTemplateLoader:
             logger.warning(f"No template found for technology: {technology}")
             return []
 
-        # Load and parse
-        alerts = self._load_from_file(template_file, technology)
+        # Load prebuilt rules, or parse the YAML
+        if self.index is not None:
+            relative = template_file.relative_to(self.templates_dir).as_posix()
+            alerts = self.index.load_rules(relative, technology)
+        else:
+            alerts = self._load_from_file(template_file, technology)
 
         # Cache results
         self.cache[technology] = alerts
@@ -106,26 +124,32 @@ class AlertTemplateLoader:
         if tech_lower in aliases:
             tech_lower = aliases[tech_lower]
 
-        # Search for exact match
-        for category_dir in self.templates_dir.iterdir():
-            if not category_dir.is_dir():
-                continue
+        files = self._template_files()
 
-            template_file = category_dir / f"{tech_lower}.yaml"
-            if template_file.exists():
+        # Search for exact match
+        for template_file in files:
+            if template_file.stem == tech_lower:
                 return template_file
 
         # Try fuzzy match
-        for category_dir in self.templates_dir.iterdir():
-            if not category_dir.is_dir():
-                continue
-
-            for template_file in category_dir.glob("*.yaml"):
-                if tech_lower in template_file.stem.lower():
-                    return template_file
+        for template_file in files:
+            if tech_lower in template_file.stem.lower():
+                return template_file
 
         return None
 
+    def templates_version(self) -> str:
+        """Digest of the templates this loader serves (see ``templates_digest``)."""
+        if self.index is not None:
+            return self.index.digest
+        return templates_digest(self.templates_dir)
+
+    def _template_files(self) -> List[Path]:
+        """Template files in search order (category, then technology)."""
+        if self.index is not None:
+            return self.index.template_files(self.templates_dir)
+        return template_files(self.templates_dir)
+
     def _load_from_file(self, template_file: Path, technology: str) -> List[AlertRule]:
         """
         Load alerts from a YAML template file.
@@ -156,7 +180,7 @@ class AlertTemplateLoader:
         # Parse rules
         alerts = []
         for group in data.get("groups", []):
-            for rule_dict in group.get("rules", []):
+            for rule_dict in group.get("rules") or []:
                 if "alert" not in rule_dict:
                     # Skip recording rules (not alerts)
                     continue
@@ -176,15 +200,7 @@ class AlertTemplateLoader:
         Returns:
             List of technology names (e.g., ["postgres", "redis", "nginx"])
         """
-        technologies = []
-
-        for category_dir in self.templates_dir.iterdir():
-            if not category_dir.is_dir():
-                continue
-
-            for template_file in category_dir.glob("*.yaml"):
-                tech = template_file.stem
-                technologies.append(tech)
+        technologies = [template_file.stem for template_file in self._template_files()]
 
         return sorted(technologies)
 
@@ -202,3 +218,19 @@ class AlertTemplateLoader:
         if template_file:
             return template_file.parent.name
         return None
+
+
+_default_loader: Optional[AlertTemplateLoader] = None
+
+
+def get_default_loader() -> AlertTemplateLoader:
+    """
+    Return the process-wide loader for the bundled templates.
+
+    Its per-technology cache is shared by every service generated in the
+    process, so each template file is parsed at most once.
+    """
+    global _default_loader
+    if _default_loader is None:
+        _default_loader = AlertTemplateLoader()
+    return _default_loader
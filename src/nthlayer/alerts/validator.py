@@ -9,6 +9,7 @@ Validates alert rules and fixes common issues from upstream templates:
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Callable
 
@@ -25,6 +26,24 @@ class ValidationResult:
     fixes_applied: list[str]
 
 
+# Output labels of template expressions, precomputed by the alert template index
+_known_output_labels: dict[str, frozenset[str] | None] = {}
+
+
+def register_output_labels(labels_by_expr: Mapping[str, Iterable[str] | None]) -> None:
+    """Record precomputed ``extract_promql_output_labels`` results by expression."""
+    for expr, labels in labels_by_expr.items():
+        _known_output_labels[expr] = None if labels is None else frozenset(labels)
+
+
+def output_labels(expr: str) -> set[str] | None:
+    """``extract_promql_output_labels`` using precomputed results when known."""
+    if expr in _known_output_labels:
+        known = _known_output_labels[expr]
+        return None if known is None else set(known)
+    return extract_promql_output_labels(expr)
+
+
 def extract_promql_output_labels(expr: str) -> set[str] | None:
     """
     Extract labels that will be present in PromQL query output.
@@ -186,7 +205,7 @@ def validate_and_fix_alert(alert: "AlertRule") -> tuple["AlertRule", ValidationR
     new_duration = alert.duration
 
     # Fix 1: Check and fix label references
-    available_labels = extract_promql_output_labels(alert.expr)
+    available_labels = output_labels(alert.expr)
     referenced_labels = extract_annotation_label_refs(alert.annotations)
 
     if available_labels is not None and referenced_labels:
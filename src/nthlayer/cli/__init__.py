@@ -1,58 +1,59 @@
 """
 CLI commands for NthLayer.
+
+Command functions are resolved on first attribute access so importing one
+command module (``nthlayer.cli.slo``) does not import all of them.
 """
 
-from nthlayer.cli.dashboard import generate_dashboard_command
-from nthlayer.cli.dashboard_validate import (
-    list_intents_command,
-    validate_dashboard_command,
-)
-from nthlayer.cli.deploy import check_deploy_command
-from nthlayer.cli.environments import (
-    diff_envs_command,
-    list_environments_command,
-    validate_env_command,
-)
-from nthlayer.cli.generate import generate_slo_command
-from nthlayer.cli.identity import handle_identity_command, register_identity_parser
-from nthlayer.cli.init import init_command
-from nthlayer.cli.ownership import handle_ownership_command, register_ownership_parser
-from nthlayer.cli.pagerduty import setup_pagerduty_command
-from nthlayer.cli.portfolio import handle_portfolio_command, register_portfolio_parser
-from nthlayer.cli.recording_rules import generate_recording_rules_command
-from nthlayer.cli.slo import handle_slo_command, register_slo_parser
-from nthlayer.cli.templates import list_templates_command
-from nthlayer.cli.validate import validate_command
-from nthlayer.cli.validate_slo import handle_validate_slo_command, register_validate_slo_parser
-
-__all__ = [
-    "generate_slo_command",
-    "validate_command",
-    "setup_pagerduty_command",
-    "check_deploy_command",
-    "list_templates_command",
-    "init_command",
-    "list_environments_command",
-    "diff_envs_command",
-    "validate_env_command",
-    "generate_dashboard_command",
-    "generate_recording_rules_command",
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Exported name -> defining submodule
+_EXPORTS = {
+    "generate_slo_command": "generate",
+    "validate_command": "validate",
+    "setup_pagerduty_command": "pagerduty",
+    "check_deploy_command": "deploy",
+    "list_templates_command": "templates",
+    "init_command": "init",
+    "list_environments_command": "environments",
+    "diff_envs_command": "environments",
+    "validate_env_command": "environments",
+    "generate_dashboard_command": "dashboard",
+    "generate_recording_rules_command": "recording_rules",
     # Hybrid model validation
-    "validate_dashboard_command",
-    "list_intents_command",
+    "validate_dashboard_command": "dashboard_validate",
+    "list_intents_command": "dashboard_validate",
     # SLO commands
-    "handle_slo_command",
-    "register_slo_parser",
+    "handle_slo_command": "slo",
+    "register_slo_parser": "slo",
     # Portfolio commands
-    "handle_portfolio_command",
-    "register_portfolio_parser",
+    "handle_portfolio_command": "portfolio",
+    "register_portfolio_parser": "portfolio",
     # Ownership commands
-    "handle_ownership_command",
-    "register_ownership_parser",
+    "handle_ownership_command": "ownership",
+    "register_ownership_parser": "ownership",
     # Identity commands
-    "handle_identity_command",
-    "register_identity_parser",
+    "handle_identity_command": "identity",
+    "register_identity_parser": "identity",
     # Validate SLO commands
-    "handle_validate_slo_command",
-    "register_validate_slo_parser",
-]
+    "handle_validate_slo_command": "validate_slo",
+    "register_validate_slo_parser": "validate_slo",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
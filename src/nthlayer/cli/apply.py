@@ -3,12 +3,30 @@ CLI command for applying (generating) all service resources.
 """
 
 import json
+import time
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
 
+from nthlayer.cli.environments import requested_environments
 from nthlayer.cli.plan import plan_command
 from nthlayer.cli.ux import console
+from nthlayer.fleet import (
+    FleetOptions,
+    FleetServiceResult,
+    FleetSummary,
+    apply_fleet,
+    discover_service_files,
+)
 from nthlayer.orchestrator import ApplyResult, ServiceOrchestrator
+from nthlayer.specs.parser import parse_service_environments
+from nthlayer.watch import (
+    DEFAULT_DEBOUNCE,
+    FileWatcher,
+    WarmTemplates,
+    affected_services,
+    watch,
+    watch_roots,
+)
 
 
 def print_apply_summary(result: ApplyResult, verbose: bool = False) -> None:
@@ -36,6 +54,11 @@ def print_apply_summary(result: ApplyResult, verbose: bool = False) -> None:
             label = resource_type.replace("-", " ").title()
             detail = f"{count} created"
 
+        if resource_type in result.up_to_date:
+            detail = "up to date"
+        elif verbose and resource_type in result.timings:
+            detail += f" [dim]({result.timings[resource_type]:.2f}s)[/dim]"
+
         if resource_type in warning_types:
             console.print(f"  [yellow]⚠ {label:<12}[/yellow] {detail}")
         else:
@@ -92,9 +115,9 @@ def _get_warning_types(result: ApplyResult) -> set:
     return warning_types
 
 
-def print_apply_json(result: ApplyResult) -> None:
-    """Print apply result in JSON format."""
-    output = {
+def apply_result_to_dict(result: ApplyResult) -> dict:
+    """Serialize an apply result for JSON output."""
+    return {
         "service_name": result.service_name,
         "resources_created": result.resources_created,
         "total_resources": result.total_resources,
@@ -102,8 +125,14 @@ def print_apply_json(result: ApplyResult) -> None:
         "output_dir": str(result.output_dir),
         "errors": result.errors,
         "success": result.success,
+        "up_to_date": result.up_to_date,
+        "timings": result.timings,
     }
-    print(json.dumps(output, indent=2, sort_keys=True))
+
+
+def print_apply_json(result: ApplyResult) -> None:
+    """Print apply result in JSON format."""
+    print(json.dumps(apply_result_to_dict(result), indent=2, sort_keys=True))
 
 
 def apply_command(
@@ -120,28 +149,111 @@ def apply_command(
     push_ruler: bool = False,
     lint: bool = False,
     prometheus_url: Optional[str] = None,
+    parallel: bool = False,
+    jobs: Optional[int] = None,
+    watch: bool = False,
+    all_envs: bool = False,
 ) -> int:
     """
-    Generate all resources for a service.
+    Generate all resources for a service, or for every service in a directory.
 
     Args:
-        service_yaml: Path to service YAML file
-        env: Environment name (dev, staging, prod)
+        service_yaml: Path to service YAML file, or a directory of manifests
+        env: Environment name (dev, staging, prod), or a comma-separated
+            list to render several environments in one run
         output_dir: Output directory for generated files
         dry_run: Preview without writing files (same as plan)
         skip: Resource types to skip (e.g., ['alerts', 'pagerduty'])
         only: Only generate specific resource types
-        force: Force regeneration, ignore cache
+        force: Regenerate every resource, ignoring the artifact cache
+            (``<output_dir>/.nthlayer/cache.json``)
         verbose: Show detailed progress
         output_format: Output format (text, json)
         push_grafana: Push dashboard to Grafana Cloud
         push_ruler: Push alerts to Mimir/Cortex Ruler API
         lint: Validate generated alerts with pint
         prometheus_url: Prometheus URL for metric discovery
+        parallel: Run independent generators concurrently
+        jobs: Worker processes when applying a directory (default: CPU count)
+        watch: Keep running and re-apply whenever the inputs change
+        all_envs: Render every environment with an override file
 
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    environments = requested_environments(service_yaml, env, all_envs)
+    if all_envs or len(environments) > 1:
+        if watch or lint or push_ruler or Path(service_yaml).is_dir():
+            console.print(
+                "[red]Several environments take a single service file and cannot be "
+                "combined with --watch, --lint or --push-ruler[/red]"
+            )
+            return 2
+        if not environments:
+            console.print(f"[red]No environment override files found for {service_yaml}[/red]")
+            return 1
+        if dry_run:
+            return plan_command(service_yaml, env=env, verbose=verbose, all_envs=all_envs)
+        return apply_environments_command(
+            Path(service_yaml),
+            environments,
+            output_dir=output_dir,
+            skip=skip,
+            only=only,
+            force=force,
+            verbose=verbose,
+            output_format=output_format,
+            push_grafana=push_grafana,
+            prometheus_url=prometheus_url,
+            parallel=parallel,
+        )
+    env = environments[0] if environments else None
+
+    if watch:
+        if dry_run or lint or push_ruler:
+            console.print(
+                "[red]--watch cannot be combined with --dry-run, --lint or --push-ruler[/red]"
+            )
+            return 2
+        return apply_watch_command(
+            Path(service_yaml),
+            FleetOptions(
+                env=env,
+                output_root=Path(output_dir) if output_dir else None,
+                skip=skip,
+                only=only,
+                force=force,
+                parallel=parallel,
+                push_to_grafana=push_grafana,
+                prometheus_url=prometheus_url,
+            ),
+            output_format=output_format,
+            verbose=verbose,
+        )
+
+    if Path(service_yaml).is_dir():
+        if dry_run or lint or push_ruler:
+            console.print(
+                "[red]--dry-run, --lint and --push-ruler take a single service file[/red]"
+            )
+            return 2
+        return apply_fleet_command(
+            Path(service_yaml),
+            FleetOptions(
+                env=env,
+                output_root=Path(output_dir) if output_dir else None,
+                skip=skip,
+                only=only,
+                force=force,
+                parallel=parallel,
+                push_to_grafana=push_grafana,
+                prometheus_url=prometheus_url,
+            ),
+            jobs=jobs,
+            output_format=output_format,
+            verbose=verbose,
+        )
+
     # Dry-run delegates to plan command
     if dry_run:
         return plan_command(service_yaml, env=env, verbose=verbose)
@@ -156,7 +268,9 @@ def apply_command(
         orchestrator.output_dir = Path(output_dir)
 
     # Apply
-    result = orchestrator.apply(skip=skip, only=only, force=force, verbose=verbose)
+    result = orchestrator.apply(
+        skip=skip, only=only, force=force, verbose=verbose, parallel=parallel
+    )
 
     # Print result
     if output_format == "json":
@@ -181,6 +295,223 @@ def apply_command(
     return 0 if result.success else 1
 
 
+def apply_environments_command(
+    service_yaml: Path,
+    environments: List[str],
+    output_dir: Optional[str] = None,
+    skip: Optional[List[str]] = None,
+    only: Optional[List[str]] = None,
+    force: bool = False,
+    verbose: bool = False,
+    output_format: str = "text",
+    push_grafana: bool = False,
+    prometheus_url: Optional[str] = None,
+    parallel: bool = False,
+) -> int:
+    """
+    Apply one service for several environments in one process.
+
+    The base YAML is read and the templates are loaded once, and each
+    environment's overrides are merged into a shared view of the base
+    (``parse_service_environments``). Each environment is written to
+    ``<output_dir>/<env>/`` (default ``generated/<service>/<env>/``).
+
+    With ``output_format="json"`` one ``"type": "environment"`` JSON object
+    is written per line.
+
+    Returns:
+        Exit code (0 if every environment applied cleanly, 1 otherwise)
+    """
+    try:
+        parsed = parse_service_environments(service_yaml, environments)
+    except Exception:
+        parsed = {}  # Each environment reports its own parse error below
+
+    exit_code = 0
+    for env in environments:
+        orchestrator = ServiceOrchestrator(
+            service_yaml,
+            env=env,
+            push_to_grafana=push_grafana,
+            prometheus_url=prometheus_url,
+            parsed=parsed.get(env),
+        )
+        service_name = parsed[env].service_name if env in parsed else service_yaml.stem
+        base_dir = Path(output_dir) if output_dir else Path("generated") / service_name
+        orchestrator.output_dir = base_dir / env
+
+        result = orchestrator.apply(
+            skip=skip, only=only, force=force, verbose=verbose, parallel=parallel
+        )
+
+        if output_format == "json":
+            record = {"type": "environment", "environment": env}
+            record.update(apply_result_to_dict(result))
+            print(json.dumps(record, sort_keys=True), flush=True)
+        else:
+            console.print()
+            console.print(f"[bold]Environment: {env}[/bold]")
+            print_apply_summary(result, verbose=verbose)
+        if not result.success:
+            exit_code = 1
+
+    return exit_code
+
+
+def apply_fleet_command(
+    root: Path,
+    options: FleetOptions,
+    jobs: Optional[int] = None,
+    output_format: str = "text",
+    verbose: bool = False,
+) -> int:
+    """
+    Apply every service manifest under a directory.
+
+    With ``output_format="json"`` one JSON object is written per line: a
+    ``"type": "service"`` record per service as it finishes, then a
+    ``"type": "summary"`` record.
+
+    Returns:
+        Exit code (0 if every service applied cleanly, 1 otherwise)
+    """
+    start = time.time()
+    service_files = discover_service_files(root)
+    summary = FleetSummary()
+
+    if output_format != "json":
+        console.print()
+        console.print(f"[bold]Applying {len(service_files)} services from {root}/[/bold]")
+        console.print()
+
+    for item in apply_fleet(service_files, options, jobs=jobs):
+        summary.add(item)
+        if output_format == "json":
+            record = {"type": "service", "service_yaml": str(item.service_yaml)}
+            record.update(apply_result_to_dict(item.result))
+            print(json.dumps(record, sort_keys=True), flush=True)
+        else:
+            _print_fleet_service(item, verbose=verbose)
+
+    summary.duration_seconds = time.time() - start
+
+    if output_format == "json":
+        print(json.dumps({"type": "summary", **summary.to_dict()}, sort_keys=True), flush=True)
+    else:
+        console.print()
+        color = "green" if summary.success else "yellow"
+        console.print(
+            f"[bold {color}]Applied {summary.succeeded}/{summary.services} services, "
+            f"{summary.total_resources} resources ({summary.up_to_date} up to date) "
+            f"in {summary.duration_seconds:.1f}s[/bold {color}]"
+        )
+        for failed in summary.failed:
+            console.print(f"  [dim]•[/dim] {failed}")
+        console.print()
+
+    return 0 if summary.success else 1
+
+
+def apply_watch_command(
+    target: Path,
+    options: FleetOptions,
+    output_format: str = "text",
+    verbose: bool = False,
+    debounce: float = DEFAULT_DEBOUNCE,
+    max_runs: Optional[int] = None,
+) -> int:
+    """
+    Apply a service file or directory, then re-apply after every change.
+
+    Templates stay loaded between runs, only services whose files or
+    environment overrides changed are applied again, and the artifact cache
+    skips generators whose inputs are unchanged. ``options.force`` only
+    applies to the first run. For a single service file
+    ``options.output_root`` is the output directory itself, as with
+    ``--output-dir``.
+
+    Returns:
+        Exit code of the last run
+    """
+    single = not target.is_dir()
+    output = options.output_root or Path("generated")
+    warm = WarmTemplates()
+    watcher = FileWatcher(watch_roots(target), ignore=[output])
+    force = options.force
+
+    def run(changed: Set[Path]) -> int:
+        nonlocal force
+        start = time.time()
+        services = [target] if single else discover_service_files(target)
+        if changed:
+            services = affected_services(services, changed, warm.templates_dir)
+            if output_format != "json":
+                names = ", ".join(sorted(path.name for path in changed))
+                console.print(f"[dim]{time.strftime('%H:%M:%S')} changed: {names}[/dim]")
+        registry = warm.refresh(changed)
+
+        exit_code = 0
+        for service_yaml in services:
+            orchestrator = ServiceOrchestrator(
+                service_yaml,
+                env=options.env,
+                push_to_grafana=options.push_to_grafana,
+                prometheus_url=options.prometheus_url,
+                template_registry=registry,
+                output_root=None if single else options.output_root,
+            )
+            if single and options.output_root:
+                orchestrator.output_dir = options.output_root
+            result = orchestrator.apply(
+                skip=options.skip,
+                only=options.only,
+                force=force,
+                verbose=verbose,
+                parallel=options.parallel,
+            )
+
+            if output_format == "json":
+                record = {"type": "service", "service_yaml": str(service_yaml)}
+                record.update(apply_result_to_dict(result))
+                print(json.dumps(record, sort_keys=True), flush=True)
+            elif single:
+                print_apply_summary(result, verbose=verbose)
+            else:
+                _print_fleet_service(FleetServiceResult(service_yaml, result), verbose=verbose)
+            if not result.success:
+                exit_code = 1
+
+        force = False
+        if output_format != "json" and not single:
+            console.print(
+                f"[dim]Applied {len(services)} services in {time.time() - start:.2f}s[/dim]"
+            )
+        return exit_code
+
+    def waiting() -> None:
+        if output_format != "json":
+            console.print(f"[bold]Watching {target} for changes[/bold] [dim](Ctrl+C to stop)[/dim]")
+
+    return watch(run, watcher, debounce=debounce, max_runs=max_runs, on_wait=waiting)
+
+
+def _print_fleet_service(item: FleetServiceResult, verbose: bool = False) -> None:
+    """Print the one-line outcome of a fleet service."""
+    result = item.result
+    detail = f"{result.total_resources} resources"
+    if result.up_to_date:
+        detail += f", {len(result.up_to_date)} up to date"
+
+    if result.success:
+        console.print(f"  [green]✓ {result.service_name:<30}[/green] {detail}")
+    else:
+        console.print(f"  [yellow]⚠ {result.service_name:<30}[/yellow] {result.errors[0]}")
+
+    if verbose and item.log.strip():
+        for line in item.log.strip().splitlines():
+            console.print(f"    [dim]{line}[/dim]")
+
+
 def _lint_generated_alerts(output_dir: Path, verbose: bool = False) -> int:
     """Lint generated alerts with pint."""
     from nthlayer.validation import PintLinter, is_pint_available
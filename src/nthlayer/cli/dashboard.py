@@ -8,7 +8,7 @@ import yaml
 
 from nthlayer.cli.ux import console, error, header
 from nthlayer.dashboards.builder_sdk import build_dashboard
-from nthlayer.specs.parser import parse_service_file
+from nthlayer.specs.parser import ParsedService, parse_service_file
 
 
 def generate_dashboard_command(
@@ -19,6 +19,7 @@ def generate_dashboard_command(
     full_panels: bool = False,
     quiet: bool = False,
     prometheus_url: Optional[str] = None,
+    parsed: Optional[ParsedService] = None,
 ) -> int:
     """Generate Grafana dashboard from service specification.
 
@@ -30,6 +31,7 @@ def generate_dashboard_command(
         full_panels: Include all template panels (default: overview only)
         quiet: Suppress output (for use in orchestrator)
         prometheus_url: Optional Prometheus URL for metric discovery
+        parsed: Already parsed service (skips reading ``service_file``)
 
     Returns:
         Exit code (0 for success, 1 for error)
@@ -56,7 +58,10 @@ def generate_dashboard_command(
     try:
         # Parse service file
         log("Parsing service specification...")
-        context, resources = parse_service_file(service_file, environment=environment)
+        if parsed is not None:
+            context, resources = parsed.context, list(parsed.resources)
+        else:
+            context, resources = parse_service_file(service_file, environment=environment)
 
         log(f"   Service: {context.name}")
         log(f"   Team: {context.team}")
@@ -27,6 +27,9 @@ def check_deploy_command(
     demo_blocked: bool = False,
     include_drift: bool = False,
     drift_window: str | None = None,
+    concurrency: int | None = None,
+    query_timeout: float | None = None,
+    batch_size: int | None = None,
 ) -> int:
     """
     Check if deployment should be allowed based on error budget.
@@ -36,6 +39,10 @@ def check_deploy_command(
     Args:
         include_drift: If True, also check for reliability drift trends
         drift_window: Override drift analysis window (e.g., "30d")
+        concurrency: Max SLO queries in flight (default: NTHLAYER_QUERY_CONCURRENCY or 8)
+        query_timeout: Per-query timeout in seconds (default: NTHLAYER_QUERY_TIMEOUT or 30)
+        batch_size: SLI queries merged per request, 1 disables batching
+            (default: NTHLAYER_QUERY_BATCH_SIZE or 20)
     """
     if demo:
         return _run_demo_mode(service_file, environment, blocked=False)
@@ -71,7 +78,12 @@ def check_deploy_command(
     console.print()
 
     try:
-        collector = SLOMetricCollector(prom_url)
+        collector = SLOMetricCollector(
+            prom_url,
+            concurrency=concurrency,
+            query_timeout=query_timeout,
+            batch_size=batch_size,
+        )
         slo_results = asyncio.run(collector.collect(slo_resources, service_context.name))
         budget = collector.calculate_aggregate_budget(slo_results)
     except Exception as e:
@@ -7,6 +7,7 @@ and detecting degradation trends.
 Commands:
     nthlayer drift <service.yaml>         - Analyze drift for a service
     nthlayer drift <service.yaml> --json  - Output as JSON
+    nthlayer drift <service.yaml> --incremental - Fetch only samples since the last run
 """
 
 from __future__ import annotations
@@ -25,6 +26,8 @@ from nthlayer.drift import (
     DriftSeverity,
     get_drift_defaults,
 )
+from nthlayer.drift.state import DriftStateStore, default_state_path
+from nthlayer.providers.query_cache import disable_query_cache
 from nthlayer.specs.parser import parse_service_file
 
 
@@ -36,6 +39,8 @@ def drift_command(
     slo: str = "availability",
     output_format: str = "table",
     demo: bool = False,
+    incremental: bool = False,
+    state_file: Optional[str] = None,
 ) -> int:
     """
     Analyze reliability drift for a service.
@@ -55,6 +60,8 @@ def drift_command(
         slo: SLO name to analyze (default: availability)
         output_format: Output format ("table" or "json")
         demo: If True, show demo output with sample data
+        incremental: Keep drift state between runs and fetch only new samples
+        state_file: Drift state file (default: ~/.cache/nthlayer/drift-state.sqlite)
 
     Returns:
         Exit code (0, 1, or 2)
@@ -107,22 +114,39 @@ def drift_command(
     analysis_window = window or drift_config["window"]
 
     # Run analysis
+    store = None
+    if incremental or state_file:
+        store = DriftStateStore(state_file or default_state_path())
     try:
-        result = asyncio.run(
-            analyzer.analyze(
-                service_name=service_name,
-                tier=tier,
-                slo=slo,
-                window=analysis_window,
-                drift_config=drift_config,
+        if store is not None:
+            result = asyncio.run(
+                analyzer.analyze_incremental(
+                    service_name=service_name,
+                    tier=tier,
+                    store=store,
+                    slo=slo,
+                    window=analysis_window,
+                )
+            )
+        else:
+            result = asyncio.run(
+                analyzer.analyze(
+                    service_name=service_name,
+                    tier=tier,
+                    slo=slo,
+                    window=analysis_window,
+                    drift_config=drift_config,
+                )
             )
-        )
     except DriftAnalysisError as e:
         error(f"Drift analysis failed: {e}")
         return 2
     except Exception as e:
         error(f"Unexpected error: {e}")
         return 2
+    finally:
+        if store is not None:
+            store.close()
 
     # Output results
     if output_format == "json":
@@ -310,10 +334,27 @@ def register_drift_parser(subparsers: argparse._SubParsersAction) -> None:
         action="store_true",
         help="Show demo output with sample data",
     )
+    drift_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Keep drift state between runs and fetch only samples since the last run",
+    )
+    drift_parser.add_argument(
+        "--state-file",
+        help="Drift state file for --incremental (default: ~/.cache/nthlayer/drift-state.sqlite)",
+    )
+    drift_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the Prometheus query cache (or set NTHLAYER_QUERY_CACHE=off)",
+    )
 
 
 def handle_drift_command(args: argparse.Namespace) -> int:
     """Handle drift command from CLI args."""
+    if getattr(args, "no_cache", False):
+        disable_query_cache()
+
     return drift_command(
         service_file=args.service_file,
         prometheus_url=getattr(args, "prometheus_url", None),
@@ -322,4 +363,6 @@ def handle_drift_command(args: argparse.Namespace) -> int:
         slo=getattr(args, "slo", "availability"),
         output_format=getattr(args, "output_format", "table"),
         demo=getattr(args, "demo", False),
+        incremental=getattr(args, "incremental", False),
+        state_file=getattr(args, "state_file", None),
     )
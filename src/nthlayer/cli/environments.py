@@ -11,9 +11,25 @@ from typing import Any
 import yaml
 
 from nthlayer.cli.ux import console, error, header, success, warning
+from nthlayer.specs.environments import EnvironmentLoader, split_environments
 from nthlayer.specs.parser import parse_service_file
 
 
+def requested_environments(
+    service_file: str | Path, env: str | None = None, all_envs: bool = False
+) -> list[str]:
+    """
+    Environments a command should render for ``--env`` / ``--all-envs``.
+
+    ``--env`` takes one name or a comma-separated list (``dev,staging,prod``);
+    ``--all-envs`` selects every environment with an override file for the
+    service. Returns an empty list when no environment was requested.
+    """
+    if all_envs:
+        return EnvironmentLoader.list_environments(Path(service_file))
+    return split_environments(env)
+
+
 def list_environments_command(service_file: str | None = None, directory: str | None = None) -> int:
     """List available environments for a service or directory.
 
@@ -6,8 +6,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from nthlayer.cli.environments import requested_environments
 from nthlayer.cli.ux import console, error, header, info, success
 from nthlayer.generators.sloth import generate_sloth_spec
+from nthlayer.specs.parser import ParsedService, parse_service_environments
 
 
 def generate_slo_command(
@@ -16,6 +18,7 @@ def generate_slo_command(
     format: str = "sloth",
     environment: str | None = None,
     dry_run: bool = False,
+    all_envs: bool = False,
 ) -> int:
     """
     Generate SLO configs from service definition.
@@ -24,8 +27,10 @@ def generate_slo_command(
         service_file: Path to service YAML file
         output_dir: Output directory for generated files
         format: Output format (sloth, prometheus, openslo)
-        environment: Environment name (dev, staging, prod) - optional
+        environment: Environment name (dev, staging, prod) - optional; a
+            comma-separated list generates each into ``sloth/<env>/``
         dry_run: Preview without writing files
+        all_envs: Generate every environment with an override file
 
     Returns:
         Exit code (0 = success, 1 = error)
@@ -33,8 +38,14 @@ def generate_slo_command(
     header("Generate SLOs")
     console.print()
 
-    if environment:
-        console.print(f"[info]Environment:[/info] {environment}")
+    environments = requested_environments(service_file, environment, all_envs)
+    if all_envs and not environments:
+        error(f"No environment override files found for {service_file}")
+        console.print()
+        return 1
+
+    if environments:
+        console.print(f"[info]Environment:[/info] {', '.join(environments)}")
         console.print()
 
     if dry_run:
@@ -51,47 +62,73 @@ def generate_slo_command(
     # Generate based on format
     if format == "sloth":
         output_path = Path(output_dir) / "sloth"
+        if not all_envs and len(environments) <= 1:
+            env = environments[0] if environments else None
+            return _generate_sloth(service_file, output_path, env, dry_run)
+
+        # Parse the base once and render every environment from it
+        try:
+            parsed = parse_service_environments(service_file, environments)
+        except Exception:
+            parsed = {}  # Each environment reports its own parse error
+
+        exit_code = 0
+        for env in environments:
+            console.print(f"[bold]Environment: {env}[/bold]")
+            if _generate_sloth(service_file, output_path / env, env, dry_run, parsed.get(env)):
+                exit_code = 1
+        return exit_code
 
-        if dry_run:
-            console.print(f"Would generate Sloth spec to: {output_path}")
-            console.print()
-            return 0
-
-        result = generate_sloth_spec(service_file, output_path, environment=environment)
+    return 0
 
-        if not result.success:
-            error(f"Generation failed: {result.error}")
-            console.print()
-            return 1
 
-        success(f"Generated SLOs for {result.service}")
-        console.print(f"   [muted]SLO count:[/muted] {result.slo_count}")
-        console.print(f"   [muted]Output:[/muted] {result.output_file}")
+def _generate_sloth(
+    service_file: str,
+    output_path: Path,
+    environment: str | None,
+    dry_run: bool,
+    parsed: ParsedService | None = None,
+) -> int:
+    """Generate the Sloth spec for one environment and print the result."""
+    if dry_run:
+        console.print(f"Would generate Sloth spec to: {output_path}")
         console.print()
-        console.print("[bold]Generated SLOs:[/bold]")
-
-        # Read and display SLO names
-        import yaml
-
-        if result.output_file:
-            with open(result.output_file) as f:
-                sloth_spec = yaml.safe_load(f)
-                for slo in sloth_spec.get("slos", []):
-                    name = slo.get("name", "unknown")
-                    objective = slo.get("objective", 0)
-                    console.print(
-                        f"   [success]•[/success] {result.service}-{name} "
-                        f"[muted]({objective}%)[/muted]"
-                    )
+        return 0
 
+    result = generate_sloth_spec(service_file, output_path, environment=environment, parsed=parsed)
+
+    if not result.success:
+        error(f"Generation failed: {result.error}")
         console.print()
-        console.print("[bold]Next steps:[/bold]")
-        console.print(f"   [muted]1.[/muted] Review generated spec: {result.output_file}")
-        console.print(
-            f"   [muted]2.[/muted] Generate Prometheus rules: "
-            f"[info]sloth generate -i {result.output_file}[/info]"
-        )
-        console.print("   [muted]3.[/muted] Deploy rules to Prometheus")
-        console.print()
+        return 1
+
+    success(f"Generated SLOs for {result.service}")
+    console.print(f"   [muted]SLO count:[/muted] {result.slo_count}")
+    console.print(f"   [muted]Output:[/muted] {result.output_file}")
+    console.print()
+    console.print("[bold]Generated SLOs:[/bold]")
+
+    # Read and display SLO names
+    import yaml
+
+    if result.output_file:
+        with open(result.output_file) as f:
+            sloth_spec = yaml.safe_load(f)
+            for slo in sloth_spec.get("slos", []):
+                name = slo.get("name", "unknown")
+                objective = slo.get("objective", 0)
+                console.print(
+                    f"   [success]•[/success] {result.service}-{name} [muted]({objective}%)[/muted]"
+                )
+
+    console.print()
+    console.print("[bold]Next steps:[/bold]")
+    console.print(f"   [muted]1.[/muted] Review generated spec: {result.output_file}")
+    console.print(
+        f"   [muted]2.[/muted] Generate Prometheus rules: "
+        f"[info]sloth generate -i {result.output_file}[/info]"
+    )
+    console.print("   [muted]3.[/muted] Deploy rules to Prometheus")
+    console.print()
 
     return 0
@@ -7,6 +7,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
+from nthlayer.cli.environments import requested_environments
 from nthlayer.cli.formatters import (
     CheckResult,
     CheckStatus,
@@ -15,6 +16,7 @@ from nthlayer.cli.formatters import (
 )
 from nthlayer.cli.ux import console, error, header, warning
 from nthlayer.orchestrator import PlanResult, ServiceOrchestrator
+from nthlayer.specs.parser import parse_service_environments
 
 
 def print_plan_summary(plan: PlanResult) -> None:
@@ -216,29 +218,62 @@ def plan_command(
     output_format: str = "table",
     output_file: Optional[str] = None,
     verbose: bool = False,
+    all_envs: bool = False,
 ) -> int:
     """
     Preview what resources would be generated (dry-run).
 
     Args:
         service_yaml: Path to service YAML file
-        env: Environment name (dev, staging, prod)
+        env: Environment name (dev, staging, prod), or a comma-separated
+            list to plan several environments from one parse
         output_format: Output format (table, json, sarif, junit, markdown)
-        output_file: Optional file path to write output
+        output_file: Optional file path to write output; with several
+            environments one file per environment (``plan-prod.json``)
         verbose: Show detailed information
+        all_envs: Plan every environment with an override file
 
     Returns:
         Exit code (0 for success, 1 for error)
     """
-    orchestrator = ServiceOrchestrator(Path(service_yaml), env=env)
-    result = orchestrator.plan()
+    environments = requested_environments(service_yaml, env, all_envs)
+    if not all_envs and len(environments) <= 1:
+        environment = environments[0] if environments else None
+        result = ServiceOrchestrator(Path(service_yaml), env=environment).plan()
+        _print_plan(result, output_format, output_file)
+        return 0 if result.success else 1
 
+    if not environments:
+        error(f"No environment override files found for {service_yaml}")
+        return 1
+
+    try:
+        parsed = parse_service_environments(service_yaml, environments)
+    except Exception:
+        parsed = {}  # Each environment reports its own parse error
+
+    exit_code = 0
+    for environment in environments:
+        result = ServiceOrchestrator(
+            Path(service_yaml), env=environment, parsed=parsed.get(environment)
+        ).plan()
+        if output_format == "table" and not output_file:
+            console.print()
+            console.print(f"[bold]Environment: {environment}[/bold]")
+        _print_plan(result, output_format, _environment_file(output_file, environment))
+        if not result.success:
+            exit_code = 1
+    return exit_code
+
+
+def _print_plan(plan: PlanResult, output_format: str, output_file: Optional[str]) -> None:
+    """Print a plan, or write it to ``output_file``."""
     # Use table format with rich console output
     if output_format == "table" and not output_file:
-        print_plan_summary(result)
+        print_plan_summary(plan)
     else:
         # Convert to report and use formatter
-        report = plan_to_report(result)
+        report = plan_to_report(plan)
         output = format_report(
             report,
             output_format=output_format,
@@ -251,4 +286,10 @@ def plan_command(
         else:
             console.print(f"[success]Output written to {output_file}[/success]")
 
-    return 0 if result.success else 1
+
+def _environment_file(output_file: Optional[str], environment: str) -> Optional[str]:
+    """``plan.json`` -> ``plan-prod.json``."""
+    if not output_file:
+        return None
+    path = Path(output_file)
+    return str(path.with_name(f"{path.stem}-{environment}{path.suffix}"))
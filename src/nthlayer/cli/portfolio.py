@@ -30,10 +30,12 @@ from nthlayer.cli.ux import console, header
 from nthlayer.drift import DriftAnalyzer, DriftResult, DriftSeverity, get_drift_defaults
 from nthlayer.portfolio import (
     HealthStatus,
+    LiveQueryStats,
     PortfolioHealth,
     ServiceHealth,
     collect_portfolio,
 )
+from nthlayer.providers.query_cache import disable_query_cache
 
 
 def portfolio_command(
@@ -41,6 +43,12 @@ def portfolio_command(
     search_paths: list[str] | None = None,
     prometheus_url: str | None = None,
     include_drift: bool = False,
+    jobs: int | None = None,
+    ignore: list[str] | None = None,
+    concurrency: int | None = None,
+    query_timeout: float | None = None,
+    rate_limit: float | None = None,
+    deadline: float | None = None,
 ) -> int:
     """
     Display SLO portfolio health across all services.
@@ -50,6 +58,12 @@ def portfolio_command(
         search_paths: Optional directories to search for service files
         prometheus_url: Optional Prometheus URL for live SLO data
         include_drift: If True, include drift trend analysis for each service
+        jobs: Worker processes for parsing service files (default: CPU count)
+        ignore: Glob patterns of service files and directories to skip
+        concurrency: Max Prometheus requests in flight (default: 8)
+        query_timeout: Per-request timeout in seconds
+        rate_limit: Max Prometheus requests started per second
+        deadline: Seconds allowed for all live queries together
 
     Returns:
         Exit code based on health:
@@ -61,7 +75,16 @@ def portfolio_command(
     prom_url = prometheus_url or os.environ.get("NTHLAYER_PROMETHEUS_URL")
 
     # Collect portfolio data
-    portfolio = collect_portfolio(search_paths, prometheus_url=prom_url)
+    portfolio = collect_portfolio(
+        search_paths,
+        prometheus_url=prom_url,
+        jobs=jobs,
+        ignore=ignore,
+        concurrency=concurrency,
+        query_timeout=query_timeout,
+        rate_limit=rate_limit,
+        deadline=deadline,
+    )
 
     # Collect drift data if requested
     drift_results: dict[str, DriftResult] = {}
@@ -91,6 +114,9 @@ def _collect_drift_data(
 ) -> dict[str, DriftResult]:
     """Collect drift data for all services in portfolio.
 
+    Budget history for the whole portfolio is fetched with one grouped
+    range query (``DriftAnalyzer.analyze_many``) rather than one per service.
+
     Args:
         portfolio: Portfolio health data
         prometheus_url: Prometheus URL
@@ -107,35 +133,28 @@ def _collect_drift_data(
         password=password,
     )
 
-    results: dict[str, DriftResult] = {}
-
+    services: dict[str, str] = {}
     for svc in portfolio.services:
         # Skip services without SLOs
         if not svc.slos:
             continue
 
         tier = str(svc.tier) if svc.tier else "standard"
-        drift_config = get_drift_defaults(tier)
 
         # Skip if drift not enabled for this tier
-        if not drift_config.get("enabled", True):
+        if not get_drift_defaults(tier).get("enabled", True):
             continue
 
-        try:
-            result = asyncio.run(
-                analyzer.analyze(
-                    service_name=svc.service,
-                    tier=tier,
-                    slo="availability",
-                    drift_config=drift_config,
-                )
-            )
-            results[svc.service] = result
-        except Exception:
-            # Skip services where drift analysis fails
-            continue
+        services[svc.service] = tier
+
+    if not services:
+        return {}
 
-    return results
+    try:
+        return asyncio.run(analyzer.analyze_many(services, slo="availability"))
+    except Exception:
+        # Report the portfolio without drift when Prometheus is unavailable
+        return {}
 
 
 def _calculate_exit_code(
@@ -176,6 +195,27 @@ def _calculate_exit_code(
     return 0
 
 
+def _print_live_queries(stats: LiveQueryStats) -> None:
+    """Print a one-line summary of the live Prometheus queries."""
+    problems = [
+        f"{count} {label}"
+        for count, label in (
+            (stats.failed, "failed"),
+            (stats.timed_out, "timed out"),
+            (stats.deadline_exceeded, "past deadline"),
+            (stats.no_data, "no data"),
+        )
+        if count
+    ]
+    summary = (
+        f"Live data: {stats.succeeded}/{stats.queries} queries in "
+        f"{stats.duration_seconds:.1f}s ({stats.requests} requests)"
+    )
+    if problems:
+        summary += f" [yellow]{', '.join(problems)}[/yellow]"
+    console.print(f"[dim]{summary}[/dim]")
+
+
 def _print_table(
     portfolio: PortfolioHealth,
     drift_results: dict[str, DriftResult] | None = None,
@@ -202,6 +242,9 @@ def _print_table(
     else:
         console.print("[yellow]Organization Health: No SLOs defined[/yellow]")
 
+    if portfolio.live_queries is not None:
+        _print_live_queries(portfolio.live_queries)
+
     console.print()
 
     # By tier breakdown with rich table
@@ -567,12 +610,67 @@ def register_portfolio_parser(subparsers: argparse._SubParsersAction) -> None:
         help="Include drift trend analysis for each service (requires Prometheus)",
     )
 
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Worker processes for parsing service files (default: CPU count)",
+    )
+
+    parser.add_argument(
+        "--ignore",
+        action="append",
+        metavar="PATTERN",
+        help="Skip service files and directories matching a glob (repeatable)",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Max concurrent Prometheus requests for live data (default: 8)",
+    )
+
+    parser.add_argument(
+        "--query-timeout",
+        type=float,
+        help="Per-request timeout in seconds for live data",
+    )
+
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        metavar="RPS",
+        help="Max Prometheus requests started per second",
+    )
+
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SECONDS",
+        help="Time allowed for all live queries; unanswered SLOs stay unknown",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the Prometheus query cache (or set NTHLAYER_QUERY_CACHE=off)",
+    )
+
 
 def handle_portfolio_command(args: argparse.Namespace) -> int:
     """Handle portfolio subcommand."""
+    if getattr(args, "no_cache", False):
+        disable_query_cache()
+
     return portfolio_command(
         format=getattr(args, "format", "table"),
         search_paths=getattr(args, "search_paths", None),
         prometheus_url=getattr(args, "prometheus_url", None),
+        jobs=getattr(args, "jobs", None),
+        ignore=getattr(args, "ignore", None),
+        concurrency=getattr(args, "concurrency", None),
+        query_timeout=getattr(args, "query_timeout", None),
+        rate_limit=getattr(args, "rate_limit", None),
+        deadline=getattr(args, "deadline", None),
         include_drift=getattr(args, "include_drift", False),
     )
@@ -28,6 +28,7 @@ from rich.table import Table
 
 from nthlayer.cli.ux import console, header
 from nthlayer.portfolio import collect_portfolio
+from nthlayer.providers.query_cache import disable_query_cache
 from nthlayer.scorecard.calculator import ScoreCalculator
 from nthlayer.scorecard.models import ScoreBand, ScorecardReport, ServiceScore, TeamScore
 from nthlayer.scorecard.trends import TrendAnalyzer
@@ -48,6 +49,12 @@ def scorecard_command(
     prometheus_url: str | None = None,
     by_team: bool = False,
     top_n: int = 5,
+    jobs: int | None = None,
+    ignore: list[str] | None = None,
+    concurrency: int | None = None,
+    query_timeout: float | None = None,
+    rate_limit: float | None = None,
+    deadline: float | None = None,
 ) -> int:
     """
     Display reliability scorecard.
@@ -58,6 +65,12 @@ def scorecard_command(
         prometheus_url: Optional Prometheus URL for live data
         by_team: If True, display by team instead of by service
         top_n: Number of top/bottom services to highlight
+        jobs: Worker processes for parsing service files (default: CPU count)
+        ignore: Glob patterns of service files and directories to skip
+        concurrency: Max Prometheus requests in flight (default: 8)
+        query_timeout: Per-request timeout in seconds
+        rate_limit: Max Prometheus requests started per second
+        deadline: Seconds allowed for all live queries together
 
     Returns:
         Exit code: 0=excellent/good, 1=fair, 2=poor/critical
@@ -66,7 +79,16 @@ def scorecard_command(
     prom_url = prometheus_url or os.environ.get("NTHLAYER_PROMETHEUS_URL")
 
     # Collect portfolio data
-    portfolio = collect_portfolio(search_paths, prometheus_url=prom_url)
+    portfolio = collect_portfolio(
+        search_paths,
+        prometheus_url=prom_url,
+        jobs=jobs,
+        ignore=ignore,
+        concurrency=concurrency,
+        query_timeout=query_timeout,
+        rate_limit=rate_limit,
+        deadline=deadline,
+    )
 
     # Calculate scores
     calculator = ScoreCalculator(prometheus_url=prom_url)
@@ -311,13 +333,68 @@ def register_scorecard_parser(subparsers: argparse._SubParsersAction) -> None:
         help="Number of top/bottom services to highlight (default: 5)",
     )
 
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Worker processes for parsing service files (default: CPU count)",
+    )
+
+    parser.add_argument(
+        "--ignore",
+        action="append",
+        metavar="PATTERN",
+        help="Skip service files and directories matching a glob (repeatable)",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Max concurrent Prometheus requests for live data (default: 8)",
+    )
+
+    parser.add_argument(
+        "--query-timeout",
+        type=float,
+        help="Per-request timeout in seconds for live data",
+    )
+
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        metavar="RPS",
+        help="Max Prometheus requests started per second",
+    )
+
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SECONDS",
+        help="Time allowed for all live queries; unanswered SLOs stay unknown",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the Prometheus query cache (or set NTHLAYER_QUERY_CACHE=off)",
+    )
+
 
 def handle_scorecard_command(args: argparse.Namespace) -> int:
     """Handle scorecard subcommand."""
+    if getattr(args, "no_cache", False):
+        disable_query_cache()
+
     return scorecard_command(
         format=getattr(args, "format", "table"),
         search_paths=getattr(args, "search_paths", None),
         prometheus_url=getattr(args, "prometheus_url", None),
+        jobs=getattr(args, "jobs", None),
+        ignore=getattr(args, "ignore", None),
+        concurrency=getattr(args, "concurrency", None),
+        query_timeout=getattr(args, "query_timeout", None),
+        rate_limit=getattr(args, "rate_limit", None),
+        deadline=getattr(args, "deadline", None),
         by_team=getattr(args, "by_team", False),
         top_n=getattr(args, "top_n", 5),
     )
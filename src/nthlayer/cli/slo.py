@@ -261,71 +261,72 @@ async def _collect_slo_metrics(
     password = os.environ.get("NTHLAYER_METRICS_PASSWORD")
 
     provider = PrometheusProvider(prometheus_url, username=username, password=password)
-    results = []
-
-    for slo in slo_resources:
-        spec = slo.spec or {}
-        objective = spec.get("objective", 99.9)
-        window = spec.get("window", "30d")
-        indicator = spec.get("indicator", {})
-
-        # Calculate budget
-        window_minutes = _parse_window_minutes(window)
-        error_budget_percent = (100 - objective) / 100
-        total_budget_minutes = window_minutes * error_budget_percent
-
-        result = {
-            "name": slo.name,
-            "objective": objective,
-            "window": window,
-            "total_budget_minutes": total_budget_minutes,
-            "current_sli": None,
-            "burned_minutes": None,
-            "percent_consumed": None,
-            "status": "UNKNOWN",
-            "error": None,
-        }
-
-        # Try to get SLI value from Prometheus
-        query = indicator.get("query")
-        if query:
-            # Substitute service name in query
-            query = query.replace("${service}", service_name)
-            query = query.replace("$service", service_name)
-
-            try:
-                sli_value = await provider.get_sli_value(query)
-
-                if sli_value > 0:
-                    result["current_sli"] = sli_value * 100  # Convert to percentage
-
-                    # Calculate burn
-                    error_rate = 1.0 - sli_value
-                    burned_minutes = window_minutes * error_rate
-                    result["burned_minutes"] = burned_minutes
-                    result["percent_consumed"] = (burned_minutes / total_budget_minutes) * 100
-
-                    # Determine status
-                    if result["percent_consumed"] >= 100:
-                        result["status"] = "EXHAUSTED"
-                    elif result["percent_consumed"] >= 80:
-                        result["status"] = "CRITICAL"
-                    elif result["percent_consumed"] >= 50:
-                        result["status"] = "WARNING"
+    results: list[dict[str, Any]] = []
+
+    async with provider:
+        for slo in slo_resources:
+            spec = slo.spec or {}
+            objective = spec.get("objective", 99.9)
+            window = spec.get("window", "30d")
+            indicator = spec.get("indicator", {})
+
+            # Calculate budget
+            window_minutes = _parse_window_minutes(window)
+            error_budget_percent = (100 - objective) / 100
+            total_budget_minutes = window_minutes * error_budget_percent
+
+            result = {
+                "name": slo.name,
+                "objective": objective,
+                "window": window,
+                "total_budget_minutes": total_budget_minutes,
+                "current_sli": None,
+                "burned_minutes": None,
+                "percent_consumed": None,
+                "status": "UNKNOWN",
+                "error": None,
+            }
+
+            # Try to get SLI value from Prometheus
+            query = indicator.get("query")
+            if query:
+                # Substitute service name in query
+                query = query.replace("${service}", service_name)
+                query = query.replace("$service", service_name)
+
+                try:
+                    sli_value = await provider.get_sli_value(query)
+
+                    if sli_value > 0:
+                        result["current_sli"] = sli_value * 100  # Convert to percentage
+
+                        # Calculate burn
+                        error_rate = 1.0 - sli_value
+                        burned_minutes = window_minutes * error_rate
+                        result["burned_minutes"] = burned_minutes
+                        result["percent_consumed"] = (burned_minutes / total_budget_minutes) * 100
+
+                        # Determine status
+                        if result["percent_consumed"] >= 100:
+                            result["status"] = "EXHAUSTED"
+                        elif result["percent_consumed"] >= 80:
+                            result["status"] = "CRITICAL"
+                        elif result["percent_consumed"] >= 50:
+                            result["status"] = "WARNING"
+                        else:
+                            result["status"] = "HEALTHY"
                     else:
-                        result["status"] = "HEALTHY"
-                else:
-                    result["error"] = "No data returned from Prometheus"
-                    result["status"] = "NO_DATA"
-
-            except PrometheusProviderError as e:
-                result["error"] = str(e)
-                result["status"] = "ERROR"
-        else:
-            result["error"] = "No query defined in SLO indicator"
-            result["status"] = "NO_QUERY"
+                        result["error"] = "No data returned from Prometheus"
+                        result["status"] = "NO_DATA"
+
+                except PrometheusProviderError as e:
+                    result["error"] = str(e)
+                    result["status"] = "ERROR"
+            else:
+                result["error"] = "No query defined in SLO indicator"
+                result["status"] = "NO_QUERY"
 
-        results.append(result)
+            results.append(result)
 
     return results
 
@@ -4,15 +4,22 @@ Validate command.
 
 from __future__ import annotations
 
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 from nthlayer.cli.ux import console, error, header, success, warning
 from nthlayer.specs.validator import validate_service_file
 
+if TYPE_CHECKING:
+    from nthlayer.specs.templates import TemplateRegistry
+
 
 def validate_command(
     service_file: str,
     environment: str | None = None,
     strict: bool = False,
     registry_dir: str | None = None,
+    watch: bool = False,
 ) -> int:
     """
     Validate service definition file.
@@ -22,10 +29,63 @@ def validate_command(
         environment: Optional environment name (dev, staging, prod)
         strict: Treat warnings as errors
         registry_dir: Optional directory to scan for contract registry
+        watch: Keep running and re-validate whenever the inputs change
 
     Returns:
         Exit code (0 = valid, 1 = invalid)
     """
+    if watch:
+        return validate_watch_command(service_file, environment, strict, registry_dir)
+    return _validate(service_file, environment, strict, registry_dir)
+
+
+def validate_watch_command(
+    service_file: str,
+    environment: str | None = None,
+    strict: bool = False,
+    registry_dir: str | None = None,
+    max_runs: int | None = None,
+) -> int:
+    """
+    Validate a service file, then re-validate after every change.
+
+    The service file, its environment overrides, the custom template
+    directory and the contract registry directory are watched; templates
+    stay loaded between runs.
+
+    Returns:
+        Exit code of the last run
+    """
+    from nthlayer.watch import FileWatcher, WarmTemplates, watch, watch_roots
+
+    roots = watch_roots(Path(service_file))
+    if registry_dir:
+        roots.append(Path(registry_dir))
+    warm = WarmTemplates()
+
+    def run(changed: set[Path]) -> int:
+        if changed:
+            console.print()
+        return _validate(
+            service_file, environment, strict, registry_dir, template_registry=warm.refresh(changed)
+        )
+
+    def waiting() -> None:
+        console.print(
+            f"[bold]Watching {service_file} for changes[/bold] [dim](Ctrl+C to stop)[/dim]"
+        )
+
+    return watch(run, FileWatcher(roots), max_runs=max_runs, on_wait=waiting)
+
+
+def _validate(
+    service_file: str,
+    environment: str | None,
+    strict: bool,
+    registry_dir: str | None,
+    template_registry: TemplateRegistry | None = None,
+) -> int:
+    """Validate once and print the report."""
     header("Validate Service Definition")
     console.print()
 
@@ -47,6 +107,7 @@ def validate_command(
         environment=environment,
         strict=strict,
         contract_registry=contract_registry,
+        template_registry=template_registry,
     )
 
     if result.valid:
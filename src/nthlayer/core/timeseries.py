@@ -0,0 +1,261 @@
+"""
+Columnar time series for SLI and error budget samples.
+
+A ``TimeSeries`` holds samples as two NumPy arrays - int64 epoch
+milliseconds and float64 values - instead of one dict (with a
+``datetime`` and a parsed float) per sample. Series are built straight
+from the Prometheus ``values`` matrix and consumed with vectorized math
+by the error budget calculator, drift analysis and the alert pipeline.
+
+The list-of-dicts shape returned by ``get_sli_time_series`` and the
+``(datetime, value)`` pairs used by drift analysis remain available
+through ``from_records``/``to_records`` and ``from_pairs``/``to_pairs``.
+
+Timestamps follow the conventions of the code that produced them: naive
+datetimes are interpreted as local time, exactly as ``datetime.timestamp``
+and ``datetime.fromtimestamp`` do.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+# Assumed duration of the last sample when no step is known
+DEFAULT_STEP_SECONDS = 300.0
+
+
+def to_epoch_ms(timestamp: datetime) -> int:
+    """Convert a datetime to epoch milliseconds."""
+    return round(timestamp.timestamp() * 1000)
+
+
+def local_weekdays(timestamps_ms: np.ndarray) -> np.ndarray:
+    """
+    Local day of week (Monday is 0) of epoch-millisecond timestamps.
+
+    Same result as ``datetime.fromtimestamp(ts / 1000).weekday()``
+    without building a datetime per sample: the local UTC offset is looked
+    up once per UTC day, and per sample only on days with a DST change.
+    Accepts arrays of any shape.
+    """
+    seconds = np.floor_divide(timestamps_ms, 1000).astype(np.int64)
+    days = np.floor_divide(seconds, 86400)
+    offsets = np.empty_like(seconds)
+    for day in np.unique(days).tolist():
+        in_day = days == day
+        first = time.localtime(day * 86400).tm_gmtoff
+        if first == time.localtime(day * 86400 + 86399).tm_gmtoff:
+            offsets[in_day] = first
+        else:
+            offsets[in_day] = [time.localtime(ts).tm_gmtoff for ts in seconds[in_day].tolist()]
+
+    # 1970-01-01 was a Thursday
+    return (np.floor_divide(seconds + offsets, 86400) + 3) % 7
+
+
+@dataclass(frozen=True, eq=False)
+class TimeSeries:
+    """
+    Samples of one series in columnar form.
+
+    Attributes:
+        timestamps_ms: int64 epoch milliseconds
+        values: float64 sample values
+        durations: float64 seconds each sample covers, NaN where unknown
+            (None when no sample carries an explicit duration)
+        step_seconds: Query resolution, used as the last sample's duration
+    """
+
+    timestamps_ms: np.ndarray
+    values: np.ndarray
+    durations: np.ndarray | None = None
+    step_seconds: float = DEFAULT_STEP_SECONDS
+
+    @classmethod
+    def empty(cls, step_seconds: float = DEFAULT_STEP_SECONDS) -> TimeSeries:
+        return cls(
+            np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64), step_seconds=step_seconds
+        )
+
+    @classmethod
+    def from_prometheus(
+        cls,
+        values: Sequence[Sequence[Any]],
+        step_seconds: float = DEFAULT_STEP_SECONDS,
+    ) -> TimeSeries:
+        """
+        Build a series from a Prometheus ``values`` list of ``[ts, "value"]``.
+
+        Malformed pairs are skipped.
+        """
+        pairs = [pair for pair in values if len(pair) >= 2]
+        seconds = np.fromiter((float(p[0]) for p in pairs), dtype=np.float64, count=len(pairs))
+        samples = np.fromiter((float(p[1]) for p in pairs), dtype=np.float64, count=len(pairs))
+        return cls(
+            np.rint(seconds * 1000).astype(np.int64),
+            samples,
+            step_seconds=step_seconds,
+        )
+
+    @classmethod
+    def from_query_range(
+        cls,
+        response: Mapping[str, Any],
+        step_seconds: float = DEFAULT_STEP_SECONDS,
+    ) -> TimeSeries:
+        """Build a series from the first series of a range query response."""
+        result = response.get("data", {}).get("result", [])
+        if not result:
+            return cls.empty(step_seconds)
+        return cls.from_prometheus(result[0].get("values", []), step_seconds)
+
+    @classmethod
+    def group_query_range(
+        cls,
+        response: Mapping[str, Any],
+        label: str,
+        step_seconds: float = DEFAULT_STEP_SECONDS,
+    ) -> dict[str, TimeSeries]:
+        """
+        Split a range query response into one series per value of ``label``.
+
+        Series without the label are skipped; when several series share a
+        value, the first one wins.
+        """
+        grouped: dict[str, TimeSeries] = {}
+        for series in response.get("data", {}).get("result", []):
+            key = series.get("metric", {}).get(label)
+            if key is not None and key not in grouped:
+                grouped[key] = cls.from_prometheus(series.get("values", []), step_seconds)
+        return grouped
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping[str, Any]],
+        step_seconds: float = DEFAULT_STEP_SECONDS,
+    ) -> TimeSeries:
+        """Build a series from ``{timestamp, sli_value, duration_seconds?}`` dicts."""
+        records = list(records)
+        timestamps = np.fromiter(
+            (to_epoch_ms(r["timestamp"]) for r in records), dtype=np.int64, count=len(records)
+        )
+        samples = np.fromiter(
+            (float(r["sli_value"]) for r in records), dtype=np.float64, count=len(records)
+        )
+
+        durations = None
+        if any("duration_seconds" in r for r in records):
+            durations = np.fromiter(
+                (float(r.get("duration_seconds", np.nan)) for r in records),
+                dtype=np.float64,
+                count=len(records),
+            )
+        return cls(timestamps, samples, durations, step_seconds)
+
+    @classmethod
+    def from_pairs(
+        cls,
+        pairs: Iterable[tuple[datetime, float]],
+        step_seconds: float = DEFAULT_STEP_SECONDS,
+    ) -> TimeSeries:
+        """Build a series from ``(datetime, value)`` pairs."""
+        pairs = list(pairs)
+        timestamps = np.fromiter(
+            (to_epoch_ms(ts) for ts, _ in pairs), dtype=np.int64, count=len(pairs)
+        )
+        samples = np.fromiter((float(v) for _, v in pairs), dtype=np.float64, count=len(pairs))
+        return cls(timestamps, samples, step_seconds=step_seconds)
+
+    def __len__(self) -> int:
+        return len(self.timestamps_ms)
+
+    @property
+    def seconds(self) -> np.ndarray:
+        """Timestamps as float64 epoch seconds."""
+        return self.timestamps_ms / 1000.0
+
+    def sorted(self) -> TimeSeries:
+        """Return the series ordered by timestamp (stable for ties)."""
+        if len(self) < 2 or bool(np.all(self.timestamps_ms[1:] >= self.timestamps_ms[:-1])):
+            return self
+
+        order = np.argsort(self.timestamps_ms, kind="stable")
+        return TimeSeries(
+            self.timestamps_ms[order],
+            self.values[order],
+            None if self.durations is None else self.durations[order],
+            self.step_seconds,
+        )
+
+    def duration_seconds(self) -> np.ndarray:
+        """
+        Seconds covered by each sample.
+
+        Explicit durations win; otherwise a sample lasts until the next one,
+        and the last sample lasts one step. Assumes the series is sorted.
+        """
+        derived = np.empty(len(self), dtype=np.float64)
+        if len(self):
+            derived[:-1] = np.diff(self.timestamps_ms) / 1000.0
+            derived[-1] = self.step_seconds
+
+        if self.durations is None:
+            return derived
+        return np.where(np.isnan(self.durations), derived, self.durations)
+
+    def mask_between(self, start: datetime, end: datetime) -> np.ndarray:
+        """Boolean mask of samples with ``start <= timestamp <= end``."""
+        return (self.timestamps_ms >= to_epoch_ms(start)) & (self.timestamps_ms <= to_epoch_ms(end))
+
+    def weekdays(self) -> np.ndarray:
+        """Local day of week of each sample (Monday is 0)."""
+        return local_weekdays(self.timestamps_ms)
+
+    def datetimes(self) -> list[datetime]:
+        """Timestamps as naive local datetimes."""
+        return [datetime.fromtimestamp(ts / 1000.0) for ts in self.timestamps_ms.tolist()]
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """Return the list-of-dicts form used by ``get_sli_time_series``."""
+        return [
+            {"timestamp": ts, "sli_value": value, "duration_seconds": duration}
+            for ts, value, duration in zip(
+                self.datetimes(),
+                self.values.tolist(),
+                self.duration_seconds().tolist(),
+                strict=True,
+            )
+        ]
+
+    def to_pairs(self) -> list[tuple[datetime, float]]:
+        """Return ``(datetime, value)`` pairs."""
+        return list(zip(self.datetimes(), self.values.tolist(), strict=True))
+
+
+def as_time_series(
+    data: TimeSeries | Iterable[Mapping[str, Any]] | Iterable[tuple[datetime, float]],
+    step_seconds: float = DEFAULT_STEP_SECONDS,
+) -> TimeSeries:
+    """
+    Coerce samples into a ``TimeSeries``.
+
+    Accepts a ``TimeSeries`` (returned as is), measurement dicts with
+    ``timestamp``/``sli_value`` keys, or ``(datetime, value)`` pairs.
+    """
+    if isinstance(data, TimeSeries):
+        return data
+
+    # Samples are all dicts or all pairs; the first one tells which
+    items: list[Any] = list(data)
+    if not items:
+        return TimeSeries.empty(step_seconds)
+    if isinstance(items[0], Mapping):
+        return TimeSeries.from_records(items, step_seconds)
+    return TimeSeries.from_pairs(items, step_seconds)
@@ -121,6 +121,8 @@ class ErrorBudgetModel(Base):
     slo_breach_burn_minutes: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="healthy")
     burn_rate: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    # Last SLI sample included in burned_minutes (incremental collection)
+    evaluated_through: Mapped[datetime | None] = mapped_column(DateTime)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
     )
@@ -128,6 +130,7 @@ class ErrorBudgetModel(Base):
     __table_args__ = (
         Index("idx_error_budgets_service_period", "service", "period_start", "period_end"),
         Index("idx_error_budgets_slo_period", "slo_id", "period_start"),
+        Index("idx_error_budgets_slo_updated", "slo_id", "updated_at"),
     )
 
 
@@ -142,6 +145,8 @@ class SLOHistoryModel(Base):
     )
     service: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    # None for raw measurements; bucket size (e.g. "1h") for aggregated burn rows
+    resolution: Mapped[str | None] = mapped_column(String(10))
     sli_value: Mapped[float] = mapped_column(Float, nullable=False)
     target_value: Mapped[float] = mapped_column(Float, nullable=False)
     compliant: Mapped[bool] = mapped_column(Boolean, nullable=False)
@@ -152,6 +157,7 @@ class SLOHistoryModel(Base):
     __table_args__ = (
         Index("idx_slo_history_slo_timestamp", "slo_id", "timestamp"),
         Index("idx_slo_history_service_timestamp", "service", "timestamp"),
+        Index("idx_slo_history_slo_resolution_timestamp", "slo_id", "resolution", "timestamp"),
     )
 
 
@@ -11,53 +11,22 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import importlib
 import os
 import sys
+from collections.abc import Collection
+from dataclasses import dataclass
 from importlib.metadata import version as get_version
-from typing import Any, Sequence
+from typing import TYPE_CHECKING, Any, Sequence
 
 import structlog
 import yaml
 
 from nthlayer.alerts import AlertTemplateLoader
 from nthlayer.alerts.models import AlertRule
-from nthlayer.cli.alerts import handle_alerts_command, register_alerts_parser
-from nthlayer.cli.blast_radius import (
-    handle_blast_radius_command,
-    register_blast_radius_parser,
-)
-from nthlayer.cli.deps import handle_deps_command, register_deps_parser
-from nthlayer.cli.drift import handle_drift_command, register_drift_parser
-from nthlayer.cli.generate_loki import handle_loki_command, register_loki_parser
-from nthlayer.cli.identity import handle_identity_command, register_identity_parser
-from nthlayer.cli.migrate import handle_migrate_command, register_migrate_parser
-from nthlayer.cli.ownership import handle_ownership_command, register_ownership_parser
-from nthlayer.cli.portfolio import handle_portfolio_command, register_portfolio_parser
-from nthlayer.cli.recommend_metrics import (
-    handle_recommend_metrics_command,
-    register_recommend_metrics_parser,
-)
-from nthlayer.cli.scorecard import (
-    handle_scorecard_command,
-    register_scorecard_parser,
-)
-from nthlayer.cli.setup import handle_setup_command, register_setup_parser
-from nthlayer.cli.slo import handle_slo_command, register_slo_parser
-from nthlayer.cli.ux import print_banner
-from nthlayer.cli.validate_metadata import (
-    handle_validate_metadata_command,
-    register_validate_metadata_parser,
-)
-from nthlayer.cli.validate_slo import (
-    handle_validate_slo_command,
-    register_validate_slo_parser,
-)
-from nthlayer.cli.validate_spec import (
-    handle_validate_spec_command,
-    register_validate_spec_parser,
-)
-from nthlayer.cli.verify import handle_verify_command, register_verify_parser
-from nthlayer.providers.grafana import GrafanaProvider, GrafanaProviderError
+
+if TYPE_CHECKING:
+    from nthlayer.providers.grafana import GrafanaProvider
 
 # Version from package metadata (single source of truth: pyproject.toml)
 __version__ = get_version("nthlayer")
@@ -68,6 +37,158 @@ DEFAULT_GRAFANA_URL = os.environ.get("NTHLAYER_GRAFANA_BASE_URL", "http://localh
 DEFAULT_GRAFANA_TOKEN = os.environ.get("NTHLAYER_GRAFANA_TOKEN")
 
 
+@dataclass(frozen=True)
+class Subcommand:
+    """
+    A subcommand whose parser and handler live in their own module.
+
+    The module is imported only when the subcommand is dispatched (or a full
+    parser is requested), so ``nthlayer --help`` and cheap commands do not
+    pay for the dependencies of every other command.
+    """
+
+    name: str
+    module: str
+    register: str
+    handler: str
+    help: str
+
+    def register_parser(self, subparsers: Any) -> None:
+        getattr(importlib.import_module(self.module), self.register)(subparsers)
+
+    def add_stub(self, subparsers: Any) -> None:
+        """Add a placeholder entry so the command is listed in ``--help``."""
+        subparsers.add_parser(self.name, help=self.help, add_help=False)
+
+    def handle(self, args: argparse.Namespace) -> int:
+        return getattr(importlib.import_module(self.module), self.handler)(args)
+
+
+SUBCOMMANDS = (
+    Subcommand(
+        "slo",
+        "nthlayer.cli.slo",
+        "register_slo_parser",
+        "handle_slo_command",
+        "SLO and error budget commands",
+    ),
+    Subcommand(
+        "portfolio",
+        "nthlayer.cli.portfolio",
+        "register_portfolio_parser",
+        "handle_portfolio_command",
+        "View SLO portfolio health across all services",
+    ),
+    Subcommand(
+        "setup",
+        "nthlayer.cli.setup",
+        "register_setup_parser",
+        "handle_setup_command",
+        "Interactive first-time setup wizard",
+    ),
+    Subcommand(
+        "verify",
+        "nthlayer.cli.verify",
+        "register_verify_parser",
+        "handle_verify_command",
+        "Verify declared metrics exist in Prometheus (contract verification)",
+    ),
+    Subcommand(
+        "generate-loki-alerts",
+        "nthlayer.cli.generate_loki",
+        "register_loki_parser",
+        "handle_loki_command",
+        "Generate Loki LogQL alert rules for a service",
+    ),
+    Subcommand(
+        "validate-metadata",
+        "nthlayer.cli.validate_metadata",
+        "register_validate_metadata_parser",
+        "handle_validate_metadata_command",
+        "Validate Prometheus rule metadata (labels, annotations, URLs)",
+    ),
+    Subcommand(
+        "validate-spec",
+        "nthlayer.cli.validate_spec",
+        "register_validate_spec_parser",
+        "handle_validate_spec_command",
+        "Validate service.yaml against OPA policies",
+    ),
+    Subcommand(
+        "drift",
+        "nthlayer.cli.drift",
+        "register_drift_parser",
+        "handle_drift_command",
+        "Analyze reliability drift for a service",
+    ),
+    Subcommand(
+        "deps",
+        "nthlayer.cli.deps",
+        "register_deps_parser",
+        "handle_deps_command",
+        "Show service dependencies",
+    ),
+    Subcommand(
+        "blast-radius",
+        "nthlayer.cli.blast_radius",
+        "register_blast_radius_parser",
+        "handle_blast_radius_command",
+        "Calculate deployment blast radius",
+    ),
+    Subcommand(
+        "ownership",
+        "nthlayer.cli.ownership",
+        "register_ownership_parser",
+        "handle_ownership_command",
+        "Show service ownership attribution",
+    ),
+    Subcommand(
+        "identity",
+        "nthlayer.cli.identity",
+        "register_identity_parser",
+        "handle_identity_command",
+        "Service identity resolution and management",
+    ),
+    Subcommand(
+        "validate-slo",
+        "nthlayer.cli.validate_slo",
+        "register_validate_slo_parser",
+        "handle_validate_slo_command",
+        "Validate SLO metrics exist in Prometheus",
+    ),
+    Subcommand(
+        "recommend-metrics",
+        "nthlayer.cli.recommend_metrics",
+        "register_recommend_metrics_parser",
+        "handle_recommend_metrics_command",
+        "Generate metric recommendations based on service type",
+    ),
+    Subcommand(
+        "scorecard",
+        "nthlayer.cli.scorecard",
+        "register_scorecard_parser",
+        "handle_scorecard_command",
+        "Display reliability scorecard with weighted scores",
+    ),
+    Subcommand(
+        "alerts",
+        "nthlayer.cli.alerts",
+        "register_alerts_parser",
+        "handle_alerts_command",
+        "Evaluate, simulate, and explain alert rules",
+    ),
+    Subcommand(
+        "migrate",
+        "nthlayer.cli.migrate",
+        "register_migrate_parser",
+        "handle_migrate_command",
+        "Migrate legacy NthLayer service.yaml to OpenSRM format",
+    ),
+)
+
+_SUBCOMMANDS_BY_NAME = {command.name: command for command in SUBCOMMANDS}
+
+
 def _default_org_id() -> int | None:
     raw = os.environ.get("NTHLAYER_GRAFANA_ORG_ID")
     if raw is None:
@@ -285,6 +406,8 @@ def _serialize_plan(plan_changes: list[Any]) -> list[dict[str, Any]]:
 async def _plan_and_apply(
     resource: Any, desired_state: dict[str, Any], *, idempotency_key: str | None
 ) -> dict[str, Any]:
+    from nthlayer.providers.grafana import GrafanaProviderError
+
     plan = await resource.plan(desired_state)
     outcome = {
         "changes": _serialize_plan(plan.changes),
@@ -397,6 +520,8 @@ async def demo_grafana(
     else:
         print("Authentication: (none provided)")
 
+    from nthlayer.providers.grafana import GrafanaProvider
+
     provider = GrafanaProvider(
         base_url,
         token,
@@ -426,7 +551,15 @@ async def demo_grafana(
             print("ℹ️ Apply skipped")
 
 
-def build_parser() -> argparse.ArgumentParser:
+def build_parser(commands: Collection[str] | None = None) -> argparse.ArgumentParser:
+    """
+    Build the ``nthlayer`` argument parser.
+
+    Args:
+        commands: Names of ``SUBCOMMANDS`` whose full parsers are needed; the
+            rest are listed in help without importing their modules. None
+            builds every parser.
+    """
     from rich_argparse import RichHelpFormatter
 
     parser = argparse.ArgumentParser(
@@ -444,7 +577,14 @@ def build_parser() -> argparse.ArgumentParser:
         "plan", help="Preview what resources would be generated (dry-run)"
     )
     plan_parser.add_argument("service_yaml", help="Path to service YAML file")
-    plan_parser.add_argument("--env", help="Environment (dev, staging, prod)")
+    plan_parser.add_argument(
+        "--env", help="Environment (dev, staging, prod), or a comma-separated list"
+    )
+    plan_parser.add_argument(
+        "--all-envs",
+        action="store_true",
+        help="Render every environment that has an override file",
+    )
     plan_parser.add_argument(
         "--format",
         "-f",
@@ -463,8 +603,17 @@ def build_parser() -> argparse.ArgumentParser:
 
     # apply command (unified generation)
     apply_parser = subparsers.add_parser("apply", help="Generate all resources for a service")
-    apply_parser.add_argument("service_yaml", help="Path to service YAML file")
-    apply_parser.add_argument("--env", help="Environment (dev, staging, prod)")
+    apply_parser.add_argument(
+        "service_yaml", help="Path to service YAML file, or a directory of service manifests"
+    )
+    apply_parser.add_argument(
+        "--env", help="Environment (dev, staging, prod), or a comma-separated list"
+    )
+    apply_parser.add_argument(
+        "--all-envs",
+        action="store_true",
+        help="Render every environment that has an override file",
+    )
     apply_parser.add_argument("--output-dir", help="Output directory for generated files")
     apply_parser.add_argument(
         "--dry-run", action="store_true", help="Preview without writing files"
@@ -500,6 +649,22 @@ def build_parser() -> argparse.ArgumentParser:
         "-p",
         help="Prometheus URL for metric discovery (or set NTHLAYER_PROMETHEUS_URL)",
     )
+    apply_parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run independent generators concurrently",
+    )
+    apply_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Worker processes when applying a directory (default: CPU count)",
+    )
+    apply_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-apply when service files, overrides or templates change",
+    )
 
     # === EXISTING COMMANDS ===
 
@@ -518,7 +683,15 @@ def build_parser() -> argparse.ArgumentParser:
         help="Output format",
     )
     generate_parser.add_argument(
-        "--env", "--environment", dest="environment", help="Environment name (dev, staging, prod)"
+        "--env",
+        "--environment",
+        dest="environment",
+        help="Environment name (dev, staging, prod), or a comma-separated list",
+    )
+    generate_parser.add_argument(
+        "--all-envs",
+        action="store_true",
+        help="Render every environment that has an override file",
     )
     generate_parser.add_argument(
         "--auto-env",
@@ -595,6 +768,11 @@ def build_parser() -> argparse.ArgumentParser:
         "--registry-dir",
         help="Directory to scan for contract registry (enables cross-service validation)",
     )
+    validate_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-validate when the service file, overrides or templates change",
+    )
 
     lint_parser = subparsers.add_parser("lint", help="Lint Prometheus alert rules with pint")
     lint_parser.add_argument("file_path", help="Path to alerts YAML file or directory")
@@ -654,6 +832,27 @@ def build_parser() -> argparse.ArgumentParser:
         "--drift-window",
         help="Drift analysis window (e.g., 30d, 14d). Uses tier default if not specified",
     )
+    deploy_parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Max concurrent SLO queries (or use NTHLAYER_QUERY_CONCURRENCY, default: 8)",
+    )
+    deploy_parser.add_argument(
+        "--query-timeout",
+        type=float,
+        help="Per-query timeout in seconds (or use NTHLAYER_QUERY_TIMEOUT, default: 30)",
+    )
+    deploy_parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="SLI queries merged per request, 1 disables batching "
+        "(or use NTHLAYER_QUERY_BATCH_SIZE, default: 20)",
+    )
+    deploy_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the Prometheus query cache (or set NTHLAYER_QUERY_CACHE=off)",
+    )
 
     init_parser = subparsers.add_parser("init", help="Initialize new NthLayer service")
     init_parser.add_argument(
@@ -816,61 +1015,18 @@ def build_parser() -> argparse.ArgumentParser:
     prom_parser.add_argument("--technology", default="postgres")
     prom_parser.add_argument("--limit", type=int, default=3)
 
-    # SLO commands (new unified interface)
-    register_slo_parser(subparsers)
-
-    # Portfolio command
-    register_portfolio_parser(subparsers)
-
-    # Setup command
-    register_setup_parser(subparsers)
-
-    # Verify command (contract verification)
-    register_verify_parser(subparsers)
-
-    # Loki alerts command
-    register_loki_parser(subparsers)
-
-    # Validate metadata command
-    register_validate_metadata_parser(subparsers)
-
-    # Validate spec command (conftest/OPA)
-    register_validate_spec_parser(subparsers)
-
-    # Drift detection command
-    register_drift_parser(subparsers)
-
-    # Dependency discovery commands
-    register_deps_parser(subparsers)
-    register_blast_radius_parser(subparsers)
-
-    # Ownership command
-    register_ownership_parser(subparsers)
-
-    # Identity command
-    register_identity_parser(subparsers)
-
-    # Validate SLO command
-    register_validate_slo_parser(subparsers)
-
-    # Recommend metrics command
-    register_recommend_metrics_parser(subparsers)
-
-    # Scorecard command
-    register_scorecard_parser(subparsers)
-
-    # Alert evaluation commands
-    register_alerts_parser(subparsers)
-
-    # Migrate command (legacy to OpenSRM)
-    register_migrate_parser(subparsers)
+    for command in SUBCOMMANDS:
+        if commands is None or command.name in commands:
+            command.register_parser(subparsers)
+        else:
+            command.add_stub(subparsers)
 
     return parser
 
 
 def _print_welcome() -> None:
     """Print styled welcome message for first-time users."""
-    from nthlayer.cli.ux import console
+    from nthlayer.cli.ux import console, print_banner
 
     print_banner()
     console.print(f"  [muted]Version: {__version__}[/muted]")
@@ -897,12 +1053,21 @@ def _print_welcome() -> None:
     console.print()
 
 
+def _requested_command(argv: Sequence[str]) -> str | None:
+    """Return the subcommand named on the command line, if any."""
+    return next((arg for arg in argv if not arg.startswith("-")), None)
+
+
 def main(argv: Sequence[str] | None = None) -> None:
-    parser = build_parser()
+    argv = sys.argv[1:] if argv is None else list(argv)
+    command = _requested_command(argv)
+    parser = build_parser(commands=[command] if command else [])
     args = parser.parse_args(argv)
 
     # Show version with banner
     if args.version:
+        from nthlayer.cli.ux import print_banner
+
         print_banner()
         print(f"nthlayer version {__version__}")
         return
@@ -923,6 +1088,7 @@ def main(argv: Sequence[str] | None = None) -> None:
                 output_format=args.format,
                 output_file=args.output,
                 verbose=args.verbose,
+                all_envs=getattr(args, "all_envs", False),
             )
         )
 
@@ -947,6 +1113,10 @@ def main(argv: Sequence[str] | None = None) -> None:
                 push_ruler=getattr(args, "push_ruler", False),
                 lint=args.lint,
                 prometheus_url=prom_url,
+                parallel=getattr(args, "parallel", False),
+                jobs=getattr(args, "jobs", None),
+                watch=getattr(args, "watch", False),
+                all_envs=getattr(args, "all_envs", False),
             )
         )
 
@@ -967,6 +1137,7 @@ def main(argv: Sequence[str] | None = None) -> None:
                 format=args.format,
                 environment=env,
                 dry_run=args.dry_run,
+                all_envs=getattr(args, "all_envs", False),
             )
         )
 
@@ -1029,6 +1200,7 @@ def main(argv: Sequence[str] | None = None) -> None:
                 environment=env,
                 strict=args.strict,
                 registry_dir=getattr(args, "registry_dir", None),
+                watch=getattr(args, "watch", False),
             )
         )
 
@@ -1063,8 +1235,12 @@ def main(argv: Sequence[str] | None = None) -> None:
 
     if args.command == "check-deploy":
         from nthlayer.cli.deploy import check_deploy_command
+        from nthlayer.providers.query_cache import disable_query_cache
         from nthlayer.specs.environment_detection import get_environment
 
+        if getattr(args, "no_cache", False):
+            disable_query_cache()
+
         env = get_environment(
             explicit_env=getattr(args, "environment", None),
             auto_detect=getattr(args, "auto_env", False),
@@ -1079,6 +1255,9 @@ def main(argv: Sequence[str] | None = None) -> None:
                 demo_blocked=getattr(args, "demo_blocked", False),
                 include_drift=getattr(args, "include_drift", False),
                 drift_window=getattr(args, "drift_window", None),
+                concurrency=getattr(args, "concurrency", None),
+                query_timeout=getattr(args, "query_timeout", None),
+                batch_size=getattr(args, "batch_size", None),
             )
         )
 
@@ -1244,55 +1423,8 @@ def main(argv: Sequence[str] | None = None) -> None:
         demo_prometheus_alerts(args.technology, args.limit)
         return
 
-    if args.command == "slo":
-        sys.exit(handle_slo_command(args))
-
-    if args.command == "portfolio":
-        sys.exit(handle_portfolio_command(args))
-
-    if args.command == "setup":
-        sys.exit(handle_setup_command(args))
-
-    if args.command == "verify":
-        sys.exit(handle_verify_command(args))
-
-    if args.command == "generate-loki-alerts":
-        sys.exit(handle_loki_command(args))
-
-    if args.command == "validate-metadata":
-        sys.exit(handle_validate_metadata_command(args))
-
-    if args.command == "validate-spec":
-        sys.exit(handle_validate_spec_command(args))
-
-    if args.command == "drift":
-        sys.exit(handle_drift_command(args))
-
-    if args.command == "deps":
-        sys.exit(handle_deps_command(args))
-
-    if args.command == "blast-radius":
-        sys.exit(handle_blast_radius_command(args))
-
-    if args.command == "ownership":
-        sys.exit(handle_ownership_command(args))
-
-    if args.command == "identity":
-        sys.exit(handle_identity_command(args))
-
-    if args.command == "validate-slo":
-        sys.exit(handle_validate_slo_command(args))
-
-    if args.command == "recommend-metrics":
-        sys.exit(handle_recommend_metrics_command(args))
-
-    if args.command == "scorecard":
-        sys.exit(handle_scorecard_command(args))
-
-    if args.command == "alerts":
-        sys.exit(handle_alerts_command(args))
-
-    if args.command == "migrate":
-        sys.exit(handle_migrate_command(args))
+    subcommand = _SUBCOMMANDS_BY_NAME.get(args.command)
+    if subcommand is not None:
+        sys.exit(subcommand.handle(args))
 
     parser.print_help()
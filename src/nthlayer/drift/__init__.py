@@ -31,6 +31,7 @@ from nthlayer.drift.models import (
     get_drift_defaults,
 )
 from nthlayer.drift.patterns import PatternDetector
+from nthlayer.drift.state import DriftState, DriftStateStore
 
 __all__ = [
     # Main analyzer
@@ -44,6 +45,9 @@ __all__ = [
     "DriftPattern",
     # Pattern detection
     "PatternDetector",
+    # Incremental analysis
+    "DriftState",
+    "DriftStateStore",
     # Configuration
     "DRIFT_DEFAULTS",
     "get_drift_defaults",
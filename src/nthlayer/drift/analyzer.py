@@ -3,17 +3,21 @@ Core drift analysis logic.
 
 Analyzes SLO drift over time using Prometheus range queries,
 calculating trends, projections, and severity classifications.
+``analyze_many`` fits the trends of a whole fleet as 2D arrays
+(``fit_trends``) rather than one ``linregress`` per series.
 """
 
 from __future__ import annotations
 
 import re
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 from typing import Any
 
 import numpy as np
 from scipy import stats
 
+from nthlayer.core.timeseries import TimeSeries, as_time_series, to_epoch_ms
 from nthlayer.drift.models import (
     DriftMetrics,
     DriftPattern,
@@ -23,6 +27,50 @@ from nthlayer.drift.models import (
     get_drift_defaults,
 )
 from nthlayer.drift.patterns import PatternDetector
+from nthlayer.drift.state import DriftState, DriftStateStore
+
+# Error budget remaining per service and SLO, recorded by the generated rules
+BUDGET_METRIC = "slo:error_budget_remaining:ratio"
+
+# Resolution of budget history queries
+HISTORY_STEP_SECONDS = 3600
+
+
+def fit_trends(
+    timestamps_ms: np.ndarray,
+    values: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Least-squares linear trend of many equal-length series at once.
+
+    Closed-form equivalent of ``scipy.stats.linregress`` per row, with
+    time measured in seconds from each row's first sample.
+
+    Args:
+        timestamps_ms: Epoch milliseconds, one row per series
+        values: Sample values, same shape as ``timestamps_ms``
+
+    Returns:
+        Tuple of (slope_per_second, intercept, r_squared) arrays. The slope
+        is NaN for a row whose timestamps are all identical.
+    """
+    x = (timestamps_ms - timestamps_ms[:, :1]) / 1000.0
+    x_mean = x.mean(axis=1)
+    y_mean = values.mean(axis=1)
+    dx = x - x_mean[:, None]
+    dy = values - y_mean[:, None]
+    ss_x = (dx * dx).mean(axis=1)
+    ss_y = (dy * dy).mean(axis=1)
+    ss_xy = (dx * dy).mean(axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slope = np.where(ss_x > 0, ss_xy / ss_x, np.nan)
+        r = np.clip(ss_xy / np.sqrt(ss_x * ss_y), -1.0, 1.0)
+    # As in linregress: r is 0 when either spread is zero, NaN if the covariance is too
+    degenerate = (ss_x == 0) | (ss_y == 0)
+    r = np.where(degenerate, np.where(ss_xy == 0, np.nan, 0.0), r)
+
+    intercept = y_mean - slope * x_mean
+    return slope, intercept, r**2
 
 
 class DriftAnalysisError(Exception):
@@ -99,10 +147,206 @@ class DriftAnalyzer:
 
         # Query Prometheus for budget history
         try:
-            data = await self._query_budget_history(service_name, analysis_window, slo)
+            history = await self._query_budget_history(service_name, analysis_window, slo)
+        except Exception as e:
+            raise DriftAnalysisError(f"Failed to query Prometheus: {e}") from e
+
+        return self._analyze_history(
+            history,
+            service_name=service_name,
+            tier=tier,
+            slo=slo,
+            window=analysis_window,
+            thresholds=analysis_thresholds,
+            projection_config=analysis_projection,
+            config=config,
+        )
+
+    async def analyze_incremental(
+        self,
+        service_name: str,
+        tier: str,
+        store: DriftStateStore,
+        slo: str = "availability",
+        window: str | None = None,
+    ) -> DriftResult:
+        """Analyze drift, updating the persisted state with new samples only.
+
+        The first run (or a run after the window configuration changed, or
+        after the stored samples fell out of the window) fetches the full
+        window like ``analyze``. Later runs fetch only the samples recorded
+        since the newest stored one, add them to the ``DriftState`` and expire
+        samples that left the window. Uses the tier's drift defaults.
+
+        Args:
+            service_name: Name of the service
+            tier: Service tier (critical, standard, low)
+            store: Where the state is loaded from and saved to
+            slo: SLO name (default: availability)
+            window: Analysis window. Uses tier default if not specified
+
+        Returns:
+            DriftResult with analysis
+        """
+        config = get_drift_defaults(tier)
+        analysis_window = window or config["window"]
+        window_seconds = self._parse_duration(analysis_window).total_seconds()
+        step_threshold = self._get_pattern_detector(config).step_change_threshold
+
+        end = datetime.now()
+        start = end - timedelta(seconds=window_seconds)
+        cutoff_ms = to_epoch_ms(start)
+
+        state = store.load(service_name, slo)
+        last_ms = state.last_timestamp_ms if state is not None else None
+        if state is None or last_ms is None or last_ms < cutoff_ms:
+            state = DriftState(service_name, slo, window_seconds, step_threshold)
+        elif not state.matches(window_seconds, step_threshold):
+            state = DriftState(service_name, slo, window_seconds, step_threshold)
+        else:
+            # Continue on the step grid of the stored samples
+            start = datetime.fromtimestamp(last_ms / 1000 + HISTORY_STEP_SECONDS)
+
+        try:
+            if start <= end:
+                state.extend(
+                    await self._fetch_budget_history(
+                        service_name, start, end, slo, f"{HISTORY_STEP_SECONDS}s"
+                    )
+                )
+        except Exception as e:
+            raise DriftAnalysisError(f"Failed to query Prometheus: {e}") from e
+
+        state.expire(cutoff_ms)
+        if len(state) < 2:
+            raise DriftAnalysisError(
+                f"Insufficient data points for {service_name}/{slo}. "
+                f"Need at least 2 data points, got {len(state)}"
+            )
+        store.save(state)
+
+        try:
+            slope_per_second, _, r_squared = state.fit()
+        except ValueError as e:
+            raise DriftAnalysisError(f"Cannot fit trend for {service_name}/{slo}: {e}") from e
+        pattern = self._get_pattern_detector(config).classify(
+            state.step_change, state.variance, slope_per_second, r_squared
+        )
+
+        return self._build_result(
+            state.series(),
+            service_name=service_name,
+            tier=tier,
+            slo=slo,
+            window=analysis_window,
+            thresholds=config["thresholds"],
+            projection_config=config["projection"],
+            slope_per_second=slope_per_second,
+            r_squared=r_squared,
+            pattern=pattern,
+            variance=state.variance,
+        )
+
+    async def analyze_many(
+        self,
+        services: Mapping[str, str],
+        slo: str = "availability",
+        window: str | None = None,
+    ) -> dict[str, DriftResult]:
+        """Analyze drift for many services with one range query per window.
+
+        Instead of a range query per service, the budget history of every
+        service is fetched with a single query grouped by ``service`` and
+        ``slo`` (one per distinct analysis window) and split by label.
+        Series of equal length are then fitted (``fit_trends``) and
+        classified (``PatternDetector.detect_many``) together, with each
+        service's tier defaults; results match ``analyze`` per service.
+
+        Args:
+            services: Service name to tier
+            slo: SLO name (default: availability)
+            window: Analysis window. Uses each tier's default if not specified
+
+        Returns:
+            DriftResult per service, in the order given. Services without
+            enough data are left out.
+
+        Raises:
+            DriftAnalysisError: If a range query fails
+        """
+        by_window: dict[str, list[str]] = {}
+        for service_name, tier in services.items():
+            service_window = window or get_drift_defaults(tier)["window"]
+            by_window.setdefault(service_window, []).append(service_name)
+
+        histories: dict[str, TimeSeries] = {}
+        try:
+            for analysis_window in by_window:
+                grouped = await self._query_fleet_budget_history(analysis_window, slo)
+                for service_name in by_window[analysis_window]:
+                    if service_name in grouped:
+                        histories[service_name] = grouped[service_name]
         except Exception as e:
             raise DriftAnalysisError(f"Failed to query Prometheus: {e}") from e
 
+        # Equal-length series of one tier are fitted and classified together
+        series: dict[str, TimeSeries] = {}
+        groups: dict[tuple[int, str], list[str]] = {}
+        for service_name, tier in services.items():
+            if service_name not in histories:
+                continue
+            data = histories[service_name].sorted()
+            if len(data) >= 2:
+                series[service_name] = data
+                groups.setdefault((len(data), tier), []).append(service_name)
+
+        fitted: dict[str, tuple[float, float, DriftPattern]] = {}
+        for (_, tier), names in groups.items():
+            timestamps_ms = np.vstack([series[name].timestamps_ms for name in names])
+            values = np.vstack([series[name].values for name in names])
+            slopes, _, r_squared = fit_trends(timestamps_ms, values)
+            detector = self._get_pattern_detector(get_drift_defaults(tier))
+            patterns = detector.detect_many(timestamps_ms, values, slopes, r_squared)
+            for name, slope, fit, pattern in zip(
+                names, slopes.tolist(), r_squared.tolist(), patterns, strict=True
+            ):
+                if not np.isnan(slope):  # All timestamps identical
+                    fitted[name] = (slope, fit, pattern)
+
+        results: dict[str, DriftResult] = {}
+        for service_name, tier in services.items():
+            if service_name not in fitted:
+                continue
+            config = get_drift_defaults(tier)
+            slope_per_second, r_squared_value, pattern = fitted[service_name]
+            results[service_name] = self._build_result(
+                series[service_name],
+                service_name=service_name,
+                tier=tier,
+                slo=slo,
+                window=window or config["window"],
+                thresholds=config["thresholds"],
+                projection_config=config["projection"],
+                slope_per_second=slope_per_second,
+                r_squared=r_squared_value,
+                pattern=pattern,
+            )
+        return results
+
+    def _analyze_history(
+        self,
+        history: TimeSeries | list[tuple[datetime, float]],
+        service_name: str,
+        tier: str,
+        slo: str,
+        window: str,
+        thresholds: dict[str, str],
+        projection_config: dict[str, str],
+        config: dict[str, Any],
+    ) -> DriftResult:
+        """Fit, classify and summarize one service's budget history."""
+        data = as_time_series(history).sorted()
+
         if len(data) < 2:
             raise DriftAnalysisError(
                 f"Insufficient data points for {service_name}/{slo}. "
@@ -112,17 +356,49 @@ class DriftAnalyzer:
         # Calculate trend
         slope_per_second, intercept, r_squared = self._calculate_trend(data)
 
+        # Detect pattern
+        detector = self._get_pattern_detector(config)
+        pattern = detector.detect(data, slope_per_second, r_squared)
+
+        return self._build_result(
+            data,
+            service_name=service_name,
+            tier=tier,
+            slo=slo,
+            window=window,
+            thresholds=thresholds,
+            projection_config=projection_config,
+            slope_per_second=slope_per_second,
+            r_squared=r_squared,
+            pattern=pattern,
+        )
+
+    def _build_result(
+        self,
+        data: TimeSeries,
+        service_name: str,
+        tier: str,
+        slo: str,
+        window: str,
+        thresholds: dict[str, str],
+        projection_config: dict[str, str],
+        slope_per_second: float,
+        r_squared: float,
+        pattern: DriftPattern,
+        variance: float | None = None,
+    ) -> DriftResult:
+        """Project, classify and summarize a fitted budget history."""
         # Convert slope to useful units
         slope_per_day = slope_per_second * 86400
         slope_per_week = slope_per_second * 86400 * 7
 
         # Current budget is the last value
-        current_budget = data[-1][1]
-        budget_at_start = data[0][1]
+        current_budget = float(data.values[-1])
+        budget_at_start = float(data.values[0])
 
         # Calculate variance
-        values = np.array([d[1] for d in data])
-        variance = float(np.var(values))
+        if variance is None:
+            variance = float(np.var(data.values))
 
         # Create metrics
         metrics = DriftMetrics(
@@ -145,17 +421,13 @@ class DriftAnalyzer:
             confidence=r_squared,
         )
 
-        # Detect pattern
-        detector = self._get_pattern_detector(config)
-        pattern = detector.detect(data, slope_per_second, r_squared)
-
         # Classify severity
         severity = self._classify_severity(
             slope_per_week=slope_per_week,
             days_until_exhaustion=days_until_exhaustion,
             pattern=pattern,
-            thresholds=analysis_thresholds,
-            projection_config=analysis_projection,
+            thresholds=thresholds,
+            projection_config=projection_config,
         )
 
         # Generate summary and recommendation
@@ -174,10 +446,10 @@ class DriftAnalyzer:
             service_name=service_name,
             tier=tier,
             slo_name=slo,
-            window=analysis_window,
+            window=window,
             analyzed_at=datetime.now(),
-            data_start=data[0][0],
-            data_end=data[-1][0],
+            data_start=datetime.fromtimestamp(data.timestamps_ms[0] / 1000),
+            data_end=datetime.fromtimestamp(data.timestamps_ms[-1] / 1000),
             metrics=metrics,
             projection=projection,
             pattern=pattern,
@@ -193,7 +465,7 @@ class DriftAnalyzer:
         window: str,
         slo: str = "availability",
         step: str = "1h",
-    ) -> list[tuple[datetime, float]]:
+    ) -> TimeSeries:
         """Query error budget over time window.
 
         Args:
@@ -203,51 +475,83 @@ class DriftAnalyzer:
             step: Query resolution
 
         Returns:
-            List of (timestamp, budget_value) tuples
+            TimeSeries of budget values
         """
-        import httpx
-
-        query = f'slo:error_budget_remaining:ratio{{service="{service}", slo="{slo}"}}'
-
         # Calculate time range
         end = datetime.now()
         start = end - self._parse_duration(window)
 
-        params: dict[str, str] = {
-            "query": query,
-            "start": str(start.timestamp()),
-            "end": str(end.timestamp()),
-            "step": step,
-        }
-
-        auth = None
-        if self.username and self.password:
-            auth = (self.username, self.password)
-
-        async with httpx.AsyncClient(auth=auth, timeout=30.0) as client:
-            response = await client.get(
-                f"{self.prometheus_url}/api/v1/query_range",
-                params=params,
-            )
-            response.raise_for_status()
-            result = response.json()
+        series = await self._fetch_budget_history(service, start, end, slo, step)
+        if not len(series):
+            raise DriftAnalysisError(f"No data returned for {service}/{slo}")
 
-        if result.get("status") != "success":
-            raise DriftAnalysisError(f"Prometheus query failed: {result.get('error', 'Unknown')}")
+        return series
 
-        data = result.get("data", {})
-        results = data.get("result", [])
+    async def _fetch_budget_history(
+        self,
+        service: str,
+        start: datetime,
+        end: datetime,
+        slo: str = "availability",
+        step: str = "1h",
+    ) -> TimeSeries:
+        """Query error budget between ``start`` and ``end`` (possibly empty)."""
+        from nthlayer.providers.prometheus import PrometheusProvider
+        from nthlayer.providers.query_cache import get_query_cache
+
+        # Same series as _query_fleet_budget_history when the metric carries more labels
+        query = f'max by (service, slo) ({BUDGET_METRIC}{{service="{service}", slo="{slo}"}})'
+
+        provider = PrometheusProvider(
+            self.prometheus_url,
+            username=self.username,
+            password=self.password,
+            cache=get_query_cache(),
+        )
+        async with provider:
+            result = await provider.query_range(query, start, end, step)
 
-        if not results:
-            raise DriftAnalysisError(f"No data returned for {service}/{slo}")
+        return TimeSeries.from_query_range(result)
+
+    async def _query_fleet_budget_history(
+        self,
+        window: str,
+        slo: str = "availability",
+        step: str = "1h",
+    ) -> dict[str, TimeSeries]:
+        """Query error budget over time window for every service at once.
+
+        Args:
+            window: Time window (e.g., "30d")
+            slo: SLO name
+            step: Query resolution
+
+        Returns:
+            TimeSeries of budget values per service
+        """
+        from nthlayer.providers.prometheus import PrometheusProvider
+        from nthlayer.providers.query_cache import get_query_cache
 
-        # Parse values from first result
-        values = results[0].get("values", [])
-        return [(datetime.fromtimestamp(float(ts)), float(val)) for ts, val in values]
+        # One series per (service, slo) even when the metric carries more labels
+        query = f'max by (service, slo) ({BUDGET_METRIC}{{slo="{slo}"}})'
+
+        end = datetime.now()
+        start = end - self._parse_duration(window)
+
+        provider = PrometheusProvider(
+            self.prometheus_url,
+            username=self.username,
+            password=self.password,
+            cache=get_query_cache(),
+        )
+        async with provider:
+            result = await provider.query_range(query, start, end, step)
+
+        return TimeSeries.group_query_range(result, "service")
 
     def _calculate_trend(
         self,
-        data: list[tuple[datetime, float]],
+        data: TimeSeries | list[tuple[datetime, float]],
     ) -> tuple[float, float, float]:
         """Calculate linear trend using least squares regression.
 
@@ -257,15 +561,13 @@ class DriftAnalyzer:
         Returns:
             Tuple of (slope_per_second, intercept, r_squared)
         """
-        if len(data) < 2:
+        series = as_time_series(data)
+        if len(series) < 2:
             raise DriftAnalysisError("Insufficient data points for trend analysis")
 
-        # Convert to numpy arrays
-        timestamps = np.array([d[0].timestamp() for d in data])
-        values = np.array([d[1] for d in data])
-
         # Normalize timestamps to start from 0
-        timestamps = timestamps - timestamps[0]
+        timestamps = (series.timestamps_ms - series.timestamps_ms[0]) / 1000.0
+        values = series.values
 
         # Linear regression
         result = stats.linregress(timestamps, values)
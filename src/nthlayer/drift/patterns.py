@@ -6,6 +6,10 @@ Classifies drift patterns beyond simple linear trends:
 - Step changes (sudden drops or improvements)
 - Volatile patterns
 - Stable (no significant trend)
+
+``detect_many`` and ``detect_seasonal_many`` classify many equal-length
+series at once from 2D arrays (one row per series), with the same results
+as ``detect`` and ``detect_seasonal`` per row.
 """
 
 from __future__ import annotations
@@ -14,8 +18,14 @@ from datetime import datetime
 
 import numpy as np
 
+from nthlayer.core.timeseries import TimeSeries, as_time_series, local_weekdays
 from nthlayer.drift.models import DriftPattern
 
+SECONDS_PER_WEEK = 7 * 24 * 60 * 60
+
+# Step changes are only counted within this gap between samples (1.5 days)
+MAX_STEP_WINDOW_SECONDS = 86400 * 1.5
+
 
 class PatternDetector:
     """Detect drift patterns beyond simple linear trends."""
@@ -42,28 +52,50 @@ class PatternDetector:
 
     def detect(
         self,
-        data: list[tuple[datetime, float]],
+        data: TimeSeries | list[tuple[datetime, float]],
         slope_per_second: float,
         r_squared: float,
     ) -> DriftPattern:
         """Classify the drift pattern.
 
         Args:
-            data: Time series data as (timestamp, value) tuples
+            data: Time series data (TimeSeries or (timestamp, value) tuples)
             slope_per_second: Linear regression slope (change per second)
             r_squared: Fit quality from regression (0-1)
 
         Returns:
             Classified DriftPattern
         """
-        if len(data) < 2:
+        series = as_time_series(data)
+        if len(series) < 2:
             return DriftPattern.STABLE
 
-        values = np.array([d[1] for d in data])
-        variance = float(np.var(values))
+        return self.classify(
+            step_change=self._detect_step_change(series),
+            variance=float(np.var(series.values)),
+            slope_per_second=slope_per_second,
+            r_squared=r_squared,
+        )
 
+    def classify(
+        self,
+        step_change: DriftPattern | None,
+        variance: float,
+        slope_per_second: float,
+        r_squared: float,
+    ) -> DriftPattern:
+        """Classify the drift pattern from precomputed statistics.
+
+        Args:
+            step_change: First step change in the window, if any
+            variance: Variance of the values
+            slope_per_second: Linear regression slope (change per second)
+            r_squared: Fit quality from regression (0-1)
+
+        Returns:
+            Classified DriftPattern
+        """
         # Check for step change first (highest priority)
-        step_change = self._detect_step_change(data)
         if step_change is not None:
             return step_change
 
@@ -76,8 +108,7 @@ class PatternDetector:
 
         # Classify by slope direction and significance
         # Convert slope from per-second to per-week
-        seconds_per_week = 7 * 24 * 60 * 60
-        weekly_slope = slope_per_second * seconds_per_week
+        weekly_slope = slope_per_second * SECONDS_PER_WEEK
 
         if abs(weekly_slope) < self.slope_significance_threshold:
             return DriftPattern.STABLE
@@ -88,7 +119,7 @@ class PatternDetector:
 
     def _detect_step_change(
         self,
-        data: list[tuple[datetime, float]],
+        data: TimeSeries | list[tuple[datetime, float]],
     ) -> DriftPattern | None:
         """Detect sudden step changes in the data.
 
@@ -100,27 +131,29 @@ class PatternDetector:
         Returns:
             STEP_CHANGE_DOWN, STEP_CHANGE_UP, or None
         """
-        if len(data) < 2:
+        series = as_time_series(data)
+        if len(series) < 2:
             return None
 
-        max_time_window = 86400 * 1.5  # 1.5 days tolerance
+        max_time_window = MAX_STEP_WINDOW_SECONDS
 
-        for i in range(1, len(data)):
-            time_diff = (data[i][0] - data[i - 1][0]).total_seconds()
-            value_diff = data[i][1] - data[i - 1][1]
+        time_diffs = np.diff(series.timestamps_ms) / 1000.0
+        value_diffs = np.diff(series.values)
 
-            # Check if change exceeds threshold within time window
-            if time_diff < max_time_window:
-                if value_diff < -self.step_change_threshold:
-                    return DriftPattern.STEP_CHANGE_DOWN
-                elif value_diff > self.step_change_threshold:
-                    return DriftPattern.STEP_CHANGE_UP
+        # First consecutive pair exceeding the threshold within the time window
+        steps = (time_diffs < max_time_window) & (
+            (value_diffs < -self.step_change_threshold) | (value_diffs > self.step_change_threshold)
+        )
+        if not steps.any():
+            return None
 
-        return None
+        if value_diffs[int(np.argmax(steps))] < 0:
+            return DriftPattern.STEP_CHANGE_DOWN
+        return DriftPattern.STEP_CHANGE_UP
 
     def detect_seasonal(
         self,
-        data: list[tuple[datetime, float]],
+        data: TimeSeries | list[tuple[datetime, float]],
         min_periods: int = 2,
     ) -> bool:
         """Detect seasonal patterns in the data.
@@ -135,27 +168,118 @@ class PatternDetector:
         Returns:
             True if seasonal pattern detected
         """
-        if len(data) < min_periods * 7 * 24:  # Assuming hourly data
+        series = as_time_series(data)
+        if len(series) < min_periods * 7 * 24:  # Assuming hourly data
             return False
 
-        # Group values by day of week
-        day_values: dict[int, list[float]] = {i: [] for i in range(7)}
-        for timestamp, value in data:
-            day_of_week = timestamp.weekday()
-            day_values[day_of_week].append(value)
+        # Group values by (local) day of week
+        weekdays = series.weekdays()
+        day_values = [series.values[weekdays == day] for day in range(7)]
 
         # Check if there's significant variance between days
-        day_means = np.array([float(np.mean(v)) if v else 0.0 for v in day_values.values()])
-        if len(day_means) == 0:
-            return False
+        day_means = np.array([float(np.mean(v)) if len(v) else 0.0 for v in day_values])
 
         # If variance between day means is significantly higher than
         # within-day variance, we have a weekly pattern
         between_day_var = float(np.var(day_means))
-        within_day_vars = np.array(
-            [float(np.var(v)) if len(v) > 1 else 0.0 for v in day_values.values()]
-        )
+        within_day_vars = np.array([float(np.var(v)) if len(v) > 1 else 0.0 for v in day_values])
         avg_within_day_var = float(np.mean(within_day_vars))
 
         # Seasonal if between-day variance is at least 2x within-day
         return bool(between_day_var > 2 * avg_within_day_var)
+
+    def detect_many(
+        self,
+        timestamps_ms: np.ndarray,
+        values: np.ndarray,
+        slopes_per_second: np.ndarray,
+        r_squared: np.ndarray,
+    ) -> list[DriftPattern]:
+        """Classify the drift pattern of many series at once.
+
+        Args:
+            timestamps_ms: Sorted epoch milliseconds, one row per series
+            values: Sample values, same shape as ``timestamps_ms``
+            slopes_per_second: Regression slope per series
+            r_squared: Fit quality per series
+
+        Returns:
+            DriftPattern per row, as ``detect`` would classify it
+        """
+        count, length = values.shape
+        if length < 2:
+            return [DriftPattern.STABLE] * count
+
+        steps = self._detect_step_changes(timestamps_ms, values)
+        return [
+            self.classify(step, variance, slope, fit)
+            for step, variance, slope, fit in zip(
+                steps,
+                values.var(axis=1).tolist(),
+                slopes_per_second.tolist(),
+                r_squared.tolist(),
+                strict=True,
+            )
+        ]
+
+    def _detect_step_changes(
+        self,
+        timestamps_ms: np.ndarray,
+        values: np.ndarray,
+    ) -> list[DriftPattern | None]:
+        """First step change per row, as ``_detect_step_change`` finds it."""
+        time_diffs = np.diff(timestamps_ms, axis=1) / 1000.0
+        value_diffs = np.diff(values, axis=1)
+        steps = (time_diffs < MAX_STEP_WINDOW_SECONDS) & (
+            (value_diffs < -self.step_change_threshold) | (value_diffs > self.step_change_threshold)
+        )
+
+        first = np.argmax(steps, axis=1)
+        first_diffs = np.take_along_axis(value_diffs, first[:, None], axis=1)[:, 0]
+        found: list[bool] = np.any(steps, axis=1).tolist()
+        return [
+            None
+            if not has_step
+            else (DriftPattern.STEP_CHANGE_DOWN if diff < 0 else DriftPattern.STEP_CHANGE_UP)
+            for has_step, diff in zip(found, first_diffs.tolist(), strict=True)
+        ]
+
+    def detect_seasonal_many(
+        self,
+        timestamps_ms: np.ndarray,
+        values: np.ndarray,
+        min_periods: int = 2,
+    ) -> np.ndarray:
+        """Detect weekly seasonality in many series at once.
+
+        Samples are bucketed by (row, local day of week) and the per-day
+        means and variances are computed for all rows together.
+
+        Args:
+            timestamps_ms: Epoch milliseconds, one row per series
+            values: Sample values, same shape as ``timestamps_ms``
+            min_periods: Minimum number of periods to detect seasonality
+
+        Returns:
+            Boolean array, True where ``detect_seasonal`` detects a pattern
+        """
+        count, length = values.shape
+        if length < min_periods * 7 * 24:  # Assuming hourly data
+            return np.zeros(count, dtype=bool)
+
+        buckets = (np.arange(count)[:, None] * 7 + local_weekdays(timestamps_ms)).ravel()
+        samples = values.ravel()
+        sizes = np.bincount(buckets, minlength=count * 7)
+        sums = np.bincount(buckets, weights=samples, minlength=count * 7)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(sizes > 0, sums / sizes, 0.0)
+            squares = np.bincount(
+                buckets, weights=(samples - means[buckets]) ** 2, minlength=count * 7
+            )
+            within = np.where(sizes > 1, squares / sizes, 0.0)
+
+        # Seasonal if between-day variance is at least 2x within-day
+        between_day_var = means.reshape(count, 7).var(axis=1)
+        avg_within_day_var = within.reshape(count, 7).mean(axis=1)
+        return between_day_var > 2 * avg_within_day_var
@@ -0,0 +1,327 @@
+"""
+Incremental drift state.
+
+A scheduled drift job would otherwise fetch the whole analysis window from
+Prometheus and refit it on every run. ``DriftState`` keeps, per service
+and SLO, the samples inside the sliding window together with the running
+sums a least-squares fit needs (n, Σx, Σy, Σxy, Σx², Σy²) and the step
+changes between consecutive samples. Adding a sample or expiring one from
+the front of the window updates the sums in O(1), so a run only has to
+fetch the samples recorded since the previous one.
+
+``DriftStateStore`` persists states between runs in a sqlite file under
+``~/.cache/nthlayer``. Only the window configuration and the samples are
+stored; the sums are rebuilt exactly when a state is loaded.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import sqlite3
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import structlog
+
+from nthlayer.core.timeseries import TimeSeries
+from nthlayer.drift.models import DriftPattern
+from nthlayer.drift.patterns import MAX_STEP_WINDOW_SECONDS
+
+logger = structlog.get_logger()
+
+STATE_FORMAT_VERSION = 1
+
+
+class DriftState:
+    """Sliding-window fit and step changes for one service's SLO budget."""
+
+    def __init__(
+        self,
+        service: str,
+        slo: str,
+        window_seconds: float,
+        step_change_threshold: float = 0.05,
+    ) -> None:
+        """Initialize an empty state.
+
+        Args:
+            service: Service name
+            slo: SLO name
+            window_seconds: Length of the sliding window
+            step_change_threshold: Minimum change between consecutive
+                samples counted as a step change
+        """
+        self.service = service
+        self.slo = slo
+        self.window_seconds = window_seconds
+        self.step_change_threshold = step_change_threshold
+
+        # (epoch ms, value) inside the window, oldest first
+        self._samples: deque[tuple[int, float]] = deque()
+        # (epoch ms of the earlier sample, value change) per step change
+        self._steps: deque[tuple[int, float]] = deque()
+        self._rebase(0, 0.0)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @property
+    def last_timestamp_ms(self) -> int | None:
+        """Timestamp of the newest sample, or None when empty."""
+        return self._samples[-1][0] if self._samples else None
+
+    def matches(self, window_seconds: float, step_change_threshold: float) -> bool:
+        """Whether the state was built with this window configuration."""
+        return (
+            self.window_seconds == window_seconds
+            and self.step_change_threshold == step_change_threshold
+        )
+
+    def add(self, timestamp_ms: int, value: float) -> None:
+        """Append a sample; samples not newer than the last one are ignored."""
+        if self._samples:
+            last_ms, last_value = self._samples[-1]
+            if timestamp_ms <= last_ms:
+                return
+            diff = value - last_value
+            if (timestamp_ms - last_ms) / 1000.0 < MAX_STEP_WINDOW_SECONDS and (
+                abs(diff) > self.step_change_threshold
+            ):
+                self._steps.append((last_ms, diff))
+        else:
+            self._rebase(timestamp_ms, value)
+
+        self._samples.append((timestamp_ms, value))
+        self._accumulate(timestamp_ms, value, 1)
+
+    def extend(self, series: TimeSeries) -> None:
+        """Append every sample of ``series`` in timestamp order."""
+        data = series.sorted()
+        for timestamp_ms, value in zip(
+            data.timestamps_ms.tolist(), data.values.tolist(), strict=True
+        ):
+            self.add(timestamp_ms, value)
+
+    def expire(self, cutoff_ms: int) -> None:
+        """Drop samples older than ``cutoff_ms`` from the front of the window."""
+        while self._samples and self._samples[0][0] < cutoff_ms:
+            timestamp_ms, value = self._samples.popleft()
+            self._accumulate(timestamp_ms, value, -1)
+
+        # A step change leaves the window with its earlier sample
+        first_ms = self._samples[0][0] if self._samples else math.inf
+        while self._steps and self._steps[0][0] < first_ms:
+            self._steps.popleft()
+
+        # Rebuild the sums relative to the new front once the old origin is a
+        # window behind, so rounding from add/subtract cannot build up
+        if not self._samples:
+            self._rebase(0, 0.0)
+        elif (first_ms - self._origin_ms) / 1000.0 > self.window_seconds:
+            self._rebuild()
+
+    def fit(self) -> tuple[float, float, float]:
+        """Linear trend of the window, as ``scipy.stats.linregress`` fits it.
+
+        Returns:
+            Tuple of (slope_per_second, intercept, r_squared), with time
+            measured from the first sample in the window
+        """
+        if self._n < 2:
+            raise ValueError("Insufficient data points for trend analysis")
+
+        n = self._n
+        x_mean = self._sum_x / n
+        y_mean = self._sum_y / n
+        ss_x = max(self._sum_xx / n - x_mean * x_mean, 0.0)
+        ss_y = max(self._sum_yy / n - y_mean * y_mean, 0.0)
+        ss_xy = self._sum_xy / n - x_mean * y_mean
+        if ss_x == 0.0:
+            raise ValueError("Cannot fit a trend when all timestamps are identical")
+
+        slope = ss_xy / ss_x
+        if ss_y == 0.0:
+            r = math.nan if ss_xy == 0 else 0.0
+        else:
+            r = min(max(ss_xy / math.sqrt(ss_x * ss_y), -1.0), 1.0)
+
+        # Intercept at the first sample rather than at the origin
+        first_x = (self._samples[0][0] - self._origin_ms) / 1000.0
+        intercept = self._origin_value + y_mean + slope * (first_x - x_mean)
+        return slope, intercept, r * r
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the values in the window."""
+        if not self._n:
+            return 0.0
+        y_mean = self._sum_y / self._n
+        return max(self._sum_yy / self._n - y_mean * y_mean, 0.0)
+
+    @property
+    def step_change(self) -> DriftPattern | None:
+        """First step change in the window, as ``PatternDetector`` finds it."""
+        if not self._steps:
+            return None
+        return (
+            DriftPattern.STEP_CHANGE_DOWN if self._steps[0][1] < 0 else DriftPattern.STEP_CHANGE_UP
+        )
+
+    def series(self) -> TimeSeries:
+        """Samples in the window as a TimeSeries."""
+        return TimeSeries(
+            np.fromiter((ts for ts, _ in self._samples), dtype=np.int64, count=len(self)),
+            np.fromiter((v for _, v in self._samples), dtype=np.float64, count=len(self)),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the window configuration and samples."""
+        return {
+            "version": STATE_FORMAT_VERSION,
+            "service": self.service,
+            "slo": self.slo,
+            "window_seconds": self.window_seconds,
+            "step_change_threshold": self.step_change_threshold,
+            "samples": [list(sample) for sample in self._samples],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DriftState:
+        """Rebuild a state (including its sums) from ``to_dict`` output."""
+        if data.get("version") != STATE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported drift state version: {data.get('version')}")
+
+        state = cls(
+            data["service"],
+            data["slo"],
+            float(data["window_seconds"]),
+            float(data["step_change_threshold"]),
+        )
+        for timestamp_ms, value in data["samples"]:
+            state.add(int(timestamp_ms), float(value))
+        return state
+
+    def _accumulate(self, timestamp_ms: int, value: float, sign: int) -> None:
+        x = (timestamp_ms - self._origin_ms) / 1000.0
+        y = value - self._origin_value
+        self._n += sign
+        self._sum_x += sign * x
+        self._sum_y += sign * y
+        self._sum_xy += sign * x * y
+        self._sum_xx += sign * x * x
+        self._sum_yy += sign * y * y
+
+    def _rebase(self, origin_ms: int, origin_value: float) -> None:
+        # Sums are kept relative to an origin sample: small x keeps Σx² exact
+        # enough, and a flat series sums to exactly zero variance
+        self._origin_ms = origin_ms
+        self._origin_value = origin_value
+        self._n = 0
+        self._sum_x = self._sum_y = self._sum_xy = self._sum_xx = self._sum_yy = 0.0
+
+    def _rebuild(self) -> None:
+        first_ms, first_value = self._samples[0]
+        self._rebase(first_ms, first_value)
+        for timestamp_ms, value in self._samples:
+            self._accumulate(timestamp_ms, value, 1)
+
+
+class DriftStateStore:
+    """
+    sqlite-backed store of ``DriftState`` per service and SLO.
+
+    A failing state file is logged and the store is switched off, so the
+    analysis falls back to fetching the full window.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            path: sqlite file holding the states
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self._disabled = False
+
+    def load(self, service: str, slo: str) -> DriftState | None:
+        """Return the stored state, or None if there is none (or it is unreadable)."""
+        with self._lock:
+            row = self._execute(
+                "SELECT value FROM states WHERE service = ? AND slo = ?", (service, slo)
+            )
+        if row is None:
+            return None
+
+        try:
+            return DriftState.from_dict(json.loads(row[0]))
+        except (ValueError, KeyError, TypeError) as exc:
+            logger.debug("drift_state_dropped", service=service, slo=slo, error=str(exc))
+            return None
+
+    def save(self, state: DriftState) -> None:
+        """Store ``state``, replacing any previous state for its service and SLO."""
+        with self._lock:
+            self._execute(
+                "INSERT OR REPLACE INTO states (service, slo, value) VALUES (?, ?, ?)",
+                (state.service, state.slo, json.dumps(state.to_dict())),
+            )
+
+    def close(self) -> None:
+        """Close the state file."""
+        with self._lock:
+            db, self._db = self._db, None
+            if db is not None:
+                db.close()
+
+    def _get_db(self) -> sqlite3.Connection | None:
+        if self._db is not None or self._disabled:
+            return self._db
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS states (service TEXT NOT NULL, slo TEXT NOT NULL, "
+                "value TEXT NOT NULL, PRIMARY KEY (service, slo))"
+            )
+            db.commit()
+        except (OSError, sqlite3.Error) as exc:
+            self._disable(exc)
+            return None
+
+        self._db = db
+        return db
+
+    def _execute(self, sql: str, params: tuple[Any, ...] = ()) -> tuple[Any, ...] | None:
+        db = self._get_db()
+        if db is None:
+            return None
+
+        try:
+            row = db.execute(sql, params).fetchone()
+            db.commit()
+            return row
+        except sqlite3.Error as exc:
+            self._disable(exc)
+            return None
+
+    def _disable(self, exc: Exception) -> None:
+        logger.warning("drift_state_disabled", path=str(self.path), error=str(exc))
+        if self._db is not None:
+            self._db.close()
+        self._db = None
+        self._disabled = True
+
+
+def default_state_path() -> Path:
+    """Default drift state file (``~/.cache/nthlayer/drift-state.sqlite``)."""
+    from nthlayer.providers.query_cache import default_cache_dir
+
+    return default_cache_dir() / "drift-state.sqlite"
@@ -0,0 +1,187 @@
+"""
+Fleet apply: generate resources for a directory of service manifests.
+
+``nthlayer apply services/ --jobs N`` discovers every manifest under a
+directory and applies each one with ``ServiceOrchestrator`` on a process
+pool. Each worker loads the service template registry, the alert template
+loader and the dashboard intent catalogs once and reuses them for every
+service it handles, instead of paying interpreter startup and template
+loading per service as a shell loop does.
+
+Results are yielded as services finish so callers can stream them.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from nthlayer.orchestrator import ApplyResult, ServiceOrchestrator
+from nthlayer.specs.loader import is_manifest_file
+from nthlayer.specs.templates import TemplateRegistry
+
+# Directories never searched for manifests (overrides, caches, VCS metadata)
+SKIP_DIRS = {"environments", "node_modules", "__pycache__"}
+
+# Per-process state shared by every service a worker applies
+_template_registry: TemplateRegistry | None = None
+
+
+@dataclass
+class FleetOptions:
+    """Apply settings shared by every service in a fleet run."""
+
+    env: str | None = None
+    output_root: Path | None = None
+    skip: list[str] | None = None
+    only: list[str] | None = None
+    force: bool = False
+    parallel: bool = False
+    push_to_grafana: bool = False
+    prometheus_url: str | None = None
+
+
+@dataclass
+class FleetServiceResult:
+    """Outcome of applying one service file."""
+
+    service_yaml: Path
+    result: ApplyResult
+    # Progress output the generators printed, captured so streams stay parseable
+    log: str = ""
+
+
+@dataclass
+class FleetSummary:
+    """Aggregate outcome of a fleet apply."""
+
+    services: int = 0
+    succeeded: int = 0
+    failed: list[str] = field(default_factory=list)
+    total_resources: int = 0
+    up_to_date: int = 0
+    duration_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return not self.failed
+
+    def add(self, item: FleetServiceResult) -> None:
+        self.services += 1
+        self.total_resources += item.result.total_resources
+        self.up_to_date += len(item.result.up_to_date)
+        if item.result.success:
+            self.succeeded += 1
+        else:
+            self.failed.append(str(item.service_yaml))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "services": self.services,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "total_resources": self.total_resources,
+            "up_to_date": self.up_to_date,
+            "duration_seconds": self.duration_seconds,
+            "success": self.success,
+        }
+
+
+def discover_service_files(root: Path) -> list[Path]:
+    """
+    Find service manifests (legacy and OpenSRM) under ``root``.
+
+    Hidden directories and environment override directories are skipped.
+    Files are returned sorted so runs are reproducible.
+    """
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith(".") and d not in SKIP_DIRS)
+        for filename in sorted(filenames):
+            path = Path(dirpath) / filename
+            if is_manifest_file(path):
+                found.append(path)
+    return found
+
+
+def apply_fleet(
+    service_files: Sequence[Path],
+    options: FleetOptions,
+    jobs: int | None = None,
+) -> Iterator[FleetServiceResult]:
+    """
+    Apply every service file, yielding results in completion order.
+
+    Args:
+        service_files: Service manifests to apply
+        options: Settings applied to every service
+        jobs: Worker processes (default: CPU count); 1 applies in-process
+
+    Yields:
+        FleetServiceResult per service as it finishes
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(service_files) <= 1:
+        _init_worker()
+        for service_file in service_files:
+            yield _apply_service(service_file, options)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(service_files)), initializer=_init_worker
+    ) as pool:
+        futures = [pool.submit(_apply_service, path, options) for path in service_files]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _init_worker() -> None:
+    """Load the shared template registry and catalogs once per process."""
+    global _template_registry
+
+    from nthlayer.alerts import get_default_loader
+    from nthlayer.dashboards import builder_sdk, intents  # noqa: F401 - warm catalogs
+    from nthlayer.specs.custom_templates import CustomTemplateLoader
+
+    get_default_loader()
+    # Custom template overrides are announced on stdout; keep streams clean
+    with contextlib.redirect_stdout(io.StringIO()):
+        _template_registry = CustomTemplateLoader.load_all_templates()
+
+
+def _apply_service(service_file: Path, options: FleetOptions) -> FleetServiceResult:
+    """Apply one service with the worker's shared state."""
+    start = time.time()
+    log = io.StringIO()
+    orchestrator = ServiceOrchestrator(
+        service_file,
+        env=options.env,
+        push_to_grafana=options.push_to_grafana,
+        prometheus_url=options.prometheus_url,
+        template_registry=_template_registry,
+        output_root=options.output_root,
+    )
+
+    try:
+        with contextlib.redirect_stdout(log):
+            result = orchestrator.apply(
+                skip=options.skip,
+                only=options.only,
+                force=options.force,
+                parallel=options.parallel,
+            )
+    except Exception as e:
+        result = ApplyResult(
+            service_name=service_file.stem,
+            errors=[f"Apply failed: {e}"],
+            duration_seconds=time.time() - start,
+        )
+
+    return FleetServiceResult(service_yaml=service_file, result=result, log=log.getvalue())
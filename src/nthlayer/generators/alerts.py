@@ -8,11 +8,11 @@ from typing import Any, List
 
 import yaml
 
-from nthlayer.alerts import AlertRule, AlertTemplateLoader
+from nthlayer.alerts import AlertRule, get_default_loader
 from nthlayer.specs.helpers import extract_dependency_technologies
 from nthlayer.specs.manifest import ReliabilityManifest
 from nthlayer.specs.models import Resource
-from nthlayer.specs.parser import parse_service_file
+from nthlayer.specs.parser import ParsedService, parse_service_file
 
 
 def extract_dependencies(resources: List[Resource]) -> List[str]:
@@ -183,6 +183,7 @@ def generate_alerts_for_service(
     routing: str | None = None,
     grafana_url: str = "",
     quiet: bool = False,
+    parsed: ParsedService | None = None,
 ) -> List[AlertRule]:
     """Generate alerts for a service based on its dependencies.
 
@@ -205,6 +206,7 @@ def generate_alerts_for_service(
         grafana_url: Base URL for Grafana dashboards
         quiet: If True, suppress progress output to stdout. Use when calling
                programmatically or when output format is machine-readable.
+        parsed: Already parsed service (skips reading ``service_file``)
 
     Returns:
         List of generated AlertRule objects
@@ -218,7 +220,10 @@ def generate_alerts_for_service(
         True
     """
     # Parse service definition with optional environment overrides
-    context, resources = parse_service_file(service_file, environment=environment)
+    if parsed is not None:
+        context, resources = parsed.context, list(parsed.resources)
+    else:
+        context, resources = parse_service_file(service_file, environment=environment)
 
     # Determine routing label (for PagerDuty Event Orchestration)
     alert_routing: str = routing or getattr(context, "support_model", "") or ""
@@ -278,8 +283,8 @@ def _generate_alerts_impl(
     if not quiet:
         print(f"📊 Loading alerts for dependencies: {', '.join(sorted(dependencies))}")
 
-    # Load alerts for each dependency
-    loader = AlertTemplateLoader()
+    # Load alerts for each dependency (parsed templates are shared per process)
+    loader = get_default_loader()
     all_alerts = []
     stats = {}
 
@@ -0,0 +1,160 @@
+"""
+Fingerprint cache for generated artifacts.
+
+``nthlayer apply`` records, per generator, a fingerprint of everything the
+generator read (the service spec subset, environment overlay and nthlayer
+version) together with the files it wrote and their hashes. On the next
+apply a generator whose fingerprint matches and whose output files are
+untouched is skipped and reported as up to date; ``--force`` ignores the
+cache.
+
+The cache lives next to the artifacts in ``<output_dir>/.nthlayer/cache.json``
+so it is discarded together with them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as get_version
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+CACHE_DIR = ".nthlayer"
+CACHE_FILE = "cache.json"
+CACHE_FORMAT_VERSION = 1
+
+
+def nthlayer_version() -> str:
+    """Installed nthlayer version, part of every fingerprint."""
+    try:
+        return get_version("nthlayer")
+    except PackageNotFoundError:
+        from nthlayer import __version__
+
+        return __version__
+
+
+def fingerprint(inputs: Any) -> str:
+    """Return a stable SHA-256 of JSON-serializable generator inputs."""
+    payload = json.dumps(inputs, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 of a file's contents."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """What one generator produced for one fingerprint."""
+
+    fingerprint: str
+    count: int
+    outputs: dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"fingerprint": self.fingerprint, "count": self.count, "outputs": self.outputs}
+
+
+class ArtifactCache:
+    """
+    Per-generator fingerprints for one output directory.
+
+    Output paths are stored relative to the output directory. An unreadable
+    or incompatible cache file is treated as empty.
+    """
+
+    def __init__(self, output_dir: Path) -> None:
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / CACHE_DIR / CACHE_FILE
+        self._entries: dict[str, CacheEntry] = {}
+        self._dirty = False
+        self._load()
+
+    def lookup(self, generator: str, key: str) -> CacheEntry | None:
+        """
+        Return the entry for ``generator`` if it is still valid.
+
+        Valid means the fingerprint matches and every recorded output file
+        still exists with the recorded contents.
+        """
+        entry = self._entries.get(generator)
+        if entry is None or entry.fingerprint != key:
+            return None
+
+        for relative, digest in entry.outputs.items():
+            output = self.output_dir / relative
+            if not output.is_file() or file_digest(output) != digest:
+                return None
+        return entry
+
+    def record(self, generator: str, key: str, count: int, outputs: list[Path]) -> None:
+        """
+        Remember a generator run.
+
+        Runs that did not produce all of their outputs are not cached, so a
+        failed generator is retried on the next apply.
+        """
+        if not outputs or not all(output.is_file() for output in outputs):
+            self.invalidate(generator)
+            return
+
+        self._entries[generator] = CacheEntry(
+            fingerprint=key,
+            count=count,
+            outputs={
+                output.relative_to(self.output_dir).as_posix(): file_digest(output)
+                for output in outputs
+            },
+        )
+        self._dirty = True
+
+    def invalidate(self, generator: str) -> None:
+        """Forget a generator's entry."""
+        if self._entries.pop(generator, None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache file if anything changed."""
+        if not self._dirty:
+            return
+
+        data = {
+            "version": CACHE_FORMAT_VERSION,
+            "generators": {name: entry.to_dict() for name, entry in self._entries.items()},
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(data, indent=2, sort_keys=True))
+        except OSError as exc:
+            logger.warning("artifact_cache_write_failed", path=str(self.path), error=str(exc))
+            return
+        self._dirty = False
+
+    def _load(self) -> None:
+        if not self.path.is_file():
+            return
+
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") != CACHE_FORMAT_VERSION:
+                return
+            self._entries = {
+                name: CacheEntry(
+                    fingerprint=entry["fingerprint"],
+                    count=int(entry["count"]),
+                    outputs=dict(entry.get("outputs", {})),
+                )
+                for name, entry in data.get("generators", {}).items()
+            }
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as exc:
+            logger.warning("artifact_cache_unreadable", path=str(self.path), error=str(exc))
+            self._entries = {}
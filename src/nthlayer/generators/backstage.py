@@ -13,13 +13,16 @@ import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from nthlayer.scorecard.models import ScoreBand
 from nthlayer.slos.gates import DeploymentGate, GateResult
 from nthlayer.specs.loader import load_manifest
 from nthlayer.specs.manifest import ReliabilityManifest
 
+if TYPE_CHECKING:
+    from nthlayer.specs.parser import ParsedService
+
 logger = logging.getLogger(__name__)
 
 # Score band to letter grade mapping
@@ -53,6 +56,7 @@ def generate_backstage_entity(
     output_dir: str | Path,
     prometheus_url: str | None = None,
     environment: str | None = None,
+    parsed: ParsedService | None = None,
 ) -> BackstageGenerationResult:
     """
     Generate Backstage entity JSON from NthLayer service definition.
@@ -65,6 +69,7 @@ def generate_backstage_entity(
         output_dir: Directory to write Backstage entity JSON
         prometheus_url: Optional Prometheus URL for live data (not used in static mode)
         environment: Optional environment name (dev, staging, prod)
+        parsed: Already parsed service (skips reading ``service_file``)
 
     Returns:
         BackstageGenerationResult with generation details
@@ -78,11 +83,14 @@ def generate_backstage_entity(
     """
     try:
         # Load manifest with auto-format detection (OpenSRM or legacy)
-        manifest = load_manifest(
-            service_file,
-            environment=environment,
-            suppress_deprecation_warning=True,  # Don't warn during generation
-        )
+        if parsed is not None:
+            manifest = parsed.manifest
+        else:
+            manifest = load_manifest(
+                service_file,
+                environment=environment,
+                suppress_deprecation_warning=True,  # Don't warn during generation
+            )
 
         # Build the Backstage entity from the unified manifest
         entity = _build_backstage_entity_from_manifest(manifest)
@@ -15,7 +15,7 @@ import yaml
 
 from nthlayer.specs.manifest import ReliabilityManifest, SLODefinition
 from nthlayer.specs.models import ServiceContext
-from nthlayer.specs.parser import parse_service_file, render_resource_spec
+from nthlayer.specs.parser import ParsedService, parse_service_file, render_resource_spec
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +32,10 @@ class SlothGenerationResult:
 
 
 def generate_sloth_spec(
-    service_file: str | Path, output_dir: str | Path, environment: str | None = None
+    service_file: str | Path,
+    output_dir: str | Path,
+    environment: str | None = None,
+    parsed: ParsedService | None = None,
 ) -> SlothGenerationResult:
     """
     Generate Sloth specification YAML from NthLayer service definition.
@@ -41,6 +44,7 @@ def generate_sloth_spec(
         service_file: Path to NthLayer service YAML file
         output_dir: Directory to write Sloth spec
         environment: Optional environment name (dev, staging, prod)
+        parsed: Already parsed service (skips reading ``service_file``)
 
     Returns:
         SlothGenerationResult with generation details
@@ -84,7 +88,10 @@ def generate_sloth_spec(
     """
     try:
         # Parse service file with optional environment overrides
-        service_context, resources = parse_service_file(service_file, environment=environment)
+        if parsed is not None:
+            service_context, resources = parsed.context, list(parsed.resources)
+        else:
+            service_context, resources = parse_service_file(service_file, environment=environment)
 
         # Filter SLO resources
         slo_resources = [r for r in resources if r.kind == "SLO"]
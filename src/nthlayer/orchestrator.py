@@ -5,18 +5,28 @@ Coordinates generation of all resources (SLOs, alerts, dashboards, etc.)
 from a single service definition file.
 """
 
+import hashlib
+import io
 import json
 import os
+import sys
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TextIO
 
 import yaml
 
 from nthlayer.alertmanager import generate_alertmanager_config
+from nthlayer.alerts import get_default_loader
 from nthlayer.core.errors import ProviderError
+from nthlayer.generators.artifact_cache import ArtifactCache, fingerprint, nthlayer_version
 from nthlayer.pagerduty import EventOrchestrationManager, PagerDutyResourceManager
+from nthlayer.specs.manifest_cache import template_registry_version
+from nthlayer.specs.parser import ParsedService, parse_service
+from nthlayer.specs.templates import TemplateRegistry
 
 
 @dataclass
@@ -28,6 +38,10 @@ class ApplyResult:
     duration_seconds: float = 0.0
     output_dir: Path = Path(".")
     errors: List[str] = field(default_factory=list)
+    # Resource types skipped because their cached artifacts are up to date
+    up_to_date: List[str] = field(default_factory=list)
+    # Wall-clock seconds per generator that ran
+    timings: Dict[str, float] = field(default_factory=dict)
 
     @property
     def total_resources(self) -> int:
@@ -40,6 +54,16 @@ class ApplyResult:
         return len(self.errors) == 0
 
 
+@dataclass
+class _GeneratorRun:
+    """Outcome of one generator call."""
+
+    count: int = 0
+    error: Optional[Exception] = None
+    seconds: float = 0.0
+    output: str = ""
+
+
 @dataclass
 class PlanResult:
     """Result of planning (dry-run) a service configuration."""
@@ -151,29 +175,61 @@ class ServiceOrchestrator:
         "backstage": ("_generate_backstage", "Backstage entity"),
     }
 
+    # Inputs each cacheable generator reads, by resource kind (None = all kinds)
+    CACHE_INPUT_KINDS: Dict[str, Optional[tuple[str, ...]]] = {
+        "slos": ("SLO",),
+        "alerts": ("Dependencies",),
+        "recording-rules": ("SLO",),
+        "dashboard": None,
+        "backstage": None,
+    }
+
     def __init__(
         self,
         service_yaml: Path,
         env: Optional[str] = None,
         push_to_grafana: bool = False,
         prometheus_url: Optional[str] = None,
+        template_registry: Optional[TemplateRegistry] = None,
+        output_root: Optional[Path] = None,
+        parsed: Optional[ParsedService] = None,
     ):
         self.service_yaml = service_yaml
         self.env = env
         self.push_to_grafana = push_to_grafana
         self.prometheus_url = prometheus_url
+        # Shared across services by fleet applies (loaded on demand otherwise)
+        self.template_registry = template_registry
+        # Parent of the default <output_root>/<service> output directory
+        self.output_root = output_root or Path("generated")
         self.service_def: Optional[Dict[str, Any]] = None
         self.service_name: Optional[str] = None
         self.output_dir: Optional[Path] = None
         self._detector: Optional[ResourceDetector] = None
+        # Already parsed for self.env (multi-environment runs parse the base once)
+        self._parsed: Optional[ParsedService] = parsed
+        # template_registry_version(), computed once for all fingerprints
+        self._templates_version: Optional[str] = None
 
     def _load_service(self) -> None:
         """Load and parse service YAML file."""
         if self.service_def is not None:
             return  # Already loaded
 
-        with open(self.service_yaml, "r") as f:
-            self.service_def = yaml.safe_load(f)
+        # Parse once for self.env and hand the result to every generator.
+        # Files the spec parser rejects are loaded as plain YAML so each
+        # generator reports its own error, as it did before.
+        try:
+            if self._parsed is None:
+                self._parsed = parse_service(
+                    self.service_yaml,
+                    environment=self.env,
+                    template_registry=self.template_registry,
+                )
+            self.service_def = self._parsed.raw_data
+        except Exception:
+            with open(self.service_yaml, "r") as f:
+                self.service_def = yaml.safe_load(f)
 
         # Get service name
         service_section = self.service_def.get("service", {})
@@ -181,12 +237,15 @@ class ServiceOrchestrator:
 
         # Set default output directory
         if self.output_dir is None:
-            self.output_dir = Path("generated") / self.service_name
+            self.output_dir = self.output_root / self.service_name
 
-        # Note: Environment-specific config is applied by individual generators
-        # when they call parse_service_file() with environment=self.env.
-        # This allows each generator to get the merged config appropriate
-        # for the target environment.
+    def _parsed_service(self) -> ParsedService:
+        """Return the parsed service, parsing now if loading fell back to YAML."""
+        if self._parsed is None:
+            self._parsed = parse_service(
+                self.service_yaml, environment=self.env, template_registry=self.template_registry
+            )
+        return self._parsed
 
     def _get_detector(self) -> ResourceDetector:
         """Get cached resource detector, creating if needed."""
@@ -251,8 +310,17 @@ class ServiceOrchestrator:
         only: Optional[List[str]] = None,
         force: bool = False,
         verbose: bool = False,
+        parallel: bool = False,
     ) -> ApplyResult:
-        """Generate all resources for the service."""
+        """Generate all resources for the service.
+
+        With ``parallel``, network-bound generators (PagerDuty setup,
+        Grafana push, metric discovery) each run on their own thread while
+        the file generators run one by one on the calling thread; those are
+        CPU-bound, so threads would not speed them up. Each threaded
+        generator prints to its own buffer, which is replayed in dispatch
+        order, so progress output matches a serial run.
+        """
         start = time.time()
 
         try:
@@ -287,29 +355,182 @@ class ServiceOrchestrator:
         resource_types = self._get_filtered_resources(skip, only)
         total_steps = len(resource_types)
 
-        # Generate each resource type using dispatch table
-        for step, resource_type in enumerate(resource_types, 1):
-            method_name, display_name = self.GENERATORS[resource_type]
+        # Fingerprints need the parsed service; --force regenerates but
+        # still records fresh entries for the next run
+        cache = ArtifactCache(self.output_dir) if self._parsed is not None else None
 
-            if verbose:
-                print(f"[{step}/{total_steps}] Generating {display_name}...")
+        # Split into up-to-date generators and the ones that must run
+        keys: Dict[str, Optional[str]] = {}
+        cached: Dict[str, int] = {}
+        for resource_type in resource_types:
+            key = keys[resource_type] = (
+                self._fingerprint(resource_type) if cache is not None else None
+            )
+            if cache is not None and key is not None and not force:
+                entry = cache.lookup(resource_type, key)
+                if entry is not None:
+                    cached[resource_type] = entry.count
+
+        with ExitStack() as stack:
+            futures: Dict[str, Future[_GeneratorRun]] = {}
+            if parallel:
+                pending = [r for r in resource_types if r not in cached]
+                futures = self._submit_generators(stack, pending)
+
+            # Report in dispatch order; serial mode runs each generator here
+            for step, resource_type in enumerate(resource_types, 1):
+                _, display_name = self.GENERATORS[resource_type]
+
+                if resource_type in cached:
+                    result.resources_created[resource_type] = cached[resource_type]
+                    result.up_to_date.append(resource_type)
+                    if verbose:
+                        print(f"[{step}/{total_steps}] {display_name.capitalize()} up to date")
+                    continue
 
-            try:
-                generator = getattr(self, method_name)
-                # Dashboard generator needs push_to_grafana arg
-                if resource_type == "dashboard":
-                    count = generator(push_to_grafana=self.push_to_grafana)
+                if verbose:
+                    print(f"[{step}/{total_steps}] Generating {display_name}...")
+
+                if resource_type in futures:
+                    run = futures[resource_type].result()
+                    sys.stdout.write(run.output)
                 else:
-                    count = generator()
-                result.resources_created[resource_type] = count
+                    run = self._run_generator(resource_type)
+                result.timings[resource_type] = run.seconds
+
+                if run.error is not None:
+                    result.errors.append(
+                        f"{display_name.capitalize()} generation failed: {run.error}"
+                    )
+                    if cache is not None:
+                        cache.invalidate(resource_type)
+                    continue
+
+                result.resources_created[resource_type] = run.count
                 if verbose:
-                    self._log_success(resource_type, count, display_name)
-            except Exception as e:
-                result.errors.append(f"{display_name.capitalize()} generation failed: {e}")
+                    self._log_success(resource_type, run.count, display_name)
+
+                key = keys[resource_type]
+                if cache is not None and key is not None:
+                    cache.record(resource_type, key, run.count, self._artifact_paths(resource_type))
+
+        if cache is not None:
+            cache.save()
 
         result.duration_seconds = time.time() - start
         return result
 
+    def _run_generator(self, resource_type: str, capture: bool = False) -> _GeneratorRun:
+        """Run one generator, timing it and capturing errors.
+
+        With ``capture``, the generator's progress output is collected in
+        ``run.output`` instead of being printed (network-bound generators
+        only; they take an ``out`` stream).
+        """
+        method_name, _ = self.GENERATORS[resource_type]
+        generator = getattr(self, method_name)
+        run = _GeneratorRun()
+
+        kwargs: Dict[str, Any] = {}
+        # Dashboard generator needs push_to_grafana arg
+        if resource_type == "dashboard":
+            kwargs["push_to_grafana"] = self.push_to_grafana
+        output = io.StringIO() if capture else None
+        if output is not None:
+            kwargs["out"] = output
+
+        started = time.perf_counter()
+        try:
+            run.count = generator(**kwargs)
+        except Exception as e:
+            run.error = e
+        finally:
+            run.seconds = time.perf_counter() - started
+            if output is not None:
+                run.output = output.getvalue()
+        return run
+
+    def _is_network_bound(self, resource_type: str) -> bool:
+        """Whether a generator mostly waits on external APIs."""
+        if resource_type == "pagerduty":
+            return True
+        return resource_type == "dashboard" and bool(self.push_to_grafana or self.prometheus_url)
+
+    def _submit_generators(
+        self, stack: ExitStack, resource_types: List[str]
+    ) -> Dict[str, Future[_GeneratorRun]]:
+        """Start the network-bound generators, each on its own thread.
+
+        The others are left to run serially. The pool is shut down when
+        ``stack`` exits.
+        """
+        network = [r for r in resource_types if self._is_network_bound(r)]
+        if not network:
+            return {}
+
+        pool = stack.enter_context(ThreadPoolExecutor(max_workers=len(network)))
+        return {
+            resource_type: pool.submit(self._run_generator, resource_type, True)
+            for resource_type in network
+        }
+
+    def _fingerprint(self, resource_type: str) -> Optional[str]:
+        """Fingerprint a generator's inputs, or None if it must always run.
+
+        Service templates (built-in and ``.nthlayer/templates``) are
+        fingerprinted by content, and alerts also by the digest of the
+        alert templates they are built from. PagerDuty and dashboards
+        pushed to Grafana or built from live metric discovery have external
+        side effects or inputs and are never cached.
+        """
+        parsed = self._parsed
+        if parsed is None or resource_type not in self.CACHE_INPUT_KINDS:
+            return None
+        if resource_type == "dashboard" and (self.push_to_grafana or self.prometheus_url):
+            return None
+
+        if self._templates_version is None:
+            self._templates_version = template_registry_version(self.template_registry)
+
+        kinds = self.CACHE_INPUT_KINDS[resource_type]
+        inputs: Dict[str, Any] = {
+            "generator": resource_type,
+            "nthlayer": nthlayer_version(),
+            "templates": self._templates_version,
+            "environment": self.env,
+            "environment_overlay": (
+                hashlib.sha256(parsed.environment_file.read_bytes()).hexdigest()
+                if parsed.environment_file
+                else None
+            ),
+            "context": asdict(parsed.context),
+            "resources": [
+                {"kind": r.kind, "name": r.name, "spec": r.spec}
+                for r in parsed.resources
+                if kinds is None or r.kind in kinds
+            ],
+        }
+        if resource_type == "alerts":
+            inputs["alert_templates"] = get_default_loader().templates_version()
+        if resource_type == "backstage":
+            # Backstage reads the whole manifest, not just resources
+            inputs["service_def"] = parsed.raw_data
+        return fingerprint(inputs)
+
+    def _artifact_paths(self, resource_type: str) -> List[Path]:
+        """Files a generator writes under the output directory."""
+        output_dir = self.output_dir or Path("generated")
+        if resource_type == "slos":
+            assert self._parsed is not None
+            return [output_dir / "sloth" / f"{self._parsed.context.name}.yaml"]
+        filenames = {
+            "alerts": "alerts.yaml",
+            "dashboard": "dashboard.json",
+            "recording-rules": "recording-rules.yaml",
+            "backstage": "backstage.json",
+        }
+        return [output_dir / filenames[resource_type]] if resource_type in filenames else []
+
     def _get_filtered_resources(
         self, skip: Optional[List[str]], only: Optional[List[str]]
     ) -> List[str]:
@@ -361,6 +582,7 @@ class ServiceOrchestrator:
                 output_file=None,  # Don't write during plan
                 environment=self.env,
                 quiet=True,
+                parsed=self._parsed,
             )
 
             # Group by severity for summary
@@ -390,10 +612,9 @@ class ServiceOrchestrator:
     def _plan_recording_rules(self) -> List[Dict[str, Any]]:
         """Plan recording rule generation using actual builder."""
         from nthlayer.recording_rules.builder import build_recording_rules
-        from nthlayer.specs.parser import parse_service_file
 
-        # Parse service file to get context and resources
-        context, resources = parse_service_file(self.service_yaml, environment=self.env)
+        parsed = self._parsed_service()
+        context, resources = parsed.context, list(parsed.resources)
 
         # Build recording rules (dry run - just to get counts)
         groups = build_recording_rules(context, resources)
@@ -482,6 +703,7 @@ class ServiceOrchestrator:
             service_file=self.service_yaml,
             output_dir=sloth_output_dir,
             environment=self.env,
+            parsed=self._parsed,
         )
 
         if not result.success:
@@ -507,15 +729,19 @@ class ServiceOrchestrator:
             output_file=output_file,
             environment=self.env,
             quiet=True,
+            parsed=self._parsed,
         )
 
         return len(alerts)
 
-    def _generate_dashboard(self, push_to_grafana: bool = False) -> int:
+    def _generate_dashboard(
+        self, push_to_grafana: bool = False, out: Optional[TextIO] = None
+    ) -> int:
         """Generate dashboard file and optionally push to Grafana.
 
         Args:
             push_to_grafana: If True, push dashboard to Grafana via API
+            out: Stream for progress output (default: stdout)
 
         Returns:
             Number of dashboards created
@@ -533,19 +759,23 @@ class ServiceOrchestrator:
             full_panels=False,
             quiet=True,
             prometheus_url=self.prometheus_url,
+            parsed=self._parsed,
         )
 
         # If push to Grafana is enabled, use the provider
         if push_to_grafana:
-            self._push_dashboard_to_grafana(output_file)
+            self._push_dashboard_to_grafana(output_file, out=out)
 
         return 1
 
-    def _push_dashboard_to_grafana(self, dashboard_file: Path) -> None:
+    def _push_dashboard_to_grafana(
+        self, dashboard_file: Path, out: Optional[TextIO] = None
+    ) -> None:
         """Push generated dashboard to Grafana via API.
 
         Args:
             dashboard_file: Path to generated dashboard JSON
+            out: Stream for progress output (default: stdout)
         """
         import asyncio
         import json
@@ -562,8 +792,11 @@ class ServiceOrchestrator:
 
         # Check if Grafana is configured
         if not grafana_url or not grafana_api_key:
-            print("⚠️  Grafana not configured. Skipping push to Grafana.")
-            print("   Set NTHLAYER_GRAFANA_URL and NTHLAYER_GRAFANA_API_KEY to enable auto-push.")
+            print("⚠️  Grafana not configured. Skipping push to Grafana.", file=out)
+            print(
+                "   Set NTHLAYER_GRAFANA_URL and NTHLAYER_GRAFANA_API_KEY to enable auto-push.",
+                file=out,
+            )
             return
 
         # Load generated dashboard
@@ -574,7 +807,7 @@ class ServiceOrchestrator:
         dashboard_json = dashboard_data.get("dashboard", {})
 
         if not dashboard_json:
-            print("⚠️  Dashboard JSON is empty, skipping push")
+            print("⚠️  Dashboard JSON is empty, skipping push", file=out)
             return
 
         # Create Grafana provider
@@ -584,7 +817,7 @@ class ServiceOrchestrator:
         dashboard_uid = dashboard_json.get("uid", service_name)
 
         # Push dashboard
-        print("📤 Pushing dashboard to Grafana...")
+        print("📤 Pushing dashboard to Grafana...", file=out)
 
         async def do_push():
             """Async function to push dashboard."""
@@ -611,26 +844,25 @@ class ServiceOrchestrator:
                 # No loop running, safe to use asyncio.run()
                 asyncio.run(do_push())
 
-            print(f"✅ Dashboard pushed to Grafana: {grafana_url}/d/{dashboard_uid}")
+            print(f"✅ Dashboard pushed to Grafana: {grafana_url}/d/{dashboard_uid}", file=out)
         except Exception as e:
-            print(f"⚠️  Failed to push dashboard to Grafana: {e}")
-            print(f"   Error type: {type(e).__name__}")
+            print(f"⚠️  Failed to push dashboard to Grafana: {e}", file=out)
+            print(f"   Error type: {type(e).__name__}", file=out)
             import traceback
 
             traceback.print_exc()
-            print("   Dashboard file saved locally, you can import manually.")
+            print("   Dashboard file saved locally, you can import manually.", file=out)
 
     def _generate_recording_rules(self) -> int:
         """Generate recording rule files using actual builder."""
         from nthlayer.recording_rules.builder import build_recording_rules
         from nthlayer.recording_rules.models import create_rule_groups
-        from nthlayer.specs.parser import parse_service_file
 
         output_dir = self.output_dir or Path("generated")
         output_file = output_dir / "recording-rules.yaml"
 
-        # Parse service file to get context and resources
-        context, resources = parse_service_file(self.service_yaml, environment=self.env)
+        parsed = self._parsed_service()
+        context, resources = parsed.context, list(parsed.resources)
 
         # Build recording rules
         groups = build_recording_rules(context, resources)
@@ -652,8 +884,11 @@ class ServiceOrchestrator:
         # Return actual count of rules
         return sum(len(group.rules) for group in groups)
 
-    def _generate_pagerduty(self) -> int:
-        """Generate PagerDuty service with tier-based defaults."""
+    def _generate_pagerduty(self, out: Optional[TextIO] = None) -> int:
+        """Generate PagerDuty service with tier-based defaults.
+
+        Progress output goes to ``out`` (default: stdout).
+        """
         # Get PagerDuty API key from environment
         api_key = os.environ.get("PAGERDUTY_API_KEY")
         default_from = os.environ.get("PAGERDUTY_FROM_EMAIL", "nthlayer@example.com")
@@ -743,6 +978,7 @@ class ServiceOrchestrator:
                 default_from=default_from,
                 service_id=result.service_id,
                 sre_escalation_policy_id=sre_ep_id,
+                out=out,
             )
 
         # Generate Alertmanager config if integration key available (uses values extracted earlier)
@@ -753,6 +989,7 @@ class ServiceOrchestrator:
                 support_model=support_model,
                 integration_key=integration_key,
                 sre_integration_key=sre_integration_key,
+                out=out,
             )
 
         return len(result.created_resources) or 1
@@ -763,6 +1000,7 @@ class ServiceOrchestrator:
         default_from: str,
         service_id: str,
         sre_escalation_policy_id: str,
+        out: Optional[TextIO] = None,
     ) -> None:
         """Set up Event Orchestration for alert routing overrides."""
         with EventOrchestrationManager(
@@ -776,9 +1014,12 @@ class ServiceOrchestrator:
                 routing_rules=[sre_rule],
             )
             if not result.success:
-                print(f"⚠️  Event Orchestration setup failed: {result.error}")
+                print(f"⚠️  Event Orchestration setup failed: {result.error}", file=out)
             elif result.rules_created > 0:
-                print(f"✅ Event Orchestration: {result.rules_created} routing rule(s) created")
+                print(
+                    f"✅ Event Orchestration: {result.rules_created} routing rule(s) created",
+                    file=out,
+                )
 
     def _generate_alertmanager_config(
         self,
@@ -787,6 +1028,7 @@ class ServiceOrchestrator:
         support_model: str,
         integration_key: str,
         sre_integration_key: str | None = None,
+        out: Optional[TextIO] = None,
     ) -> None:
         """Generate Alertmanager configuration with PagerDuty receiver."""
         service_name = self.service_name or "unknown"
@@ -803,7 +1045,7 @@ class ServiceOrchestrator:
         # Write Alertmanager config
         output_file = output_dir / "alertmanager.yaml"
         config.write(output_file)
-        print(f"✅ Alertmanager config: {output_file}")
+        print(f"✅ Alertmanager config: {output_file}", file=out)
 
     def _generate_backstage(self) -> int:
         """Generate Backstage entity JSON file.
@@ -820,6 +1062,7 @@ class ServiceOrchestrator:
             service_file=self.service_yaml,
             output_dir=output_dir,
             environment=self.env,
+            parsed=self._parsed,
         )
 
         if not result.success:
@@ -9,6 +9,8 @@ from nthlayer.portfolio.models import (
     HealthStatus,
     Insight,
     InsightType,
+    LiveQueryStats,
+    LiveQueryTiming,
     PortfolioHealth,
     ServiceHealth,
     SLOHealth,
@@ -20,6 +22,8 @@ __all__ = [
     "HealthStatus",
     "Insight",
     "InsightType",
+    "LiveQueryStats",
+    "LiveQueryTiming",
     "PortfolioAggregator",
     "PortfolioHealth",
     "ServiceHealth",
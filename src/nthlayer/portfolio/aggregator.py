@@ -3,12 +3,28 @@ Portfolio aggregator.
 
 Scans service files and collects SLO information.
 Optionally queries Prometheus for live SLO data.
+
+Search paths are walked recursively. Large trees are parsed on a process
+pool (``jobs``); each service file is parsed once, and the SLI queries
+found while parsing are kept for the live-data stage instead of parsing
+the file again.
+
+Live queries share one provider and run concurrently, optionally under a
+global rate limit and a deadline for the whole stage; their timings and
+failures are reported in ``PortfolioHealth.live_queries``.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import fnmatch
+import io
 import os
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -16,6 +32,8 @@ from nthlayer.portfolio.models import (
     HealthStatus,
     Insight,
     InsightType,
+    LiveQueryStats,
+    LiveQueryTiming,
     PortfolioHealth,
     ServiceHealth,
     SLOHealth,
@@ -23,6 +41,190 @@ from nthlayer.portfolio.models import (
     get_tier_name,
 )
 from nthlayer.specs.parser import parse_service_file
+from nthlayer.specs.templates import TemplateRegistry
+
+SERVICE_FILE_SUFFIXES = (".yaml", ".yml")
+
+# Directories never searched for service files (overrides, caches)
+SKIP_DIRS = {"environments", "node_modules", "__pycache__"}
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+# Per-process template registry shared by every file a worker parses
+_template_registry: TemplateRegistry | None = None
+
+
+@dataclass
+class ScannedService:
+    """A parsed service file and the live SLI queries of its SLOs."""
+
+    path: Path
+    health: ServiceHealth
+    # (index into health.slos, SLI query with the service name substituted)
+    queries: list[tuple[int, str]] = field(default_factory=list)
+
+
+def discover_service_files(
+    search_paths: Sequence[Path],
+    ignore: Sequence[str] | None = None,
+) -> list[Path]:
+    """
+    Find candidate service files under ``search_paths``, recursively.
+
+    Hidden directories and environment override directories are skipped,
+    as are files and directories matching an ``ignore`` glob. Patterns are
+    matched against both the name and the path relative to the search path
+    (``generated``, ``*.rules.yaml``, ``legacy/*``). Files are returned
+    sorted per search path so runs are reproducible.
+
+    Args:
+        search_paths: Directories (or single files) to search
+        ignore: Glob patterns of files and directories to leave out
+
+    Returns:
+        Service file paths, without duplicates
+    """
+    patterns = list(ignore or [])
+
+    def ignored(path: Path, root: Path) -> bool:
+        relative = path.relative_to(root).as_posix()
+        return any(
+            fnmatch.fnmatch(path.name, pattern) or fnmatch.fnmatch(relative, pattern)
+            for pattern in patterns
+        )
+
+    found: list[Path] = []
+    seen: set[Path] = set()
+
+    def add(path: Path) -> None:
+        resolved = path.resolve()
+        if resolved not in seen:
+            seen.add(resolved)
+            found.append(path)
+
+    for search_path in search_paths:
+        if search_path.is_file():
+            add(search_path)
+            continue
+        if not search_path.is_dir():
+            continue
+
+        for dirpath, dirnames, filenames in os.walk(search_path):
+            directory = Path(dirpath)
+            dirnames[:] = sorted(
+                d
+                for d in dirnames
+                if not d.startswith(".")
+                and d not in SKIP_DIRS
+                and not ignored(directory / d, search_path)
+            )
+            for filename in sorted(filenames):
+                path = directory / filename
+                if path.suffix in SERVICE_FILE_SUFFIXES and not ignored(path, search_path):
+                    add(path)
+
+    return found
+
+
+def scan_service_file(file_path: Path) -> ScannedService | None:
+    """
+    Parse a service file into its health skeleton and live SLI queries.
+
+    Returns None for files that are not legacy service definitions.
+    """
+    try:
+        context, resources = parse_service_file(
+            str(file_path), template_registry=_template_registry
+        )
+    except Exception:
+        return None
+
+    slos: list[SLOHealth] = []
+    queries: list[tuple[int, str]] = []
+    for slo in (r for r in resources if r.kind == "SLO"):
+        spec = slo.spec or {}
+        query = (spec.get("indicator") or {}).get("query")
+        if query:
+            # Substitute service name in query
+            query = query.replace("${service}", context.name)
+            query = query.replace("$service", context.name)
+            queries.append((len(slos), query))
+
+        slos.append(
+            SLOHealth(
+                name=slo.name or "unnamed",
+                objective=spec.get("objective", 99.9),
+                window=spec.get("window", "30d"),
+                status=HealthStatus.UNKNOWN,  # No live data in basic mode
+            )
+        )
+
+    health = ServiceHealth(
+        service=context.name,
+        tier=_tier_number(context.tier),
+        team=context.team,
+        service_type=context.type,
+        slos=slos,
+    )
+    return ScannedService(path=file_path, health=health, queries=queries)
+
+
+def scan_service_files(
+    service_files: Sequence[Path],
+    jobs: int | None = None,
+) -> list[ScannedService]:
+    """
+    Parse every service file, on a process pool for large trees.
+
+    Args:
+        service_files: Files to parse
+        jobs: Worker processes (default: CPU count); 1 parses in-process
+
+    Returns:
+        ScannedService per parseable file, in ``service_files`` order
+    """
+    jobs = jobs or os.cpu_count() or 1
+    workers = min(jobs, len(service_files) // PARALLEL_MIN_FILES)
+    if jobs == 1 or workers <= 1:
+        _init_worker()
+        scanned = [scan_service_file(path) for path in service_files]
+    else:
+        # A few chunks per worker keeps them busy without paying IPC per file
+        chunksize = max(1, len(service_files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            scanned = list(pool.map(scan_service_file, service_files, chunksize=chunksize))
+
+    return [item for item in scanned if item is not None]
+
+
+def _init_worker() -> None:
+    """Load the template registry once per process."""
+    global _template_registry
+
+    from nthlayer.specs.custom_templates import CustomTemplateLoader
+
+    # Custom template overrides are announced on stdout; keep output clean
+    with contextlib.redirect_stdout(io.StringIO()):
+        _template_registry = CustomTemplateLoader.load_all_templates()
+
+
+def _tier_number(tier: str | int | None) -> int:
+    """Tier as a number (handles "tier-1", "1", "critical" and ints)."""
+    tier_num: int = 2  # default to standard
+    if isinstance(tier, str):
+        # Handle "tier-1", "tier-2", etc.
+        if tier.startswith("tier-"):
+            tier_num = int(tier.split("-")[1])
+        elif tier.isdigit():
+            tier_num = int(tier)
+        else:
+            # Map string names to numbers
+            tier_map = {"critical": 1, "standard": 2, "low": 3}
+            tier_num = tier_map.get(tier.lower(), 2)
+    elif isinstance(tier, int):
+        tier_num = tier
+    return tier_num
 
 
 class PortfolioAggregator:
@@ -32,6 +234,12 @@ class PortfolioAggregator:
         self,
         search_paths: list[Path] | None = None,
         prometheus_url: str | None = None,
+        jobs: int | None = None,
+        ignore: list[str] | None = None,
+        concurrency: int | None = None,
+        query_timeout: float | None = None,
+        rate_limit: float | None = None,
+        deadline: float | None = None,
     ):
         """
         Initialize aggregator.
@@ -40,12 +248,25 @@ class PortfolioAggregator:
             search_paths: Directories to search for service files.
                          Defaults to ["services", "examples/services"]
             prometheus_url: Optional Prometheus URL for live SLO queries
+            jobs: Worker processes for parsing (default: CPU count)
+            ignore: Glob patterns of files and directories to skip
+            concurrency: Maximum Prometheus requests in flight (default: 8)
+            query_timeout: Seconds allowed per request
+            rate_limit: Maximum Prometheus requests started per second
+            deadline: Seconds allowed for all live queries together; SLOs
+                not answered by then stay UNKNOWN
         """
         self.search_paths = search_paths or [
             Path("services"),
             Path("examples/services"),
         ]
         self.prometheus_url = prometheus_url
+        self.jobs = jobs
+        self.ignore = ignore
+        self.concurrency = concurrency
+        self.query_timeout = query_timeout
+        self.rate_limit = rate_limit
+        self.deadline = deadline
 
     def collect(self) -> PortfolioHealth:
         """
@@ -56,23 +277,14 @@ class PortfolioAggregator:
         Returns:
             PortfolioHealth with aggregated data
         """
-        services: list[ServiceHealth] = []
-        slo_specs: list[tuple[ServiceHealth, Path]] = []
-
-        # Scan for service files
-        for search_path in self.search_paths:
-            if not search_path.exists():
-                continue
-
-            for service_file in search_path.glob("*.yaml"):
-                service_health = self._parse_service_file(service_file)
-                if service_health:
-                    services.append(service_health)
-                    slo_specs.append((service_health, service_file))
+        service_files = discover_service_files(self.search_paths, self.ignore)
+        scanned = scan_service_files(service_files, jobs=self.jobs)
+        services = [item.health for item in scanned]
 
         # If Prometheus URL provided, enrich with live data
+        live_queries = None
         if self.prometheus_url:
-            asyncio.run(self._enrich_with_live_data(slo_specs))
+            live_queries = asyncio.run(self._enrich_with_live_data(scanned))
 
         # Calculate tier health
         by_tier = self._calculate_tier_health(services)
@@ -92,18 +304,30 @@ class PortfolioAggregator:
             by_tier=by_tier,
             services=services,
             insights=insights,
+            live_queries=live_queries,
         )
 
-    async def _enrich_with_live_data(
-        self,
-        slo_specs: list[tuple[ServiceHealth, Path]],
-    ) -> None:
+    async def _enrich_with_live_data(self, scanned: list[ScannedService]) -> LiveQueryStats:
         """
         Enrich SLO health with live data from Prometheus.
 
+        SLI queries from every service (collected while scanning) are
+        evaluated concurrently through one ``QueryBatcher`` on a shared
+        provider, so the whole portfolio costs a handful of merged requests
+        and finishes in about the time of the slowest one.
+
         Updates SLO status, current_value, and budget_consumed_percent in place.
+
+        Returns:
+            Counters and per-query timings of the live queries
         """
         from nthlayer.providers.prometheus import PrometheusProvider
+        from nthlayer.providers.query_batch import (
+            DEFAULT_BATCH_CONCURRENCY,
+            DeadlineExceeded,
+            QueryBatcher,
+        )
+        from nthlayer.providers.query_cache import get_query_cache
 
         # Get auth credentials from environment
         username = os.environ.get("NTHLAYER_METRICS_USER")
@@ -111,106 +335,92 @@ class PortfolioAggregator:
 
         if not self.prometheus_url:
             raise ValueError("Prometheus URL is required for collecting metrics")
-        provider = PrometheusProvider(self.prometheus_url, username=username, password=password)
 
-        for service_health, service_file in slo_specs:
-            try:
-                context, resources = parse_service_file(str(service_file))
-            except Exception:
-                continue
+        targets: list[SLOHealth] = []
+        timings: list[LiveQueryTiming] = []
+        queries: dict[str, str] = {}
+        for item in scanned:
+            for index, query in item.queries:
+                queries[str(len(targets))] = query
+                targets.append(item.health.slos[index])
+                timings.append(LiveQueryTiming(item.health.service, item.health.slos[index].name))
+
+        provider = PrometheusProvider(
+            self.prometheus_url,
+            username=username,
+            password=password,
+            cache=get_query_cache(),
+        )
 
-            slo_resources = [r for r in resources if r.kind == "SLO"]
-
-            # Match SLO resources to health objects (use strict=False for robustness)
-            for slo_resource, slo_health in zip(slo_resources, service_health.slos, strict=False):
-                spec = slo_resource.spec or {}
-                indicator = spec.get("indicator", {})
-                query = indicator.get("query")
-
-                if not query:
-                    continue
-
-                # Substitute service name in query
-                query = query.replace("${service}", context.name)
-                query = query.replace("$service", context.name)
-
-                try:
-                    result = await provider.query(query)
-                    if result and result.get("result"):
-                        value_data = result["result"][0].get("value", [])
-                        if len(value_data) >= 2:
-                            current_value = float(value_data[1])
-                            slo_health.current_value = current_value
-
-                            # Calculate status based on objective
-                            objective = slo_health.objective
-                            if current_value >= objective:
-                                slo_health.status = HealthStatus.HEALTHY
-                            elif current_value >= objective * 0.99:  # Within 1%
-                                slo_health.status = HealthStatus.WARNING
-                            elif current_value >= objective * 0.95:  # Within 5%
-                                slo_health.status = HealthStatus.CRITICAL
-                            else:
-                                slo_health.status = HealthStatus.EXHAUSTED
-
-                            # Estimate budget consumed
-                            error_budget = 100 - objective
-                            error_rate = 100 - current_value
-                            if error_budget > 0:
-                                budget_consumed = (error_rate / error_budget) * 100
-                                slo_health.budget_consumed_percent = min(budget_consumed, 100)
-                except Exception:
-                    # Keep UNKNOWN status on query failure
-                    pass
-
-            # Recalculate overall status after enrichment
-            service_health.__post_init__()
+        batcher = QueryBatcher(
+            provider,
+            concurrency=self.concurrency or DEFAULT_BATCH_CONCURRENCY,
+            timeout=self.query_timeout,
+            rate_limit=self.rate_limit,
+            deadline=self.deadline,
+        )
 
-    def _parse_service_file(self, file_path: Path) -> ServiceHealth | None:
-        """Parse a service file and extract health information."""
-        try:
-            context, resources = parse_service_file(str(file_path))
-        except Exception:
-            return None
-
-        # Extract SLOs
-        slo_resources = [r for r in resources if r.kind == "SLO"]
-        slos = []
-
-        for slo in slo_resources:
-            spec = slo.spec or {}
-            slos.append(
-                SLOHealth(
-                    name=slo.name or "unnamed",
-                    objective=spec.get("objective", 99.9),
-                    window=spec.get("window", "30d"),
-                    status=HealthStatus.UNKNOWN,  # No live data in basic mode
-                )
-            )
+        start = time.monotonic()
+        async with provider:
+            values = await batcher.get_sli_values(queries)
 
-        # Parse tier (handle both int and string formats)
-        tier_str = context.tier
-        tier_num: int = 2  # default to standard
-        if isinstance(tier_str, str):
-            # Handle "tier-1", "tier-2", etc.
-            if tier_str.startswith("tier-"):
-                tier_num = int(tier_str.split("-")[1])
-            elif tier_str.isdigit():
-                tier_num = int(tier_str)
-            else:
-                # Map string names to numbers
-                tier_map = {"critical": 1, "standard": 2, "low": 3}
-                tier_num = tier_map.get(tier_str.lower(), 2)
-        elif isinstance(tier_str, int):
-            tier_num = tier_str
-
-        return ServiceHealth(
-            service=context.name,
-            tier=tier_num,
-            team=context.team,
-            service_type=context.type,
-            slos=slos,
+        stats = LiveQueryStats(
+            queries=len(queries),
+            requests=batcher.stats.requests,
+            duration_seconds=time.monotonic() - start,
+            timings=timings,
         )
+        for key, value in values.items():
+            timing = timings[int(key)]
+            timing.seconds = batcher.stats.query_seconds.get(key)
+            if isinstance(value, Exception):
+                # Keep UNKNOWN status on query failure
+                timing.error = str(value) or type(value).__name__
+                if isinstance(value, DeadlineExceeded):
+                    stats.deadline_exceeded += 1
+                elif isinstance(value, TimeoutError):
+                    stats.timed_out += 1
+                else:
+                    stats.failed += 1
+            elif value is None:
+                # Keep UNKNOWN status when the query returned no series
+                stats.no_data += 1
+            else:
+                stats.succeeded += 1
+                self._apply_live_value(targets[int(key)], value)
+
+        # Recalculate overall status after enrichment
+        for item in scanned:
+            item.health.__post_init__()
+
+        return stats
+
+    def _apply_live_value(self, slo_health: SLOHealth, current_value: float) -> None:
+        """Update status and budget consumption from a live SLI value."""
+        slo_health.current_value = current_value
+
+        # Calculate status based on objective
+        objective = slo_health.objective
+        if current_value >= objective:
+            slo_health.status = HealthStatus.HEALTHY
+        elif current_value >= objective * 0.99:  # Within 1%
+            slo_health.status = HealthStatus.WARNING
+        elif current_value >= objective * 0.95:  # Within 5%
+            slo_health.status = HealthStatus.CRITICAL
+        else:
+            slo_health.status = HealthStatus.EXHAUSTED
+
+        # Estimate budget consumed
+        error_budget = 100 - objective
+        error_rate = 100 - current_value
+        if error_budget > 0:
+            budget_consumed = (error_rate / error_budget) * 100
+            slo_health.budget_consumed_percent = min(budget_consumed, 100)
+
+    def _parse_service_file(self, file_path: Path) -> ServiceHealth | None:
+        """Parse a service file and extract health information."""
+        scanned = scan_service_file(file_path)
+        return scanned.health if scanned else None
 
     def _calculate_tier_health(self, services: list[ServiceHealth]) -> list[TierHealth]:
         """Calculate health statistics per tier."""
@@ -292,6 +502,12 @@ class PortfolioAggregator:
 def collect_portfolio(
     search_paths: list[str] | None = None,
     prometheus_url: str | None = None,
+    jobs: int | None = None,
+    ignore: list[str] | None = None,
+    concurrency: int | None = None,
+    query_timeout: float | None = None,
+    rate_limit: float | None = None,
+    deadline: float | None = None,
 ) -> PortfolioHealth:
     """
     Convenience function to collect portfolio health.
@@ -299,10 +515,25 @@ def collect_portfolio(
     Args:
         search_paths: Optional list of directories to search
         prometheus_url: Optional Prometheus URL for live SLO data
+        jobs: Worker processes for parsing (default: CPU count)
+        ignore: Glob patterns of files and directories to skip
+        concurrency: Maximum Prometheus requests in flight (default: 8)
+        query_timeout: Seconds allowed per request
+        rate_limit: Maximum Prometheus requests started per second
+        deadline: Seconds allowed for all live queries together
 
     Returns:
         PortfolioHealth with aggregated data
     """
     paths = [Path(p) for p in search_paths] if search_paths else None
-    aggregator = PortfolioAggregator(search_paths=paths, prometheus_url=prometheus_url)
+    aggregator = PortfolioAggregator(
+        search_paths=paths,
+        prometheus_url=prometheus_url,
+        jobs=jobs,
+        ignore=ignore,
+        concurrency=concurrency,
+        query_timeout=query_timeout,
+        rate_limit=rate_limit,
+        deadline=deadline,
+    )
     return aggregator.collect()
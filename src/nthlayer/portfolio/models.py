@@ -22,6 +22,10 @@ class HealthStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
+# Slowest live queries listed in the JSON output
+SLOWEST_QUERIES = 5
+
+
 class InsightType(str, Enum):
     """Type of portfolio insight."""
 
@@ -160,6 +164,83 @@ class Insight:
         }
 
 
+@dataclass
+class LiveQueryTiming:
+    """Outcome of one SLO's live SLI query."""
+
+    service: str
+    slo: str
+    seconds: float | None = None  # None if the query was never sent
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON export."""
+        return {
+            "service": self.service,
+            "slo": self.slo,
+            "seconds": None if self.seconds is None else round(self.seconds, 4),
+            "error": self.error,
+        }
+
+
+@dataclass
+class LiveQueryStats:
+    """Counters and timings of the live Prometheus queries of a collection."""
+
+    queries: int = 0
+    requests: int = 0  # HTTP requests sent (batches answer several queries)
+    succeeded: int = 0
+    no_data: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    deadline_exceeded: int = 0
+    duration_seconds: float = 0.0
+    timings: list[LiveQueryTiming] = field(default_factory=list)
+
+    def percentile_seconds(self, percentile: float) -> float | None:
+        """Query duration at ``percentile`` (0-100), or None without timings."""
+        durations = sorted(t.seconds for t in self.timings if t.seconds is not None)
+        if not durations:
+            return None
+        index = min(len(durations) - 1, int(len(durations) * percentile / 100))
+        return durations[index]
+
+    @property
+    def failures(self) -> list[LiveQueryTiming]:
+        """Queries that failed, timed out or missed the deadline."""
+        return [t for t in self.timings if t.error is not None]
+
+    @property
+    def slowest(self) -> list[LiveQueryTiming]:
+        """The slowest queries, slowest first."""
+        timed = [t for t in self.timings if t.seconds is not None]
+        return sorted(timed, key=lambda t: t.seconds or 0.0, reverse=True)[:SLOWEST_QUERIES]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON export."""
+
+        def rounded(value: float | None) -> float | None:
+            return None if value is None else round(value, 4)
+
+        return {
+            "queries": self.queries,
+            "requests": self.requests,
+            "succeeded": self.succeeded,
+            "no_data": self.no_data,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "deadline_exceeded": self.deadline_exceeded,
+            "duration_seconds": round(self.duration_seconds, 4),
+            "query_seconds": {
+                "p50": rounded(self.percentile_seconds(50)),
+                "p95": rounded(self.percentile_seconds(95)),
+                "max": rounded(self.percentile_seconds(100)),
+            },
+            "slowest": [t.to_dict() for t in self.slowest],
+            "failures": [t.to_dict() for t in self.failures],
+        }
+
+
 @dataclass
 class PortfolioHealth:
     """Overall portfolio health aggregation."""
@@ -171,6 +252,8 @@ class PortfolioHealth:
     by_tier: list[TierHealth] = field(default_factory=list)
     services: list[ServiceHealth] = field(default_factory=list)
     insights: list[Insight] = field(default_factory=list)
+    # Set when live data was fetched from Prometheus
+    live_queries: LiveQueryStats | None = None
 
     @property
     def org_health_percent(self) -> float:
@@ -191,7 +274,7 @@ class PortfolioHealth:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON export."""
-        return {
+        data = {
             "timestamp": self.timestamp.isoformat(),
             "summary": {
                 "total_services": self.total_services,
@@ -204,6 +287,9 @@ class PortfolioHealth:
             "services": [svc.to_dict() for svc in self.services],
             "insights": [insight.to_dict() for insight in self.insights],
         }
+        if self.live_queries is not None:
+            data["live_queries"] = self.live_queries.to_dict()
+        return data
 
     def to_csv_rows(self) -> list[dict[str, Any]]:
         """Convert to flat rows for CSV export."""
@@ -6,23 +6,80 @@ Implements provider interface for Prometheus/VictoriaMetrics.
 
 from __future__ import annotations
 
+import asyncio
+import os
 from datetime import datetime
-from typing import Any
+from typing import Any, overload
 
 import httpx
 
 from nthlayer.core.errors import ProviderError
+from nthlayer.core.timeseries import TimeSeries
 from nthlayer.providers.base import Provider, ProviderHealth, ProviderResourceSchema
+from nthlayer.providers.query_cache import QueryCache, align_range, classify_query
+from nthlayer.providers.query_shard import (
+    DEFAULT_SHARD_CONCURRENCY,
+    MAX_POINTS_PER_QUERY,
+    merge_range_results,
+    plan_shards,
+)
+
+# Optional h2 import (HTTP/2 support in httpx)
+try:
+    import h2  # noqa: F401
+
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
 
 DEFAULT_USER_AGENT = "nthlayer-provider-prometheus/0.1.0"
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+# Queries longer than this are sent as a form-encoded POST so batched
+# expressions do not hit URL length limits in proxies and query frontends.
+MAX_GET_QUERY_LENGTH = 4096
+
+SHARD_DURATION_ENV = "NTHLAYER_QUERY_SHARD_DURATION"
 
 
 class PrometheusProviderError(ProviderError):
     """Raised when Prometheus provider encounters an error."""
 
 
+def extract_sli_value(series: dict[str, Any] | None) -> float:
+    """Return the sample value of one instant-vector series (0.0 when missing)."""
+    if not series:
+        return 0.0
+
+    value_data = series.get("value", [])
+
+    if len(value_data) < 2:
+        return 0.0
+
+    try:
+        return float(value_data[1])
+    except (ValueError, TypeError):
+        return 0.0
+
+
 class PrometheusProvider(Provider):
-    """Prometheus metrics provider."""
+    """
+    Prometheus metrics provider.
+
+    Requests share one pooled ``httpx.AsyncClient`` that is created on first
+    use and kept alive until ``aclose()``, so consecutive queries reuse the
+    same TCP/TLS connections instead of handshaking per query. The provider
+    can be used as an async context manager to guarantee the pool is released.
+
+    When a ``QueryCache`` is supplied, successful ``query``/``query_range``
+    responses are served from it and range bounds are aligned to the step.
+
+    Range queries that exceed the per-query point limit (or the configured
+    shard duration) are split into step-aligned shards, fetched concurrently
+    and stitched back into a single response.
+    """
 
     name = "prometheus"
 
@@ -34,15 +91,80 @@ class PrometheusProvider(Provider):
         password: str | None = None,
         timeout: float = 30.0,
         user_agent: str = DEFAULT_USER_AGENT,
+        http2: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        cache: QueryCache | None = None,
+        max_points_per_query: int = MAX_POINTS_PER_QUERY,
+        shard_duration: str | None = None,
+        shard_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
     ) -> None:
+        """
+        Initialize Prometheus provider.
+
+        Args:
+            url: Base URL of the Prometheus-compatible API
+            username: Basic auth username
+            password: Basic auth password
+            timeout: Request timeout in seconds
+            user_agent: User agent string
+            http2: Negotiate HTTP/2 when the ``h2`` package is installed
+                (falls back to HTTP/1.1 otherwise)
+            max_connections: Maximum concurrent connections in the pool
+            max_keepalive_connections: Maximum idle connections kept open
+            keepalive_expiry: Seconds an idle connection is kept open
+            cache: Optional result cache shared with other providers
+            max_points_per_query: Points per series above which a range
+                query is sharded (Prometheus rejects more than 11,000)
+            shard_duration: Maximum time span per range shard (e.g. "7d");
+                defaults to NTHLAYER_QUERY_SHARD_DURATION, else unlimited
+            shard_concurrency: Maximum range shards fetched at once
+        """
         self._base_url = url.rstrip("/")
         self._timeout = timeout
         self._user_agent = user_agent
         self._auth = (username, password) if username and password else None
+        self._http2 = http2 and H2_AVAILABLE
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client: httpx.AsyncClient | None = None
+        self._cache = cache
+        # Different credentials may see different tenants
+        self._cache_namespace = f"{self._base_url}|{username or ''}"
+        self._max_points_per_query = max_points_per_query
+        shard_duration = shard_duration or os.environ.get(SHARD_DURATION_ENV)
+        self._shard_seconds = (
+            self._parse_step_to_seconds(shard_duration) if shard_duration else None
+        )
+        self._shard_concurrency = max(1, shard_concurrency)
+
+    async def __aenter__(self) -> PrometheusProvider:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     async def aclose(self) -> None:
-        """Close provider (for symmetry with other providers)."""
-        return None
+        """Close the pooled HTTP client and release its connections."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                auth=self._auth,
+                limits=self._limits,
+                http2=self._http2,
+                headers={"User-Agent": self._user_agent},
+            )
+        return self._client
 
     async def health_check(self) -> ProviderHealth:
         """Check if Prometheus is reachable."""
@@ -72,8 +194,7 @@ class PrometheusProvider(Provider):
         if time is not None:
             params["time"] = time.timestamp()
 
-        result = await self._request("GET", "/api/v1/query", params=params)
-        return result
+        return await self._query_api("/api/v1/query", params)
 
     async def query_range(
         self,
@@ -85,6 +206,9 @@ class PrometheusProvider(Provider):
         """
         Execute range query over a time period.
 
+        Long ranges are split into shards that are fetched concurrently;
+        the stitched result has the same shape as a single response.
+
         Args:
             query: PromQL query string
             start: Start time
@@ -94,30 +218,62 @@ class PrometheusProvider(Provider):
         Returns:
             Query result from Prometheus with time series data
         """
-        params = {
-            "query": query,
-            "start": start.timestamp(),
-            "end": end.timestamp(),
-            "step": step,
-        }
-
-        result = await self._request("GET", "/api/v1/query_range", params=params)
-        return result
+        step_seconds = self._parse_step_to_seconds(step)
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+        if self._cache is not None:
+            start_ts, end_ts = align_range(start_ts, end_ts, step_seconds)
+
+        shards = plan_shards(
+            start_ts,
+            end_ts,
+            step_seconds,
+            max_points=self._max_points_per_query,
+            shard_seconds=self._shard_seconds,
+        )
+        if len(shards) == 1:
+            return await self._query_api(
+                "/api/v1/query_range",
+                {"query": query, "start": start_ts, "end": end_ts, "step": step},
+            )
+
+        semaphore = asyncio.Semaphore(self._shard_concurrency)
+
+        async def _fetch_shard(shard_start: float, shard_end: float) -> dict[str, Any]:
+            async with semaphore:
+                return await self._query_api(
+                    "/api/v1/query_range",
+                    {"query": query, "start": shard_start, "end": shard_end, "step": step},
+                )
+
+        results = await asyncio.gather(*(_fetch_shard(s, e) for s, e in shards))
+        return merge_range_results(results)
+
+    @overload
+    async def get_sli_value(self, query: str, time: datetime | None = None) -> float: ...
+
+    @overload
+    async def get_sli_value(
+        self, query: str, time: datetime | None = None, *, missing: None
+    ) -> float | None: ...
 
     async def get_sli_value(
         self,
         query: str,
         time: datetime | None = None,
-    ) -> float:
+        *,
+        missing: float | None = 0.0,
+    ) -> float | None:
         """
         Get SLI value from a query (simplified, returns single value).
 
         Args:
             query: PromQL query that returns a single metric value
             time: Evaluation time (defaults to now)
+            missing: Returned when the query yields no series, so callers
+                can tell "no data" from a real 0 by passing None
 
         Returns:
-            SLI value as float (0.0-1.0)
+            SLI value as float (0.0-1.0), or ``missing``
         """
         result = await self.query(query, time)
 
@@ -126,18 +282,32 @@ class PrometheusProvider(Provider):
         result_data = data.get("result", [])
 
         if not result_data:
-            return 0.0
+            return missing
 
         # Get first result's value
-        value_data = result_data[0].get("value", [])
+        return extract_sli_value(result_data[0])
 
-        if len(value_data) < 2:
-            return 0.0
+    async def get_sli_series(
+        self,
+        query: str,
+        start: datetime,
+        end: datetime,
+        step: str = "5m",
+    ) -> TimeSeries:
+        """
+        Get an SLI time series in columnar form.
 
-        try:
-            return float(value_data[1])
-        except (ValueError, TypeError):
-            return 0.0
+        Args:
+            query: PromQL query
+            start: Start time
+            end: End time
+            step: Query resolution
+
+        Returns:
+            TimeSeries of the first returned series (empty if none)
+        """
+        result = await self.query_range(query, start, end, step)
+        return TimeSeries.from_query_range(result, self._parse_step_to_seconds(step))
 
     async def get_sli_time_series(
         self,
@@ -149,6 +319,9 @@ class PrometheusProvider(Provider):
         """
         Get time series of SLI values.
 
+        Prefer ``get_sli_series`` for long windows; this builds one dict
+        per sample.
+
         Args:
             query: PromQL query
             start: Start time
@@ -158,45 +331,26 @@ class PrometheusProvider(Provider):
         Returns:
             List of {timestamp, sli_value, duration_seconds} dicts
         """
-        result = await self.query_range(query, start, end, step)
-
-        # Parse result
-        data = result.get("data", {})
-        result_data = data.get("result", [])
-
-        if not result_data:
-            return []
-
-        # Extract time series values
-        values = result_data[0].get("values", [])
-
-        measurements = []
-        for i, value_pair in enumerate(values):
-            if len(value_pair) < 2:
-                continue
-
-            timestamp_unix = value_pair[0]
-            sli_value = float(value_pair[1])
-
-            timestamp = datetime.fromtimestamp(timestamp_unix)
-
-            # Calculate duration (time to next measurement or step size)
-            if i < len(values) - 1:
-                next_timestamp_unix = values[i + 1][0]
-                duration_seconds = next_timestamp_unix - timestamp_unix
-            else:
-                # Last point: use step size
-                duration_seconds = self._parse_step_to_seconds(step)
-
-            measurements.append(
-                {
-                    "timestamp": timestamp,
-                    "sli_value": sli_value,
-                    "duration_seconds": duration_seconds,
-                }
-            )
+        series = await self.get_sli_series(query, start, end, step)
+        return series.to_records()
+
+    async def _query_api(self, path: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Run a query API request, going through the result cache if configured."""
+        cache, key = self._cache, ""
+        if cache is not None:
+            key = cache.make_key(self._cache_namespace, path, params)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        if len(params["query"]) > MAX_GET_QUERY_LENGTH:
+            result = await self._request("POST", path, data=params)
+        else:
+            result = await self._request("GET", path, params=params)
 
-        return measurements
+        if cache is not None:
+            cache.set(key, result, classify_query(params))
+        return result
 
     async def _request(
         self,
@@ -210,31 +364,27 @@ class PrometheusProvider(Provider):
         headers = kwargs.pop("headers", {}) or {}
         headers.setdefault("User-Agent", self._user_agent)
 
-        async def _call() -> dict[str, Any]:
-            try:
-                async with httpx.AsyncClient(timeout=self._timeout, auth=self._auth) as client:
-                    resp = await client.request(
-                        method,
-                        url,
-                        headers=headers,
-                        params=params,
-                        **kwargs,
-                    )
-                    resp.raise_for_status()
-
-                    data = resp.json()
-
-                    # Check Prometheus API status
-                    status = data.get("status")
-                    if status != "success":
-                        error = data.get("error", "Unknown error")
-                        raise PrometheusProviderError(f"Prometheus API error: {error}")
-
-                    return data
-            except httpx.HTTPError as exc:
-                raise PrometheusProviderError(str(exc)) from exc
-
-        return await _call()
+        try:
+            resp = await self._get_client().request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                **kwargs,
+            )
+            resp.raise_for_status()
+        except httpx.HTTPError as exc:
+            raise PrometheusProviderError(str(exc)) from exc
+
+        data = resp.json()
+
+        # Check Prometheus API status
+        status = data.get("status")
+        if status != "success":
+            error = data.get("error", "Unknown error")
+            raise PrometheusProviderError(f"Prometheus API error: {error}")
+
+        return data
 
     def _parse_step_to_seconds(self, step: str) -> float:
         """Parse Prometheus step string to seconds."""
@@ -0,0 +1,287 @@
+"""
+Batched instant queries for Prometheus.
+
+Merges the SLI expressions of many SLOs into a single PromQL request.
+Each sub-expression is tagged with a ``nthlayer_slo`` label via
+``label_replace`` and the tagged vectors are joined with ``or``:
+
+    label_replace((<expr 0>), "nthlayer_slo", "0", "", "")
+      or label_replace((<expr 1>), "nthlayer_slo", "1", "", "")
+
+The single vector result is then split back per query by that label.
+Expressions that cannot be merged (scalars, range vectors) and batches
+whose request fails are answered with individual queries instead; a batch
+that times out is not retried.
+
+Requests run concurrently, optionally paced by a global rate limit and
+bounded by a deadline for the whole call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, TypeVar
+
+from nthlayer.providers.prometheus import PrometheusProvider, extract_sli_value
+
+BATCH_LABEL = "nthlayer_slo"
+DEFAULT_MAX_BATCH_SIZE = 20
+DEFAULT_BATCH_CONCURRENCY = 8
+
+_NUMBER_LITERAL = re.compile(r"^[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?$")
+_SCALAR_FUNCTION = re.compile(r"^(scalar|time|pi)\s*\(")
+_TRAILING_RANGE = re.compile(r"\[[^\]]*\]\s*$")
+
+
+T = TypeVar("T")
+
+
+class BatchSplitError(Exception):
+    """Raised when a batched result cannot be split back per query."""
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised for queries that could not finish before the batcher deadline."""
+
+
+@dataclass
+class QueryBatchStats:
+    """Request counters and per-query timings of a ``get_sli_values`` call."""
+
+    requests: int = 0
+    batches: int = 0
+    # Batches answered with individual queries after the merged request failed
+    fallbacks: int = 0
+    # Seconds taken by the request that answered each query, by caller key
+    query_seconds: dict[str, float] = field(default_factory=dict)
+
+
+class RateLimiter:
+    """Spaces request starts evenly so at most ``rate`` begin per second."""
+
+    def __init__(self, rate: float) -> None:
+        if rate <= 0:
+            raise ValueError("Rate limit must be positive")
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        """Wait for the next free slot."""
+        now = asyncio.get_running_loop().time()
+        # Reserved before sleeping, so concurrent callers queue up in order
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def can_merge(expr: str) -> bool:
+    """
+    Check whether an expression can be tagged and merged into a batch.
+
+    ``label_replace`` only accepts instant vectors, so scalar expressions
+    and bare range selectors are answered individually. This is a cheap
+    syntactic check; anything it lets through that Prometheus rejects is
+    caught by the batch-level fallback.
+    """
+    stripped = expr.strip()
+    if not stripped or BATCH_LABEL in stripped:
+        return False
+    if _NUMBER_LITERAL.match(stripped) or _SCALAR_FUNCTION.match(stripped):
+        return False
+    if _TRAILING_RANGE.search(stripped):
+        return False
+    return True
+
+
+def build_batch_query(exprs: Sequence[str]) -> str:
+    """Merge expressions into one query, tagging each with its index."""
+    return " or ".join(
+        f'label_replace(({expr}), "{BATCH_LABEL}", "{i}", "", "")' for i, expr in enumerate(exprs)
+    )
+
+
+def split_batch_result(result: dict[str, Any], size: int) -> list[float | None]:
+    """
+    Split a batched vector result back into one value per sub-expression.
+
+    The first series carrying each tag wins, matching ``get_sli_value``
+    for an unbatched query. Tags with no series yield None (no data).
+
+    Raises:
+        BatchSplitError: If a series lacks a valid batch tag
+    """
+    series_by_index: dict[int, dict[str, Any]] = {}
+
+    for series in result.get("data", {}).get("result", []):
+        tag = series.get("metric", {}).get(BATCH_LABEL)
+        if tag is None or not tag.isdigit() or int(tag) >= size:
+            raise BatchSplitError(f"Unexpected series in batched result: {series.get('metric')}")
+        series_by_index.setdefault(int(tag), series)
+
+    return [
+        extract_sli_value(series_by_index[i]) if i in series_by_index else None for i in range(size)
+    ]
+
+
+class QueryBatcher:
+    """
+    Answers many SLI instant queries with as few requests as possible.
+
+    Identical expressions are issued once. Mergeable expressions are sent
+    in batches of up to ``max_batch_size``; batches and individual queries
+    run concurrently, at most ``concurrency`` requests at a time, each
+    bounded by ``timeout`` seconds. ``rate_limit`` caps how many requests
+    start per second, and ``deadline`` bounds a whole ``get_sli_values``
+    call: queries still unanswered then fail with ``DeadlineExceeded``.
+
+    ``stats`` holds the counters and timings of the latest call.
+    """
+
+    def __init__(
+        self,
+        provider: PrometheusProvider,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        timeout: float | None = None,
+        rate_limit: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        self._provider = provider
+        self._max_batch_size = max(1, max_batch_size)
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._timeout = timeout
+        self._rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+        self._deadline = deadline
+        self._deadline_at: float | None = None
+        self._seconds_by_expr: dict[str, float] = {}
+        self.stats = QueryBatchStats()
+
+    async def get_sli_values(
+        self,
+        queries: Mapping[str, str],
+        time: datetime | None = None,
+    ) -> dict[str, float | None | Exception]:
+        """
+        Evaluate SLI queries, returning one value per key.
+
+        Values follow ``PrometheusProvider.get_sli_value`` semantics, except
+        that a query returning no series yields None rather than 0.0, so a
+        real 0 is not mistaken for missing data. A query that fails is reported by
+        storing its exception under its key instead of raising, so one bad
+        query does not hide the others.
+
+        Args:
+            queries: Mapping of caller-chosen key to PromQL expression
+            time: Query evaluation time (defaults to now)
+
+        Returns:
+            Mapping of the same keys to a float, None or the raised exception
+        """
+        self.stats = QueryBatchStats()
+        self._seconds_by_expr = {}
+        self._deadline_at = (
+            None if self._deadline is None else asyncio.get_running_loop().time() + self._deadline
+        )
+
+        # Identical expressions are only evaluated once
+        unique_exprs = list(dict.fromkeys(queries.values()))
+        mergeable = [expr for expr in unique_exprs if can_merge(expr)]
+        singles = [expr for expr in unique_exprs if not can_merge(expr)]
+
+        chunks = [
+            mergeable[i : i + self._max_batch_size]
+            for i in range(0, len(mergeable), self._max_batch_size)
+        ]
+        # A batch of one gains nothing from tagging
+        singles.extend(chunk[0] for chunk in chunks if len(chunk) == 1)
+        batches = [chunk for chunk in chunks if len(chunk) > 1]
+
+        values_by_expr: dict[str, float | None | Exception] = {}
+
+        async def _run_single(expr: str) -> None:
+            values_by_expr[expr] = await self._query_single(expr, time)
+
+        async def _run_batch(exprs: list[str]) -> None:
+            try:
+                values = await self._query_batch(exprs, time)
+            except TimeoutError as exc:
+                # Retrying individually would wait out the timeout again
+                # per query, or there is no time left (DeadlineExceeded)
+                values_by_expr.update(dict.fromkeys(exprs, exc))
+                return
+            except Exception:
+                # Fall back to individual queries for this batch
+                self.stats.fallbacks += 1
+                await asyncio.gather(*(_run_single(expr) for expr in exprs))
+                return
+            values_by_expr.update(zip(exprs, values, strict=True))
+
+        await asyncio.gather(
+            *(_run_batch(exprs) for exprs in batches),
+            *(_run_single(expr) for expr in singles),
+        )
+
+        self.stats.query_seconds = {
+            key: self._seconds_by_expr[expr]
+            for key, expr in queries.items()
+            if expr in self._seconds_by_expr
+        }
+        return {key: values_by_expr[expr] for key, expr in queries.items()}
+
+    async def _query_single(self, expr: str, time: datetime | None) -> float | None | Exception:
+        """Run one unbatched query, capturing any failure."""
+        try:
+            return await self._request(
+                lambda: self._provider.get_sli_value(expr, time, missing=None), [expr]
+            )
+        except Exception as exc:
+            return exc
+
+    async def _query_batch(self, exprs: list[str], time: datetime | None) -> list[float | None]:
+        """Run one merged query and split its result per expression."""
+        self.stats.batches += 1
+        result = await self._request(
+            lambda: self._provider.query(build_batch_query(exprs), time), exprs
+        )
+        return split_batch_result(result, len(exprs))
+
+    async def _request(self, send: Callable[[], Awaitable[T]], exprs: list[str]) -> T:
+        """
+        Send one request within the concurrency, rate and time limits.
+
+        The request's duration is recorded for each expression it answers.
+
+        Raises:
+            DeadlineExceeded: If the deadline passes before or while it runs
+        """
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+
+            timeout = self._timeout
+            cut_by_deadline = False
+            if self._deadline_at is not None:
+                remaining = self._deadline_at - loop.time()
+                if remaining <= 0:
+                    raise DeadlineExceeded("Query deadline passed before the request was sent")
+                cut_by_deadline = timeout is None or remaining < timeout
+                timeout = remaining if cut_by_deadline else timeout
+
+            self.stats.requests += 1
+            start = loop.time()
+            try:
+                return await asyncio.wait_for(send(), timeout=timeout)
+            except TimeoutError:
+                if cut_by_deadline:
+                    raise DeadlineExceeded("Query deadline passed during the request") from None
+                raise
+            finally:
+                elapsed = loop.time() - start
+                self._seconds_by_expr.update(dict.fromkeys(exprs, elapsed))
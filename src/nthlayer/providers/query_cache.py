@@ -0,0 +1,317 @@
+"""
+Result cache for Prometheus queries.
+
+``check-deploy``, ``drift``, ``portfolio`` and ``scorecard`` re-issue the
+same instant and range queries within a run and across back-to-back runs
+in CI. ``QueryCache`` keeps successful query responses in an in-memory
+LRU tier and, optionally, in a sqlite file under ``~/.cache/nthlayer`` so
+the next process can reuse them.
+
+Entries expire per query class:
+
+    instant     - evaluated "now"                       (30s)
+    range       - range ending within the last hour     (5m)
+    historical  - instant or range entirely in the past (24h)
+
+The process-wide cache is configured with ``NTHLAYER_QUERY_CACHE``
+(``memory`` - the default, ``disk`` or ``off``) and can be switched off
+for a run with ``--no-cache``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+from cachetools import TLRUCache  # type: ignore[import-untyped]
+
+logger = structlog.get_logger()
+
+QUERY_CACHE_ENV = "NTHLAYER_QUERY_CACHE"
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTLS: dict[str, float] = {
+    "instant": 30.0,
+    "range": 300.0,
+    "historical": 86400.0,
+}
+
+# Queries evaluated further back than this are not expected to change
+HISTORICAL_AGE = 3600.0
+
+_DISABLED_MODES = {"off", "none", "false", "0"}
+
+
+def default_cache_dir() -> Path:
+    """Return the nthlayer cache directory (``$XDG_CACHE_HOME/nthlayer``)."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "nthlayer"
+
+
+def classify_query(params: Mapping[str, Any], now: float | None = None) -> str:
+    """Return the TTL class of a query from its API parameters."""
+    now = time.time() if now is None else now
+    evaluated_at = params.get("end", params.get("time"))
+
+    if evaluated_at is not None and now - float(evaluated_at) > HISTORICAL_AGE:
+        return "historical"
+    return "range" if "end" in params else "instant"
+
+
+def align_range(start: float, end: float, step: float) -> tuple[float, float]:
+    """
+    Snap range bounds down to multiples of ``step``.
+
+    Prometheus evaluates a range query at ``start + k * step``, so aligned
+    bounds return the same samples for every run inside one step and the
+    requests share a cache key.
+    """
+    if step <= 0:
+        return start, end
+    return (start // step) * step, (end // step) * step
+
+
+@dataclass
+class QueryCacheStats:
+    """Hit/miss counters for a query cache."""
+
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+    entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "entries": self.entries,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class QueryCache:
+    """
+    Two-tier TTL/LRU cache of Prometheus query responses.
+
+    Cached responses are shared between callers and must be treated as
+    read-only. A failing disk tier is logged and switched off rather than
+    failing the query.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttls: Mapping[str, float] | None = None,
+        disk_path: Path | str | None = None,
+        timer: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum responses held in memory (least recently
+                used entries are evicted first)
+            ttls: Per query class TTL overrides in seconds
+            disk_path: sqlite file for the persistent tier (memory only if None)
+            timer: Clock returning epoch seconds
+        """
+        self._ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._memory: TLRUCache = TLRUCache(
+            maxsize=max_entries,
+            ttu=lambda _key, value, _now: value[0],
+            timer=timer,
+        )
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._disk_path = Path(disk_path) if disk_path else None
+        self._db: sqlite3.Connection | None = None
+        self._stats = QueryCacheStats()
+
+    @staticmethod
+    def make_key(namespace: str, path: str, params: Mapping[str, Any]) -> str:
+        """Build a stable cache key for one API request."""
+        payload = json.dumps(
+            [namespace, path, sorted((k, str(v)) for k, v in params.items())],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def ttl_for(self, query_class: str) -> float:
+        """Return the TTL in seconds for a query class."""
+        return self._ttls.get(query_class, self._ttls["instant"])
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return a cached response, or None on a miss."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._stats.hits += 1
+                return entry[1]
+
+            cached = self._disk_get(key)
+            if cached is not None:
+                # Promote to memory so later lookups skip sqlite
+                self._memory[key] = cached
+                self._stats.hits += 1
+                self._stats.disk_hits += 1
+                return cached[1]
+
+            self._stats.misses += 1
+            return None
+
+    def set(self, key: str, value: dict[str, Any], query_class: str = "instant") -> None:
+        """Store a response under ``key`` for its class TTL."""
+        ttl = self.ttl_for(query_class)
+        if ttl <= 0:
+            return
+
+        entry = (self._timer() + ttl, value)
+        with self._lock:
+            self._memory[key] = entry
+            self._disk_set(key, entry)
+
+    def stats(self) -> QueryCacheStats:
+        """Return a snapshot of the hit/miss counters."""
+        with self._lock:
+            return QueryCacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                disk_hits=self._stats.disk_hits,
+                entries=len(self._memory),
+            )
+
+    def clear(self) -> None:
+        """Drop all entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            db = self._get_db()
+            if db is not None:
+                self._disk_execute(db, "DELETE FROM entries")
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        with self._lock:
+            db, self._db = self._db, None
+            if db is not None:
+                db.close()
+
+    def _get_db(self) -> sqlite3.Connection | None:
+        """Open the sqlite tier on first use, pruning expired rows."""
+        if self._db is not None or self._disk_path is None:
+            return self._db
+
+        try:
+            self._disk_path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self._disk_path, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            db.execute("DELETE FROM entries WHERE expires_at <= ?", (self._timer(),))
+            db.commit()
+        except (OSError, sqlite3.Error) as exc:
+            self._disable_disk(exc)
+            return None
+
+        self._db = db
+        return db
+
+    def _disk_get(self, key: str) -> tuple[float, dict[str, Any]] | None:
+        db = self._get_db()
+        if db is None:
+            return None
+
+        row = self._disk_execute(
+            db,
+            "SELECT value, expires_at FROM entries WHERE key = ? AND expires_at > ?",
+            (key, self._timer()),
+        )
+        if not row:
+            return None
+
+        value, expires_at = row
+        return expires_at, json.loads(value)
+
+    def _disk_set(self, key: str, entry: tuple[float, dict[str, Any]]) -> None:
+        db = self._get_db()
+        if db is None:
+            return
+
+        expires_at, value = entry
+        self._disk_execute(
+            db,
+            "INSERT OR REPLACE INTO entries (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, json.dumps(value), expires_at),
+        )
+
+    def _disk_execute(
+        self, db: sqlite3.Connection, sql: str, params: tuple[Any, ...] = ()
+    ) -> tuple[Any, ...] | None:
+        try:
+            row = db.execute(sql, params).fetchone()
+            db.commit()
+            return row
+        except sqlite3.Error as exc:
+            self._disable_disk(exc)
+            return None
+
+    def _disable_disk(self, exc: Exception) -> None:
+        logger.warning("query_cache_disk_disabled", path=str(self._disk_path), error=str(exc))
+        if self._db is not None:
+            self._db.close()
+        self._db = None
+        self._disk_path = None
+
+
+_query_cache: QueryCache | None = None
+_query_cache_disabled = False
+
+
+def get_query_cache() -> QueryCache | None:
+    """
+    Return the process-wide query cache, or None when caching is off.
+
+    The tier is chosen by ``NTHLAYER_QUERY_CACHE``: ``memory`` (default),
+    ``disk`` (memory plus ``~/.cache/nthlayer/query-cache.sqlite``) or ``off``.
+    """
+    global _query_cache
+
+    mode = os.environ.get(QUERY_CACHE_ENV, "memory").strip().lower()
+    if _query_cache_disabled or mode in _DISABLED_MODES:
+        return None
+
+    if _query_cache is None:
+        disk_path = default_cache_dir() / "query-cache.sqlite" if mode == "disk" else None
+        _query_cache = QueryCache(disk_path=disk_path)
+    return _query_cache
+
+
+def disable_query_cache() -> None:
+    """Turn the process-wide cache off (``--no-cache``)."""
+    global _query_cache_disabled
+    _query_cache_disabled = True
+
+
+def reset_query_cache() -> None:
+    """Drop the process-wide cache and re-enable caching."""
+    global _query_cache, _query_cache_disabled
+    if _query_cache is not None:
+        _query_cache.close()
+    _query_cache = None
+    _query_cache_disabled = False
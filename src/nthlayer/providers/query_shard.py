@@ -0,0 +1,107 @@
+"""
+Sharding for long Prometheus range queries.
+
+Prometheus rejects range queries that would return more than 11,000
+points per series, so a 90d window at a 5m step cannot be fetched in one
+request; long ranges are also slow on Thanos and similar query frontends.
+``plan_shards`` splits a range into step-aligned shards that respect the
+point limit and ``merge_range_results`` stitches the shard responses back
+into one matrix, dropping samples duplicated at shard boundaries.
+
+Shard boundaries fall on fixed multiples of the shard span (in the start
+time's step phase), so interior shards are identical from one run to the
+next and can be served from the query cache.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+# Prometheus limit on points per series in one range query
+MAX_POINTS_PER_QUERY = 11_000
+DEFAULT_SHARD_CONCURRENCY = 4
+
+
+def plan_shards(
+    start: float,
+    end: float,
+    step: float,
+    *,
+    max_points: int = MAX_POINTS_PER_QUERY,
+    shard_seconds: float | None = None,
+) -> list[tuple[float, float]]:
+    """
+    Split ``[start, end]`` into step-aligned shards.
+
+    Each shard holds at most ``max_points`` evaluation points and, when
+    ``shard_seconds`` is given, spans at most that long. Consecutive shards
+    do not overlap: the next shard starts one step after the previous ends.
+
+    Args:
+        start: Range start (epoch seconds)
+        end: Range end (epoch seconds)
+        step: Query resolution in seconds
+        max_points: Maximum points per shard
+        shard_seconds: Optional maximum shard duration in seconds
+
+    Returns:
+        List of (start, end) pairs covering the range in order
+    """
+    if step <= 0 or end <= start:
+        return [(start, end)]
+
+    points = max(1, max_points)
+    if shard_seconds is not None and shard_seconds > 0:
+        points = max(1, min(points, int(shard_seconds // step)))
+
+    span = points * step
+    if end - start < span:
+        return [(start, end)]
+
+    # Boundaries on multiples of the span keep interior shards stable across runs
+    phase = start % step
+    shards = []
+    shard_start = start
+    while shard_start <= end:
+        boundary = ((shard_start - phase) // span + 1) * span + phase
+        shard_end = min(boundary - step, end)
+        shards.append((shard_start, shard_end))
+        shard_start = boundary
+    return shards
+
+
+def merge_range_results(results: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Stitch shard responses back into one range query response.
+
+    Series are matched by their label set and keep the order in which
+    they first appear. Within a series, samples are ordered by timestamp
+    and a timestamp returned by two shards is kept once (first shard wins).
+    """
+    merged: dict[tuple[tuple[str, str], ...], dict[str, Any]] = {}
+    samples: dict[tuple[tuple[str, str], ...], dict[float, Any]] = {}
+    warnings: list[str] = []
+
+    for result in results:
+        warnings.extend(w for w in result.get("warnings", []) if w not in warnings)
+        for series in result.get("data", {}).get("result", []):
+            metric = series.get("metric", {})
+            labels = tuple(sorted(metric.items()))
+            if labels not in merged:
+                merged[labels] = {"metric": metric, "values": []}
+                samples[labels] = {}
+            by_ts = samples[labels]
+            for value_pair in series.get("values", []):
+                by_ts.setdefault(float(value_pair[0]), value_pair)
+
+    for labels, series in merged.items():
+        series["values"] = [samples[labels][ts] for ts in sorted(samples[labels])]
+
+    response: dict[str, Any] = {
+        "status": "success",
+        "data": {"resultType": "matrix", "result": list(merged.values())},
+    }
+    if warnings:
+        response["warnings"] = warnings
+    return response
@@ -6,10 +6,20 @@ Calculates error budget consumption from SLI measurements.
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from datetime import datetime, timedelta
 from typing import Any
 
-from nthlayer.slos.models import SLO, ErrorBudget, SLOStatus
+import numpy as np
+
+from nthlayer.core.timeseries import TimeSeries, as_time_series
+from nthlayer.slos.models import (
+    BURN_BUCKET_SECONDS,
+    SLO,
+    BurnBucket,
+    ErrorBudget,
+    SLOStatus,
+)
 
 
 class ErrorBudgetCalculator:
@@ -22,7 +32,7 @@ class ErrorBudgetCalculator:
         self,
         period_start: datetime | None = None,
         period_end: datetime | None = None,
-        sli_measurements: list[dict[str, Any]] | None = None,
+        sli_measurements: TimeSeries | Sequence[Mapping[str, Any]] | None = None,
     ) -> ErrorBudget:
         """
         Calculate error budget for a time period.
@@ -30,7 +40,8 @@ class ErrorBudgetCalculator:
         Args:
             period_start: Start of evaluation period (defaults to now - time_window)
             period_end: End of evaluation period (defaults to now)
-            sli_measurements: List of SLI measurements with timestamp and value
+            sli_measurements: SLI samples as a TimeSeries, or a list of
+                measurement dicts with timestamp and value
             
         Returns:
             ErrorBudget with consumption details
@@ -42,21 +53,27 @@ class ErrorBudgetCalculator:
         if period_start is None:
             period_start = self.slo.time_window.get_start_time(period_end)
         
-        # Calculate total budget
-        total_minutes = self.slo.error_budget_minutes()
-        
         # Calculate burned budget from measurements
         burned_minutes = 0.0
-        if sli_measurements:
+        if sli_measurements is not None and len(sli_measurements):
             burned_minutes = self._calculate_burn_from_measurements(
                 sli_measurements,
                 period_start,
                 period_end,
             )
         
-        # Create budget object
+        return self.budget_from_burn(period_start, period_end, burned_minutes)
+
+    def budget_from_burn(
+        self,
+        period_start: datetime,
+        period_end: datetime,
+        burned_minutes: float,
+    ) -> ErrorBudget:
+        """Build an ErrorBudget (with status) from already-computed burn."""
+        total_minutes = self.slo.error_budget_minutes()
         remaining_minutes = max(0.0, total_minutes - burned_minutes)
-        
+
         budget = ErrorBudget(
             slo_id=self.slo.id,
             service=self.slo.service,
@@ -66,63 +83,90 @@ class ErrorBudgetCalculator:
             burned_minutes=burned_minutes,
             remaining_minutes=remaining_minutes,
         )
-        
+
         # Determine status
         budget.status = budget.calculate_status()
-        
+
         return budget
 
     def _calculate_burn_from_measurements(
         self,
-        measurements: list[dict[str, Any]],
+        measurements: TimeSeries | Sequence[Mapping[str, Any]],
         period_start: datetime,
         period_end: datetime,
     ) -> float:
         """
         Calculate budget burn from SLI measurements.
-        
-        Assumes measurements have:
-        - timestamp: datetime
-        - sli_value: float (0.0-1.0, where 1.0 = 100% good)
-        - duration_seconds: float (optional, defaults to interval between measurements)
+
+        Each sample burns ``max(0, 1 - sli_value) * duration`` minutes, where
+        the duration is the sample's explicit ``duration_seconds``, else the
+        time until the next sample, else the series step (5 minutes).
+        Samples outside the period are ignored.
         """
-        if not measurements:
+        series = as_time_series(measurements).sorted()
+        if not len(series):
             return 0.0
-        
-        # Sort by timestamp
-        measurements = sorted(measurements, key=lambda m: m["timestamp"])
-        
-        total_burn_minutes = 0.0
-        
-        for i, measurement in enumerate(measurements):
-            timestamp = measurement["timestamp"]
-            sli_value = measurement["sli_value"]
-            
-            # Skip measurements outside period
-            if timestamp < period_start or timestamp > period_end:
-                continue
-            
-            # Calculate duration for this measurement
-            if "duration_seconds" in measurement:
-                duration_seconds = measurement["duration_seconds"]
-            elif i < len(measurements) - 1:
-                # Use time until next measurement
-                next_timestamp = measurements[i + 1]["timestamp"]
-                duration_seconds = (next_timestamp - timestamp).total_seconds()
-            else:
-                # Last measurement: assume 5 minute interval
-                duration_seconds = 300
-            
-            # Calculate error rate (1.0 - sli_value)
-            error_rate = max(0.0, 1.0 - sli_value)
-            
-            # Budget burn = error_rate × duration
-            duration_minutes = duration_seconds / 60
-            burn_minutes = error_rate * duration_minutes
-            
-            total_burn_minutes += burn_minutes
-        
-        return total_burn_minutes
+
+        durations = series.duration_seconds()
+        in_period = series.mask_between(period_start, period_end)
+
+        # fmax treats NaN samples as no errors, like max(0.0, nan)
+        error_rate = np.fmax(0.0, 1.0 - series.values[in_period])
+        return float(np.sum(error_rate * durations[in_period]) / 60)
+
+    def calculate_bucket_burn(
+        self,
+        measurements: TimeSeries | Sequence[Mapping[str, Any]],
+        bucket_seconds: int = BURN_BUCKET_SECONDS,
+    ) -> list[BurnBucket]:
+        """
+        Aggregate per-sample burn into fixed, epoch-aligned time buckets.
+
+        Uses the same per-sample burn as ``_calculate_burn_from_measurements``;
+        a sample is attributed to the bucket containing its timestamp. Each
+        bucket also carries the min/max SLI and how many samples met the
+        target, for the SLI history rollups.
+        """
+        series = as_time_series(measurements).sorted()
+        if not len(series):
+            return []
+
+        values = series.values
+        has_value = ~np.isnan(values)
+        durations = series.duration_seconds()
+        burn = np.fmax(0.0, 1.0 - values) * durations / 60
+        # Treat NaN samples as covering no time in the SLI average
+        weighted = np.where(has_value, values * durations, 0.0)
+        covered = np.where(has_value, durations, 0.0)
+
+        bucket_ids, first_index, inverse = np.unique(
+            series.timestamps_ms // (bucket_seconds * 1000),
+            return_index=True,
+            return_inverse=True,
+        )
+        burned = np.bincount(inverse, weights=burn)
+        weighted_sums = np.bincount(inverse, weights=weighted)
+        covered_sums = np.bincount(inverse, weights=covered)
+        good = np.bincount(inverse, weights=has_value & (values >= self.slo.target))
+        total = np.bincount(inverse, weights=has_value)
+        # Sorted series: each bucket is a contiguous run starting at first_index
+        with np.errstate(invalid="ignore"):
+            mins = np.fmin.reduceat(values, first_index)
+            maxes = np.fmax.reduceat(values, first_index)
+
+        return [
+            BurnBucket(
+                start=datetime.fromtimestamp(int(bucket_id) * bucket_seconds),
+                burned_minutes=float(burned[i]),
+                sli_value=float(weighted_sums[i] / covered_sums[i]) if covered_sums[i] else 1.0,
+                duration_seconds=float(covered_sums[i]),
+                min_value=None if np.isnan(mins[i]) else float(mins[i]),
+                max_value=None if np.isnan(maxes[i]) else float(maxes[i]),
+                good_count=int(good[i]),
+                total_count=int(total[i]),
+            )
+            for i, bucket_id in enumerate(bucket_ids)
+        ]
 
     def calculate_burn_rate(
         self,
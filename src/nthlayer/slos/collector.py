@@ -8,18 +8,31 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 
 import structlog
 
+from nthlayer.core.timeseries import TimeSeries, to_epoch_ms
 from nthlayer.providers.prometheus import PrometheusProvider, PrometheusProviderError
+from nthlayer.providers.query_batch import DEFAULT_MAX_BATCH_SIZE, QueryBatcher
+from nthlayer.providers.query_cache import get_query_cache
 from nthlayer.slos.calculator import ErrorBudgetCalculator
-from nthlayer.slos.models import SLO, ErrorBudget
+from nthlayer.slos.models import (
+    BURN_BUCKET_SECONDS,
+    ROLLUP_RESOLUTIONS,
+    SLO,
+    BurnBucket,
+    ErrorBudget,
+)
 from nthlayer.slos.storage import SLORepository
 
 logger = structlog.get_logger()
 
+# Resolution of SLI range queries used for error budget collection
+COLLECTION_STEP = "5m"
+COLLECTION_STEP_SECONDS = 300
+
 
 class SLOCollector:
     """Collects SLI metrics and calculates error budgets."""
@@ -41,6 +54,14 @@ class SLOCollector:
         """
         Collect metrics for an SLO and calculate error budget.
 
+        With the default (rolling) period, collection is incremental: the
+        stored budget's ``evaluated_through`` watermark limits the Prometheus
+        query to samples newer than the last run, their burn is added to
+        persisted hourly buckets, and buckets that left the window are
+        dropped. The first run, or a run whose watermark fell out of the
+        window, queries the whole window. An explicit ``period_start``
+        always recomputes the period from scratch.
+
         Args:
             slo: SLO to collect metrics for
             period_end: End of evaluation period (defaults to now)
@@ -56,25 +77,45 @@ class SLOCollector:
         if period_end is None:
             period_end = datetime.utcnow()
 
+        incremental = period_start is None
         if period_start is None:
             period_start = slo.time_window.get_start_time(period_end)
 
+        watermark: datetime | None = None
+        if incremental:
+            previous = await self.repository.get_current_error_budget(slo.id)
+            if (
+                previous is not None
+                and previous.evaluated_through is not None
+                and period_start <= previous.evaluated_through < period_end
+            ):
+                watermark = previous.evaluated_through
+
+        fetch_start = (
+            watermark + timedelta(seconds=COLLECTION_STEP_SECONDS) if watermark else period_start
+        )
+
         logger.info(
             "collecting_slo_metrics",
             slo_id=slo.id,
             service=slo.service,
             period_start=period_start.isoformat(),
             period_end=period_end.isoformat(),
+            fetch_start=fetch_start.isoformat(),
+            incremental=watermark is not None,
         )
 
         try:
-            # Query Prometheus for SLI time series
-            measurements = await self.prometheus.get_sli_time_series(
-                query=slo.query,
-                start=period_start,
-                end=period_end,
-                step="5m",  # 5-minute resolution
-            )
+            # Query Prometheus for SLI time series (nothing new within one step)
+            if fetch_start > period_end:
+                measurements = TimeSeries.empty()
+            else:
+                measurements = await self.prometheus.get_sli_series(
+                    query=slo.query,
+                    start=fetch_start,
+                    end=period_end,
+                    step=COLLECTION_STEP,
+                )
 
             logger.info(
                 "collected_measurements",
@@ -82,13 +123,21 @@ class SLOCollector:
                 measurement_count=len(measurements),
             )
 
+            # Only samples not folded into stored buckets by an earlier run
+            fresh = self._new_samples(measurements, period_start, period_end, watermark)
+
             # Calculate error budget
             calculator = ErrorBudgetCalculator(slo)
-            budget = calculator.calculate_budget(
-                period_start=period_start,
-                period_end=period_end,
-                sli_measurements=measurements,
-            )
+            if incremental:
+                budget = await self._calculate_incremental_budget(
+                    calculator, slo, fresh, period_start, period_end, watermark
+                )
+            else:
+                budget = calculator.calculate_budget(
+                    period_start=period_start,
+                    period_end=period_end,
+                    sli_measurements=measurements,
+                )
 
             logger.info(
                 "calculated_budget",
@@ -102,8 +151,10 @@ class SLOCollector:
             # Store in database
             await self.repository.create_or_update_error_budget(budget)
 
-            # Store history records (optional, for time series tracking)
-            await self._store_measurement_history(slo, measurements)
+            # Store downsampled history (a full recompute replaces overlapping rows)
+            await self._store_measurement_history(
+                slo, fresh, period_start, period_end, replace=watermark is None
+            )
 
             logger.info(
                 "stored_budget",
@@ -121,6 +172,53 @@ class SLOCollector:
             )
             raise
 
+    async def _calculate_incremental_budget(
+        self,
+        calculator: ErrorBudgetCalculator,
+        slo: SLO,
+        fresh: TimeSeries,
+        period_start: datetime,
+        period_end: datetime,
+        watermark: datetime | None,
+    ) -> ErrorBudget:
+        """
+        Add newly fetched samples to the persisted burn buckets.
+
+        The bucket straddling ``period_start`` is counted whole until it
+        leaves the window, so the rolling total can overstate burn by at
+        most one bucket's worth of samples.
+        """
+        buckets: dict[datetime, BurnBucket] = {}
+        if watermark is not None:
+            for bucket in await self.repository.get_burn_buckets(slo.id, since=period_start):
+                buckets[bucket.start] = bucket
+
+        for bucket in calculator.calculate_bucket_burn(fresh):
+            existing = buckets.get(bucket.start)
+            buckets[bucket.start] = existing.merge(bucket) if existing else bucket
+
+        bucket_size = timedelta(seconds=BURN_BUCKET_SECONDS)
+        burned_minutes = sum(
+            bucket.burned_minutes
+            for bucket in buckets.values()
+            if bucket.start + bucket_size > period_start
+        )
+
+        budget = calculator.budget_from_burn(period_start, period_end, burned_minutes)
+        budget.evaluated_through = fresh.datetimes()[-1] if len(fresh) else watermark
+
+        logger.debug(
+            "incremental_budget",
+            slo_id=slo.id,
+            new_samples=len(fresh),
+            buckets=len(buckets),
+            evaluated_through=(
+                budget.evaluated_through.isoformat() if budget.evaluated_through else None
+            ),
+        )
+
+        return budget
+
     async def collect_service_budgets(
         self,
         service: str,
@@ -171,20 +269,56 @@ class SLOCollector:
 
         return budgets
 
+    @staticmethod
+    def _new_samples(
+        measurements: TimeSeries,
+        period_start: datetime,
+        period_end: datetime,
+        watermark: datetime | None,
+    ) -> TimeSeries:
+        """Samples inside the period and after the watermark, sorted."""
+        series = measurements.sorted()
+        keep = series.mask_between(period_start, period_end)
+        if watermark is not None:
+            keep &= series.timestamps_ms > to_epoch_ms(watermark)
+
+        return TimeSeries(
+            series.timestamps_ms[keep],
+            series.values[keep],
+            None if series.durations is None else series.durations[keep],
+            series.step_seconds,
+        )
+
     async def _store_measurement_history(
         self,
         slo: SLO,
-        measurements: list[dict[str, Any]],
+        measurements: TimeSeries,
+        period_start: datetime,
+        period_end: datetime,
+        replace: bool = False,
     ) -> None:
         """
-        Store SLI measurement history (optional).
+        Store SLI measurement history as 5m, 1h and 1d rollups.
 
-        This stores individual measurements for historical tracking.
-        Can be used later for trend analysis.
+        Rollup buckets (min/avg/max SLI, good/total samples, burn) are
+        merged into the stored rows in one bulk write, so history and trend
+        queries can be served locally instead of from Prometheus.
         """
-        # For now, we'll skip storing every measurement to keep it simple
-        # In production, you might want to downsample or store aggregates
-        pass
+        if not len(measurements):
+            return
+
+        calculator = ErrorBudgetCalculator(slo)
+        rollups = {
+            resolution: calculator.calculate_bucket_burn(measurements, bucket_seconds)
+            for resolution, bucket_seconds in ROLLUP_RESOLUTIONS.items()
+        }
+        await self.repository.save_rollups(
+            slo,
+            rollups,
+            period_start=period_start,
+            period_end=period_end,
+            replace=replace,
+        )
 
 
 async def collect_and_store_budget(
@@ -216,8 +350,9 @@ async def collect_and_store_budget(
     prometheus = PrometheusProvider(prometheus_url)
 
     # Create collector and collect
-    collector = SLOCollector(prometheus, repository)
-    budget = await collector.collect_slo_budget(slo)
+    async with prometheus:
+        collector = SLOCollector(prometheus, repository)
+        budget = await collector.collect_slo_budget(slo)
 
     return budget
 
@@ -242,8 +377,9 @@ async def collect_service_budgets(
     prometheus = PrometheusProvider(prometheus_url)
 
     # Create collector and collect
-    collector = SLOCollector(prometheus, repository)
-    budgets = await collector.collect_service_budgets(service)
+    async with prometheus:
+        collector = SLOCollector(prometheus, repository)
+        budgets = await collector.collect_service_budgets(service)
 
     return budgets
 
@@ -279,11 +415,45 @@ class BudgetSummary:
     valid_slo_count: int
 
 
+DEFAULT_QUERY_CONCURRENCY = 8
+DEFAULT_QUERY_TIMEOUT = 30.0
+
+
+def _env_number(name: str, default: float, cast: type[int] | type[float]) -> Any:
+    """Read a positive number from the environment, falling back to default."""
+    raw = os.environ.get(name)
+    if raw is None:
+        return cast(default)
+    try:
+        value = cast(raw)
+    except ValueError:
+        return cast(default)
+    return value if value > 0 else cast(default)
+
+
 class SLOMetricCollector:
     """Stateless SLO metric collector for CLI deployment gate checks."""
 
-    def __init__(self, prometheus_url: str | None = None):
-        """Initialize collector with Prometheus connection details."""
+    def __init__(
+        self,
+        prometheus_url: str | None = None,
+        *,
+        concurrency: int | None = None,
+        query_timeout: float | None = None,
+        batch_size: int | None = None,
+    ):
+        """
+        Initialize collector with Prometheus connection details.
+
+        Args:
+            prometheus_url: Prometheus server URL
+            concurrency: Maximum Prometheus requests in flight at once
+                (default: NTHLAYER_QUERY_CONCURRENCY or 8)
+            query_timeout: Seconds allowed per request before its SLOs are
+                reported as ERROR (default: NTHLAYER_QUERY_TIMEOUT or 30)
+            batch_size: Maximum SLI expressions merged into one request;
+                1 disables batching (default: NTHLAYER_QUERY_BATCH_SIZE or 20)
+        """
         self.prometheus_url = prometheus_url
         self._username = os.environ.get("PROMETHEUS_USERNAME") or os.environ.get(
             "NTHLAYER_METRICS_USER"
@@ -291,27 +461,59 @@ class SLOMetricCollector:
         self._password = os.environ.get("PROMETHEUS_PASSWORD") or os.environ.get(
             "NTHLAYER_METRICS_PASSWORD"
         )
+        self.concurrency = concurrency or _env_number(
+            "NTHLAYER_QUERY_CONCURRENCY", DEFAULT_QUERY_CONCURRENCY, int
+        )
+        self.query_timeout = query_timeout or _env_number(
+            "NTHLAYER_QUERY_TIMEOUT", DEFAULT_QUERY_TIMEOUT, float
+        )
+        self.batch_size = batch_size or _env_number(
+            "NTHLAYER_QUERY_BATCH_SIZE", DEFAULT_MAX_BATCH_SIZE, int
+        )
 
     async def collect(self, slo_resources: list[Any], service_name: str) -> list[SLOResult]:
-        """Collect SLO metrics from Prometheus (stateless)."""
+        """
+        Collect SLO metrics from Prometheus (stateless).
+
+        SLI expressions are merged into batched requests where possible and
+        requests run concurrently, at most ``concurrency`` at a time.
+        Results are returned in the same order as ``slo_resources``.
+        """
         if not self.prometheus_url:
             raise ValueError("Prometheus URL is required for metric collection")
 
-        provider = PrometheusProvider(
-            self.prometheus_url, username=self._username, password=self._password
-        )
-        results = []
+        results: list[SLOResult] = []
+        queries: dict[str, str] = {}
 
         for slo in slo_resources:
-            result = await self._collect_single_slo(slo, service_name, provider)
+            result, query = self._prepare_result(slo, service_name)
+            if query is not None:
+                queries[str(len(results))] = query
             results.append(result)
 
+        provider = PrometheusProvider(
+            self.prometheus_url,
+            username=self._username,
+            password=self._password,
+            cache=get_query_cache(),
+        )
+        batcher = QueryBatcher(
+            provider,
+            max_batch_size=self.batch_size,
+            concurrency=self.concurrency,
+            timeout=self.query_timeout,
+        )
+
+        async with provider:
+            values = await batcher.get_sli_values(queries)
+
+        for key, value in values.items():
+            self._apply_sli_value(results[int(key)], value)
+
         return results
 
-    async def _collect_single_slo(
-        self, slo: Any, service_name: str, provider: PrometheusProvider
-    ) -> SLOResult:
-        """Collect metrics for a single SLO."""
+    def _prepare_result(self, slo: Any, service_name: str) -> tuple[SLOResult, str | None]:
+        """Build the result skeleton and SLI query for a single SLO."""
         spec = slo.spec or {}
         objective = spec.get("objective", 99.9)
         window = spec.get("window", "30d")
@@ -338,30 +540,36 @@ class SLOMetricCollector:
             else:
                 result.error = "No query defined"
                 result.status = "NO_DATA"
-            return result
 
-        try:
-            sli_value = await provider.get_sli_value(query)
-
-            if sli_value > 0:
-                result.current_sli = sli_value * 100
-                error_rate = 1.0 - sli_value
-                result.burned_minutes = window_minutes * error_rate
-                result.percent_consumed = (
-                    (result.burned_minutes / total_budget_minutes) * 100
-                    if total_budget_minutes > 0
-                    else 0
-                )
-                result.status = self._determine_status(result.percent_consumed)
-            else:
-                result.error = "No data returned"
-                result.status = "NO_DATA"
+        return result, query
 
-        except PrometheusProviderError as e:
-            result.error = str(e)
+    def _apply_sli_value(self, result: SLOResult, sli_value: float | None | Exception) -> None:
+        """Fill in burn and status from a queried SLI value (or its failure)."""
+        if isinstance(sli_value, PrometheusProviderError):
+            result.error = str(sli_value)
             result.status = "ERROR"
-
-        return result
+            return
+        if isinstance(sli_value, TimeoutError):
+            result.error = f"Query timed out after {self.query_timeout:g}s"
+            result.status = "ERROR"
+            return
+        if isinstance(sli_value, Exception):
+            raise sli_value
+
+        if sli_value is not None and sli_value > 0:
+            window_minutes = self._parse_window_minutes(result.window)
+            result.current_sli = sli_value * 100
+            error_rate = 1.0 - sli_value
+            result.burned_minutes = window_minutes * error_rate
+            result.percent_consumed = (
+                (result.burned_minutes / result.total_budget_minutes) * 100
+                if result.total_budget_minutes > 0
+                else 0
+            )
+            result.status = self._determine_status(result.percent_consumed)
+        else:
+            result.error = "No data returned"
+            result.status = "NO_DATA"
 
     def _build_slo_query(
         self, spec: dict[str, Any], indicator: dict[str, Any], service_name: str
@@ -7,8 +7,9 @@ caused reliability issues.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 
 import structlog
@@ -68,6 +69,40 @@ class CorrelationResult:
             return "✅"
 
 
+def window_burn_rates(
+    samples: Sequence[tuple[datetime, float]],
+    windows: Sequence[tuple[datetime, datetime]],
+) -> list[float]:
+    """
+    Burn rate (minutes per minute) in each window from cumulative budget samples.
+
+    Matches ``SLORepository.get_burn_rate_window``: the difference between
+    the latest and earliest ``burned_minutes`` inside ``[start, end]``,
+    divided by the window length. Samples must be ordered by time and
+    windows ordered so that both starts and ends never decrease (true for
+    fixed-size windows around sorted deployments); two pointers then sweep
+    the samples once for all windows.
+    """
+    rates = []
+    first = 0  # first sample with time >= start
+    after = 0  # first sample with time > end
+
+    for start, end in windows:
+        while first < len(samples) and samples[first][0] < start:
+            first += 1
+        after = max(after, first)
+        while after < len(samples) and samples[after][0] <= end:
+            after += 1
+
+        duration = (end - start).total_seconds() / 60
+        if after <= first or duration == 0:
+            rates.append(0.0)
+            continue
+        rates.append((samples[after - 1][1] - samples[first][1]) / duration)
+
+    return rates
+
+
 class DeploymentCorrelator:
     """Correlates deployments with error budget burns."""
     
@@ -123,44 +158,10 @@ class DeploymentCorrelator:
             end_time=after_end,
         )
         
-        # Calculate total burn in after window
-        burn_minutes = after_burn_rate * self.window.after_minutes
-        
-        # Calculate confidence factors
-        burn_rate_score = self._calculate_burn_rate_score(
-            before_burn_rate,
-            after_burn_rate,
-        )
-        
-        # Time proximity is always high for first analysis (within window)
-        proximity_score = 1.0
-        
-        magnitude_score = self._calculate_magnitude_score(burn_minutes)
-        
-        # Overall confidence (weighted average)
-        confidence = (
-            0.4 * burn_rate_score +
-            0.3 * proximity_score +
-            0.3 * magnitude_score
-        )
-        
-        result = CorrelationResult(
-            deployment_id=deployment.id,
-            service=deployment.service,
-            burn_minutes=burn_minutes,
-            confidence=confidence,
-            method="time_window_analysis",
-            details={
-                "before_burn_rate": before_burn_rate,
-                "after_burn_rate": after_burn_rate,
-                "burn_rate_score": burn_rate_score,
-                "proximity_score": proximity_score,
-                "magnitude_score": magnitude_score,
-                "window_before_minutes": self.window.before_minutes,
-                "window_after_minutes": self.window.after_minutes,
-            },
-        )
-        
+        result = self._build_result(deployment, before_burn_rate, after_burn_rate)
+        confidence = result.confidence
+        burn_minutes = result.burn_minutes
+
         logger.info(
             "correlation_complete",
             deployment_id=deployment.id,
@@ -183,14 +184,21 @@ class DeploymentCorrelator:
         self,
         service: str,
         lookback_hours: int = 24,
+        batch: bool = True,
     ) -> list[CorrelationResult]:
         """
         Correlate all recent deployments for a service.
-        
+
+        In batch mode each SLO's budget history for the whole span is
+        loaded once, burn rates for every deployment come from one sorted
+        sweep, and correlations are written back in one bulk update.
+        Otherwise each deployment is correlated with ``correlate_deployment``.
+
         Args:
             service: Service name
             lookback_hours: How far back to analyze
-            
+            batch: Use the batch engine (one history query per SLO)
+
         Returns:
             List of correlation results sorted by confidence
         """
@@ -217,22 +225,25 @@ class DeploymentCorrelator:
             logger.warning("no_slos_found", service=service)
             return []
         
-        # Correlate each deployment with each SLO
-        results = []
-        for deployment in deployments:
-            for slo in slos:
-                try:
-                    result = await self.correlate_deployment(deployment, slo)
-                    if result.confidence >= LOW_CONFIDENCE:
-                        results.append(result)
-                except Exception as exc:
-                    logger.error(
-                        "correlation_failed",
-                        deployment_id=deployment.id,
-                        slo_id=slo.id,
-                        error=str(exc),
-                    )
-        
+        if batch:
+            results = await self._correlate_batch(deployments, slos)
+        else:
+            # Correlate each deployment with each SLO
+            results = []
+            for deployment in deployments:
+                for slo in slos:
+                    try:
+                        result = await self.correlate_deployment(deployment, slo)
+                        if result.confidence >= LOW_CONFIDENCE:
+                            results.append(result)
+                    except Exception as exc:
+                        logger.error(
+                            "correlation_failed",
+                            deployment_id=deployment.id,
+                            slo_id=slo.id,
+                            error=str(exc),
+                        )
+
         # Sort by confidence (highest first)
         results.sort(key=lambda r: r.confidence, reverse=True)
         
@@ -245,6 +256,90 @@ class DeploymentCorrelator:
         
         return results
     
+    async def _correlate_batch(
+        self,
+        deployments: list[Deployment],
+        slos: list[SLO],
+    ) -> list[CorrelationResult]:
+        """Correlate all deployments against all SLOs with one history query per SLO."""
+        ordered = sorted(deployments, key=lambda d: d.deployed_at)
+        before = timedelta(minutes=self.window.before_minutes)
+        after = timedelta(minutes=self.window.after_minutes)
+        before_windows = [(d.deployed_at - before, d.deployed_at) for d in ordered]
+        after_windows = [(d.deployed_at, d.deployed_at + after) for d in ordered]
+
+        results = []
+        # Last qualifying SLO wins, as with sequential correlate_deployment calls
+        updates: dict[str, tuple[str, float, float]] = {}
+        for slo in slos:
+            try:
+                samples = await self.repository.get_burn_history(
+                    slo_id=slo.id,
+                    start_time=before_windows[0][0],
+                    end_time=after_windows[-1][1],
+                )
+            except Exception as exc:
+                logger.error("correlation_failed", slo_id=slo.id, error=str(exc))
+                continue
+
+            before_rates = window_burn_rates(samples, before_windows)
+            after_rates = window_burn_rates(samples, after_windows)
+            for deployment, before_rate, after_rate in zip(
+                ordered, before_rates, after_rates, strict=True
+            ):
+                result = self._build_result(deployment, before_rate, after_rate)
+                if result.confidence >= LOW_CONFIDENCE:
+                    results.append(result)
+                    updates[deployment.id] = (
+                        deployment.id,
+                        result.burn_minutes,
+                        result.confidence,
+                    )
+
+        await self.repository.update_deployment_correlations(list(updates.values()))
+        return results
+
+    def _build_result(
+        self,
+        deployment: Deployment,
+        before_burn_rate: float,
+        after_burn_rate: float,
+    ) -> CorrelationResult:
+        """Score a deployment from its before/after burn rates."""
+        # Calculate total burn in after window
+        burn_minutes = after_burn_rate * self.window.after_minutes
+
+        # Calculate confidence factors
+        burn_rate_score = self._calculate_burn_rate_score(
+            before_burn_rate,
+            after_burn_rate,
+        )
+
+        # Time proximity is always high for first analysis (within window)
+        proximity_score = 1.0
+
+        magnitude_score = self._calculate_magnitude_score(burn_minutes)
+
+        # Overall confidence (weighted average)
+        confidence = 0.4 * burn_rate_score + 0.3 * proximity_score + 0.3 * magnitude_score
+
+        return CorrelationResult(
+            deployment_id=deployment.id,
+            service=deployment.service,
+            burn_minutes=burn_minutes,
+            confidence=confidence,
+            method="time_window_analysis",
+            details={
+                "before_burn_rate": before_burn_rate,
+                "after_burn_rate": after_burn_rate,
+                "burn_rate_score": burn_rate_score,
+                "proximity_score": proximity_score,
+                "magnitude_score": magnitude_score,
+                "window_before_minutes": self.window.before_minutes,
+                "window_after_minutes": self.window.after_minutes,
+            },
+        )
+
     def _calculate_burn_rate_score(
         self,
         before_rate: float,
@@ -188,6 +188,10 @@ class ErrorBudget:
     
     # Metadata
     updated_at: datetime = field(default_factory=datetime.utcnow)
+
+    # Incremental collection watermark: timestamp of the last SLI sample
+    # included in burned_minutes (None when computed from scratch)
+    evaluated_through: datetime | None = None
     
     @property
     def percent_consumed(self) -> float:
@@ -239,3 +243,60 @@ class ErrorBudget:
             "burn_rate": self.burn_rate,
             "updated_at": self.updated_at.isoformat(),
         }
+
+
+# Burn buckets persisted for incremental collection (slo_history.resolution)
+BURN_BUCKET_SECONDS = 3600
+BURN_BUCKET_RESOLUTION = "1h"
+
+# SLI history rollups, finest first (resolution label -> bucket seconds)
+ROLLUP_RESOLUTIONS: dict[str, int] = {"5m": 300, "1h": 3600, "1d": 86400}
+
+# How long each rollup is kept (1h rows also live as long as the SLO window)
+ROLLUP_RETENTION: dict[str, timedelta] = {
+    "5m": timedelta(days=7),
+    "1h": timedelta(days=90),
+    "1d": timedelta(days=730),
+}
+
+
+@dataclass
+class BurnBucket:
+    """
+    Error budget burn and SLI statistics for one fixed time bucket.
+
+    Buckets let collection add only new samples to a running total and
+    drop whole buckets as they leave the rolling window. The same shape
+    is stored as the 5m/1h/1d SLI history rollups.
+    """
+
+    start: datetime
+    burned_minutes: float
+    sli_value: float  # Duration-weighted mean SLI over the bucket
+    duration_seconds: float  # Sample time covered by the bucket
+    min_value: float | None = None
+    max_value: float | None = None
+    good_count: int = 0  # Samples meeting the SLO target
+    total_count: int = 0  # Samples with a value
+
+    def merge(self, other: BurnBucket) -> BurnBucket:
+        """Combine two partial buckets with the same start."""
+        duration = self.duration_seconds + other.duration_seconds
+        sli_value = (
+            (self.sli_value * self.duration_seconds + other.sli_value * other.duration_seconds)
+            / duration
+            if duration
+            else other.sli_value
+        )
+        mins = [v for v in (self.min_value, other.min_value) if v is not None]
+        maxes = [v for v in (self.max_value, other.max_value) if v is not None]
+        return BurnBucket(
+            start=self.start,
+            burned_minutes=self.burned_minutes + other.burned_minutes,
+            sli_value=sli_value,
+            duration_seconds=duration,
+            min_value=min(mins) if mins else None,
+            max_value=max(maxes) if maxes else None,
+            good_count=self.good_count + other.good_count,
+            total_count=self.total_count + other.total_count,
+        )
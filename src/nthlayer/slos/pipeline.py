@@ -9,12 +9,14 @@ explanation generation, and notification dispatch into a single
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 import structlog
 
+from nthlayer.core.timeseries import TimeSeries
 from nthlayer.slos.alerts import (
     AlertEvaluator,
     AlertEvent,
@@ -101,7 +103,7 @@ class AlertPipeline:
     def evaluate_service(
         self,
         manifest: ReliabilityManifest,
-        sli_measurements: dict[str, list[dict[str, Any]]] | None = None,
+        sli_measurements: Mapping[str, TimeSeries | list[dict[str, Any]]] | None = None,
         simulate_burn_pct: float | None = None,
     ) -> PipelineResult:
         """
@@ -109,7 +111,8 @@ class AlertPipeline:
 
         Args:
             manifest: Parsed reliability manifest.
-            sli_measurements: Optional dict mapping SLO name to measurement list.
+            sli_measurements: Optional dict mapping SLO name to its samples,
+                as a TimeSeries (preferred) or a measurement list.
             simulate_burn_pct: If set, simulate this % of budget burned (0-100).
 
         Returns:
@@ -233,7 +236,7 @@ def _build_slo_from_manifest(
 
 def _calculate_budget(
     slo: SLO,
-    sli_measurements: list[dict[str, Any]] | None = None,
+    sli_measurements: TimeSeries | list[dict[str, Any]] | None = None,
     simulate_burn_pct: float | None = None,
 ) -> ErrorBudget:
     """Calculate error budget from measurements or simulation."""
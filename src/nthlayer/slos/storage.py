@@ -6,12 +6,13 @@ Handles database operations for SLOs and error budgets.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
 
 # Import Deployment dataclass (avoid circular import)
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
-from sqlalchemy import select
+from sqlalchemy import and_, delete, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from nthlayer.db.models import (
@@ -21,11 +22,53 @@ from nthlayer.db.models import (
     SLOHistoryModel,
     SLOModel,
 )
-from nthlayer.slos.models import SLO, ErrorBudget, TimeWindowType
+from nthlayer.slos.models import (
+    BURN_BUCKET_RESOLUTION,
+    BURN_BUCKET_SECONDS,
+    ROLLUP_RESOLUTIONS,
+    ROLLUP_RETENTION,
+    SLO,
+    BurnBucket,
+    ErrorBudget,
+    TimeWindowType,
+)
 
 if TYPE_CHECKING:
     from nthlayer.slos.deployment import Deployment
 
+# Minimum buckets a history query should return when picking a rollup
+HISTORY_MIN_POINTS = 24
+
+
+def select_history_resolution(
+    start_time: datetime, end_time: datetime, now: datetime | None = None
+) -> str:
+    """
+    Pick the coarsest rollup giving at least ``HISTORY_MIN_POINTS`` buckets.
+
+    A 30d range is served from 1d rollups, 7d from 1h and 6h from 5m.
+    Rollups already pruned at ``start_time`` (see ``ROLLUP_RETENTION``,
+    counted back from ``now``) are skipped, so a short range from two
+    weeks ago reads 1h rather than 5m rollups.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+        if start_time.tzinfo is None:
+            now = now.replace(tzinfo=None)
+    retained = [
+        resolution
+        for resolution in ROLLUP_RESOLUTIONS
+        if start_time >= now - ROLLUP_RETENTION[resolution]
+    ]
+    if not retained:
+        return next(reversed(ROLLUP_RESOLUTIONS))
+
+    span = (end_time - start_time).total_seconds()
+    for resolution in reversed(retained):
+        if span / ROLLUP_RESOLUTIONS[resolution] >= HISTORY_MIN_POINTS:
+            return resolution
+    return retained[0]
+
 
 class SLORepository:
     """Repository for SLO database operations."""
@@ -132,6 +175,7 @@ class SLORepository:
                 slo_breach_burn_minutes=budget.slo_breach_burn_minutes,
                 status=budget.status.value,
                 burn_rate=budget.burn_rate,
+                evaluated_through=budget.evaluated_through,
             )
             self.session.add(model)
         else:
@@ -143,6 +187,7 @@ class SLORepository:
             model.slo_breach_burn_minutes = budget.slo_breach_burn_minutes
             model.status = budget.status.value
             model.burn_rate = budget.burn_rate
+            model.evaluated_through = budget.evaluated_through
             model.updated_at = datetime.utcnow()
         
         await self.session.flush()
@@ -193,30 +238,155 @@ class SLORepository:
         slo_id: str,
         start_time: datetime,
         end_time: datetime,
+        resolution: str | None = None,
     ) -> list[dict[str, Any]]:
-        """Get SLO measurement history for a time range."""
+        """
+        Get SLO measurement history for a time range.
+
+        History is read from the SLI rollups: the given ``resolution``, or
+        else the one picked by ``select_history_resolution``. When that
+        rollup has no rows in the range, coarser rollups are tried next and
+        finally raw measurements recorded with ``record_slo_measurement``.
+        """
+        if resolution is None:
+            resolution = select_history_resolution(start_time, end_time)
+
+        resolutions = list(ROLLUP_RESOLUTIONS)
+        candidates: list[str | None] = [*resolutions[resolutions.index(resolution) :], None]
+        models: list[SLOHistoryModel] = []
+        for candidate in candidates:
+            models = await self._get_history_rows(slo_id, start_time, end_time, candidate)
+            if models:
+                break
+
+        return [self._history_row_to_dict(model) for model in models]
+
+    async def _get_history_rows(
+        self,
+        slo_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        resolution: str | None,
+    ) -> list[SLOHistoryModel]:
+        """Select history rows of one resolution (None for raw rows)."""
         result = await self.session.execute(
             select(SLOHistoryModel)
             .where(
                 SLOHistoryModel.slo_id == slo_id,
+                SLOHistoryModel.resolution.is_(None)
+                if resolution is None
+                else SLOHistoryModel.resolution == resolution,
                 SLOHistoryModel.timestamp >= start_time,
                 SLOHistoryModel.timestamp <= end_time,
             )
             .order_by(SLOHistoryModel.timestamp)
         )
-        models = result.scalars().all()
-        
-        return [
-            {
-                "timestamp": model.timestamp.isoformat(),
-                "sli_value": model.sli_value,
-                "target_value": model.target_value,
-                "compliant": model.compliant,
-                "budget_burn_minutes": model.budget_burn_minutes,
-                "extra_data": model.extra_data,
+        return list(result.scalars().all())
+
+    async def get_burn_buckets(self, slo_id: str, since: datetime) -> list[BurnBucket]:
+        """Get persisted burn buckets overlapping ``[since, now]``."""
+        result = await self.session.execute(
+            select(SLOHistoryModel)
+            .where(
+                SLOHistoryModel.slo_id == slo_id,
+                SLOHistoryModel.resolution == BURN_BUCKET_RESOLUTION,
+                SLOHistoryModel.timestamp > since - timedelta(seconds=BURN_BUCKET_SECONDS),
+            )
+            .order_by(SLOHistoryModel.timestamp)
+        )
+
+        return [self._model_to_burn_bucket(model) for model in result.scalars().all()]
+
+    async def save_rollups(
+        self,
+        slo: SLO,
+        rollups: Mapping[str, list[BurnBucket]],
+        *,
+        period_start: datetime,
+        period_end: datetime,
+        replace: bool = False,
+    ) -> None:
+        """
+        Write SLI rollup buckets and prune rows past their retention.
+
+        Buckets already past their resolution's retention are dropped up
+        front rather than written and pruned again. Existing rows in the
+        range spanned by the remaining buckets are loaded in one query.
+        Each new bucket is merged into its existing row, or overwrites it
+        when ``replace`` is set (a full recompute of the period); the rest
+        are inserted with ``add_all`` so the flush emits a multi-row
+        INSERT. Everything happens in the caller's transaction.
+
+        Args:
+            slo: SLO the buckets belong to
+            rollups: Buckets keyed by resolution (see ``ROLLUP_RESOLUTIONS``)
+            period_start: Start of the SLO window; 1h burn buckets inside
+                it are kept regardless of retention
+            period_end: End of the evaluated period, the retention reference
+            replace: Overwrite existing rows instead of merging into them
+        """
+        cutoffs = {
+            resolution: period_end - ROLLUP_RETENTION[resolution]
+            for resolution in ROLLUP_RESOLUTIONS
+        }
+        cutoffs[BURN_BUCKET_RESOLUTION] = min(
+            cutoffs[BURN_BUCKET_RESOLUTION],
+            period_start - timedelta(seconds=BURN_BUCKET_SECONDS),
+        )
+        rollups = {
+            resolution: [bucket for bucket in buckets if bucket.start > cutoffs[resolution]]
+            for resolution, buckets in rollups.items()
+        }
+
+        starts = [bucket.start for buckets in rollups.values() for bucket in buckets]
+        existing: dict[tuple[str | None, datetime], SLOHistoryModel] = {}
+        if starts:
+            # A range rather than an IN list: a 30d backfill has ~10k 5m starts
+            result = await self.session.execute(
+                select(SLOHistoryModel).where(
+                    SLOHistoryModel.slo_id == slo.id,
+                    SLOHistoryModel.resolution.in_(list(rollups)),
+                    SLOHistoryModel.timestamp >= min(starts),
+                    SLOHistoryModel.timestamp <= max(starts),
+                )
+            )
+            existing = {
+                (model.resolution, model.timestamp): model for model in result.scalars().all()
             }
-            for model in models
-        ]
+
+        new_models = []
+        for resolution, buckets in rollups.items():
+            for bucket in buckets:
+                model = existing.get((resolution, bucket.start))
+                if model is None:
+                    model = SLOHistoryModel(
+                        slo_id=slo.id,
+                        service=slo.service,
+                        timestamp=bucket.start,
+                        resolution=resolution,
+                    )
+                    new_models.append(model)
+                elif not replace:
+                    bucket = self._model_to_burn_bucket(model).merge(bucket)
+                self._apply_bucket(model, bucket, slo.target)
+
+        self.session.add_all(new_models)
+
+        await self.session.execute(
+            delete(SLOHistoryModel).where(
+                SLOHistoryModel.slo_id == slo.id,
+                or_(
+                    *(
+                        and_(
+                            SLOHistoryModel.resolution == resolution,
+                            SLOHistoryModel.timestamp <= cutoff,
+                        )
+                        for resolution, cutoff in cutoffs.items()
+                    )
+                ),
+            )
+        )
+        await self.session.flush()
 
     async def record_deployment(
         self,
@@ -295,6 +465,57 @@ class SLORepository:
             updated_at=model.updated_at,
         )
 
+    def _model_to_burn_bucket(self, model: SLOHistoryModel) -> BurnBucket:
+        """Convert a rollup history row to a BurnBucket."""
+        extra = model.extra_data or {}
+        return BurnBucket(
+            start=model.timestamp,
+            burned_minutes=model.budget_burn_minutes,
+            sli_value=model.sli_value,
+            duration_seconds=float(extra.get("duration_seconds", 0.0)),
+            min_value=extra.get("min"),
+            max_value=extra.get("max"),
+            good_count=int(extra.get("good", 0)),
+            total_count=int(extra.get("total", 0)),
+        )
+
+    @staticmethod
+    def _apply_bucket(model: SLOHistoryModel, bucket: BurnBucket, target: float) -> None:
+        """Copy a bucket's values onto a rollup history row."""
+        model.sli_value = bucket.sli_value
+        model.target_value = target
+        model.compliant = bucket.sli_value >= target
+        model.budget_burn_minutes = bucket.burned_minutes
+        model.extra_data = {
+            "duration_seconds": bucket.duration_seconds,
+            "min": bucket.min_value,
+            "max": bucket.max_value,
+            "good": bucket.good_count,
+            "total": bucket.total_count,
+        }
+
+    @staticmethod
+    def _history_row_to_dict(model: SLOHistoryModel) -> dict[str, Any]:
+        """Convert a history row (raw or rollup) to its API dict."""
+        extra = model.extra_data or {}
+        row = {
+            "timestamp": model.timestamp.isoformat(),
+            "sli_value": model.sli_value,
+            "target_value": model.target_value,
+            "compliant": model.compliant,
+            "budget_burn_minutes": model.budget_burn_minutes,
+            "extra_data": model.extra_data,
+        }
+        if model.resolution is not None:
+            row.update(
+                resolution=model.resolution,
+                min_value=extra.get("min"),
+                max_value=extra.get("max"),
+                good_count=extra.get("good", 0),
+                total_count=extra.get("total", 0),
+            )
+        return row
+
     def _model_to_error_budget(self, model: ErrorBudgetModel) -> ErrorBudget:
         """Convert SQLAlchemy model to ErrorBudget object."""
         from nthlayer.slos.models import SLOStatus
@@ -313,6 +534,7 @@ class SLORepository:
             status=SLOStatus(model.status),
             burn_rate=model.burn_rate,
             updated_at=model.updated_at,
+            evaluated_through=model.evaluated_through,
         )
     
     # Deployment methods
@@ -416,7 +638,54 @@ class SLORepository:
             model.correlated_burn_minutes = burn_minutes
             model.correlation_confidence = confidence
             await self.session.flush()
+
+    async def update_deployment_correlations(
+        self,
+        correlations: list[tuple[str, float, float]],
+    ) -> None:
+        """
+        Write correlation data for many deployments in one bulk UPDATE.
+
+        Args:
+            correlations: (deployment_id, burn_minutes, confidence) tuples
+        """
+        if not correlations:
+            return
+
+        await self.session.execute(
+            update(DeploymentModel),
+            [
+                {
+                    "id": deployment_id,
+                    "correlated_burn_minutes": burn_minutes,
+                    "correlation_confidence": confidence,
+                }
+                for deployment_id, burn_minutes, confidence in correlations
+            ],
+        )
     
+    async def get_burn_history(
+        self,
+        slo_id: str,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> list[tuple[datetime, float]]:
+        """
+        Get (updated_at, burned_minutes) budget samples ordered by time.
+
+        Selects only the two columns, so long spans do not build ORM objects.
+        """
+        result = await self.session.execute(
+            select(ErrorBudgetModel.updated_at, ErrorBudgetModel.burned_minutes)
+            .where(
+                ErrorBudgetModel.slo_id == slo_id,
+                ErrorBudgetModel.updated_at >= start_time,
+                ErrorBudgetModel.updated_at <= end_time,
+            )
+            .order_by(ErrorBudgetModel.updated_at)
+        )
+        return [(updated_at, burned) for updated_at, burned in result.all()]
+
     async def get_burn_rate_window(
         self,
         slo_id: str,
@@ -434,29 +703,37 @@ class SLORepository:
         Returns:
             Burn rate in minutes per minute
         """
-        # Query error budgets in window
-        result = await self.session.execute(
-            select(ErrorBudgetModel)
-            .where(
-                ErrorBudgetModel.slo_id == slo_id,
-                ErrorBudgetModel.updated_at >= start_time,
-                ErrorBudgetModel.updated_at <= end_time,
-            )
+        # Earliest and latest cumulative burn in the window, each read with an
+        # ORDER BY ... LIMIT 1 on idx_error_budgets_slo_updated
+        in_window = (
+            ErrorBudgetModel.slo_id == slo_id,
+            ErrorBudgetModel.updated_at >= start_time,
+            ErrorBudgetModel.updated_at <= end_time,
         )
-        budgets = result.scalars().all()
-        
-        if not budgets:
+        earliest = (
+            select(ErrorBudgetModel.burned_minutes)
+            .where(*in_window)
+            .order_by(ErrorBudgetModel.updated_at.asc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        latest = (
+            select(ErrorBudgetModel.burned_minutes)
+            .where(*in_window)
+            .order_by(ErrorBudgetModel.updated_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(select(earliest, latest))
+        # Scalar subqueries are untyped; both are NULL when the window is empty
+        oldest_burn, latest_burn = cast("tuple[float | None, float | None]", tuple(result.one()))
+
+        if oldest_burn is None or latest_burn is None:
             return 0.0
-        
-        # Get most recent budget (has cumulative burn)
-        latest_budget = max(budgets, key=lambda b: b.updated_at)
-        
-        # Get oldest budget in window
-        oldest_budget = min(budgets, key=lambda b: b.updated_at)
-        
+
         # Calculate burn in window
-        burn_in_window = latest_budget.burned_minutes - oldest_budget.burned_minutes
-        
+        burn_in_window = latest_burn - oldest_burn
+
         # Calculate window duration in minutes
         window_duration = (end_time - start_time).total_seconds() / 60
         
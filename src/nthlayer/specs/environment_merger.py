@@ -16,68 +16,81 @@ class EnvironmentMerger:
     @staticmethod
     def merge_service_config(
         base_data: Dict[str, Any],
-        env_overrides: Dict[str, Any]
+        env_overrides: Dict[str, Any],
+        copy: bool = True,
     ) -> Dict[str, Any]:
         """Merge base service config with environment overrides.
         
         Args:
             base_data: Base service YAML data (full dict with 'service' and 'resources')
             env_overrides: Environment override data (with 'service' and 'resources')
+            copy: Deep-copy the inputs. With False only the dicts and lists on
+                the path to an overridden value are new; everything else is
+                shared with ``base_data`` and ``env_overrides``, so merging one
+                base for several environments does not copy the whole tree
+                each time. The result must then be treated as read-only.
             
         Returns:
             Merged configuration
         """
-        result = deepcopy(base_data)
+        result = deepcopy(base_data) if copy else dict(base_data)
         
         # Merge service-level fields
         if "service" in env_overrides:
             result["service"] = EnvironmentMerger._merge_dict(
                 result.get("service", {}),
-                env_overrides["service"]
+                env_overrides["service"],
+                copy,
             )
         
         # Merge resources
         if "resources" in env_overrides:
             result["resources"] = EnvironmentMerger._merge_resources(
                 result.get("resources", []),
-                env_overrides["resources"]
+                env_overrides["resources"],
+                copy,
             )
         
         return result
     
     @staticmethod
-    def _merge_dict(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    def _merge_dict(
+        base: Dict[str, Any], override: Dict[str, Any], copy: bool = True
+    ) -> Dict[str, Any]:
         """Deep merge two dictionaries (override wins).
         
         Args:
             base: Base dictionary
             override: Override dictionary
+            copy: Deep-copy values instead of sharing them
             
         Returns:
             Merged dictionary
         """
-        result = deepcopy(base)
+        result = deepcopy(base) if copy else dict(base)
         
         for key, value in override.items():
             if key in result and isinstance(result[key], dict) and isinstance(value, dict):
                 # Recursive merge for nested dicts
-                result[key] = EnvironmentMerger._merge_dict(result[key], value)
+                result[key] = EnvironmentMerger._merge_dict(result[key], value, copy)
             else:
                 # Override value
-                result[key] = deepcopy(value)
+                result[key] = deepcopy(value) if copy else value
         
         return result
     
     @staticmethod
     def _merge_resources(
         base_resources: List[Dict[str, Any]],
-        override_resources: List[Dict[str, Any]]
+        override_resources: List[Dict[str, Any]],
+        copy: bool = True,
     ) -> List[Dict[str, Any]]:
         """Merge resource lists (override by kind+name).
         
         Args:
             base_resources: Base resources list
             override_resources: Override resources list
+            copy: Deep-copy resources instead of sharing untouched ones
             
         Returns:
             Merged resources list
@@ -86,27 +99,32 @@ class EnvironmentMerger:
         indexed = {}
         for resource in base_resources:
             key = (resource.get("kind"), resource.get("name"))
-            indexed[key] = deepcopy(resource)
+            indexed[key] = deepcopy(resource) if copy else resource
         
         # Apply overrides
         for override_resource in override_resources:
             key = (override_resource.get("kind"), override_resource.get("name"))
             
             if key in indexed:
+                # Shared resources are replaced, never modified
+                merged = indexed[key] if copy else dict(indexed[key])
+
                 # Merge spec (deep merge)
                 if "spec" in override_resource:
-                    indexed[key]["spec"] = EnvironmentMerger._merge_dict(
-                        indexed[key].get("spec", {}),
-                        override_resource["spec"]
+                    merged["spec"] = EnvironmentMerger._merge_dict(
+                        merged.get("spec", {}),
+                        override_resource["spec"],
+                        copy,
                     )
                 
                 # Other fields override completely
                 for field in ["kind", "name"]:
                     if field in override_resource:
-                        indexed[key][field] = override_resource[field]
+                        merged[field] = override_resource[field]
+                indexed[key] = merged
             else:
                 # New resource in environment
-                indexed[key] = deepcopy(override_resource)
+                indexed[key] = deepcopy(override_resource) if copy else override_resource
         
         # Return resources in stable order
         result = []
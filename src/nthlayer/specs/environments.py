@@ -119,6 +119,47 @@ class EnvironmentLoader:
 
         return None
 
+    @staticmethod
+    def list_environments(base_file: Path) -> List[str]:
+        """List the environments that have an override file for a service.
+
+        Reads the ``environment`` field of the files ``find_environment_file``
+        would pick for this service: shared ``{env}.yaml`` files and
+        ``{service}-{env}.yaml`` files in the search directories.
+
+        Args:
+            base_file: Path to base service YAML
+
+        Returns:
+            Sorted environment names
+        """
+        base_dir = base_file.parent
+        service_name = base_file.stem
+        environments = set()
+
+        # (directory, whether shared {env}.yaml files there apply)
+        search = [
+            (base_dir / "environments", True),
+            (base_dir / ".nthlayer" / "environments", False),
+        ]
+        for env_dir, shared in search:
+            for env_file in sorted(env_dir.glob("*.yaml")):
+                try:
+                    with open(env_file) as f:
+                        data = yaml.safe_load(f)
+                except (OSError, yaml.YAMLError):
+                    continue
+                if not isinstance(data, dict) or not data.get("environment"):
+                    continue
+
+                environment = str(data["environment"]).lower().strip()
+                if env_file.stem == f"{service_name}-{environment}" or (
+                    shared and env_file.stem == environment
+                ):
+                    environments.add(environment)
+
+        return sorted(environments)
+
     @staticmethod
     def load_environment_override(env_file: Path) -> EnvironmentOverride:
         """Load environment override from YAML file.
@@ -171,6 +212,23 @@ class EnvironmentLoader:
         return config
 
 
+def split_environments(value: Optional[str]) -> List[str]:
+    """Split a comma-separated ``--env`` value into environment names.
+
+    Args:
+        value: Environment name, list such as ``dev,staging,prod``, or None
+
+    Returns:
+        Environment names in the order given, without blanks or duplicates
+    """
+    environments: List[str] = []
+    for name in (value or "").split(","):
+        name = name.strip()
+        if name and name not in environments:
+            environments.append(name)
+    return environments
+
+
 # Standard environment names
 STANDARD_ENVIRONMENTS = ["dev", "development", "staging", "stage", "prod", "production"]
 
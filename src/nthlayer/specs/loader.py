@@ -36,6 +36,7 @@ from nthlayer.specs.manifest import (
     SLODefinition,
     SourceFormat,
 )
+from nthlayer.specs.manifest_cache import get_manifest_cache, manifest_cache_key
 from nthlayer.specs.opensrm_parser import (
     OpenSRMParseError,
     is_opensrm_format,
@@ -97,6 +98,17 @@ def load_manifest(
     if not path.exists():
         raise FileNotFoundError(f"Manifest file not found: {file_path}")
 
+    cache = get_manifest_cache()
+    if cache is not None:
+        key = manifest_cache_key(
+            path, "manifest", environment, format, template_dir=_find_template_dir(path)
+        )
+        manifest = cache.get(key)
+        if manifest is not None:
+            if manifest.source_format == SourceFormat.LEGACY and not suppress_deprecation_warning:
+                _warn_legacy_format(file_path)
+            return manifest
+
     # Load YAML
     try:
         with open(path) as f:
@@ -104,6 +116,33 @@ def load_manifest(
     except yaml.YAMLError as e:
         raise ManifestLoadError(f"Invalid YAML in {file_path}: {e}") from e
 
+    manifest = manifest_from_data(
+        data,
+        path,
+        environment=environment,
+        format=format,
+        suppress_deprecation_warning=suppress_deprecation_warning,
+    )
+    if cache is not None:
+        cache.set(key, manifest)
+    return manifest
+
+
+def manifest_from_data(
+    data: Any,
+    file_path: str | Path,
+    environment: str | None = None,
+    format: Literal["auto", "opensrm", "legacy"] | None = "auto",
+    suppress_deprecation_warning: bool = False,
+) -> ReliabilityManifest:
+    """
+    Build a manifest from an already-loaded YAML document.
+
+    Same as ``load_manifest`` without reading the file; ``file_path`` is
+    used for template lookup and source tracking.
+    """
+    path = Path(file_path)
+
     if not isinstance(data, dict):
         raise ManifestLoadError(f"Expected YAML object in {file_path}")
 
@@ -136,17 +175,21 @@ def load_manifest(
     else:
         # Legacy format
         if not suppress_deprecation_warning:
-            warnings.warn(
-                f"Legacy NthLayer format detected in {file_path}. "
-                f"Consider migrating to OpenSRM format (apiVersion: srm/v1). "
-                f"Run 'nthlayer migrate {file_path}' to convert.",
-                LegacyFormatWarning,
-                stacklevel=2,
-            )
+            _warn_legacy_format(file_path)
 
         return _parse_legacy_to_manifest(data, str(path), environment)
 
 
+def _warn_legacy_format(file_path: str | Path) -> None:
+    warnings.warn(
+        f"Legacy NthLayer format detected in {file_path}. "
+        f"Consider migrating to OpenSRM format (apiVersion: srm/v1). "
+        f"Run 'nthlayer migrate {file_path}' to convert.",
+        LegacyFormatWarning,
+        stacklevel=3,
+    )
+
+
 def _detect_format(data: dict[str, Any]) -> SourceFormat:
     """
     Detect the format of manifest data.
@@ -0,0 +1,366 @@
+"""
+Persistent cache of parsed service manifests.
+
+A CI job typically runs validate, plan, apply, check-deploy, portfolio and
+scorecard against the same manifests, and each process parses the YAML,
+merges environment overrides and resolves templates again.
+``ManifestCache`` keeps parsed results (``ServiceContext`` and resources
+from ``parse_service_file``, ``ReliabilityManifest`` from ``load_manifest``
+and ``parse_opensrm_file``) in a sqlite file under ``~/.cache/nthlayer``.
+
+Entries are keyed by a hash of everything the parse read: the manifest
+bytes, the environment overlay bytes, the template registry version and
+the nthlayer version. Editing any input produces a new key, so entries are
+never stale; unused entries are evicted least recently used first once
+the cache exceeds its size cap. The variable-substitution plan of each
+service file is stored too, so parsing it for another environment skips
+compiling the plan.
+
+The cache is opt-in: set ``NTHLAYER_MANIFEST_CACHE=disk`` to enable it
+and ``NTHLAYER_MANIFEST_CACHE_MAX_MB`` to change the cap (default 64).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from nthlayer.specs.templates import TemplateRegistry
+
+logger = structlog.get_logger()
+
+MANIFEST_CACHE_ENV = "NTHLAYER_MANIFEST_CACHE"
+MANIFEST_CACHE_MAX_MB_ENV = "NTHLAYER_MANIFEST_CACHE_MAX_MB"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+CACHE_FORMAT_VERSION = 1
+
+_ENABLED_MODES = {"disk", "on", "true", "1"}
+_TEMPLATE_PATTERNS = ("*.yaml", "*.yml")
+
+
+def _hash_parts(parts: Iterable[bytes | str | None]) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        if part is None:
+            digest.update(b"\x00none")
+        else:
+            data = part.encode() if isinstance(part, str) else part
+            digest.update(len(data).to_bytes(8, "big"))
+            digest.update(data)
+    return digest.hexdigest()
+
+
+def directory_digest(directory: Path | None) -> str | None:
+    """Hash of the names and contents of the template files in ``directory``."""
+    if directory is None or not directory.is_dir():
+        return None
+
+    files = sorted({path for pattern in _TEMPLATE_PATTERNS for path in directory.glob(pattern)})
+    parts: list[bytes | str | None] = []
+    for path in files:
+        parts.extend([path.name, path.read_bytes()])
+    return _hash_parts(parts)
+
+
+def template_registry_version(registry: TemplateRegistry | None) -> str:
+    """
+    Version of the templates a legacy service parse resolves against.
+
+    Without an explicit registry the parser loads the built-in templates
+    plus ``.nthlayer/templates``, so the version is a hash of those files;
+    an explicit registry is hashed by content.
+    """
+    if registry is None:
+        from nthlayer.specs.custom_templates import CustomTemplateLoader
+
+        # Directory TemplateLoader.load_builtin reads
+        builtin = Path(__file__).parent / "builtin_templates"
+        return _hash_parts(
+            [
+                "files",
+                directory_digest(builtin),
+                directory_digest(CustomTemplateLoader.find_templates_directory()),
+            ]
+        )
+
+    templates = [asdict(template) for _, template in sorted(registry.templates.items())]
+    return _hash_parts(["registry", json.dumps(templates, sort_keys=True, default=str)])
+
+
+def _read(path: Path | None) -> bytes | None:
+    return None if path is None else path.read_bytes()
+
+
+def _nthlayer_version() -> str:
+    # Imported here: nthlayer.generators imports the spec parser
+    from nthlayer.generators.artifact_cache import nthlayer_version
+
+    return nthlayer_version()
+
+
+def service_cache_key(
+    file_path: Path,
+    environment: str | None,
+    environment_file: Path | None,
+    template_registry: TemplateRegistry | None,
+    content: bytes | None = None,
+) -> str:
+    """
+    Cache key for ``parse_service``/``parse_service_file`` results.
+
+    ``content`` is the manifest as already read, so the key matches the
+    bytes that are parsed even if the file changes meanwhile.
+    """
+    return _hash_parts(
+        [
+            "service",
+            str(CACHE_FORMAT_VERSION),
+            _nthlayer_version(),
+            file_path.read_bytes() if content is None else content,
+            environment,
+            _read(environment_file),
+            template_registry_version(template_registry),
+        ]
+    )
+
+
+def substitution_plan_key(content: bytes) -> str:
+    """Cache key for the ``SubstitutionPlan`` of a service file's base document."""
+    return _hash_parts(
+        ["substitution-plan", str(CACHE_FORMAT_VERSION), _nthlayer_version(), content]
+    )
+
+
+def manifest_cache_key(
+    file_path: Path,
+    kind: str,
+    environment: str | None = None,
+    format: str | None = None,
+    template_dir: Path | None = None,
+) -> str:
+    """
+    Cache key for ``load_manifest``/``parse_opensrm_file`` results.
+
+    The path is part of the key because the manifest records its source file.
+    """
+    return _hash_parts(
+        [
+            kind,
+            str(CACHE_FORMAT_VERSION),
+            _nthlayer_version(),
+            str(file_path),
+            file_path.read_bytes(),
+            environment,
+            format,
+            directory_digest(template_dir),
+        ]
+    )
+
+
+@dataclass
+class ManifestCacheStats:
+    """Hit/miss counters for a manifest cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class ManifestCache:
+    """
+    sqlite-backed, size-capped LRU cache of parsed manifests.
+
+    Values are pickled. Entries that can no longer be unpickled are dropped
+    and treated as misses; a failing cache file is logged and the cache is
+    switched off rather than failing the parse.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        timer: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            path: sqlite file holding the entries
+            max_bytes: Total size of stored values above which the least
+                recently used entries are evicted
+            timer: Clock returning epoch seconds
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self._disabled = False
+        self.stats = ManifestCacheStats()
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for ``key``, or None on a miss."""
+        with self._lock:
+            row = self._execute("SELECT value FROM entries WHERE key = ?", (key,))
+            if row is None:
+                self.stats.misses += 1
+                return None
+
+            try:
+                value = pickle.loads(row[0])
+            except Exception as exc:  # noqa: BLE001 - any unpickling failure is a miss
+                logger.debug("manifest_cache_entry_dropped", error=str(exc))
+                self._execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.stats.misses += 1
+                return None
+
+            self._execute("UPDATE entries SET last_used = ? WHERE key = ?", (self._timer(), key))
+            self.stats.hits += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key`` and evict entries over the size cap."""
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            logger.debug("manifest_cache_unpicklable", error=str(exc))
+            return
+        if len(payload) > self.max_bytes:
+            return
+
+        with self._lock:
+            self._execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), self._timer()),
+            )
+            self._evict()
+
+    def size(self) -> int:
+        """Total bytes of stored values."""
+        with self._lock:
+            row = self._execute("SELECT COALESCE(SUM(size), 0) FROM entries")
+            return int(row[0]) if row else 0
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Close the cache file."""
+        with self._lock:
+            db, self._db = self._db, None
+            if db is not None:
+                db.close()
+
+    def _evict(self) -> None:
+        db = self._get_db()
+        if db is None:
+            return
+
+        try:
+            rows = db.execute("SELECT key, size FROM entries ORDER BY last_used DESC").fetchall()
+            kept = 0
+            evicted = []
+            for key, size in rows:
+                kept += size
+                if kept > self.max_bytes:
+                    evicted.append((key,))
+            if evicted:
+                db.executemany("DELETE FROM entries WHERE key = ?", evicted)
+                db.commit()
+                self.stats.evictions += len(evicted)
+        except sqlite3.Error as exc:
+            self._disable(exc)
+
+    def _get_db(self) -> sqlite3.Connection | None:
+        if self._db is not None or self._disabled:
+            return self._db
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            db.commit()
+        except (OSError, sqlite3.Error) as exc:
+            self._disable(exc)
+            return None
+
+        self._db = db
+        return db
+
+    def _execute(self, sql: str, params: tuple[Any, ...] = ()) -> tuple[Any, ...] | None:
+        db = self._get_db()
+        if db is None:
+            return None
+
+        try:
+            row = db.execute(sql, params).fetchone()
+            db.commit()
+            return row
+        except sqlite3.Error as exc:
+            self._disable(exc)
+            return None
+
+    def _disable(self, exc: Exception) -> None:
+        logger.warning("manifest_cache_disabled", path=str(self.path), error=str(exc))
+        if self._db is not None:
+            self._db.close()
+        self._db = None
+        self._disabled = True
+
+
+_manifest_cache: ManifestCache | None = None
+
+
+def get_manifest_cache() -> ManifestCache | None:
+    """
+    Return the process-wide manifest cache, or None when it is off.
+
+    Enabled with ``NTHLAYER_MANIFEST_CACHE=disk``; entries are stored in
+    ``~/.cache/nthlayer/manifest-cache.sqlite``.
+    """
+    global _manifest_cache
+
+    mode = os.environ.get(MANIFEST_CACHE_ENV, "off").strip().lower()
+    if mode not in _ENABLED_MODES:
+        return None
+
+    if _manifest_cache is None:
+        from nthlayer.providers.query_cache import default_cache_dir
+
+        max_bytes = DEFAULT_MAX_BYTES
+        raw_max = os.environ.get(MANIFEST_CACHE_MAX_MB_ENV)
+        if raw_max:
+            try:
+                max_bytes = int(float(raw_max) * 1024 * 1024)
+            except ValueError:
+                logger.warning("manifest_cache_invalid_max_mb", value=raw_max)
+        _manifest_cache = ManifestCache(
+            default_cache_dir() / "manifest-cache.sqlite", max_bytes=max_bytes
+        )
+    return _manifest_cache
+
+
+def reset_manifest_cache() -> None:
+    """Close and drop the process-wide cache."""
+    global _manifest_cache
+    if _manifest_cache is not None:
+        _manifest_cache.close()
+    _manifest_cache = None
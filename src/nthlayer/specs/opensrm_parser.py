@@ -49,6 +49,7 @@ from nthlayer.specs.manifest import (
     SourceFormat,
     TelemetryEvent,
 )
+from nthlayer.specs.manifest_cache import get_manifest_cache, manifest_cache_key
 
 
 class OpenSRMParseError(Exception):
@@ -184,6 +185,13 @@ def parse_opensrm_file(file_path: str | Path) -> ReliabilityManifest:
     if not path.exists():
         raise FileNotFoundError(f"Manifest file not found: {file_path}")
 
+    cache = get_manifest_cache()
+    if cache is not None:
+        key = manifest_cache_key(path, "opensrm")
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
     try:
         with open(path) as f:
             data = yaml.safe_load(f)
@@ -193,7 +201,10 @@ def parse_opensrm_file(file_path: str | Path) -> ReliabilityManifest:
     if not isinstance(data, dict):
         raise OpenSRMParseError(f"Expected YAML object in {file_path}")
 
-    return parse_opensrm(data, source_file=str(path))
+    manifest = parse_opensrm(data, source_file=str(path))
+    if cache is not None:
+        cache.set(key, manifest)
+    return manifest
 
 
 # =============================================================================
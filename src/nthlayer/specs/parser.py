@@ -6,24 +6,162 @@ Parses service definition files with implicit service context.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
 from nthlayer.specs.custom_templates import CustomTemplateLoader
 from nthlayer.specs.environment_merger import EnvironmentMerger
 from nthlayer.specs.environments import EnvironmentLoader
+from nthlayer.specs.manifest_cache import (
+    ManifestCache,
+    get_manifest_cache,
+    service_cache_key,
+    substitution_plan_key,
+)
 from nthlayer.specs.models import Resource, ServiceContext
 from nthlayer.specs.template import substitute_variables
 from nthlayer.specs.templates import TemplateRegistry
+from nthlayer.specs.variable_substitution import (
+    SubstitutionPlan,
+    compile_substitution_plan,
+)
 from nthlayer.specs.variable_substitution import substitute_variables as substitute_env_variables
 
+if TYPE_CHECKING:
+    from nthlayer.specs.manifest import ReliabilityManifest
+
 
 class ServiceParseError(Exception):
     """Raised when service YAML parsing fails."""
 
 
+@dataclass(frozen=True)
+class ParsedService:
+    """
+    A service file parsed once for one environment.
+
+    Shared by every generator in an apply run so the YAML is read, merged
+    with environment overrides and variable-substituted only once. Treat
+    it as read-only: generators must not modify ``raw_data``, the context
+    or resource specs.
+
+    Attributes:
+        path: Service YAML file
+        environment: Environment the overrides were merged for
+        raw_data: Base YAML document, before environment overrides
+        context: Service context with the environment applied
+        resources: Template and user resources with the environment applied
+        environment_file: Environment override file that was merged, if any
+    """
+
+    path: Path
+    environment: str | None
+    raw_data: dict[str, Any]
+    context: ServiceContext
+    resources: tuple[Resource, ...]
+    environment_file: Path | None = None
+
+    @property
+    def service_name(self) -> str:
+        """Service name, falling back to the file name."""
+        return self.context.name or self.path.stem
+
+    @cached_property
+    def manifest(self) -> ReliabilityManifest:
+        """The file as a ``ReliabilityManifest`` (same result as ``load_manifest``)."""
+        from nthlayer.specs.loader import manifest_from_data
+
+        return manifest_from_data(
+            self.raw_data,
+            self.path,
+            environment=self.environment,
+            suppress_deprecation_warning=True,
+        )
+
+    def resources_by_kind(self, kind: str) -> list[Resource]:
+        """Resources of one kind, in definition order."""
+        return [r for r in self.resources if r.kind == kind]
+
+
+def parse_service(
+    file_path: str | Path,
+    environment: str | None = None,
+    template_registry: TemplateRegistry | None = None,
+) -> ParsedService:
+    """
+    Parse a service YAML file into a reusable ``ParsedService``.
+
+    Same parsing and errors as ``parse_service_file``.
+    """
+    file_path = Path(file_path)
+    raw_data, env_file, context, resources = _parse_cached(
+        file_path, template_registry, environment
+    )
+    return ParsedService(
+        path=file_path,
+        environment=environment,
+        raw_data=raw_data,
+        context=context,
+        resources=tuple(resources),
+        environment_file=env_file,
+    )
+
+
+def parse_service_environments(
+    file_path: str | Path,
+    environments: Iterable[str],
+    template_registry: TemplateRegistry | None = None,
+) -> dict[str, ParsedService]:
+    """
+    Parse a service file once for several environments.
+
+    The base YAML is read once, the templates are loaded once and the
+    base document's variable-substitution plan is compiled once; each
+    environment's overrides are then merged into a structurally shared
+    view of the base instead of repeating the whole parse per environment.
+    Same parsing and errors as ``parse_service``.
+
+    Returns:
+        ParsedService per environment, in the order given
+    """
+    file_path = Path(file_path)
+    cache = get_manifest_cache()
+    if cache is None:
+        raw_data = _load_yaml(file_path)
+        base_plan = compile_substitution_plan(raw_data)
+    else:
+        content = _read_service_file(file_path)
+        raw_data = _parse_yaml(file_path, content)
+        base_plan = _substitution_plan(cache, content, raw_data)
+
+    service = raw_data.get("service") if isinstance(raw_data, dict) else None
+    if template_registry is None and isinstance(service, dict) and service.get("template"):
+        template_registry = CustomTemplateLoader.load_all_templates()
+
+    parsed: dict[str, ParsedService] = {}
+    for environment in environments:
+        if environment in parsed:
+            continue
+        env_file = _find_environment_file(file_path, environment)
+        context, resources = _parse_service_data(
+            raw_data, file_path, template_registry, environment, env_file, base_plan
+        )
+        parsed[environment] = ParsedService(
+            path=file_path,
+            environment=environment,
+            raw_data=raw_data,
+            context=context,
+            resources=tuple(resources),
+            environment_file=env_file,
+        )
+    return parsed
+
+
 def parse_service_file(
     file_path: str | Path,
     template_registry: TemplateRegistry | None = None,
@@ -67,32 +205,111 @@ def parse_service_file(
     Raises:
         ServiceParseError: If parsing fails or required fields missing
     """
-    file_path = Path(file_path)
+    _, _, context, resources = _parse_cached(Path(file_path), template_registry, environment)
+    return context, list(resources)
+
+
+def _parse_cached(
+    file_path: Path,
+    template_registry: TemplateRegistry | None,
+    environment: str | None,
+) -> tuple[Any, Path | None, ServiceContext, list[Resource]]:
+    """
+    Load, merge and parse a service file, through the manifest cache if enabled.
+
+    Returns the base YAML document, the environment file that was merged,
+    the service context and the resources.
+    """
+    cache = get_manifest_cache()
+    if cache is None:
+        raw_data = _load_yaml(file_path)
+        env_file = _find_environment_file(file_path, environment)
+        context, resources = _parse_service_data(
+            raw_data, file_path, template_registry, environment, env_file
+        )
+        return raw_data, env_file, context, resources
 
+    # Key and parse from the same bytes, even if the file is being edited
+    content = _read_service_file(file_path)
+    env_file = _find_environment_file(file_path, environment)
+    key = service_cache_key(file_path, environment, env_file, template_registry, content)
+    cached = cache.get(key)
+    if cached is not None:
+        raw_data, context, resources = cached
+        return raw_data, env_file, context, resources
+
+    raw_data = _parse_yaml(file_path, content)
+    base_plan = _substitution_plan(cache, content, raw_data) if environment else None
+    context, resources = _parse_service_data(
+        raw_data, file_path, template_registry, environment, env_file, base_plan
+    )
+    cache.set(key, (raw_data, context, resources))
+    return raw_data, env_file, context, resources
+
+
+def _load_yaml(file_path: Path) -> Any:
+    """Load the base service YAML document."""
+    return _parse_yaml(file_path, _read_service_file(file_path))
+
+
+def _read_service_file(file_path: Path) -> bytes:
     if not file_path.exists():
         raise ServiceParseError(f"Service file not found: {file_path}")
+    return file_path.read_bytes()
+
 
-    # Load base file
+def _parse_yaml(file_path: Path, content: bytes) -> Any:
     try:
-        with open(file_path) as f:
-            data = yaml.safe_load(f)
+        return yaml.safe_load(content)
     except yaml.YAMLError as e:
         raise ServiceParseError(f"Invalid YAML in {file_path}: {e}") from e
 
-    # If environment specified, load and merge environment overrides
-    if environment:
-        env_file = EnvironmentLoader.find_environment_file(file_path, environment)
-        if env_file:
-            try:
-                with open(env_file) as f:
-                    env_data = yaml.safe_load(f)
 
-                # Merge environment overrides into base data
-                data = EnvironmentMerger.merge_service_config(data, env_data)
-            except Exception as e:
-                raise ServiceParseError(
-                    f"Error loading environment '{environment}' from {env_file}: {e}"
-                ) from e
+def _substitution_plan(cache: ManifestCache, content: bytes, raw_data: Any) -> SubstitutionPlan:
+    """Substitution plan of a base document, from the manifest cache if stored."""
+    key = substitution_plan_key(content)
+    plan = cache.get(key)
+    if not isinstance(plan, SubstitutionPlan):
+        plan = compile_substitution_plan(raw_data)
+        cache.set(key, plan)
+    return plan
+
+
+def _find_environment_file(file_path: Path, environment: str | None) -> Path | None:
+    """Locate the environment override file for a service, if any."""
+    if not environment:
+        return None
+    return EnvironmentLoader.find_environment_file(file_path, environment)
+
+
+def _parse_service_data(
+    data: Any,
+    file_path: Path,
+    template_registry: TemplateRegistry | None,
+    environment: str | None,
+    env_file: Path | None,
+    base_plan: SubstitutionPlan | None = None,
+) -> tuple[ServiceContext, list[Resource]]:
+    """
+    Apply environment overrides to loaded YAML and build context and resources.
+
+    ``base_plan`` is the substitution plan compiled for ``data``; the parts
+    of the merged document the overrides left alone reuse its targets.
+    """
+    base_data = data
+    # If environment specified, load and merge environment overrides
+    if env_file:
+        try:
+            with open(env_file) as f:
+                env_data = yaml.safe_load(f)
+
+            # Merge environment overrides into base data
+            # Substitution below rebuilds the tree, so the merge can share it
+            data = EnvironmentMerger.merge_service_config(data, env_data, copy=False)
+        except Exception as e:
+            raise ServiceParseError(
+                f"Error loading environment '{environment}' from {env_file}: {e}"
+            ) from e
 
     if not isinstance(data, dict):
         raise ServiceParseError(f"Service file must be a YAML dictionary: {file_path}")
@@ -105,8 +322,9 @@ def parse_service_file(
         team = data.get("service", {}).get("team", "")
 
         # Substitute variables throughout the entire config
+        plan = compile_substitution_plan(data, base=base_data, base_plan=base_plan)
         data = substitute_env_variables(
-            data, environment=environment, service_name=service_name, team=team
+            data, environment=environment, service_name=service_name, team=team, plan=plan
         )
 
     # Parse service context (required)
@@ -26,6 +26,7 @@ from nthlayer.specs.manifest import SERVICE_TYPE_ALIASES, VALID_SERVICE_TYPES, V
 from nthlayer.specs.models import VALID_RESOURCE_KINDS
 from nthlayer.specs.parser import ServiceParseError, parse_service_file
 from nthlayer.specs.template import validate_template_variables
+from nthlayer.specs.templates import TemplateRegistry
 
 
 @dataclass
@@ -67,6 +68,7 @@ def validate_service_file(
     strict: bool = False,
     validate_filename: bool = True,
     contract_registry: ContractRegistry | None = None,
+    template_registry: TemplateRegistry | None = None,
 ) -> ValidationResult:
     """
     Validate service YAML file.
@@ -87,6 +89,10 @@ def validate_service_file(
         environment: Optional environment name (dev, staging, prod)
         strict: If True, treat warnings as errors
         validate_filename: Check if filename matches service name
+        contract_registry: Registry of other services' contracts for
+            cross-service checks (OpenSRM only)
+        template_registry: Templates to resolve against (default: built-in
+            plus custom templates)
 
     Returns:
         ValidationResult with errors and warnings
@@ -162,7 +168,9 @@ def validate_service_file(
     else:
         # Use legacy parser for legacy format (preserves resource list for validation)
         try:
-            service_context, resources = parse_service_file(file_path, environment=environment)
+            service_context, resources = parse_service_file(
+                file_path, environment=environment, template_registry=template_registry
+            )
             resource_count = len(resources)
         except ServiceParseError as parse_err:
             return ValidationResult(
@@ -4,10 +4,142 @@ Supports substitution of:
 - ${env} - Environment name
 - ${service} - Service name
 - ${team} - Team name
+
+Most strings in a service file contain no placeholder, so substitution is
+driven by a ``SubstitutionPlan``: the paths of the strings that do, each
+pre-split into literal and variable fragments. Applying a plan for one
+environment only visits those paths, and a plan compiled for a base file is
+reused for every environment merged from it.
 """
 
 import re
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
+
+# ${var} placeholder; re.split with it yields literal, name, literal, ...
+PLACEHOLDER_PATTERN = re.compile(r"\$\{(\w+)\}")
+
+# Dict keys and list indexes from the document root
+DocumentPath = Tuple[Union[str, int], ...]
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class SubstitutionPlan:
+    """Locations of ``${var}`` placeholders in one configuration document.
+
+    Attributes:
+        targets: ``(path, fragments)`` for every string containing a
+            placeholder, where ``fragments`` is the string split by
+            ``PLACEHOLDER_PATTERN``: literal text at even positions and
+            variable names at odd positions
+    """
+
+    targets: Tuple[Tuple[DocumentPath, Tuple[str, ...]], ...] = ()
+
+    @property
+    def variables(self) -> FrozenSet[str]:
+        """Names of the variables the document uses."""
+        return frozenset(name for _, fragments in self.targets for name in fragments[1::2])
+
+    @cached_property
+    def _by_prefix(self) -> Dict[DocumentPath, List[Tuple[DocumentPath, Tuple[str, ...]]]]:
+        index: Dict[DocumentPath, List[Tuple[DocumentPath, Tuple[str, ...]]]] = {}
+        for target in self.targets:
+            path = target[0]
+            for depth in range(len(path) + 1):
+                index.setdefault(path[:depth], []).append(target)
+        return index
+
+    def targets_under(self, prefix: DocumentPath) -> List[Tuple[DocumentPath, Tuple[str, ...]]]:
+        """Targets at or below ``prefix``."""
+        return self._by_prefix.get(prefix, [])
+
+    def apply(self, data: Any, variables: Dict[str, str]) -> Any:
+        """Return ``data`` with the planned placeholders substituted.
+
+        Only the dicts and lists on the path to a substituted string are
+        copied; everything else is shared with ``data``, which is not
+        modified. Unknown variables are left as ``${name}``.
+
+        Args:
+            data: The document the plan was compiled for
+            variables: Variable name to value
+        """
+        if not self.targets:
+            return data
+
+        result = data
+        copies: Dict[DocumentPath, Any] = {}
+        for path, fragments in self.targets:
+            text = "".join(
+                fragment if i % 2 == 0 else variables.get(fragment, "${" + fragment + "}")
+                for i, fragment in enumerate(fragments)
+            )
+            if not path:
+                return text
+
+            if not copies:
+                result = copies[()] = _shallow_copy(data)
+            node = result
+            for depth in range(1, len(path)):
+                prefix = path[:depth]
+                child = copies.get(prefix)
+                if child is None:
+                    child = copies[prefix] = _shallow_copy(node[path[depth - 1]])
+                    node[path[depth - 1]] = child
+                node = child
+            node[path[-1]] = text
+        return result
+
+
+def _shallow_copy(container: Any) -> Any:
+    return dict(container) if isinstance(container, dict) else list(container)
+
+
+def compile_substitution_plan(
+    data: Any,
+    base: Any = None,
+    base_plan: Optional[SubstitutionPlan] = None,
+) -> SubstitutionPlan:
+    """Find every string with a ``${var}`` placeholder in ``data``.
+
+    When ``data`` was derived from ``base`` without copying the parts it
+    left alone (``EnvironmentMerger.merge_service_config(copy=False)``),
+    pass ``base`` and its plan: subtrees ``data`` shares with ``base`` are
+    not walked again, their targets are taken from ``base_plan``.
+
+    Args:
+        data: Configuration document
+        base: Document ``data`` was derived from
+        base_plan: Plan compiled for ``base``
+
+    Returns:
+        SubstitutionPlan for ``data``
+    """
+    targets: List[Tuple[DocumentPath, Tuple[str, ...]]] = []
+
+    def walk(value: Any, base_value: Any, path: DocumentPath) -> None:
+        if base_value is value and base_plan is not None:
+            targets.extend(base_plan.targets_under(path))
+        elif isinstance(value, str):
+            if "${" in value:
+                fragments = tuple(PLACEHOLDER_PATTERN.split(value))
+                if len(fragments) > 1:
+                    targets.append((path, fragments))
+        elif isinstance(value, dict):
+            base_dict = base_value if isinstance(base_value, dict) else {}
+            for key, child in value.items():
+                walk(child, base_dict.get(key, _MISSING), path + (key,))
+        elif isinstance(value, list):
+            base_list = base_value if isinstance(base_value, list) else []
+            for i, child in enumerate(value):
+                walk(child, base_list[i] if i < len(base_list) else _MISSING, path + (i,))
+
+    walk(data, base if base_plan is not None else _MISSING, ())
+    return SubstitutionPlan(targets=tuple(targets))
 
 
 class VariableSubstitutor:
@@ -32,9 +164,13 @@ class VariableSubstitutor:
             "team": team or "",
         }
     
-    def substitute(self, value: Any) -> Any:
+    def substitute(self, value: Any, plan: Optional[SubstitutionPlan] = None) -> Any:
         """Recursively substitute variables in a value.
         
+        With a ``plan`` compiled for ``value`` only the planned paths are
+        visited (see ``SubstitutionPlan.apply``); without one the whole
+        value is walked and copied.
+        
         Supports:
         - Strings: "availability-${env}" → "availability-prod"
         - Dicts: Recursively processes all values
@@ -43,6 +179,7 @@ class VariableSubstitutor:
         
         Args:
             value: Value to process
+            plan: Substitution plan compiled for ``value``
             
         Returns:
             Value with variables substituted
@@ -52,6 +189,8 @@ class VariableSubstitutor:
             >>> sub.substitute("slo-${service}-${env}")
             'slo-payment-api-prod'
         """
+        if plan is not None:
+            return plan.apply(value, self.variables)
         if isinstance(value, str):
             return self._substitute_string(value)
         elif isinstance(value, dict):
@@ -78,24 +217,28 @@ class VariableSubstitutor:
             return self.variables.get(var_name, match.group(0))
         
         # Replace ${var} patterns
-        return re.sub(r'\$\{(\w+)\}', replace_var, text)
+        return PLACEHOLDER_PATTERN.sub(replace_var, text)
 
 
 def substitute_variables(
     data: Dict[str, Any],
     environment: Optional[str] = None,
     service_name: Optional[str] = None,
-    team: Optional[str] = None
+    team: Optional[str] = None,
+    plan: Optional[SubstitutionPlan] = None,
 ) -> Dict[str, Any]:
     """Substitute variables throughout a configuration dictionary.
     
-    Convenience function for one-shot substitution.
+    Convenience function for one-shot substitution. Only the paths holding
+    placeholders are visited and copied; the rest of the result is shared
+    with ``data``.
     
     Args:
         data: Configuration dictionary
         environment: Environment name
         service_name: Service name
         team: Team name
+        plan: Plan compiled for ``data`` (compiled here if omitted)
         
     Returns:
         Configuration with variables substituted
@@ -113,4 +256,6 @@ def substitute_variables(
         service_name=service_name,
         team=team
     )
-    return substitutor.substitute(data)
+    if plan is None:
+        plan = compile_substitution_plan(data)
+    return substitutor.substitute(data, plan=plan)
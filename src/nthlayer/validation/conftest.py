@@ -22,7 +22,6 @@ from typing import Any
 import yaml
 
 from nthlayer.core.tiers import VALID_TIERS
-from nthlayer.slos.ceiling import validate_slo_ceiling
 from nthlayer.validation.metadata import Severity, ValidationIssue, ValidationResult
 
 
@@ -414,6 +413,9 @@ class ConftestValidator:
         This is OPT-IN: only runs if at least one dependency has an
         explicit `sla` field. Teams not ready for this can omit the field.
         """
+        # nthlayer.slos pulls in the SLO storage layer; only load it when validating
+        from nthlayer.slos.ceiling import validate_slo_ceiling
+
         # Check each SLO against the ceiling
         resources = spec.get("resources", [])
 
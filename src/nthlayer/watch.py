@@ -0,0 +1,261 @@
+"""
+Watch mode: re-run a command whenever its inputs change.
+
+``nthlayer apply --watch`` and ``nthlayer validate --watch`` keep running
+and re-run after every edit to the service files, their ``environments/``
+overrides or the custom template directory
+(``CustomTemplateLoader.find_templates_directory``). The process keeps the
+service template registry, the alert templates and the dashboard intent
+catalogs loaded between runs; only services whose files changed are parsed
+again, and apply's artifact cache skips generators whose inputs are
+unchanged. An edit is reflected without paying interpreter startup,
+template loading and a full regeneration again.
+
+Changes are found by polling file sizes and modification times, which
+needs no extra dependency and also works on network and container mounts.
+A burst of writes (an editor saving several files, a ``git checkout``) is
+coalesced into one run once the files have been quiet for the debounce
+interval.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable, Collection, Iterable, Sequence
+from pathlib import Path
+
+import structlog
+
+from nthlayer.specs.templates import TemplateRegistry
+
+logger = structlog.get_logger()
+
+WATCH_PATTERNS = ("*.yaml", "*.yml")
+DEFAULT_DEBOUNCE = 0.3
+DEFAULT_INTERVAL = 0.2
+
+# Directories never searched below a watched directory
+SKIP_DIRS = {"node_modules", "__pycache__"}
+
+# Hidden directory searched anyway: it holds environment overrides
+# (.nthlayer/environments, see EnvironmentLoader.find_environment_file)
+NTHLAYER_DIR = ".nthlayer"
+
+# (mtime_ns, size) per watched file
+Snapshot = dict[Path, tuple[int, int]]
+
+
+def custom_templates_dir() -> Path:
+    """Custom template directory in effect, or where one would be created."""
+    from nthlayer.specs.custom_templates import CustomTemplateLoader
+
+    return CustomTemplateLoader.find_templates_directory() or (
+        Path.cwd() / ".nthlayer" / "templates"
+    )
+
+
+def watch_roots(target: Path) -> list[Path]:
+    """
+    Files and directories whose edits affect ``target``.
+
+    A service file is watched together with the environment override
+    directories ``EnvironmentLoader.find_environment_file`` searches; a
+    directory is watched recursively. The custom template directory is
+    always watched, even before it exists.
+    """
+    roots = [target]
+    if not target.is_dir():
+        roots.append(target.parent / "environments")
+        roots.append(target.parent / ".nthlayer" / "environments")
+    roots.append(custom_templates_dir())
+    return roots
+
+
+class FileWatcher:
+    """
+    Polls a set of files and directories for changes.
+
+    Args:
+        roots: Files (always watched) and directories (searched recursively
+            for ``patterns``, skipping hidden directories other than
+            ``.nthlayer``)
+        ignore: Directories never searched, such as the output directory
+        patterns: File name patterns watched below directories
+    """
+
+    def __init__(
+        self,
+        roots: Iterable[Path],
+        ignore: Iterable[Path] = (),
+        patterns: Sequence[str] = WATCH_PATTERNS,
+    ) -> None:
+        self.roots = [Path(root) for root in roots]
+        self.ignore = {Path(path).resolve() for path in ignore}
+        self.patterns = tuple(patterns)
+        self._snapshot = self.snapshot()
+
+    def snapshot(self) -> Snapshot:
+        """Current size and modification time of every watched file."""
+        files: Snapshot = {}
+        for root in self.roots:
+            if root.is_file():
+                self._stat(root, files)
+            elif root.is_dir() and root.resolve() not in self.ignore:
+                for dirpath, dirnames, filenames in os.walk(root):
+                    dirnames[:] = [
+                        name
+                        for name in dirnames
+                        if (name == NTHLAYER_DIR or not name.startswith("."))
+                        and name not in SKIP_DIRS
+                        and (Path(dirpath) / name).resolve() not in self.ignore
+                    ]
+                    for filename in filenames:
+                        path = Path(dirpath) / filename
+                        if any(path.match(pattern) for pattern in self.patterns):
+                            self._stat(path, files)
+        return files
+
+    def poll(self) -> set[Path]:
+        """Return files created, modified or deleted since the last poll."""
+        current = self.snapshot()
+        previous, self._snapshot = self._snapshot, current
+        return {
+            path
+            for path in current.keys() | previous.keys()
+            if current.get(path) != previous.get(path)
+        }
+
+    def wait(
+        self,
+        debounce: float = DEFAULT_DEBOUNCE,
+        interval: float = DEFAULT_INTERVAL,
+        sleep: Callable[[float], None] = time.sleep,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> set[Path]:
+        """
+        Block until files change, then until they stop changing.
+
+        Returns every file changed during the burst once no further change
+        was seen for ``debounce`` seconds.
+        """
+        changed: set[Path] = set()
+        last_change = 0.0
+        while True:
+            sleep(interval)
+            found = self.poll()
+            now = timer()
+            if found:
+                changed |= found
+                last_change = now
+            elif changed and now - last_change >= debounce:
+                return changed
+
+    @staticmethod
+    def _stat(path: Path, files: Snapshot) -> None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return  # Deleted between listing and stat
+        files[path] = (stat.st_mtime_ns, stat.st_size)
+
+
+class WarmTemplates:
+    """
+    Templates and catalogs kept loaded across watch runs.
+
+    The alert templates and dashboard intent catalogs do not change while
+    watching; the service template registry is reloaded only after an edit
+    below the custom template directory.
+    """
+
+    def __init__(self) -> None:
+        self.registry: TemplateRegistry | None = None
+        self.templates_dir = custom_templates_dir()
+
+    def refresh(self, changed: Collection[Path] = ()) -> TemplateRegistry:
+        """Return the registry, reloading it if a custom template changed."""
+        if self.registry is None:
+            from nthlayer.alerts import get_default_loader
+            from nthlayer.dashboards import builder_sdk, intents  # noqa: F401 - warm catalogs
+
+            get_default_loader()
+        elif not templates_changed(changed, self.templates_dir):
+            return self.registry
+
+        from nthlayer.specs.custom_templates import CustomTemplateLoader
+
+        self.registry = CustomTemplateLoader.load_all_templates()
+        return self.registry
+
+
+def templates_changed(changed: Collection[Path], templates_dir: Path) -> bool:
+    """Whether any changed file is below ``templates_dir``."""
+    templates_dir = templates_dir.resolve()
+    return any(path.resolve().is_relative_to(templates_dir) for path in changed)
+
+
+def affected_services(
+    services: Sequence[Path], changed: Collection[Path], templates_dir: Path
+) -> list[Path]:
+    """
+    Services that must be re-run after ``changed`` files were edited.
+
+    Every service is affected by a custom template edit; otherwise a
+    service is affected when its own file or an environment override next
+    to it changed.
+    """
+    if templates_changed(changed, templates_dir):
+        return list(services)
+
+    changed_dirs = {path.parent.resolve() for path in changed}
+    resolved = {path.resolve() for path in changed}
+    affected = []
+    for service in services:
+        base = service.parent.resolve()
+        if (
+            service.resolve() in resolved
+            or base / "environments" in changed_dirs
+            or base / ".nthlayer" / "environments" in changed_dirs
+        ):
+            affected.append(service)
+    return affected
+
+
+def watch(
+    run: Callable[[set[Path]], int],
+    watcher: FileWatcher,
+    debounce: float = DEFAULT_DEBOUNCE,
+    interval: float = DEFAULT_INTERVAL,
+    max_runs: int | None = None,
+    on_wait: Callable[[], None] | None = None,
+) -> int:
+    """
+    Run ``run`` once, then again after every burst of changes.
+
+    ``run`` receives the changed files (empty on the first run) and returns
+    an exit code. A run that raises is logged and counted as a failure so
+    the next edit can fix it. Stops on Ctrl+C, or after ``max_runs`` runs.
+
+    Returns:
+        Exit code of the last run
+    """
+    exit_code = 0
+    runs = 0
+    changed: set[Path] = set()
+    try:
+        while True:
+            try:
+                exit_code = run(changed)
+            except Exception as exc:  # noqa: BLE001 - keep watching after a failed run
+                logger.error("watch_run_failed", error=str(exc))
+                exit_code = 1
+            runs += 1
+            if max_runs is not None and runs >= max_runs:
+                break
+            if on_wait is not None:
+                on_wait()
+            changed = watcher.wait(debounce=debounce, interval=interval)
+    except KeyboardInterrupt:
+        pass
+    return exit_code
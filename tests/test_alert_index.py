@@ -0,0 +1,168 @@
+"""Tests for the precompiled alert template index."""
+
+import pickle
+import shutil
+
+import pytest
+from nthlayer.alerts import AlertTemplateLoader
+from nthlayer.alerts.index import (
+    INDEX_FILE,
+    build_index,
+    default_templates_dir,
+    load_index,
+    write_index,
+)
+from nthlayer.alerts.validator import extract_promql_output_labels, output_labels
+
+TEMPLATE = """
+groups:
+  - name: cache
+    rules:
+      - alert: CacheDown
+        expr: sum by (instance) (cache_up) == 0
+        for: 1m
+        labels:
+          severity: critical
+        annotations:
+          summary: Cache down on {{ $labels.instance }}
+"""
+
+
+@pytest.fixture
+def templates_dir(tmp_path):
+    """Small templates directory with an up-to-date index."""
+    (tmp_path / "databases").mkdir()
+    (tmp_path / "databases" / "cache.yaml").write_text(TEMPLATE)
+    (tmp_path / "databases" / "empty.yaml").write_text("groups:\n  - name: empty\n    rules:\n")
+    write_index(tmp_path)
+    return tmp_path
+
+
+def test_bundled_index_is_up_to_date():
+    """The committed index matches the bundled templates (rebuild with build_alert_index.py)."""
+    assert load_index(default_templates_dir()) is not None
+
+
+def test_index_matches_yaml_for_bundled_templates():
+    """Rules from the index are identical to rules parsed from YAML."""
+    indexed = AlertTemplateLoader()
+    parsed = AlertTemplateLoader(use_index=False)
+    assert indexed.index is not None
+
+    technologies = parsed.list_available_technologies()
+    assert indexed.list_available_technologies() == technologies
+
+    for technology in [*technologies, "pg", "k8s", "mongo", "sql"]:
+        assert indexed.load_technology(technology) == parsed.load_technology(technology)
+        assert indexed.get_category_for_technology(
+            technology
+        ) == parsed.get_category_for_technology(technology)
+
+
+def test_build_index_records_rules_and_output_labels(templates_dir):
+    index = build_index(templates_dir)
+
+    assert list(index.rules) == ["databases/cache.yaml", "databases/empty.yaml"]
+    assert index.rules["databases/empty.yaml"] == []
+    (fields,) = index.rules["databases/cache.yaml"]
+    assert fields["name"] == "CacheDown"
+    assert fields["category"] == "databases"
+    assert "technology" not in fields
+    assert index.output_labels == {"sum by (instance) (cache_up) == 0": ["instance"]}
+
+
+def test_loader_uses_index(templates_dir, monkeypatch):
+    loader = AlertTemplateLoader(templates_dir)
+    assert loader.index is not None
+
+    monkeypatch.setattr(
+        AlertTemplateLoader, "_load_from_file", lambda *a: pytest.fail("parsed YAML")
+    )
+    (alert,) = loader.load_technology("cache")
+    assert alert.technology == "cache"
+    assert alert.labels == {"severity": "critical"}
+
+
+def test_index_rules_are_not_shared_between_technologies(templates_dir):
+    loader = AlertTemplateLoader(templates_dir)
+    first = loader.load_technology("cache")[0]
+    first.labels["service"] = "checkout"
+
+    assert "service" not in loader.load_technology("cach")[0].labels
+
+
+def test_customized_templates_fall_back_to_yaml(templates_dir):
+    (templates_dir / "databases" / "cache.yaml").write_text(
+        TEMPLATE.replace("CacheDown", "CacheUnavailable")
+    )
+
+    loader = AlertTemplateLoader(templates_dir)
+
+    assert loader.index is None
+    assert [alert.name for alert in loader.load_technology("cache")] == ["CacheUnavailable"]
+
+
+def test_same_size_edit_is_detected_outside_installed_packages(templates_dir):
+    (templates_dir / "databases" / "cache.yaml").write_text(
+        TEMPLATE.replace("CacheDown", "CacheDowm")
+    )
+
+    assert load_index(templates_dir) is None
+
+
+def test_installed_index_is_trusted_without_reading_templates(templates_dir, monkeypatch):
+    monkeypatch.setattr("nthlayer.alerts.index._is_installed", lambda path: True)
+    monkeypatch.setattr(
+        "nthlayer.alerts.index.templates_digest",
+        lambda *a: pytest.fail("hashed template contents"),
+    )
+
+    assert load_index(templates_dir) is not None
+
+
+def test_installed_index_still_checks_sizes(templates_dir, monkeypatch):
+    monkeypatch.setattr("nthlayer.alerts.index._is_installed", lambda path: True)
+    (templates_dir / "databases" / "empty.yaml").write_text(TEMPLATE)
+
+    assert load_index(templates_dir) is None
+
+
+def test_directory_without_index_parses_yaml(templates_dir):
+    (templates_dir / INDEX_FILE).unlink()
+
+    loader = AlertTemplateLoader(templates_dir)
+
+    assert loader.index is None
+    assert [alert.name for alert in loader.load_technology("cache")] == ["CacheDown"]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"not a pickle",
+        pickle.dumps({"format": 0}),
+        pickle.dumps(["rules"]),
+        pickle.dumps(shutil.copyfile),
+    ],
+    ids=["corrupt", "old-format", "wrong-shape", "global"],
+)
+def test_unusable_index_is_ignored(templates_dir, payload):
+    (templates_dir / INDEX_FILE).write_bytes(payload)
+
+    assert load_index(templates_dir) is None
+    assert AlertTemplateLoader(templates_dir).load_technology("cache")
+
+
+def test_index_seeds_output_labels(templates_dir, monkeypatch):
+    AlertTemplateLoader(templates_dir)
+    monkeypatch.setattr(
+        "nthlayer.alerts.validator.extract_promql_output_labels",
+        lambda expr: pytest.fail("recomputed output labels"),
+    )
+
+    assert output_labels("sum by (instance) (cache_up) == 0") == {"instance"}
+
+
+def test_output_labels_computes_unknown_expressions():
+    expr = "max by (pod, namespace) (kube_pod_status_ready)"
+    assert output_labels(expr) == extract_promql_output_labels(expr)
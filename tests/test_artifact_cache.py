@@ -0,0 +1,83 @@
+"""Tests for the generated-artifact fingerprint cache."""
+
+import json
+
+from nthlayer.generators.artifact_cache import (
+    CACHE_FORMAT_VERSION,
+    ArtifactCache,
+    fingerprint,
+)
+
+
+def _write(path, text="content"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+class TestFingerprint:
+    """Tests for fingerprint."""
+
+    def test_ignores_key_order(self):
+        assert fingerprint({"a": 1, "b": [1, 2]}) == fingerprint({"b": [1, 2], "a": 1})
+
+    def test_changes_with_values(self):
+        assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+
+class TestArtifactCache:
+    """Tests for ArtifactCache."""
+
+    def test_hit_after_record_and_reload(self, tmp_path):
+        output = _write(tmp_path / "alerts.yaml")
+        cache = ArtifactCache(tmp_path)
+        cache.record("alerts", "key", 12, [output])
+        cache.save()
+
+        entry = ArtifactCache(tmp_path).lookup("alerts", "key")
+
+        assert entry is not None
+        assert entry.count == 12
+        assert entry.outputs == {"alerts.yaml": entry.outputs["alerts.yaml"]}
+        assert (tmp_path / ".nthlayer" / "cache.json").is_file()
+
+    def test_miss_on_other_fingerprint(self, tmp_path):
+        cache = ArtifactCache(tmp_path)
+        cache.record("alerts", "key", 1, [_write(tmp_path / "alerts.yaml")])
+
+        assert cache.lookup("alerts", "other") is None
+        assert cache.lookup("slos", "key") is None
+
+    def test_miss_when_output_edited_or_deleted(self, tmp_path):
+        alerts = _write(tmp_path / "alerts.yaml")
+        rules = _write(tmp_path / "recording-rules.yaml")
+        cache = ArtifactCache(tmp_path)
+        cache.record("alerts", "key", 1, [alerts])
+        cache.record("recording-rules", "key", 1, [rules])
+
+        alerts.write_text("edited")
+        rules.unlink()
+
+        assert cache.lookup("alerts", "key") is None
+        assert cache.lookup("recording-rules", "key") is None
+
+    def test_missing_output_not_recorded(self, tmp_path):
+        cache = ArtifactCache(tmp_path)
+        cache.record("alerts", "key", 1, [_write(tmp_path / "alerts.yaml")])
+
+        cache.record("alerts", "new", 1, [tmp_path / "missing.yaml"])
+
+        assert cache.lookup("alerts", "key") is None
+        assert cache.lookup("alerts", "new") is None
+
+    def test_unreadable_or_old_cache_is_empty(self, tmp_path):
+        cache_file = _write(tmp_path / ".nthlayer" / "cache.json", "{not json")
+        assert ArtifactCache(tmp_path).lookup("alerts", "key") is None
+
+        cache_file.write_text(json.dumps({"version": CACHE_FORMAT_VERSION + 1}))
+        assert ArtifactCache(tmp_path).lookup("alerts", "key") is None
+
+    def test_save_skipped_when_unchanged(self, tmp_path):
+        ArtifactCache(tmp_path).save()
+
+        assert not (tmp_path / ".nthlayer").exists()
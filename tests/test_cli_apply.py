@@ -254,6 +254,15 @@ class TestPrintApplySummary:
         captured = capsys.readouterr()
         assert "dashboard.json" in captured.out or "Generated files" in captured.out
 
+    def test_up_to_date_resources(self, successful_apply_result, capsys):
+        """Test cached resource types are reported as up to date."""
+        successful_apply_result.up_to_date = ["alerts"]
+
+        print_apply_summary(successful_apply_result)
+
+        captured = capsys.readouterr()
+        assert "up to date" in captured.out
+
 
 class TestPrintApplyJson:
     """Tests for print_apply_json function."""
@@ -284,6 +293,7 @@ class TestPrintApplyJson:
             "output_dir",
             "errors",
             "success",
+            "up_to_date",
         ]
         for field in expected_fields:
             assert field in output
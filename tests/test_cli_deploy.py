@@ -207,6 +207,180 @@ class TestCollectSLOMetrics:
         assert results[0].burned_minutes is not None
         assert results[0].percent_consumed > 100  # Budget exhausted
 
+    @pytest.mark.asyncio
+    async def test_collect_preserves_order_with_concurrency(self):
+        """Test that concurrent collection returns results in SLO order."""
+        import asyncio
+
+        delays = {"q-slow": 0.05, "q-medium": 0.02, "q-fast": 0.0}
+
+        async def get_sli_value(query, time=None, missing=0.0):
+            await asyncio.sleep(delays[query])
+            return 0.9995
+
+        mock_provider_instance = MagicMock()
+        mock_provider_instance.get_sli_value = AsyncMock(side_effect=get_sli_value)
+
+        slo_resources = []
+        for name in ("slow", "medium", "fast"):
+            mock_slo = MagicMock()
+            mock_slo.name = name
+            mock_slo.spec = {"objective": 99.9, "indicator": {"query": f"q-{name}"}}
+            slo_resources.append(mock_slo)
+
+        with patch(
+            "nthlayer.slos.collector.PrometheusProvider",
+            return_value=mock_provider_instance,
+        ):
+            collector = SLOMetricCollector("http://prometheus:9090", concurrency=3, batch_size=1)
+            results = await collector.collect(slo_resources, "test-service")
+
+        assert [r.name for r in results] == ["slow", "medium", "fast"]
+        assert all(r.status == "HEALTHY" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_collect_bounds_concurrency(self):
+        """Test that no more than `concurrency` queries run at once."""
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def get_sli_value(query, time=None, missing=0.0):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return 0.9995
+
+        mock_provider_instance = MagicMock()
+        mock_provider_instance.get_sli_value = AsyncMock(side_effect=get_sli_value)
+
+        slo_resources = []
+        for i in range(6):
+            mock_slo = MagicMock()
+            mock_slo.name = f"slo-{i}"
+            mock_slo.spec = {"objective": 99.9, "indicator": {"query": f"q-{i}"}}
+            slo_resources.append(mock_slo)
+
+        with patch(
+            "nthlayer.slos.collector.PrometheusProvider",
+            return_value=mock_provider_instance,
+        ):
+            collector = SLOMetricCollector("http://prometheus:9090", concurrency=2, batch_size=1)
+            results = await collector.collect(slo_resources, "test-service")
+
+        assert len(results) == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_collect_slow_query_times_out(self):
+        """Test that a slow SLO is reported as ERROR without stalling the rest."""
+        import asyncio
+
+        async def get_sli_value(query, time=None, missing=0.0):
+            if query == "q-slow":
+                await asyncio.sleep(5)
+            return 0.9995
+
+        mock_provider_instance = MagicMock()
+        mock_provider_instance.get_sli_value = AsyncMock(side_effect=get_sli_value)
+
+        slo_resources = []
+        for name in ("slow", "fast"):
+            mock_slo = MagicMock()
+            mock_slo.name = name
+            mock_slo.spec = {"objective": 99.9, "indicator": {"query": f"q-{name}"}}
+            slo_resources.append(mock_slo)
+
+        with patch(
+            "nthlayer.slos.collector.PrometheusProvider",
+            return_value=mock_provider_instance,
+        ):
+            collector = SLOMetricCollector(
+                "http://prometheus:9090", query_timeout=0.05, batch_size=1
+            )
+            results = await collector.collect(slo_resources, "test-service")
+
+        assert results[0].status == "ERROR"
+        assert "timed out" in results[0].error
+        assert results[1].status == "HEALTHY"
+
+    @pytest.mark.asyncio
+    async def test_collect_batches_queries(self):
+        """Test that SLI queries are merged into a single request."""
+        mock_provider_instance = MagicMock()
+        mock_provider_instance.query = AsyncMock(
+            return_value={
+                "status": "success",
+                "data": {
+                    "resultType": "vector",
+                    "result": [
+                        {"metric": {"nthlayer_slo": "1"}, "value": [0, "0.995"]},
+                        {"metric": {"nthlayer_slo": "0"}, "value": [0, "0.9999"]},
+                    ],
+                },
+            }
+        )
+        mock_provider_instance.get_sli_value = AsyncMock()
+
+        slo_resources = []
+        for name in ("availability", "errors", "no-query"):
+            mock_slo = MagicMock()
+            mock_slo.name = name
+            indicator = {"query": f"{name}_ratio"} if name != "no-query" else {}
+            mock_slo.spec = {"objective": 99.9, "indicator": indicator}
+            slo_resources.append(mock_slo)
+
+        with patch(
+            "nthlayer.slos.collector.PrometheusProvider",
+            return_value=mock_provider_instance,
+        ):
+            collector = SLOMetricCollector("http://prometheus:9090")
+            results = await collector.collect(slo_resources, "test-service")
+
+        mock_provider_instance.query.assert_called_once()
+        mock_provider_instance.get_sli_value.assert_not_called()
+        assert [r.name for r in results] == ["availability", "errors", "no-query"]
+        assert results[0].current_sli == pytest.approx(99.99)
+        assert results[1].current_sli == pytest.approx(99.5)
+        assert results[2].status == "NO_DATA"
+
+
+class TestCollectorSettings:
+    """Test concurrency and timeout configuration."""
+
+    def test_defaults(self, monkeypatch):
+        monkeypatch.delenv("NTHLAYER_QUERY_CONCURRENCY", raising=False)
+        monkeypatch.delenv("NTHLAYER_QUERY_TIMEOUT", raising=False)
+        monkeypatch.delenv("NTHLAYER_QUERY_BATCH_SIZE", raising=False)
+        collector = SLOMetricCollector()
+        assert collector.concurrency == 8
+        assert collector.query_timeout == 30.0
+        assert collector.batch_size == 20
+
+    def test_env_vars(self, monkeypatch):
+        monkeypatch.setenv("NTHLAYER_QUERY_CONCURRENCY", "16")
+        monkeypatch.setenv("NTHLAYER_QUERY_TIMEOUT", "2.5")
+        monkeypatch.setenv("NTHLAYER_QUERY_BATCH_SIZE", "1")
+        collector = SLOMetricCollector()
+        assert collector.concurrency == 16
+        assert collector.query_timeout == 2.5
+        assert collector.batch_size == 1
+
+    def test_explicit_overrides_env(self, monkeypatch):
+        monkeypatch.setenv("NTHLAYER_QUERY_CONCURRENCY", "16")
+        collector = SLOMetricCollector(concurrency=4)
+        assert collector.concurrency == 4
+
+    def test_invalid_env_falls_back(self, monkeypatch):
+        monkeypatch.setenv("NTHLAYER_QUERY_CONCURRENCY", "lots")
+        monkeypatch.setenv("NTHLAYER_QUERY_TIMEOUT", "-1")
+        collector = SLOMetricCollector()
+        assert collector.concurrency == 8
+        assert collector.query_timeout == 30.0
+
 
 class TestIntegration:
     """Integration tests for deployment gate with mock Prometheus."""
@@ -6,11 +6,12 @@ output formats, and exit codes.
 
 import argparse
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from nthlayer.cli.portfolio import (
     _calculate_exit_code,
+    _collect_drift_data,
     _print_csv,
     _print_markdown,
     _print_service_attention,
@@ -20,13 +21,16 @@ from nthlayer.cli.portfolio import (
     portfolio_command,
     register_portfolio_parser,
 )
-from nthlayer.portfolio import HealthStatus, PortfolioHealth, ServiceHealth
+from nthlayer.portfolio import HealthStatus, LiveQueryStats, PortfolioHealth, ServiceHealth
+
+NO_LIVE_OPTIONS = {"concurrency": None, "query_timeout": None, "rate_limit": None, "deadline": None}
 
 
 @pytest.fixture
 def healthy_portfolio():
     """Create a healthy portfolio with all services meeting SLOs."""
     portfolio = MagicMock(spec=PortfolioHealth)
+    portfolio.live_queries = None
     portfolio.services = []
     portfolio.services_with_slos = 3
     portfolio.healthy_services = 3
@@ -58,6 +62,7 @@ def warning_portfolio():
     svc.slos = []
 
     portfolio = MagicMock(spec=PortfolioHealth)
+    portfolio.live_queries = None
     portfolio.services = [svc]
     portfolio.services_with_slos = 3
     portfolio.healthy_services = 2
@@ -82,6 +87,7 @@ def critical_portfolio():
     svc.slos = []
 
     portfolio = MagicMock(spec=PortfolioHealth)
+    portfolio.live_queries = None
     portfolio.services = [svc]
     portfolio.services_with_slos = 3
     portfolio.healthy_services = 1
@@ -106,6 +112,7 @@ def exhausted_portfolio():
     svc.slos = []
 
     portfolio = MagicMock(spec=PortfolioHealth)
+    portfolio.live_queries = None
     portfolio.services = [svc]
     portfolio.services_with_slos = 3
     portfolio.healthy_services = 0
@@ -207,7 +214,9 @@ class TestPortfolioCommand:
 
         portfolio_command(search_paths=["/path/to/services"])
 
-        mock_collect.assert_called_once_with(["/path/to/services"], prometheus_url=None)
+        mock_collect.assert_called_once_with(
+            ["/path/to/services"], prometheus_url=None, jobs=None, ignore=None, **NO_LIVE_OPTIONS
+        )
 
     @patch("nthlayer.cli.portfolio.collect_portfolio")
     def test_uses_prometheus_url(self, mock_collect, healthy_portfolio):
@@ -216,7 +225,9 @@ class TestPortfolioCommand:
 
         portfolio_command(prometheus_url="http://prometheus:9090")
 
-        mock_collect.assert_called_once_with(None, prometheus_url="http://prometheus:9090")
+        mock_collect.assert_called_once_with(
+            None, prometheus_url="http://prometheus:9090", jobs=None, ignore=None, **NO_LIVE_OPTIONS
+        )
 
     @patch.dict("os.environ", {"NTHLAYER_PROMETHEUS_URL": "http://env-prom:9090"})
     @patch("nthlayer.cli.portfolio.collect_portfolio")
@@ -226,7 +237,9 @@ class TestPortfolioCommand:
 
         portfolio_command()
 
-        mock_collect.assert_called_once_with(None, prometheus_url="http://env-prom:9090")
+        mock_collect.assert_called_once_with(
+            None, prometheus_url="http://env-prom:9090", jobs=None, ignore=None, **NO_LIVE_OPTIONS
+        )
 
 
 class TestCalculateExitCode:
@@ -261,12 +274,55 @@ class TestCalculateExitCode:
         critical_svc.overall_status = HealthStatus.CRITICAL
 
         portfolio = MagicMock(spec=PortfolioHealth)
+        portfolio.live_queries = None
         portfolio.services = [warning_svc, critical_svc]
 
         result = _calculate_exit_code(portfolio)
         assert result == 2  # Critical takes precedence
 
 
+class TestCollectDriftData:
+    """Tests for _collect_drift_data function."""
+
+    @staticmethod
+    def _service(name, tier, slos=True):
+        svc = MagicMock()
+        svc.service = name
+        svc.tier = tier
+        svc.slos = [MagicMock()] if slos else []
+        return svc
+
+    def test_analyzes_eligible_services_in_one_batch(self):
+        portfolio = MagicMock(spec=PortfolioHealth)
+        portfolio.live_queries = None
+        portfolio.services = [
+            self._service("checkout", "critical"),
+            self._service("search", None),
+            self._service("batch", "low"),  # drift is opt-in for low tier
+            self._service("docs", "standard", slos=False),
+        ]
+        analyze_many = AsyncMock(return_value={"checkout": MagicMock()})
+
+        with patch("nthlayer.cli.portfolio.DriftAnalyzer.analyze_many", analyze_many):
+            results = _collect_drift_data(portfolio, "http://prom:9090")
+
+        analyze_many.assert_awaited_once_with(
+            {"checkout": "critical", "search": "standard"}, slo="availability"
+        )
+        assert list(results) == ["checkout"]
+
+    def test_query_failure_returns_no_drift(self):
+        portfolio = MagicMock(spec=PortfolioHealth)
+        portfolio.live_queries = None
+        portfolio.services = [self._service("checkout", "critical")]
+
+        with patch(
+            "nthlayer.cli.portfolio.DriftAnalyzer.analyze_many",
+            AsyncMock(side_effect=RuntimeError("down")),
+        ):
+            assert _collect_drift_data(portfolio, "http://prom:9090") == {}
+
+
 class TestProgressBar:
     """Tests for _progress_bar function."""
 
@@ -308,9 +364,22 @@ class TestPrintTable:
         captured = capsys.readouterr()
         assert "100%" in captured.out or "Health" in captured.out
 
+    def test_prints_live_query_summary(self, healthy_portfolio, capsys):
+        """Test that live query counters are summarized."""
+        healthy_portfolio.live_queries = LiveQueryStats(
+            queries=6, requests=2, succeeded=4, failed=1, deadline_exceeded=1, duration_seconds=1.5
+        )
+
+        _print_table(healthy_portfolio)
+
+        captured = capsys.readouterr()
+        assert "4/6 queries in 1.5s (2 requests)" in captured.out
+        assert "1 failed, 1 past deadline" in captured.out
+
     def test_no_slos_message(self, capsys):
         """Test message when no SLOs defined."""
         portfolio = MagicMock(spec=PortfolioHealth)
+        portfolio.live_queries = None
         portfolio.services_with_slos = 0
         portfolio.by_tier = []
         portfolio.services_needing_attention = []
@@ -333,6 +402,7 @@ class TestPrintTable:
         tier.total_services = 2
 
         portfolio = MagicMock(spec=PortfolioHealth)
+        portfolio.live_queries = None
         portfolio.services_with_slos = 2
         portfolio.org_health_percent = 100.0
         portfolio.healthy_services = 2
@@ -355,6 +425,7 @@ class TestPrintTable:
         insight.message = "SLO degraded"
 
         portfolio = MagicMock(spec=PortfolioHealth)
+        portfolio.live_queries = None
         portfolio.services_with_slos = 1
         portfolio.org_health_percent = 80.0
         portfolio.healthy_services = 0
@@ -475,6 +546,7 @@ class TestPrintMarkdown:
         tier.total_services = 2
 
         portfolio = MagicMock(spec=PortfolioHealth)
+        portfolio.live_queries = None
         portfolio.services_with_slos = 2
         portfolio.org_health_percent = 100.0
         portfolio.healthy_services = 2
@@ -496,6 +568,7 @@ class TestPrintCSV:
     def test_prints_header_when_empty(self, capsys):
         """Test CSV header printed even when empty."""
         portfolio = MagicMock(spec=PortfolioHealth)
+        portfolio.live_queries = None
         portfolio.to_csv_rows.return_value = []
 
         _print_csv(portfolio)
@@ -559,6 +632,7 @@ class TestPrintTableAdditionalCoverage:
     def test_health_color_red_when_below_80(self, capsys):
         """Test health color is red when below 80%."""
         portfolio = MagicMock(spec=PortfolioHealth)
+        portfolio.live_queries = None
         portfolio.services_with_slos = 5
         portfolio.org_health_percent = 50.0  # Below 80% = red
         portfolio.healthy_services = 2
@@ -594,6 +668,7 @@ class TestPrintTableAdditionalCoverage:
         exhausted_svc.slos = []
 
         portfolio = MagicMock(spec=PortfolioHealth)
+        portfolio.live_queries = None
         portfolio.services_with_slos = 3
         portfolio.org_health_percent = 50.0
         portfolio.healthy_services = 0
@@ -620,6 +695,7 @@ class TestPrintTableAdditionalCoverage:
         insight.message = "Error budget exhausted"
 
         portfolio = MagicMock(spec=PortfolioHealth)
+        portfolio.live_queries = None
         portfolio.services_with_slos = 1
         portfolio.org_health_percent = 80.0
         portfolio.healthy_services = 0
@@ -643,6 +719,7 @@ class TestPrintTableAdditionalCoverage:
         insight.message = "Service has no SLOs defined"
 
         portfolio = MagicMock(spec=PortfolioHealth)
+        portfolio.live_queries = None
         portfolio.services_with_slos = 0
         portfolio.org_health_percent = 0.0
         portfolio.healthy_services = 0
@@ -669,6 +746,7 @@ class TestPrintTableAdditionalCoverage:
             insights.append(insight)
 
         portfolio = MagicMock(spec=PortfolioHealth)
+        portfolio.live_queries = None
         portfolio.services_with_slos = 15
         portfolio.org_health_percent = 50.0
         portfolio.healthy_services = 0
@@ -707,6 +785,7 @@ class TestPrintMarkdownAdditionalCoverage:
         svc.slos = [slo]
 
         portfolio = MagicMock(spec=PortfolioHealth)
+        portfolio.live_queries = None
         portfolio.services_with_slos = 1
         portfolio.org_health_percent = 80.0
         portfolio.healthy_services = 0
@@ -741,6 +820,7 @@ class TestPrintMarkdownAdditionalCoverage:
         svc.slos = [slo]
 
         portfolio = MagicMock(spec=PortfolioHealth)
+        portfolio.live_queries = None
         portfolio.services_with_slos = 1
         portfolio.org_health_percent = 50.0
         portfolio.healthy_services = 0
@@ -775,6 +855,7 @@ class TestPrintMarkdownAdditionalCoverage:
         info_insight.message = "No SLOs defined"
 
         portfolio = MagicMock(spec=PortfolioHealth)
+        portfolio.live_queries = None
         portfolio.services_with_slos = 3
         portfolio.org_health_percent = 60.0
         portfolio.healthy_services = 0
@@ -809,6 +890,10 @@ class TestHandlePortfolioCommand:
             search_paths=["/path"],
             prometheus_url="http://prom:9090",
             include_drift=True,
+            jobs=4,
+            ignore=["generated"],
+            rate_limit=5.0,
+            deadline=30.0,
         )
 
         result = handle_portfolio_command(args)
@@ -818,6 +903,12 @@ class TestHandlePortfolioCommand:
             format="json",
             search_paths=["/path"],
             prometheus_url="http://prom:9090",
+            jobs=4,
+            ignore=["generated"],
+            concurrency=None,
+            query_timeout=None,
+            rate_limit=5.0,
+            deadline=30.0,
             include_drift=True,
         )
 
@@ -835,5 +926,8 @@ class TestHandlePortfolioCommand:
             format="table",
             search_paths=None,
             prometheus_url=None,
+            jobs=None,
+            ignore=None,
+            **NO_LIVE_OPTIONS,
             include_drift=False,
         )
@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+from nthlayer.core.timeseries import TimeSeries
 from nthlayer.providers.prometheus import PrometheusProvider
 from nthlayer.slos.collector import SLOCollector
 from nthlayer.slos.models import SLO, TimeWindow, TimeWindowType
@@ -32,7 +33,7 @@ def sample_slo():
 def mock_prometheus():
     """Create a mock Prometheus provider."""
     provider = Mock(spec=PrometheusProvider)
-    provider.get_sli_time_series = AsyncMock()
+    provider.get_sli_series = AsyncMock()
     return provider
 
 
@@ -42,9 +43,41 @@ def mock_repository():
     repo = Mock(spec=SLORepository)
     repo.create_or_update_error_budget = AsyncMock()
     repo.get_slos_by_service = AsyncMock()
+    repo.get_current_error_budget = AsyncMock(return_value=None)
+    repo.get_burn_buckets = AsyncMock(return_value=[])
+    repo.save_rollups = AsyncMock()
     return repo
 
 
+class FakeBudgetStore:
+    """In-memory stand-in for the error budget and burn bucket tables."""
+
+    def __init__(self):
+        self.budget = None
+        self.rollups = {"5m": {}, "1h": {}, "1d": {}}
+        self.buckets = self.rollups["1h"]
+
+    async def get_current_error_budget(self, slo_id):
+        return self.budget
+
+    async def create_or_update_error_budget(self, budget):
+        self.budget = budget
+
+    async def get_burn_buckets(self, slo_id, since):
+        return [b for b in self.buckets.values() if b.start + timedelta(hours=1) > since]
+
+    async def save_rollups(self, slo, rollups, *, period_start, period_end, replace=False):
+        for resolution, buckets in rollups.items():
+            stored = self.rollups[resolution]
+            for bucket in buckets:
+                existing = stored.get(bucket.start)
+                stored[bucket.start] = (
+                    existing.merge(bucket) if existing and not replace else bucket
+                )
+        for start in [s for s in self.buckets if s + timedelta(hours=1) <= period_start]:
+            del self.buckets[start]
+
+
 class TestSLOCollector:
     """Test SLO collector."""
 
@@ -65,7 +98,7 @@ class TestSLOCollector:
                 }
             )
 
-        mock_prometheus.get_sli_time_series.return_value = measurements
+        mock_prometheus.get_sli_series.return_value = TimeSeries.from_records(measurements)
 
         # Create collector and collect
         collector = SLOCollector(mock_prometheus, mock_repository)
@@ -80,7 +113,7 @@ class TestSLOCollector:
         assert budget.status.value == "healthy"
 
         # Verify Prometheus was called
-        mock_prometheus.get_sli_time_series.assert_called_once()
+        mock_prometheus.get_sli_series.assert_called_once()
 
         # Verify budget was stored
         mock_repository.create_or_update_error_budget.assert_called_once()
@@ -111,7 +144,7 @@ class TestSLOCollector:
                 }
             )
 
-        mock_prometheus.get_sli_time_series.return_value = measurements
+        mock_prometheus.get_sli_series.return_value = TimeSeries.from_records(measurements)
 
         # Create collector and collect
         collector = SLOCollector(mock_prometheus, mock_repository)
@@ -126,7 +159,7 @@ class TestSLOCollector:
     async def test_collect_with_no_measurements(self, sample_slo, mock_prometheus, mock_repository):
         """Test collection when no measurements are available."""
         # Mock Prometheus to return empty list
-        mock_prometheus.get_sli_time_series.return_value = []
+        mock_prometheus.get_sli_series.return_value = TimeSeries.empty()
 
         # Create collector and collect
         collector = SLOCollector(mock_prometheus, mock_repository)
@@ -173,7 +206,7 @@ class TestSLOCollector:
             }
             for i in range(24)
         ]
-        mock_prometheus.get_sli_time_series.return_value = measurements
+        mock_prometheus.get_sli_series.return_value = TimeSeries.from_records(measurements)
 
         # Create collector and collect
         collector = SLOCollector(mock_prometheus, mock_repository)
@@ -208,7 +241,7 @@ class TestSLOCollector:
             }
             for i in range(7 * 24)
         ]
-        mock_prometheus.get_sli_time_series.return_value = measurements
+        mock_prometheus.get_sli_series.return_value = TimeSeries.from_records(measurements)
 
         # Create collector and collect with custom range
         collector = SLOCollector(mock_prometheus, mock_repository)
@@ -219,7 +252,7 @@ class TestSLOCollector:
         )
 
         # Verify time range was passed to Prometheus
-        call_args = mock_prometheus.get_sli_time_series.call_args
+        call_args = mock_prometheus.get_sli_series.call_args
         assert call_args.kwargs["start"] == period_start
         assert call_args.kwargs["end"] == period_end
 
@@ -228,6 +261,172 @@ class TestSLOCollector:
         assert budget.period_end == period_end
 
 
+class TestIncrementalCollection:
+    """Test watermark-based incremental budget collection."""
+
+    @staticmethod
+    def _series(start, count, sli_value):
+        return TimeSeries.from_records(
+            {"timestamp": start + timedelta(minutes=5 * i), "sli_value": sli_value}
+            for i in range(count)
+        )
+
+    @pytest.mark.asyncio
+    async def test_second_run_fetches_only_new_samples(self, sample_slo, mock_prometheus):
+        store = FakeBudgetStore()
+        collector = SLOCollector(mock_prometheus, store)
+        first_end = datetime(2026, 1, 31, 12, 0)
+        window_start = first_end - timedelta(days=30)
+
+        # 0.999 SLI for the last 12 samples of the first run: 12 * 5m * 0.001 burned
+        mock_prometheus.get_sli_series.return_value = self._series(
+            first_end - timedelta(minutes=55), 12, 0.999
+        )
+        first = await collector.collect_slo_budget(sample_slo, period_end=first_end)
+
+        assert mock_prometheus.get_sli_series.call_args.kwargs["start"] == window_start
+        assert first.evaluated_through == first_end
+        assert first.burned_minutes == pytest.approx(0.06)
+
+        second_end = first_end + timedelta(minutes=30)
+        mock_prometheus.get_sli_series.return_value = self._series(
+            first_end + timedelta(minutes=5), 6, 0.999
+        )
+        second = await collector.collect_slo_budget(sample_slo, period_end=second_end)
+
+        call = mock_prometheus.get_sli_series.call_args.kwargs
+        assert call["start"] == first_end + timedelta(minutes=5)
+        assert call["end"] == second_end
+        assert second.evaluated_through == second_end
+        assert second.burned_minutes == pytest.approx(0.09)
+
+    @pytest.mark.asyncio
+    async def test_overlapping_samples_not_counted_twice(self, sample_slo, mock_prometheus):
+        store = FakeBudgetStore()
+        collector = SLOCollector(mock_prometheus, store)
+        end = datetime(2026, 1, 31, 12, 0)
+
+        mock_prometheus.get_sli_series.return_value = self._series(
+            end - timedelta(minutes=55), 12, 0.9
+        )
+        first = await collector.collect_slo_budget(sample_slo, period_end=end)
+        # Prometheus returns the boundary sample again alongside one new sample
+        mock_prometheus.get_sli_series.return_value = self._series(end, 2, 0.9)
+        second = await collector.collect_slo_budget(
+            sample_slo, period_end=end + timedelta(minutes=5)
+        )
+
+        assert second.burned_minutes == pytest.approx(first.burned_minutes + 0.5)
+        assert second.evaluated_through == end + timedelta(minutes=5)
+
+    @pytest.mark.asyncio
+    async def test_no_query_within_one_step(self, sample_slo, mock_prometheus):
+        store = FakeBudgetStore()
+        collector = SLOCollector(mock_prometheus, store)
+        end = datetime(2026, 1, 31, 12, 0)
+        mock_prometheus.get_sli_series.return_value = self._series(
+            end - timedelta(minutes=55), 12, 0.9
+        )
+        first = await collector.collect_slo_budget(sample_slo, period_end=end)
+
+        second = await collector.collect_slo_budget(
+            sample_slo, period_end=end + timedelta(minutes=1)
+        )
+
+        assert mock_prometheus.get_sli_series.call_count == 1
+        assert second.burned_minutes == pytest.approx(first.burned_minutes)
+        assert second.evaluated_through == end
+
+    @pytest.mark.asyncio
+    async def test_buckets_age_out_of_window(self, sample_slo, mock_prometheus):
+        store = FakeBudgetStore()
+        collector = SLOCollector(mock_prometheus, store)
+        end = datetime(2026, 1, 31, 12, 0)
+
+        mock_prometheus.get_sli_series.return_value = self._series(
+            end - timedelta(minutes=55), 12, 0.9
+        )
+        await collector.collect_slo_budget(sample_slo, period_end=end)
+
+        # 30 days and two hours later the burned hour has left the window
+        later = end + timedelta(days=30, hours=2)
+        store.budget.evaluated_through = later - timedelta(minutes=5)
+        mock_prometheus.get_sli_series.return_value = self._series(later, 1, 1.0)
+        budget = await collector.collect_slo_budget(sample_slo, period_end=later)
+
+        assert budget.burned_minutes == 0.0
+        assert all(start > end - timedelta(days=1) for start in store.buckets)
+
+    @pytest.mark.asyncio
+    async def test_stale_watermark_refetches_window(self, sample_slo, mock_prometheus):
+        store = FakeBudgetStore()
+        collector = SLOCollector(mock_prometheus, store)
+        end = datetime(2026, 1, 31, 12, 0)
+        mock_prometheus.get_sli_series.return_value = TimeSeries.empty()
+        store.budget = Mock(evaluated_through=end - timedelta(days=60))
+
+        await collector.collect_slo_budget(sample_slo, period_end=end)
+
+        call = mock_prometheus.get_sli_series.call_args.kwargs
+        assert call["start"] == end - timedelta(days=30)
+
+
+class TestMeasurementHistory:
+    """Test downsampled SLI history written during collection."""
+
+    @pytest.mark.asyncio
+    async def test_rollups_written_for_each_resolution(
+        self, sample_slo, mock_prometheus, mock_repository
+    ):
+        end = datetime(2026, 1, 31, 12, 0)
+        mock_prometheus.get_sli_series.return_value = TimeSeries.from_records(
+            {"timestamp": end - timedelta(minutes=5 * i), "sli_value": 0.999} for i in range(24)
+        )
+
+        collector = SLOCollector(mock_prometheus, mock_repository)
+        await collector.collect_slo_budget(sample_slo, period_end=end)
+
+        mock_repository.save_rollups.assert_called_once()
+        _, rollups = mock_repository.save_rollups.call_args.args
+        assert set(rollups) == {"5m", "1h", "1d"}
+        assert len(rollups["5m"]) == 24
+        assert len(rollups["1h"]) == 3
+        assert rollups["1d"][0].total_count == 24
+        assert rollups["1d"][0].good_count == 0
+        # First run has no watermark, so stored rows are replaced
+        assert mock_repository.save_rollups.call_args.kwargs["replace"] is True
+
+    @pytest.mark.asyncio
+    async def test_incremental_runs_merge_daily_rollup(self, sample_slo, mock_prometheus):
+        store = FakeBudgetStore()
+        collector = SLOCollector(mock_prometheus, store)
+        end = datetime(2026, 1, 31, 12, 0)
+
+        mock_prometheus.get_sli_series.return_value = TestIncrementalCollection._series(
+            end - timedelta(minutes=55), 12, 1.0
+        )
+        await collector.collect_slo_budget(sample_slo, period_end=end)
+        mock_prometheus.get_sli_series.return_value = TestIncrementalCollection._series(
+            end + timedelta(minutes=5), 6, 0.99
+        )
+        await collector.collect_slo_budget(sample_slo, period_end=end + timedelta(minutes=30))
+
+        (daily,) = store.rollups["1d"].values()
+        assert daily.total_count == 18
+        assert daily.good_count == 12
+        assert daily.min_value == pytest.approx(0.99)
+        assert daily.max_value == 1.0
+
+    @pytest.mark.asyncio
+    async def test_no_samples_writes_nothing(self, sample_slo, mock_prometheus, mock_repository):
+        mock_prometheus.get_sli_series.return_value = TimeSeries.empty()
+
+        collector = SLOCollector(mock_prometheus, mock_repository)
+        await collector.collect_slo_budget(sample_slo)
+
+        mock_repository.save_rollups.assert_not_called()
+
+
 class TestPrometheusIntegration:
     """Test Prometheus provider integration (without network calls)."""
 
@@ -5,12 +5,16 @@ demo walkthroughs, and command dispatch.
 """
 
 import argparse
+import re
+import subprocess
+import sys
 from importlib.metadata import version as get_version
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from nthlayer.alerts.models import AlertRule
 from nthlayer.demo import (
+    SUBCOMMANDS,
     _default_org_id,
     _format_change,
     _plan_and_apply,
@@ -577,6 +581,26 @@ class TestBuildParser:
         parser = build_parser()
         assert isinstance(parser, argparse.ArgumentParser)
 
+    def test_lazy_parser_lists_every_subcommand(self):
+        """Unloaded subcommands are still listed with the help of their real parser."""
+
+        def help_by_command(parser):
+            action = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+            return {choice.dest: choice.help for choice in action._choices_actions}
+
+        full = help_by_command(build_parser())
+        lazy = help_by_command(build_parser(commands=[]))
+
+        assert lazy == full
+        assert {command.name for command in SUBCOMMANDS} <= set(lazy)
+
+    def test_lazy_parser_loads_requested_subcommand(self):
+        """The dispatched subcommand gets its full parser."""
+        parser = build_parser(commands=["drift"])
+        args = parser.parse_args(["drift", "service.yaml", "--window", "7d"])
+        assert args.command == "drift"
+        assert args.window == "7d"
+
     def test_has_version_flag(self):
         """Parser has --version flag."""
         parser = build_parser()
@@ -931,7 +955,7 @@ teams:
         """slo command dispatches to handler."""
         monkeypatch.chdir(tmp_path)
 
-        with patch("nthlayer.demo.handle_slo_command", return_value=0) as mock:
+        with patch("nthlayer.cli.slo.handle_slo_command", return_value=0) as mock:
             with pytest.raises(SystemExit) as exc_info:
                 main(["slo", "list"])
 
@@ -942,7 +966,7 @@ teams:
         """portfolio command dispatches to handler."""
         monkeypatch.chdir(tmp_path)
 
-        with patch("nthlayer.demo.handle_portfolio_command", return_value=0) as mock:
+        with patch("nthlayer.cli.portfolio.handle_portfolio_command", return_value=0) as mock:
             with pytest.raises(SystemExit) as exc_info:
                 main(["portfolio"])
 
@@ -951,7 +975,7 @@ teams:
 
     def test_setup_command_dispatch(self):
         """setup command dispatches to handler."""
-        with patch("nthlayer.demo.handle_setup_command", return_value=0) as mock:
+        with patch("nthlayer.cli.setup.handle_setup_command", return_value=0) as mock:
             with pytest.raises(SystemExit) as exc_info:
                 main(["setup"])
 
@@ -962,7 +986,7 @@ teams:
         """verify command dispatches to handler."""
         monkeypatch.chdir(tmp_path)
 
-        with patch("nthlayer.demo.handle_verify_command", return_value=0) as mock:
+        with patch("nthlayer.cli.verify.handle_verify_command", return_value=0) as mock:
             with pytest.raises(SystemExit) as exc_info:
                 main(["verify", "service.yaml"])
 
@@ -973,7 +997,7 @@ teams:
         """generate-loki-alerts command dispatches to handler."""
         monkeypatch.chdir(tmp_path)
 
-        with patch("nthlayer.demo.handle_loki_command", return_value=0) as mock:
+        with patch("nthlayer.cli.generate_loki.handle_loki_command", return_value=0) as mock:
             with pytest.raises(SystemExit) as exc_info:
                 main(["generate-loki-alerts", "service.yaml"])
 
@@ -984,7 +1008,9 @@ teams:
         """validate-metadata command dispatches to handler."""
         monkeypatch.chdir(tmp_path)
 
-        with patch("nthlayer.demo.handle_validate_metadata_command", return_value=0) as mock:
+        with patch(
+            "nthlayer.cli.validate_metadata.handle_validate_metadata_command", return_value=0
+        ) as mock:
             with pytest.raises(SystemExit) as exc_info:
                 main(["validate-metadata", "service.yaml"])
 
@@ -995,7 +1021,9 @@ teams:
         """validate-spec command dispatches to handler."""
         monkeypatch.chdir(tmp_path)
 
-        with patch("nthlayer.demo.handle_validate_spec_command", return_value=0) as mock:
+        with patch(
+            "nthlayer.cli.validate_spec.handle_validate_spec_command", return_value=0
+        ) as mock:
             with pytest.raises(SystemExit) as exc_info:
                 main(["validate-spec", "service.yaml"])
 
@@ -1159,3 +1187,41 @@ service:
 
         # Should fail due to no PagerDuty resource
         assert exc_info.value.code == 1
+
+
+class TestImportTime:
+    """Cold-start regression tests for the CLI entry point."""
+
+    # Generous multiple of the measured import time so slow CI runners pass
+    IMPORT_BUDGET_SECONDS = 1.0
+    HEAVY_MODULES = (
+        "numpy",
+        "scipy",
+        "sqlalchemy",
+        "nthlayer.dashboards",
+        "nthlayer.drift",
+        "nthlayer.providers.grafana",
+    )
+
+    def test_import_skips_subcommand_dependencies(self):
+        """Importing the entry point does not import subcommand modules."""
+        code = (
+            "import sys, nthlayer.demo; "
+            f"print(','.join(m for m in {self.HEAVY_MODULES!r} if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
+
+    def test_import_within_budget(self):
+        """nthlayer.demo imports within the cold-start budget."""
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import nthlayer.demo"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        match = re.search(r"\|\s*(\d+) \| nthlayer\.demo$", result.stderr, re.MULTILINE)
+        assert match is not None
+        assert int(match.group(1)) / 1_000_000 < self.IMPORT_BUDGET_SECONDS
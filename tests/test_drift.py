@@ -13,7 +13,9 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
+import numpy as np
 import pytest
+from nthlayer.core.timeseries import TimeSeries
 from nthlayer.drift import (
     DRIFT_DEFAULTS,
     DriftAnalysisError,
@@ -26,6 +28,7 @@ from nthlayer.drift import (
     PatternDetector,
     get_drift_defaults,
 )
+from nthlayer.drift.analyzer import fit_trends
 
 
 class TestDriftModels:
@@ -274,6 +277,95 @@ class TestPatternDetector:
         assert pattern == DriftPattern.STABLE
 
 
+def _series_batch(count=40, length=240, seed=7):
+    """Equal-length hourly series mixing trends, steps, noise and flat lines."""
+    rng = np.random.default_rng(seed)
+    start = int(datetime(2024, 3, 1).timestamp() * 1000)
+    timestamps = start + np.arange(length, dtype=np.int64) * 3_600_000
+    rows = []
+    for i in range(count):
+        values = 0.9 + rng.normal(0, [0.0, 0.001, 0.04][i % 3], length)
+        values += np.linspace(0, [-0.05, 0.0, 0.03, -0.2][i % 4], length)
+        if i % 5 == 0:
+            values[length // 2 :] -= 0.1 if i % 2 else -0.1
+        rows.append(values)
+    return np.tile(timestamps, (count, 1)), np.vstack(rows)
+
+
+class TestBatchFitting:
+    """Tests for the vectorized batch path (fit_trends, detect_many)."""
+
+    def test_fit_trends_matches_linregress(self):
+        timestamps, values = _series_batch()
+        analyzer = DriftAnalyzer(prometheus_url="http://localhost:9090")
+
+        slopes, intercepts, r_squared = fit_trends(timestamps, values)
+
+        for row in range(len(values)):
+            series = TimeSeries(timestamps[row], values[row])
+            expected = analyzer._calculate_trend(series)
+            assert slopes[row] == pytest.approx(expected[0], rel=1e-9, abs=1e-18)
+            assert intercepts[row] == pytest.approx(expected[1], rel=1e-9)
+            assert r_squared[row] == pytest.approx(expected[2], rel=1e-9, nan_ok=True)
+
+    def test_fit_trends_degenerate_rows(self):
+        timestamps = np.array([[0, 1000, 2000], [5, 5, 5]], dtype=np.int64)
+        values = np.array([[0.5, 0.5, 0.5], [0.1, 0.2, 0.3]])
+
+        slopes, _, r_squared = fit_trends(timestamps, values)
+
+        assert slopes[0] == 0 and np.isnan(r_squared[0])
+        assert np.isnan(slopes[1])
+
+    @pytest.mark.parametrize(
+        "threshold, seen",
+        [
+            (0.05, {DriftPattern.STEP_CHANGE_DOWN, DriftPattern.STEP_CHANGE_UP}),
+            (0.5, {DriftPattern.VOLATILE, DriftPattern.GRADUAL_DECLINE, DriftPattern.STABLE}),
+        ],
+    )
+    def test_detect_many_matches_detect(self, threshold, seen):
+        # Noisy rows have a variance around 0.0016
+        timestamps, values = _series_batch()
+        slopes, _, r_squared = fit_trends(timestamps, values)
+        detector = PatternDetector(
+            step_change_threshold=threshold, volatility_variance_threshold=0.001
+        )
+
+        patterns = detector.detect_many(timestamps, values, slopes, r_squared)
+
+        expected = [
+            detector.detect(TimeSeries(timestamps[i], values[i]), slopes[i], r_squared[i])
+            for i in range(len(values))
+        ]
+        assert patterns == expected
+        assert seen <= set(patterns)
+
+    def test_detect_seasonal_many_matches_detect_seasonal(self):
+        timestamps, values = _series_batch(count=6, length=21 * 24)
+        weekdays = np.array(
+            [datetime.fromtimestamp(ts / 1000).weekday() for ts in timestamps[0].tolist()]
+        )
+        values[::2] += np.where(weekdays >= 5, 0.2, 0.0)  # Weekend pattern on even rows
+        detector = PatternDetector()
+
+        seasonal = detector.detect_seasonal_many(timestamps, values)
+
+        expected = [
+            detector.detect_seasonal(TimeSeries(timestamps[i], values[i]))
+            for i in range(len(values))
+        ]
+        assert seasonal.tolist() == expected
+        assert seasonal[0] and not all(seasonal)
+
+    def test_detect_seasonal_many_needs_two_weeks(self):
+        timestamps, values = _series_batch(count=2, length=100)
+        assert PatternDetector().detect_seasonal_many(timestamps, values).tolist() == [
+            False,
+            False,
+        ]
+
+
 class TestDriftAnalyzer:
     """Tests for DriftAnalyzer."""
 
@@ -476,6 +568,138 @@ class TestDriftAnalyzer:
             assert "Insufficient data points" in str(exc_info.value)
 
 
+def _budget_matrix(series: dict[str, list[tuple[datetime, float]]]) -> dict:
+    """Range query response with one budget series per service."""
+    return {
+        "status": "success",
+        "data": {
+            "resultType": "matrix",
+            "result": [
+                {
+                    "metric": {"service": name, "slo": "availability"},
+                    "values": [[ts.timestamp(), str(value)] for ts, value in points],
+                }
+                for name, points in series.items()
+            ],
+        },
+    }
+
+
+class TestAnalyzeMany:
+    """Tests for DriftAnalyzer.analyze_many."""
+
+    @pytest.fixture
+    def histories(self):
+        now = datetime.now().replace(microsecond=0)
+        hours = [now - timedelta(hours=720 - i) for i in range(720)]
+        return {
+            "checkout": [(ts, 0.90 - i * 0.0002) for i, ts in enumerate(hours)],
+            "search": [(ts, 0.80) for ts in hours],
+            "sparse": [(hours[0], 0.5)],
+            "unrequested": [(ts, 0.5) for ts in hours],
+        }
+
+    @pytest.mark.asyncio
+    async def test_one_grouped_query_for_all_services(self, histories):
+        analyzer = DriftAnalyzer(prometheus_url="http://localhost:9090")
+        queries = []
+
+        async def query_range(provider, query, start, end, step="5m"):
+            queries.append(query)
+            return _budget_matrix(histories)
+
+        services = {
+            "search": "standard",
+            "checkout": "critical",
+            "sparse": "critical",
+            "gone": "standard",
+        }
+        with patch("nthlayer.providers.prometheus.PrometheusProvider.query_range", query_range):
+            results = await analyzer.analyze_many(services)
+
+        assert queries == [
+            'max by (service, slo) (slo:error_budget_remaining:ratio{slo="availability"})'
+        ]
+        assert list(results) == ["search", "checkout"]
+        assert results["checkout"].tier == "critical"
+        assert results["search"].pattern == DriftPattern.STABLE
+
+    @pytest.mark.asyncio
+    async def test_matches_per_service_analysis(self, histories):
+        analyzer = DriftAnalyzer(prometheus_url="http://localhost:9090")
+
+        async def query_range(provider, query, start, end, step="5m"):
+            return _budget_matrix(histories)
+
+        with patch("nthlayer.providers.prometheus.PrometheusProvider.query_range", query_range):
+            batch = await analyzer.analyze_many({"checkout": "critical"})
+
+        with patch.object(analyzer, "_query_budget_history") as mock_query:
+            mock_query.return_value = histories["checkout"]
+            single = await analyzer.analyze(service_name="checkout", tier="critical")
+
+        expected = single.to_dict()
+        actual = batch["checkout"].to_dict()
+        for key in ("analyzed_at", "data_start", "data_end"):
+            expected.pop(key), actual.pop(key)
+        assert actual == expected
+
+    @pytest.mark.asyncio
+    async def test_extra_labels_analyze_the_same_series(self, histories):
+        """Test both paths aggregate series that differ only in extra labels."""
+        analyzer = DriftAnalyzer(prometheus_url="http://localhost:9090")
+        staging = [(ts, 0.99) for ts, _ in histories["checkout"]]
+        raw = _budget_matrix({"checkout": staging})["data"]["result"]
+        raw += _budget_matrix({"checkout": histories["checkout"]})["data"]["result"]
+        raw[0]["metric"]["environment"] = "staging"
+        raw[1]["metric"]["environment"] = "production"
+        queries = []
+
+        async def query_range(provider, query, start, end, step="5m"):
+            # Emulate Prometheus: max by (service, slo) merges the two series
+            queries.append(query)
+            if query.startswith("max by (service, slo)"):
+                merged = [max(a, b) for a, b in zip(staging, histories["checkout"], strict=True)]
+                return _budget_matrix({"checkout": merged})
+            return {"status": "success", "data": {"resultType": "matrix", "result": raw}}
+
+        with patch("nthlayer.providers.prometheus.PrometheusProvider.query_range", query_range):
+            batch = await analyzer.analyze_many({"checkout": "critical"})
+            single = await analyzer.analyze(service_name="checkout", tier="critical")
+
+        assert queries[1] == (
+            "max by (service, slo) "
+            '(slo:error_budget_remaining:ratio{service="checkout", slo="availability"})'
+        )
+        expected = single.to_dict()
+        actual = batch["checkout"].to_dict()
+        for key in ("analyzed_at", "data_start", "data_end"):
+            expected.pop(key), actual.pop(key)
+        assert actual == expected
+
+    @pytest.mark.asyncio
+    async def test_one_query_per_distinct_window(self, histories):
+        analyzer = DriftAnalyzer(prometheus_url="http://localhost:9090")
+        calls = []
+
+        async def fleet_history(window, slo="availability", step="1h"):
+            calls.append(window)
+            return {}
+
+        with patch.object(analyzer, "_query_fleet_budget_history", fleet_history):
+            await analyzer.analyze_many({"a": "critical", "b": "standard", "c": "low"})
+
+        assert calls == ["30d", "14d"]
+
+    @pytest.mark.asyncio
+    async def test_query_failure_raises(self):
+        analyzer = DriftAnalyzer(prometheus_url="http://localhost:9090")
+
+        with patch.object(analyzer, "_query_fleet_budget_history", side_effect=OSError("down")):
+            with pytest.raises(DriftAnalysisError, match="Failed to query Prometheus"):
+                await analyzer.analyze_many({"a": "critical"})
+
+
 class TestDriftCLI:
     """Tests for drift CLI command."""
 
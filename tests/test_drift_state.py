@@ -0,0 +1,204 @@
+"""Tests for incremental drift state."""
+
+import math
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from scipy import stats
+from nthlayer.core.timeseries import TimeSeries, to_epoch_ms
+from nthlayer.drift import DriftAnalyzer, DriftState, DriftStateStore, PatternDetector
+from nthlayer.drift.state import STATE_FORMAT_VERSION
+
+HOUR_MS = 3_600_000
+WINDOW = 7 * 86400
+START = 1_700_000_000_000
+
+
+def _budget(hours, seed=3):
+    """Slowly declining noisy budget with a drop half way."""
+    rng = np.random.default_rng(seed)
+    values = 0.9 - 0.0001 * np.arange(hours) + rng.normal(0, 0.002, hours)
+    values[hours // 2 :] -= 0.08
+    return values
+
+
+def _fill(state, values, start=START):
+    for i, value in enumerate(values.tolist()):
+        timestamp = start + i * HOUR_MS
+        state.add(timestamp, value)
+        state.expire(timestamp - WINDOW * 1000)
+
+
+class TestDriftState:
+    """Tests for DriftState."""
+
+    def test_sliding_fit_matches_linregress(self):
+        state = DriftState("checkout", "availability", WINDOW)
+        values = _budget(1000)
+
+        for hour, value in enumerate(values.tolist()):
+            timestamp = START + hour * HOUR_MS
+            state.add(timestamp, value)
+            state.expire(timestamp - WINDOW * 1000)
+            if hour + 1 not in (50, 500, 1000):
+                continue
+
+            series = state.series()
+            expected = stats.linregress(
+                (series.timestamps_ms - series.timestamps_ms[0]) / 1000, series.values
+            )
+            slope, intercept, r_squared = state.fit()
+            assert slope == pytest.approx(expected.slope, rel=1e-9)
+            assert intercept == pytest.approx(expected.intercept, rel=1e-9)
+            assert r_squared == pytest.approx(expected.rvalue**2, rel=1e-9)
+            assert state.variance == pytest.approx(np.var(series.values), rel=1e-9)
+
+        assert len(state) == WINDOW // 3600 + 1
+
+    @pytest.mark.parametrize("hours, found", [(150, False), (210, True), (400, False)])
+    def test_step_change_follows_the_window(self, hours, found):
+        state = DriftState("checkout", "availability", WINDOW, step_change_threshold=0.05)
+
+        # The drop at hour 200 is inside the 7 day window only at hour 210
+        _fill(state, _budget(400)[:hours])
+
+        expected = PatternDetector(step_change_threshold=0.05)._detect_step_change(state.series())
+        assert state.step_change == expected
+        assert (state.step_change is not None) == found
+
+    def test_flat_series(self):
+        state = DriftState("checkout", "availability", WINDOW)
+        _fill(state, np.full(300, 0.8))
+
+        slope, _, r_squared = state.fit()
+
+        assert slope == 0.0
+        assert math.isnan(r_squared)
+        assert state.variance == 0.0
+
+    def test_ignores_stale_samples(self):
+        state = DriftState("checkout", "availability", WINDOW)
+        state.add(START, 0.9)
+        state.add(START, 0.1)
+        state.add(START - HOUR_MS, 0.1)
+
+        assert len(state) == 1
+        with pytest.raises(ValueError, match="Insufficient"):
+            state.fit()
+
+    def test_round_trip(self):
+        state = DriftState("checkout", "availability", WINDOW, step_change_threshold=0.05)
+        _fill(state, _budget(210))
+
+        restored = DriftState.from_dict(state.to_dict())
+
+        assert restored.fit() == pytest.approx(state.fit(), rel=1e-9)
+        assert restored.step_change == state.step_change
+        assert restored.last_timestamp_ms == state.last_timestamp_ms
+
+    def test_unknown_version_rejected(self):
+        data = DriftState("checkout", "availability", WINDOW).to_dict()
+        data["version"] = STATE_FORMAT_VERSION + 1
+
+        with pytest.raises(ValueError, match="Unsupported"):
+            DriftState.from_dict(data)
+
+
+class TestDriftStateStore:
+    """Tests for DriftStateStore."""
+
+    def test_save_and_load(self, tmp_path):
+        state = DriftState("checkout", "availability", WINDOW)
+        _fill(state, _budget(50))
+        DriftStateStore(tmp_path / "state.sqlite").save(state)
+
+        loaded = DriftStateStore(tmp_path / "state.sqlite").load("checkout", "availability")
+
+        assert loaded is not None
+        assert loaded.to_dict() == state.to_dict()
+        assert DriftStateStore(tmp_path / "state.sqlite").load("checkout", "latency") is None
+
+    def test_unreadable_state_is_a_miss(self, tmp_path):
+        store = DriftStateStore(tmp_path / "state.sqlite")
+        store.save(DriftState("checkout", "availability", WINDOW))
+        store._execute("UPDATE states SET value = ?", ("{not json",))
+
+        assert store.load("checkout", "availability") is None
+
+    def test_unusable_path_disables_store(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        store = DriftStateStore(blocker / "state.sqlite")
+
+        store.save(DriftState("checkout", "availability", WINDOW))
+
+        assert store.load("checkout", "availability") is None
+
+
+class TestAnalyzeIncremental:
+    """Tests for DriftAnalyzer.analyze_incremental."""
+
+    @pytest.fixture
+    def prometheus(self, monkeypatch):
+        """Fake budget history: hourly samples up to a movable 'now'."""
+        clock = {"now": datetime(2024, 3, 20, 12, 0)}
+        history_start = clock["now"] - timedelta(days=60)
+        values = _budget(24 * 90)
+        requests = []
+
+        class FakeDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return clock["now"]
+
+        async def fetch(self, service, start, end, slo="availability", step="1h"):
+            requests.append((start, end))
+            first = max(0, math.ceil((start - history_start).total_seconds() / 3600))
+            last = int((end - history_start).total_seconds() // 3600)
+            hours = range(first, last + 1)
+            return TimeSeries(
+                np.array(
+                    [to_epoch_ms(history_start + timedelta(hours=h)) for h in hours],
+                    dtype=np.int64,
+                ),
+                values[list(hours)],
+            )
+
+        monkeypatch.setattr("nthlayer.drift.analyzer.datetime", FakeDatetime)
+        monkeypatch.setattr(DriftAnalyzer, "_fetch_budget_history", fetch)
+        return clock, requests
+
+    @pytest.mark.asyncio
+    async def test_later_runs_fetch_only_new_samples(self, prometheus, tmp_path):
+        clock, requests = prometheus
+        analyzer = DriftAnalyzer(prometheus_url="http://localhost:9090")
+        store = DriftStateStore(tmp_path / "state.sqlite")
+
+        await analyzer.analyze_incremental("checkout", "critical", store)
+        clock["now"] += timedelta(hours=3)
+        result = await analyzer.analyze_incremental("checkout", "critical", store)
+
+        assert requests[0][1] - requests[0][0] == timedelta(days=30)
+        assert requests[1][1] - requests[1][0] < timedelta(hours=3)
+
+        # Same result as refetching and refitting the whole window
+        full = await analyzer.analyze_incremental(
+            "checkout", "critical", DriftStateStore(tmp_path / "fresh.sqlite")
+        )
+        assert result.metrics.data_points == full.metrics.data_points == 721
+        assert result.metrics.slope_per_week == pytest.approx(full.metrics.slope_per_week)
+        assert result.pattern == full.pattern
+        assert result.severity == full.severity
+
+    @pytest.mark.asyncio
+    async def test_window_change_refetches(self, prometheus, tmp_path):
+        _, requests = prometheus
+        analyzer = DriftAnalyzer(prometheus_url="http://localhost:9090")
+        store = DriftStateStore(tmp_path / "state.sqlite")
+
+        await analyzer.analyze_incremental("checkout", "critical", store)
+        result = await analyzer.analyze_incremental("checkout", "critical", store, window="14d")
+
+        assert requests[1][1] - requests[1][0] == timedelta(days=14)
+        assert result.window == "14d"
@@ -0,0 +1,152 @@
+"""Tests for fleet apply over a directory of service manifests."""
+
+import json
+from pathlib import Path
+
+import pytest
+from nthlayer.cli.apply import apply_command
+from nthlayer.fleet import (
+    FleetOptions,
+    FleetSummary,
+    apply_fleet,
+    discover_service_files,
+)
+
+SERVICE = """
+service:
+  name: {name}
+  team: platform
+  tier: standard
+  type: api
+
+resources:
+  - kind: SLO
+    name: availability
+    spec:
+      objective: 99.9
+      window: 30d
+      indicator:
+        type: availability
+  - kind: Dependencies
+    name: deps
+    spec:
+      databases:
+        - name: main-db
+          type: postgres
+"""
+
+OPENSRM = """
+apiVersion: srm/v1
+kind: ServiceReliabilityManifest
+metadata:
+  name: orders
+  team: commerce
+  tier: critical
+spec:
+  type: api
+  slos:
+    availability:
+      target: 99.95
+      window: 30d
+"""
+
+
+@pytest.fixture
+def services_dir(tmp_path):
+    root = tmp_path / "services"
+    (root / "team-a").mkdir(parents=True)
+    (root / "team-a" / "checkout.yaml").write_text(SERVICE.format(name="checkout"))
+    (root / "search.yaml").write_text(SERVICE.format(name="search"))
+    (root / "orders.reliability.yaml").write_text(OPENSRM)
+    # Not services: overlays, hidden directories, other YAML
+    (root / "environments").mkdir()
+    (root / "environments" / "prod.yaml").write_text(SERVICE.format(name="overlay"))
+    (root / ".nthlayer").mkdir()
+    (root / ".nthlayer" / "hidden.yaml").write_text(SERVICE.format(name="hidden"))
+    (root / "README.yaml").write_text("title: not a service\n")
+    return root
+
+
+class TestDiscoverServiceFiles:
+    """Tests for discover_service_files."""
+
+    def test_finds_legacy_and_opensrm_manifests(self, services_dir):
+        found = discover_service_files(services_dir)
+
+        assert [p.relative_to(services_dir).as_posix() for p in found] == [
+            "orders.reliability.yaml",
+            "search.yaml",
+            "team-a/checkout.yaml",
+        ]
+
+
+class TestApplyFleet:
+    """Tests for apply_fleet."""
+
+    def test_in_process(self, services_dir, tmp_path):
+        files = discover_service_files(services_dir)
+        options = FleetOptions(output_root=tmp_path / "out", skip=["pagerduty"])
+
+        results = list(apply_fleet(files, options, jobs=1))
+
+        by_name = {r.result.service_name: r for r in results}
+        assert sorted(r.service_yaml for r in results) == files
+        assert by_name["checkout"].result.success is True
+        assert by_name["checkout"].result.output_dir == tmp_path / "out" / "checkout"
+        assert (tmp_path / "out" / "search" / "alerts.yaml").is_file()
+
+    def test_process_pool_matches_in_process(self, services_dir, tmp_path):
+        files = discover_service_files(services_dir)
+
+        serial = list(apply_fleet(files, FleetOptions(output_root=tmp_path / "a"), jobs=1))
+        pooled = list(apply_fleet(files, FleetOptions(output_root=tmp_path / "b"), jobs=2))
+
+        def counts(results):
+            return {r.service_yaml: r.result.resources_created for r in results}
+
+        assert counts(pooled) == counts(serial)
+
+    def test_summary(self, services_dir, tmp_path):
+        summary = FleetSummary()
+        files = discover_service_files(services_dir)
+
+        for item in apply_fleet(files, FleetOptions(output_root=tmp_path / "out"), jobs=1):
+            summary.add(item)
+
+        assert summary.services == 3
+        assert summary.success is True
+        assert summary.total_resources > 0
+
+
+class TestApplyFleetCommand:
+    """Tests for apply_command with a directory."""
+
+    def test_streams_ndjson(self, services_dir, tmp_path, capsys):
+        exit_code = apply_command(
+            str(services_dir),
+            output_dir=str(tmp_path / "out"),
+            output_format="json",
+            jobs=1,
+        )
+
+        lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert exit_code == 0
+        assert [line["type"] for line in lines] == ["service"] * 3 + ["summary"]
+        assert lines[-1]["services"] == 3
+        assert {Path(line["service_yaml"]).name for line in lines[:-1]} == {
+            "checkout.yaml",
+            "search.yaml",
+            "orders.reliability.yaml",
+        }
+
+    def test_failure_sets_exit_code(self, services_dir, tmp_path, capsys):
+        blocker = tmp_path / "out"
+        blocker.write_text("not a directory")
+
+        exit_code = apply_command(str(services_dir), output_dir=str(blocker), jobs=1)
+
+        assert exit_code == 1
+        assert "Applied 0/3 services" in capsys.readouterr().out
+
+    def test_single_file_options_rejected(self, services_dir):
+        assert apply_command(str(services_dir), dry_run=True) == 2
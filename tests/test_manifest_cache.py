@@ -0,0 +1,314 @@
+"""Tests for the persistent parsed-manifest cache."""
+
+import pickle
+import warnings
+
+import pytest
+from nthlayer.specs import loader, manifest_cache, parser
+from nthlayer.specs.loader import LegacyFormatWarning, load_manifest
+from nthlayer.specs.manifest_cache import (
+    MANIFEST_CACHE_ENV,
+    MANIFEST_CACHE_MAX_MB_ENV,
+    ManifestCache,
+    get_manifest_cache,
+    reset_manifest_cache,
+    template_registry_version,
+)
+from nthlayer.specs.opensrm_parser import parse_opensrm_file
+from nthlayer.specs.parser import parse_service, parse_service_file
+from nthlayer.specs.template_loader import TemplateLoader
+
+SERVICE = """
+service:
+  name: checkout
+  team: payments
+  tier: critical
+  type: api
+
+resources:
+  - kind: SLO
+    name: availability
+    spec:
+      objective: 99.9
+      query: 'up{env="${env}"}'
+"""
+
+OPENSRM = """
+apiVersion: srm/v1
+kind: ServiceReliabilityManifest
+metadata:
+  name: orders
+  team: commerce
+  tier: critical
+spec:
+  type: api
+  slos:
+    availability:
+      target: 99.9
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_process_cache(monkeypatch):
+    monkeypatch.delenv(MANIFEST_CACHE_ENV, raising=False)
+    monkeypatch.delenv(MANIFEST_CACHE_MAX_MB_ENV, raising=False)
+    reset_manifest_cache()
+    yield
+    reset_manifest_cache()
+
+
+@pytest.fixture
+def enabled(monkeypatch, tmp_path):
+    monkeypatch.setenv(MANIFEST_CACHE_ENV, "disk")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path
+
+
+@pytest.fixture
+def service_file(tmp_path):
+    path = tmp_path / "services" / "checkout.yaml"
+    path.parent.mkdir()
+    path.write_text(SERVICE)
+    return path
+
+
+def _count_yaml_loads(monkeypatch):
+    calls = []
+    original = parser._load_yaml
+
+    def counting(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(parser, "_load_yaml", counting)
+    return calls
+
+
+class TestManifestCache:
+    """Tests for the ManifestCache store."""
+
+    def test_miss_then_hit(self, tmp_path):
+        cache = ManifestCache(tmp_path / "cache.sqlite")
+        assert cache.get("k") is None
+
+        cache.set("k", {"name": "checkout"})
+
+        assert cache.get("k") == {"name": "checkout"}
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_survives_new_process(self, tmp_path):
+        ManifestCache(tmp_path / "cache.sqlite").set("k", [1, 2])
+        assert ManifestCache(tmp_path / "cache.sqlite").get("k") == [1, 2]
+
+    def test_lru_eviction_over_size_cap(self, tmp_path):
+        clock = iter(range(100))
+        entry_size = len(pickle.dumps("x" * 100, protocol=pickle.HIGHEST_PROTOCOL))
+        cache = ManifestCache(
+            tmp_path / "cache.sqlite",
+            max_bytes=entry_size * 2,
+            timer=lambda: next(clock),
+        )
+        cache.set("a", "x" * 100)
+        cache.set("b", "x" * 100)
+        assert cache.get("a") is not None  # "b" is now least recently used
+
+        cache.set("c", "x" * 100)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.size() <= cache.max_bytes
+        assert cache.stats.evictions == 1
+
+    def test_undecodable_entry_is_dropped(self, tmp_path):
+        cache = ManifestCache(tmp_path / "cache.sqlite")
+        cache.set("k", "value")
+        cache._execute("UPDATE entries SET value = ? WHERE key = ?", (b"garbage", "k"))
+
+        assert cache.get("k") is None
+        assert cache._execute("SELECT COUNT(*) FROM entries") == (0,)
+
+    def test_unusable_path_disables_cache(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = ManifestCache(blocker / "cache.sqlite")
+
+        cache.set("k", "value")
+
+        assert cache.get("k") is None
+
+    def test_clear(self, tmp_path):
+        cache = ManifestCache(tmp_path / "cache.sqlite")
+        cache.set("k", "value")
+        cache.clear()
+        assert cache.get("k") is None
+
+
+class TestProcessCache:
+    """Tests for get_manifest_cache configuration."""
+
+    def test_off_by_default(self):
+        assert get_manifest_cache() is None
+
+    def test_env_disk(self, enabled):
+        cache = get_manifest_cache()
+        assert cache is not None
+        assert cache.path == enabled / "cache" / "nthlayer" / "manifest-cache.sqlite"
+        assert get_manifest_cache() is cache
+
+    def test_env_max_mb(self, enabled, monkeypatch):
+        monkeypatch.setenv(MANIFEST_CACHE_MAX_MB_ENV, "0.5")
+        assert get_manifest_cache().max_bytes == 512 * 1024
+
+
+class TestServiceParsing:
+    """Tests for cached parse_service / parse_service_file."""
+
+    def test_disabled_cache_parses_every_time(self, service_file, monkeypatch):
+        loads = _count_yaml_loads(monkeypatch)
+        parse_service_file(service_file)
+        parse_service_file(service_file)
+        assert len(loads) == 2
+
+    def test_second_parse_served_from_cache(self, enabled, service_file, monkeypatch):
+        first = parse_service_file(service_file, environment="prod")
+        loads = _count_yaml_loads(monkeypatch)
+
+        second = parse_service_file(service_file, environment="prod")
+        parsed = parse_service(service_file, environment="prod")
+
+        assert loads == []
+        assert second == first
+        assert parsed.resources == tuple(first[1])
+        assert parsed.raw_data["service"]["name"] == "checkout"
+        assert first[1][0].spec["query"] == 'up{env="prod"}'
+
+    def test_edited_file_is_reparsed(self, enabled, service_file):
+        parse_service_file(service_file)
+        service_file.write_text(SERVICE.replace("99.9", "99.5"))
+
+        _, resources = parse_service_file(service_file)
+
+        assert resources[0].spec["objective"] == 99.5
+
+    def test_environment_overlay_is_part_of_key(self, enabled, service_file):
+        overlay = service_file.parent / "environments" / "prod.yaml"
+        overlay.parent.mkdir()
+        overlay.write_text("environment: prod\nservice:\n  tier: standard\n")
+
+        context, _ = parse_service_file(service_file, environment="prod")
+        assert context.tier == "standard"
+
+        overlay.write_text("environment: prod\nservice:\n  tier: low\n")
+        context, _ = parse_service_file(service_file, environment="prod")
+        assert context.tier == "low"
+
+        context, _ = parse_service_file(service_file, environment="dev")
+        assert context.tier == "critical"
+
+    def test_parse_errors_are_not_cached(self, enabled, tmp_path):
+        broken = tmp_path / "broken.yaml"
+        broken.write_text("resources: []\n")
+
+        for _ in range(2):
+            with pytest.raises(parser.ServiceParseError):
+                parse_service_file(broken)
+        assert get_manifest_cache().size() == 0
+
+    def test_cached_results_are_independent(self, enabled, service_file):
+        parse_service_file(service_file)
+        _, resources = parse_service_file(service_file)
+        resources[0].spec["objective"] = 1.0
+
+        _, again = parse_service_file(service_file)
+        assert again[0].spec["objective"] == 99.9
+
+
+class TestTemplateRegistryVersion:
+    """Tests for template_registry_version."""
+
+    def test_registry_content_changes_version(self):
+        registry = TemplateLoader.load_builtin()
+        before = template_registry_version(registry)
+        name = next(iter(registry.templates))
+        registry.templates[name].description = "changed"
+
+        assert template_registry_version(registry) != before
+
+    def test_custom_templates_change_default_version(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        before = template_registry_version(None)
+
+        custom = tmp_path / ".nthlayer" / "templates"
+        custom.mkdir(parents=True)
+        (custom / "internal-api.yaml").write_text("name: internal-api\n")
+
+        assert template_registry_version(None) != before
+
+
+class TestManifestLoading:
+    """Tests for cached load_manifest / parse_opensrm_file."""
+
+    def test_load_manifest_served_from_cache(self, enabled, tmp_path, monkeypatch):
+        path = tmp_path / "orders.reliability.yaml"
+        path.write_text(OPENSRM)
+        first = load_manifest(path)
+
+        monkeypatch.setattr(
+            loader, "manifest_from_data", lambda *a, **k: pytest.fail("reparsed manifest")
+        )
+        second = load_manifest(path)
+
+        assert second == first
+        assert second.source_file == str(path)
+
+    def test_opensrm_template_changes_invalidate(self, enabled, tmp_path):
+        templates = tmp_path / "templates"
+        templates.mkdir()
+        (templates / "base.yaml").write_text("spec:\n  description: one\n")
+        path = tmp_path / "orders.reliability.yaml"
+        path.write_text(
+            OPENSRM.replace("  tier: critical\n", "  tier: critical\n  template: base\n")
+        )
+
+        assert load_manifest(path).raw_data["spec"]["description"] == "one"
+        (templates / "base.yaml").write_text("spec:\n  description: two\n")
+        assert load_manifest(path).raw_data["spec"]["description"] == "two"
+
+    def test_legacy_warning_on_cache_hit(self, enabled, service_file):
+        load_manifest(service_file, suppress_deprecation_warning=True)
+
+        with pytest.warns(LegacyFormatWarning):
+            load_manifest(service_file)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            load_manifest(service_file, suppress_deprecation_warning=True)
+
+    def test_parse_opensrm_file_served_from_cache(self, enabled, tmp_path, monkeypatch):
+        path = tmp_path / "orders.reliability.yaml"
+        path.write_text(OPENSRM)
+        first = parse_opensrm_file(path)
+
+        monkeypatch.setattr(
+            "nthlayer.specs.opensrm_parser.parse_opensrm",
+            lambda *a, **k: pytest.fail("reparsed manifest"),
+        )
+
+        assert parse_opensrm_file(path) == first
+
+    def test_nthlayer_version_is_part_of_key(self, enabled, tmp_path, monkeypatch):
+        path = tmp_path / "orders.reliability.yaml"
+        path.write_text(OPENSRM)
+        load_manifest(path)
+
+        monkeypatch.setattr(manifest_cache, "_nthlayer_version", lambda: "999.0")
+        calls = []
+        original = loader.manifest_from_data
+        monkeypatch.setattr(
+            loader,
+            "manifest_from_data",
+            lambda *a, **k: calls.append(a) or original(*a, **k),
+        )
+        load_manifest(path)
+
+        assert len(calls) == 1
@@ -0,0 +1,193 @@
+"""Tests for rendering several environments from one parse."""
+
+import copy
+import json
+
+import pytest
+from nthlayer.cli.apply import apply_command
+from nthlayer.cli.generate import generate_slo_command
+from nthlayer.cli.plan import plan_command
+from nthlayer.specs import parser
+from nthlayer.specs.environment_merger import EnvironmentMerger
+from nthlayer.specs.environments import EnvironmentLoader, split_environments
+from nthlayer.specs.parser import parse_service, parse_service_environments
+
+SERVICE = """
+service:
+  name: checkout
+  team: payments
+  tier: critical
+  type: api
+
+resources:
+  - kind: SLO
+    name: availability
+    spec:
+      objective: 99.9
+      window: 30d
+      indicator:
+        type: availability
+        query: 'up{env="${env}"}'
+  - kind: Dependencies
+    name: deps
+    spec:
+      databases:
+        - name: main-db
+          type: postgres
+"""
+
+OVERLAY = """
+environment: {env}
+service:
+  tier: {tier}
+resources:
+  - kind: SLO
+    name: availability
+    spec:
+      objective: {objective}
+"""
+
+
+@pytest.fixture
+def service_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "checkout.yaml"
+    path.write_text(SERVICE)
+    envs = tmp_path / "environments"
+    envs.mkdir()
+    (envs / "dev.yaml").write_text(OVERLAY.format(env="dev", tier="low", objective=99.0))
+    (envs / "checkout-prod.yaml").write_text(
+        OVERLAY.format(env="prod", tier="critical", objective=99.95)
+    )
+    return path
+
+
+class TestStructurallySharedMerge:
+    """Tests for EnvironmentMerger.merge_service_config(copy=False)."""
+
+    BASE = {
+        "service": {"name": "checkout", "tier": "critical", "metadata": {"a": {"b": 1}}},
+        "resources": [
+            {"kind": "SLO", "name": "availability", "spec": {"objective": 99.9, "x": {"y": 1}}},
+            {"kind": "Dependencies", "name": "deps", "spec": {"databases": [{"name": "db"}]}},
+        ],
+    }
+    OVERRIDES = {
+        "service": {"tier": "low"},
+        "resources": [
+            {"kind": "SLO", "name": "availability", "spec": {"objective": 99.0}},
+            {"kind": "SLO", "name": "latency", "spec": {"objective": 95}},
+        ],
+    }
+
+    def test_same_result_as_deep_copy(self):
+        base = copy.deepcopy(self.BASE)
+
+        shared = EnvironmentMerger.merge_service_config(base, self.OVERRIDES, copy=False)
+
+        assert shared == EnvironmentMerger.merge_service_config(self.BASE, self.OVERRIDES)
+        assert base == self.BASE
+
+    def test_untouched_subtrees_are_shared(self):
+        merged = EnvironmentMerger.merge_service_config(self.BASE, self.OVERRIDES, copy=False)
+
+        assert merged["service"] is not self.BASE["service"]
+        assert merged["service"]["metadata"] is self.BASE["service"]["metadata"]
+        assert merged["resources"][0] is not self.BASE["resources"][0]
+        assert merged["resources"][0]["spec"]["x"] is self.BASE["resources"][0]["spec"]["x"]
+        assert merged["resources"][1] is self.BASE["resources"][1]
+
+
+def test_split_environments():
+    assert split_environments("dev, staging,prod,dev,") == ["dev", "staging", "prod"]
+    assert split_environments(None) == []
+
+
+def test_list_environments(service_file):
+    envs = service_file.parent / "environments"
+    (envs / "search-staging.yaml").write_text("environment: staging\n")
+    (envs / "notes.yaml").write_text("- not an override\n")
+    hidden = service_file.parent / ".nthlayer" / "environments"
+    hidden.mkdir(parents=True)
+    (hidden / "checkout-qa.yaml").write_text("environment: qa\n")
+    (hidden / "perf.yaml").write_text("environment: perf\n")
+
+    assert EnvironmentLoader.list_environments(service_file) == ["dev", "prod", "qa"]
+
+
+class TestParseServiceEnvironments:
+    """Tests for parse_service_environments."""
+
+    def test_matches_per_environment_parse(self, service_file):
+        parsed = parse_service_environments(service_file, ["dev", "prod", "staging"])
+
+        assert list(parsed) == ["dev", "prod", "staging"]
+        for env, service in parsed.items():
+            assert service == parse_service(service_file, environment=env)
+        assert parsed["dev"].context.tier == "low"
+        assert parsed["prod"].resources[0].spec["objective"] == 99.95
+        assert parsed["staging"].resources[0].spec["indicator"]["query"] == 'up{env="staging"}'
+
+    def test_reads_base_once(self, service_file, monkeypatch):
+        loads = []
+        original = parser._load_yaml
+        monkeypatch.setattr(parser, "_load_yaml", lambda path: loads.append(path) or original(path))
+
+        parse_service_environments(service_file, ["dev", "prod", "dev"])
+
+        assert loads == [service_file]
+
+    def test_environments_share_untouched_subtrees(self, service_file):
+        parsed = parse_service_environments(service_file, ["dev", "prod"])
+
+        dev, prod = parsed["dev"].resources, parsed["prod"].resources
+        assert dev[1].spec["databases"] is prod[1].spec["databases"]
+        assert dev[0].spec["indicator"]["query"] == 'up{env="dev"}'
+        assert prod[0].spec["indicator"]["query"] == 'up{env="prod"}'
+        assert parsed["dev"].raw_data["resources"][0]["spec"]["indicator"]["query"] == (
+            'up{env="${env}"}'
+        )
+
+
+class TestMultiEnvironmentCommands:
+    """Tests for --env lists and --all-envs on apply, plan and generate-slo."""
+
+    def test_apply_writes_each_environment(self, service_file, capsys):
+        exit_code = apply_command(str(service_file), env="dev,prod", output_format="json")
+
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert exit_code == 0
+        assert [r["environment"] for r in records] == ["dev", "prod"]
+        assert records[0]["output_dir"] == "generated/checkout/dev"
+        dev = (service_file.parent / "generated/checkout/dev/sloth/checkout.yaml").read_text()
+        prod = (service_file.parent / "generated/checkout/prod/sloth/checkout.yaml").read_text()
+        assert "99.0" in dev
+        assert "99.95" in prod
+
+    def test_apply_all_envs(self, service_file, tmp_path):
+        assert apply_command(str(service_file), all_envs=True, output_dir="out") == 0
+        assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["dev", "prod"]
+
+    def test_apply_all_envs_without_overrides(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "checkout.yaml").write_text(SERVICE)
+
+        assert apply_command(str(tmp_path / "checkout.yaml"), all_envs=True) == 1
+
+    def test_apply_rejects_directory(self, service_file):
+        assert apply_command(str(service_file.parent), env="dev,prod") == 2
+
+    def test_plan_writes_file_per_environment(self, service_file, tmp_path):
+        exit_code = plan_command(
+            str(service_file), env="dev,prod", output_format="json", output_file="plan.json"
+        )
+
+        assert exit_code == 0
+        assert (tmp_path / "plan-dev.json").exists()
+        assert (tmp_path / "plan-prod.json").exists()
+
+    def test_generate_slo_per_environment(self, service_file, tmp_path):
+        assert generate_slo_command(str(service_file), output_dir="out", all_envs=True) == 0
+
+        assert "99.0" in (tmp_path / "out/sloth/dev/checkout.yaml").read_text()
+        assert "99.95" in (tmp_path / "out/sloth/prod/checkout.yaml").read_text()
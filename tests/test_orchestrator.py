@@ -457,6 +457,305 @@ class TestServiceOrchestrator:
         assert output_dir.exists()
 
 
+class TestParseOnce:
+    """Tests for sharing one parsed service across generators."""
+
+    def test_apply_parses_once(self, sample_service_yaml, tmp_path):
+        """Test apply parses the service file once for all generators."""
+        from nthlayer.specs import parser
+
+        orchestrator = ServiceOrchestrator(sample_service_yaml)
+        orchestrator.output_dir = tmp_path / "output"
+
+        with (
+            patch("nthlayer.orchestrator.parse_service", wraps=parser.parse_service) as parse,
+            patch.object(parser, "_load_yaml", wraps=parser._load_yaml) as load_yaml,
+            patch("nthlayer.generators.backstage.load_manifest") as load_manifest,
+        ):
+            result = orchestrator.apply(skip=["pagerduty"])
+
+        assert result.success is True
+        assert {"slos", "alerts", "dashboard", "recording-rules", "backstage"} <= set(
+            result.resources_created
+        )
+        parse.assert_called_once_with(sample_service_yaml, environment=None, template_registry=None)
+        load_yaml.assert_called_once()
+        load_manifest.assert_not_called()
+
+    def test_service_def_is_base_yaml(self, sample_service_yaml):
+        """Test service_def is the parsed file's raw data."""
+        orchestrator = ServiceOrchestrator(sample_service_yaml, env="prod")
+        orchestrator._load_service()
+
+        assert orchestrator._parsed is not None
+        assert orchestrator._parsed.environment == "prod"
+        assert orchestrator.service_def is orchestrator._parsed.raw_data
+
+    def test_unparseable_service_falls_back_to_yaml(self, tmp_path):
+        """Test files the spec parser rejects still load as plain YAML."""
+        service_file = tmp_path / "bad.yaml"
+        service_file.write_text("service:\n  name: bad\nresources: not-a-list\n")
+
+        orchestrator = ServiceOrchestrator(service_file)
+        orchestrator._load_service()
+
+        assert orchestrator._parsed is None
+        assert orchestrator.service_name == "bad"
+
+    def test_generators_use_parsed_service(self, sample_service_yaml, tmp_path):
+        """Test generators given a parsed service do not read the file."""
+        from nthlayer.generators.alerts import generate_alerts_for_service
+        from nthlayer.generators.sloth import generate_sloth_spec
+        from nthlayer.specs.parser import parse_service
+
+        parsed = parse_service(sample_service_yaml)
+        missing = tmp_path / "missing.yaml"
+
+        sloth = generate_sloth_spec(missing, tmp_path / "sloth", parsed=parsed)
+        alerts = generate_alerts_for_service(missing, quiet=True, parsed=parsed)
+
+        assert sloth.success is True
+        assert sloth.service == "test-service"
+        assert alerts == generate_alerts_for_service(sample_service_yaml, quiet=True)
+
+
+class TestArtifactCaching:
+    """Tests for skipping generators whose inputs are unchanged."""
+
+    CACHED = {"slos", "alerts", "dashboard", "recording-rules", "backstage"}
+
+    def _apply(self, service_yaml, output_dir, **kwargs):
+        orchestrator = ServiceOrchestrator(service_yaml, env=kwargs.pop("env", None))
+        orchestrator.output_dir = output_dir
+        return orchestrator.apply(skip=["pagerduty"], **kwargs)
+
+    def test_second_apply_is_up_to_date(self, sample_service_yaml, tmp_path):
+        """Test unchanged generators are skipped with their previous counts."""
+        output_dir = tmp_path / "output"
+        first = self._apply(sample_service_yaml, output_dir)
+
+        with patch.object(ServiceOrchestrator, "_generate_alerts") as generate_alerts:
+            second = self._apply(sample_service_yaml, output_dir)
+
+        generate_alerts.assert_not_called()
+        assert first.up_to_date == []
+        assert set(second.up_to_date) == self.CACHED
+        assert second.resources_created == first.resources_created
+        assert (output_dir / ".nthlayer" / "cache.json").is_file()
+
+    def test_force_regenerates(self, sample_service_yaml, tmp_path):
+        """Test --force ignores the cache."""
+        output_dir = tmp_path / "output"
+        self._apply(sample_service_yaml, output_dir)
+
+        result = self._apply(sample_service_yaml, output_dir, force=True)
+
+        assert result.up_to_date == []
+
+    def test_only_changed_generators_rerun(self, sample_service_yaml, tmp_path):
+        """Test an SLO change reruns SLO consumers but not alerts."""
+        output_dir = tmp_path / "output"
+        self._apply(sample_service_yaml, output_dir)
+        sample_service_yaml.write_text(
+            sample_service_yaml.read_text().replace("objective: 99.9", "objective: 99.5")
+        )
+
+        result = self._apply(sample_service_yaml, output_dir)
+
+        assert "alerts" in result.up_to_date
+        assert not {"slos", "recording-rules", "dashboard"} & set(result.up_to_date)
+
+    def test_edited_artifact_regenerated(self, sample_service_yaml, tmp_path):
+        """Test a hand-edited output file is regenerated."""
+        output_dir = tmp_path / "output"
+        self._apply(sample_service_yaml, output_dir)
+        (output_dir / "recording-rules.yaml").write_text("edited")
+
+        result = self._apply(sample_service_yaml, output_dir)
+
+        assert "recording-rules" not in result.up_to_date
+        assert (output_dir / "recording-rules.yaml").read_text() != "edited"
+
+    def test_environment_overlay_change_invalidates(self, sample_service_yaml, tmp_path):
+        """Test editing the environment overlay reruns generators."""
+        output_dir = tmp_path / "output"
+        env_dir = sample_service_yaml.parent / "environments"
+        env_dir.mkdir()
+        overlay = env_dir / "prod.yaml"
+        overlay.write_text("environment: prod\n")
+        self._apply(sample_service_yaml, output_dir, env="prod")
+
+        overlay.write_text("environment: prod\nservice:\n  tier: critical\n")
+        result = self._apply(sample_service_yaml, output_dir, env="prod")
+
+        assert result.up_to_date == []
+
+    def test_custom_template_change_invalidates(self, sample_service_yaml, tmp_path, monkeypatch):
+        """Test editing a template in .nthlayer/templates reruns generators."""
+        output_dir = tmp_path / "output"
+        templates_dir = tmp_path / ".nthlayer" / "templates"
+        templates_dir.mkdir(parents=True)
+        template = templates_dir / "team-api.yaml"
+        template.write_text("name: team-api\ndescription: Team API\ntier: critical\n")
+        monkeypatch.chdir(tmp_path)
+        self._apply(sample_service_yaml, output_dir)
+
+        template.write_text("name: team-api\ndescription: Team API\ntier: standard\n")
+        result = self._apply(sample_service_yaml, output_dir)
+
+        assert result.up_to_date == []
+
+    def test_alert_template_change_invalidates_alerts(self, sample_service_yaml, tmp_path):
+        """Test new alert templates rerun the alerts generator only."""
+        from nthlayer.alerts import AlertTemplateLoader
+
+        output_dir = tmp_path / "output"
+        self._apply(sample_service_yaml, output_dir)
+
+        with patch.object(AlertTemplateLoader, "templates_version", return_value="changed"):
+            result = self._apply(sample_service_yaml, output_dir)
+
+        assert "alerts" not in result.up_to_date
+        assert "slos" in result.up_to_date
+
+    def test_pagerduty_never_cached(self, sample_service_yaml, tmp_path):
+        """Test generators with external side effects always run."""
+        orchestrator = ServiceOrchestrator(sample_service_yaml, push_to_grafana=True)
+        orchestrator._load_service()
+
+        assert orchestrator._fingerprint("pagerduty") is None
+        assert orchestrator._fingerprint("dashboard") is None
+        assert orchestrator._fingerprint("alerts") is not None
+
+
+class TestParallelApply:
+    """Tests for apply(parallel=True)."""
+
+    def test_matches_serial_output(self, sample_service_yaml, tmp_path):
+        """Test parallel apply writes the same artifacts and counts as serial."""
+        results = {}
+        for mode in ("serial", "parallel"):
+            orchestrator = ServiceOrchestrator(sample_service_yaml)
+            orchestrator.output_dir = tmp_path / mode
+            results[mode] = orchestrator.apply(skip=["pagerduty"], parallel=mode == "parallel")
+
+        assert results["parallel"].success is True
+        assert results["parallel"].resources_created == results["serial"].resources_created
+        for name in ("alerts.yaml", "recording-rules.yaml", "sloth/test-service.yaml"):
+            assert (tmp_path / "parallel" / name).read_text() == (
+                tmp_path / "serial" / name
+            ).read_text()
+
+    def test_records_timings(self, sample_service_yaml, tmp_path):
+        """Test each generator that ran has a wall-clock timing."""
+        orchestrator = ServiceOrchestrator(sample_service_yaml)
+        orchestrator.output_dir = tmp_path / "output"
+
+        result = orchestrator.apply(skip=["pagerduty"], parallel=True)
+
+        assert set(result.timings) == set(result.resources_created)
+        assert all(seconds >= 0 for seconds in result.timings.values())
+
+    def test_network_generators_overlap(self, sample_service_yaml, tmp_path):
+        """Test PagerDuty and the dashboard push run at the same time."""
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait(*args, **kwargs):
+            barrier.wait()
+            return 1
+
+        orchestrator = ServiceOrchestrator(sample_service_yaml, push_to_grafana=True)
+        orchestrator.output_dir = tmp_path / "output"
+
+        with (
+            patch.object(orchestrator, "_generate_pagerduty", side_effect=wait),
+            patch.object(orchestrator, "_generate_dashboard", side_effect=wait),
+        ):
+            result = orchestrator.apply(only=["pagerduty", "dashboard"], parallel=True)
+
+        assert result.success is True
+        assert result.resources_created == {"dashboard": 1, "pagerduty": 1}
+
+    def test_progress_output_in_dispatch_order(self, sample_service_yaml, tmp_path, capsys):
+        """Test threaded generator output is replayed in serial order."""
+        import threading
+
+        pagerduty_done = threading.Event()
+
+        def dashboard(push_to_grafana=False, out=None):
+            # Finish after PagerDuty so unordered output would come out reversed
+            assert pagerduty_done.wait(5)
+            print("dashboard output", file=out)
+            return 1
+
+        def pagerduty(out=None):
+            print("pagerduty output", file=out)
+            pagerduty_done.set()
+            return 2
+
+        orchestrator = ServiceOrchestrator(sample_service_yaml, push_to_grafana=True)
+        orchestrator.output_dir = tmp_path / "output"
+
+        with (
+            patch.object(orchestrator, "_generate_dashboard", side_effect=dashboard),
+            patch.object(orchestrator, "_generate_pagerduty", side_effect=pagerduty),
+        ):
+            result = orchestrator.apply(
+                only=["dashboard", "pagerduty"], parallel=True, verbose=True
+            )
+
+        out = capsys.readouterr().out
+        assert result.resources_created == {"dashboard": 1, "pagerduty": 2}
+        assert out.index("Generating dashboard") < out.index("dashboard output")
+        assert out.index("dashboard output") < out.index("Generating PagerDuty")
+        assert out.index("Generating PagerDuty") < out.index("pagerduty output")
+
+    def test_file_generators_stay_serial(self, sample_service_yaml, tmp_path):
+        """Test CPU-bound generators run on the calling thread with stdout untouched."""
+        import sys
+        import threading
+
+        stdout = sys.stdout
+        calls = []
+
+        def record(name):
+            def generator(**kwargs):
+                calls.append((name, threading.current_thread(), sys.stdout, kwargs))
+                return 1
+
+            return generator
+
+        orchestrator = ServiceOrchestrator(sample_service_yaml)
+        orchestrator.output_dir = tmp_path / "output"
+
+        with (
+            patch.object(orchestrator, "_generate_slos", side_effect=record("slos")),
+            patch.object(orchestrator, "_generate_alerts", side_effect=record("alerts")),
+        ):
+            orchestrator.apply(only=["slos", "alerts"], parallel=True)
+
+        assert [name for name, *_ in calls] == ["slos", "alerts"]
+        for _, thread, current_stdout, kwargs in calls:
+            assert thread is threading.main_thread()
+            assert current_stdout is stdout
+            assert "out" not in kwargs
+
+    def test_generator_errors_reported(self, sample_service_yaml, tmp_path):
+        """Test a failing generator does not stop the others."""
+        orchestrator = ServiceOrchestrator(sample_service_yaml)
+        orchestrator.output_dir = tmp_path / "output"
+
+        with patch.object(orchestrator, "_generate_alerts", side_effect=RuntimeError("boom")):
+            result = orchestrator.apply(skip=["pagerduty"], parallel=True)
+
+        assert result.errors == ["Alerts generation failed: boom"]
+        assert "alerts" not in result.resources_created
+        assert "alerts" in result.timings
+        assert "slos" in result.resources_created
+
+
 class TestOrchestratorPlanMethods:
     """Tests for orchestrator planning methods."""
 
@@ -5,7 +5,14 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from nthlayer.portfolio.aggregator import PortfolioAggregator, collect_portfolio
+from nthlayer.portfolio import aggregator as aggregator_module
+from nthlayer.portfolio.aggregator import (
+    PortfolioAggregator,
+    ScannedService,
+    collect_portfolio,
+    discover_service_files,
+    scan_service_files,
+)
 from nthlayer.portfolio.models import HealthStatus, InsightType
 
 
@@ -182,7 +189,7 @@ class TestCollectWithPrometheus:
 
         # Setup mock provider
         mock_provider = MagicMock()
-        mock_provider.query = AsyncMock(return_value={"result": [{"value": [1234567890, "99.95"]}]})
+        mock_provider.get_sli_value = AsyncMock(return_value=99.95)
         mock_provider_class.return_value = mock_provider
 
         aggregator = PortfolioAggregator(
@@ -205,7 +212,7 @@ class TestCollectWithPrometheus:
 
         mock_provider = MagicMock()
         # Return value above the 99.9% objective
-        mock_provider.query = AsyncMock(return_value={"result": [{"value": [0, "99.95"]}]})
+        mock_provider.get_sli_value = AsyncMock(return_value=99.95)
         mock_provider_class.return_value = mock_provider
 
         aggregator = PortfolioAggregator(
@@ -231,7 +238,7 @@ class TestCollectWithPrometheus:
 
         mock_provider = MagicMock()
         # Return value between objective * 0.99 and objective (99.9 * 0.99 = 98.9)
-        mock_provider.query = AsyncMock(return_value={"result": [{"value": [0, "99.0"]}]})
+        mock_provider.get_sli_value = AsyncMock(return_value=99.0)
         mock_provider_class.return_value = mock_provider
 
         aggregator = PortfolioAggregator(
@@ -254,7 +261,7 @@ class TestCollectWithPrometheus:
 
         mock_provider = MagicMock()
         # Return value between objective * 0.95 and objective * 0.99
-        mock_provider.query = AsyncMock(return_value={"result": [{"value": [0, "95.5"]}]})
+        mock_provider.get_sli_value = AsyncMock(return_value=95.5)
         mock_provider_class.return_value = mock_provider
 
         aggregator = PortfolioAggregator(
@@ -277,7 +284,7 @@ class TestCollectWithPrometheus:
 
         mock_provider = MagicMock()
         # Return value below objective * 0.95
-        mock_provider.query = AsyncMock(return_value={"result": [{"value": [0, "90.0"]}]})
+        mock_provider.get_sli_value = AsyncMock(return_value=90.0)
         mock_provider_class.return_value = mock_provider
 
         aggregator = PortfolioAggregator(
@@ -299,7 +306,7 @@ class TestCollectWithPrometheus:
         monkeypatch.setenv("NTHLAYER_METRICS_PASSWORD", "pass")
 
         mock_provider = MagicMock()
-        mock_provider.query = AsyncMock(side_effect=Exception("Query failed"))
+        mock_provider.get_sli_value = AsyncMock(side_effect=Exception("Query failed"))
         mock_provider_class.return_value = mock_provider
 
         aggregator = PortfolioAggregator(
@@ -322,7 +329,7 @@ class TestCollectWithPrometheus:
         monkeypatch.setenv("NTHLAYER_METRICS_PASSWORD", "pass")
 
         mock_provider = MagicMock()
-        mock_provider.query = AsyncMock(return_value={"result": []})
+        mock_provider.get_sli_value = AsyncMock(return_value=None)
         mock_provider_class.return_value = mock_provider
 
         aggregator = PortfolioAggregator(
@@ -592,7 +599,7 @@ class TestCollectPortfolioFunction:
         """Test collect_portfolio with Prometheus URL."""
         with patch("nthlayer.providers.prometheus.PrometheusProvider") as mock_class:
             mock_provider = MagicMock()
-            mock_provider.query = AsyncMock(return_value={"result": []})
+            mock_provider.get_sli_value = AsyncMock(return_value=None)
             mock_class.return_value = mock_provider
 
             result = collect_portfolio(
@@ -616,15 +623,17 @@ class TestEnrichWithLiveDataEdgeCases:
             asyncio.run(aggregator._enrich_with_live_data([]))
 
     @patch("nthlayer.providers.prometheus.PrometheusProvider")
-    def test_handles_service_file_parse_error(self, mock_provider_class, tmp_path, monkeypatch):
-        """Test handling of service file parse errors during enrichment."""
+    def test_service_without_queries_stays_unknown(
+        self, mock_provider_class, tmp_path, monkeypatch
+    ):
+        """Test that services with no SLI queries keep UNKNOWN status."""
         import asyncio
 
         monkeypatch.setenv("NTHLAYER_METRICS_USER", "user")
         monkeypatch.setenv("NTHLAYER_METRICS_PASSWORD", "pass")
 
         mock_provider = MagicMock()
-        mock_provider.query = AsyncMock(return_value={"result": []})
+        mock_provider.get_sli_value = AsyncMock(return_value=0.0)
         mock_provider_class.return_value = mock_provider
 
         # Create a mock service health with invalid file path
@@ -640,13 +649,14 @@ class TestEnrichWithLiveDataEdgeCases:
             ],
         )
 
-        bad_path = tmp_path / "nonexistent.yaml"
-        slo_specs = [(service_health, bad_path)]
+        scanned = [ScannedService(path=tmp_path / "test.yaml", health=service_health)]
 
         aggregator = PortfolioAggregator(prometheus_url="http://prometheus:9090")
 
         # Should handle gracefully without raising
-        asyncio.run(aggregator._enrich_with_live_data(slo_specs))
+        asyncio.run(aggregator._enrich_with_live_data(scanned))
+
+        assert service_health.slos[0].status == HealthStatus.UNKNOWN
 
     @patch("nthlayer.providers.prometheus.PrometheusProvider")
     def test_handles_slo_without_query(self, mock_provider_class, tmp_path, monkeypatch):
@@ -655,7 +665,7 @@ class TestEnrichWithLiveDataEdgeCases:
         monkeypatch.setenv("NTHLAYER_METRICS_PASSWORD", "pass")
 
         mock_provider = MagicMock()
-        mock_provider.query = AsyncMock(return_value={"result": []})
+        mock_provider.get_sli_value = AsyncMock(return_value=0.0)
         mock_provider_class.return_value = mock_provider
 
         # Create service file with SLO but no query
@@ -695,12 +705,12 @@ resources:
 
         captured_queries = []
 
-        def capture_query(query):
+        def capture_query(query, time=None, missing=0.0):
             captured_queries.append(query)
-            return {"result": [{"value": [0, "99.95"]}]}
+            return 99.95
 
         mock_provider = MagicMock()
-        mock_provider.query = AsyncMock(side_effect=capture_query)
+        mock_provider.get_sli_value = AsyncMock(side_effect=capture_query)
         mock_provider_class.return_value = mock_provider
 
         services_dir = tmp_path / "services"
@@ -744,7 +754,7 @@ resources:
         # Error budget = 100 - 99.9 = 0.1%
         # Error rate = 100 - 99.8 = 0.2%
         # Budget consumed = 0.2 / 0.1 * 100 = 200% (capped at 100)
-        mock_provider.query = AsyncMock(return_value={"result": [{"value": [0, "99.8"]}]})
+        mock_provider.get_sli_value = AsyncMock(return_value=99.8)
         mock_provider_class.return_value = mock_provider
 
         services_dir = tmp_path / "services"
@@ -780,3 +790,202 @@ resources:
         availability_slo = test_service.slos[0]
         if availability_slo.budget_consumed_percent is not None:
             assert availability_slo.budget_consumed_percent <= 100
+
+
+SERVICE = """
+service:
+  name: {name}
+  team: team
+  tier: critical
+  type: api
+
+resources:
+  - kind: SLO
+    name: availability
+    spec:
+      objective: 99.9
+      window: 30d
+      indicator:
+        query: up{{service="${{service}}"}}
+"""
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+class TestDiscoverServiceFiles:
+    """Tests for recursive service file discovery."""
+
+    def test_walks_subdirectories(self, tmp_path):
+        root = tmp_path / "services"
+        a = _write(root / "a.yaml", "")
+        b = _write(root / "team-b" / "b.yml", "")
+        c = _write(root / "team-b" / "nested" / "c.yaml", "")
+        _write(root / "team-b" / "notes.txt", "")
+        _write(root / ".git" / "config.yaml", "")
+        _write(root / "environments" / "prod.yaml", "")
+        _write(root / "team-b" / "environments" / "b-dev.yaml", "")
+
+        assert discover_service_files([root]) == [a, b, c]
+
+    def test_ignore_patterns(self, tmp_path):
+        root = tmp_path / "services"
+        a = _write(root / "a.yaml", "")
+        _write(root / "generated" / "a" / "alerts.yaml", "")
+        _write(root / "a.rules.yaml", "")
+        _write(root / "legacy" / "old.yaml", "")
+        keep = _write(root / "team" / "legacy" / "kept.yaml", "")
+
+        found = discover_service_files([root], ignore=["generated", "*.rules.yaml", "legacy/*"])
+
+        assert found == [a, keep]
+
+    def test_files_and_missing_paths(self, tmp_path):
+        a = _write(tmp_path / "services" / "a.yaml", "")
+
+        found = discover_service_files([a, tmp_path / "services", tmp_path / "missing"])
+
+        assert found == [a]
+
+
+class TestScanServiceFiles:
+    """Tests for the parse stage."""
+
+    def test_process_pool_matches_in_process(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(aggregator_module, "PARALLEL_MIN_FILES", 1)
+        files = [
+            _write(tmp_path / f"svc-{i}.yaml", SERVICE.format(name=f"svc-{i}")) for i in range(6)
+        ]
+        files.insert(3, _write(tmp_path / "broken.yaml", "service: [\n"))
+
+        serial = scan_service_files(files, jobs=1)
+        parallel = scan_service_files(files, jobs=3)
+
+        assert [s.health.service for s in parallel] == [f"svc-{i}" for i in range(6)]
+        assert [(s.path, s.health, s.queries) for s in parallel] == [
+            (s.path, s.health, s.queries) for s in serial
+        ]
+        assert serial[0].queries == [(0, 'up{service="svc-0"}')]
+
+    @patch("nthlayer.providers.prometheus.PrometheusProvider")
+    def test_enrichment_reuses_first_parse(self, mock_provider_class, tmp_path, monkeypatch):
+        mock_provider = MagicMock()
+        mock_provider.get_sli_value = AsyncMock(return_value=99.95)
+        mock_provider_class.return_value = mock_provider
+        for name in ("a", "b"):
+            _write(tmp_path / "services" / f"{name}.yaml", SERVICE.format(name=name))
+
+        parses = []
+        original = aggregator_module.parse_service_file
+        monkeypatch.setattr(
+            aggregator_module,
+            "parse_service_file",
+            lambda path, **kwargs: parses.append(path) or original(path, **kwargs),
+        )
+
+        result = PortfolioAggregator(
+            search_paths=[tmp_path / "services"], prometheus_url="http://prometheus:9090", jobs=1
+        ).collect()
+
+        assert len(parses) == 2
+        assert all(svc.slos[0].status == HealthStatus.HEALTHY for svc in result.services)
+
+
+class TestLiveQueryStats:
+    """Tests for the live query counters reported in PortfolioHealth."""
+
+    @pytest.fixture
+    def services_dir(self, tmp_path):
+        for name in ("ok", "broken", "empty", "slow"):
+            _write(tmp_path / "services" / f"{name}.yaml", SERVICE.format(name=name))
+        return tmp_path / "services"
+
+    @pytest.fixture
+    def provider(self):
+        import asyncio
+
+        from nthlayer.providers.prometheus import PrometheusProviderError
+
+        async def get_sli_value(query, time=None, missing=0.0):
+            if "broken" in query:
+                raise PrometheusProviderError("bad_data: parse error")
+            if "slow" in query:
+                await asyncio.sleep(5)
+            return missing if "empty" in query else 99.95
+
+        provider = MagicMock()
+        # Merged requests fail, so every SLO is queried on its own
+        provider.query = AsyncMock(side_effect=PrometheusProviderError("no batching"))
+        provider.get_sli_value = AsyncMock(side_effect=get_sli_value)
+        with patch("nthlayer.providers.prometheus.PrometheusProvider", return_value=provider):
+            yield provider
+
+    def test_counts_outcomes(self, services_dir, provider):
+        result = PortfolioAggregator(
+            search_paths=[services_dir],
+            prometheus_url="http://prometheus:9090",
+            jobs=1,
+            query_timeout=0.2,
+        ).collect()
+
+        stats = result.live_queries
+        assert stats is not None
+        assert (stats.queries, stats.succeeded, stats.no_data) == (4, 1, 1)
+        assert (stats.failed, stats.timed_out, stats.deadline_exceeded) == (1, 1, 0)
+        assert stats.requests == 5
+        assert [(t.service, t.error) for t in stats.failures] == [
+            ("broken", "bad_data: parse error"),
+            ("slow", "TimeoutError"),
+        ]
+        assert stats.slowest[0].service == "slow"
+        assert result.to_dict()["live_queries"]["failed"] == 1
+
+    def test_deadline_leaves_slos_unknown(self, services_dir, provider):
+        result = PortfolioAggregator(
+            search_paths=[services_dir],
+            prometheus_url="http://prometheus:9090",
+            jobs=1,
+            deadline=0.2,
+        ).collect()
+
+        stats = result.live_queries
+        slow = next(svc for svc in result.services if svc.service == "slow")
+        assert stats.deadline_exceeded == 1
+        assert stats.duration_seconds < 2
+        assert slow.slos[0].status == HealthStatus.UNKNOWN
+
+    @pytest.mark.parametrize(
+        "result,status,no_data",
+        [
+            ([{"metric": {}, "value": [0, "0"]}], HealthStatus.EXHAUSTED, 0),
+            ([], HealthStatus.UNKNOWN, 1),
+        ],
+        ids=["zero", "empty"],
+    )
+    def test_zero_sli_is_data(self, tmp_path, result, status, no_data):
+        """Test a real SLI of 0 (total outage) is not counted as missing data."""
+        from nthlayer.providers.prometheus import PrometheusProvider
+
+        _write(tmp_path / "services" / "down.yaml", SERVICE.format(name="down"))
+        response = {"status": "success", "data": {"resultType": "vector", "result": result}}
+
+        with patch.object(PrometheusProvider, "query", AsyncMock(return_value=response)):
+            portfolio = PortfolioAggregator(
+                search_paths=[tmp_path / "services"],
+                prometheus_url="http://prometheus:9090",
+                jobs=1,
+            ).collect()
+
+        (slo,) = portfolio.services[0].slos
+        assert slo.status == status
+        assert slo.current_value == (0.0 if result else None)
+        assert portfolio.live_queries.no_data == no_data
+
+    def test_absent_without_prometheus(self, services_dir):
+        result = PortfolioAggregator(search_paths=[services_dir], jobs=1).collect()
+
+        assert result.live_queries is None
+        assert "live_queries" not in result.to_dict()
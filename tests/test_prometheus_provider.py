@@ -4,6 +4,7 @@ Tests for querying Prometheus metrics, SLI calculation,
 and error handling.
 """
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -168,6 +169,19 @@ class TestQuery:
             assert "time" in call_args.kwargs["params"]
             assert call_args.kwargs["params"]["time"] == query_time.timestamp()
 
+    @pytest.mark.asyncio
+    async def test_long_query_uses_post(self, prometheus_provider, mock_successful_response):
+        """Test that very long queries are sent as a form-encoded POST."""
+        with patch.object(prometheus_provider, "_request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_successful_response
+
+            long_query = " or ".join(["up"] * 2000)
+            await prometheus_provider.query(long_query)
+
+            mock_request.assert_called_once_with(
+                "POST", "/api/v1/query", data={"query": long_query}
+            )
+
 
 class TestQueryRange:
     """Tests for range query method."""
@@ -211,6 +225,80 @@ class TestQueryRange:
             assert call_args.kwargs["params"]["step"] == "1h"
 
 
+class TestQueryRangeSharding:
+    """Tests for automatic sharding of long range queries."""
+
+    @staticmethod
+    def _echo_range(method, path, params=None, **kwargs):
+        """Return one sample per step for the requested shard."""
+        params = params or kwargs["data"]
+        start, end = int(params["start"]), int(params["end"])
+        values = [[ts, "0.999"] for ts in range(start, end + 1, 300)]
+        return {
+            "status": "success",
+            "data": {"resultType": "matrix", "result": [{"metric": {}, "values": values}]},
+        }
+
+    @pytest.mark.asyncio
+    async def test_long_window_split_and_stitched(self, prometheus_provider):
+        """A 90d window at 5m exceeds 11,000 points and is sharded."""
+        with patch.object(
+            prometheus_provider, "_request", new=AsyncMock(side_effect=self._echo_range)
+        ) as mock_request:
+            start = datetime.fromtimestamp(0)
+            end = datetime.fromtimestamp(90 * 86400)
+
+            result = await prometheus_provider.query_range("up", start, end, step="5m")
+
+        assert mock_request.call_count == 3
+        values = result["data"]["result"][0]["values"]
+        timestamps = [v[0] for v in values]
+        assert len(values) == 90 * 288 + 1
+        assert timestamps == sorted(set(timestamps))
+
+    @pytest.mark.asyncio
+    async def test_shard_duration_configurable(self, monkeypatch):
+        """Shard duration can be set explicitly or via the environment."""
+        monkeypatch.setenv("NTHLAYER_QUERY_SHARD_DURATION", "1d")
+        provider = PrometheusProvider("http://prometheus:9090")
+
+        with patch.object(
+            provider, "_request", new=AsyncMock(side_effect=self._echo_range)
+        ) as mock_request:
+            start = datetime.fromtimestamp(0)
+            end = datetime.fromtimestamp(7 * 86400)
+
+            series = await provider.get_sli_time_series("up", start, end, step="5m")
+
+        assert mock_request.call_count == 8
+        assert len(series) == 7 * 288 + 1
+
+    @pytest.mark.asyncio
+    async def test_shard_concurrency_bounded(self):
+        """No more than shard_concurrency shards are in flight at once."""
+        provider = PrometheusProvider("http://prometheus:9090", shard_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def request(method, path, params=None, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return self._echo_range(method, path, params, **kwargs)
+
+        with patch.object(provider, "_request", new=AsyncMock(side_effect=request)):
+            await provider.query_range(
+                "up",
+                datetime.fromtimestamp(0),
+                datetime.fromtimestamp(365 * 86400),
+                step="5m",
+            )
+
+        assert peak == 2
+
+
 class TestGetSliValue:
     """Tests for get_sli_value method."""
 
@@ -342,7 +430,8 @@ class TestRequest:
         """Test that API errors are properly handled."""
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.is_closed = False
+            mock_client_class.return_value = mock_client
 
             mock_response = MagicMock()
             mock_response.json.return_value = mock_error_response
@@ -359,12 +448,33 @@ class TestRequest:
         """Test that HTTP errors are properly handled."""
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.is_closed = False
+            mock_client_class.return_value = mock_client
             mock_client.request.side_effect = httpx.HTTPError("Connection failed")
 
             with pytest.raises(PrometheusProviderError):
                 await prometheus_provider._request("GET", "/api/v1/query", params={})
 
+    @pytest.mark.asyncio
+    async def test_request_reuses_pooled_client(
+        self, prometheus_provider, mock_successful_response
+    ):
+        """Test that consecutive requests share one long-lived client."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.is_closed = False
+            mock_client_class.return_value = mock_client
+
+            mock_response = MagicMock()
+            mock_response.json.return_value = mock_successful_response
+            mock_client.request.return_value = mock_response
+
+            await prometheus_provider.query("up")
+            await prometheus_provider.query("up")
+
+            mock_client_class.assert_called_once()
+            assert mock_client.request.call_count == 2
+
 
 class TestParseStepToSeconds:
     """Tests for _parse_step_to_seconds helper."""
@@ -404,11 +514,63 @@ class TestResources:
         assert resources == []
 
 
+class TestConnectionPool:
+    """Tests for the pooled HTTP client."""
+
+    def test_client_created_lazily(self, prometheus_provider):
+        """Test that no client exists until the first request."""
+        assert prometheus_provider._client is None
+
+    def test_pool_limits_configurable(self):
+        """Test that pool limits are passed through to the client."""
+        provider = PrometheusProvider(
+            url="http://localhost:9090",
+            max_connections=5,
+            max_keepalive_connections=2,
+            keepalive_expiry=10.0,
+        )
+
+        client = provider._get_client()
+
+        pool = client._transport._pool
+        assert pool._max_connections == 5
+        assert pool._max_keepalive_connections == 2
+        assert pool._keepalive_expiry == 10.0
+
+    def test_http2_requires_h2(self):
+        """Test that HTTP/2 is only enabled when h2 is importable."""
+        with patch("nthlayer.providers.prometheus.H2_AVAILABLE", False):
+            provider = PrometheusProvider(url="http://localhost:9090", http2=True)
+        assert provider._http2 is False
+
+        with patch("nthlayer.providers.prometheus.H2_AVAILABLE", True):
+            provider = PrometheusProvider(url="http://localhost:9090", http2=True)
+        assert provider._http2 is True
+
+
 class TestAclose:
     """Tests for aclose method."""
 
     @pytest.mark.asyncio
-    async def test_aclose_returns_none(self, prometheus_provider):
-        """Test that aclose returns None (no cleanup needed)."""
+    async def test_aclose_without_client(self, prometheus_provider):
+        """Test that aclose is a no-op before any request."""
         result = await prometheus_provider.aclose()
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_aclose_releases_client(self, prometheus_provider):
+        """Test that aclose closes the pooled client."""
+        client = prometheus_provider._get_client()
+
+        await prometheus_provider.aclose()
+
+        assert client.is_closed
+        assert prometheus_provider._client is None
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_client(self):
+        """Test that leaving the async context closes the client."""
+        async with PrometheusProvider(url="http://localhost:9090") as provider:
+            client = provider._get_client()
+
+        assert client.is_closed
@@ -0,0 +1,305 @@
+"""Tests for batched Prometheus instant queries."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from nthlayer.providers.prometheus import PrometheusProviderError
+from nthlayer.providers.query_batch import (
+    BATCH_LABEL,
+    BatchSplitError,
+    DeadlineExceeded,
+    QueryBatcher,
+    RateLimiter,
+    build_batch_query,
+    can_merge,
+    split_batch_result,
+)
+
+
+def _vector(*series):
+    """Build a Prometheus vector response from (labels, value) pairs."""
+    return {
+        "status": "success",
+        "data": {
+            "resultType": "vector",
+            "result": [{"metric": labels, "value": [1609459200, v]} for labels, v in series],
+        },
+    }
+
+
+@pytest.fixture
+def provider():
+    mock = MagicMock()
+    mock.query = AsyncMock()
+    mock.get_sli_value = AsyncMock()
+    return mock
+
+
+class TestCanMerge:
+    """Tests for can_merge."""
+
+    def test_vector_expression(self):
+        assert can_merge('sum(rate(http_requests_total{code!~"5.."}[5m]))')
+        assert can_merge("(sum(good) / sum(total))")
+
+    def test_scalar_expressions(self):
+        assert not can_merge("1")
+        assert not can_merge("0.999")
+        assert not can_merge("scalar(sum(up))")
+        assert not can_merge("time()")
+
+    def test_range_vector(self):
+        assert not can_merge("up[5m]")
+        assert not can_merge("rate(up[5m])[1h:5m]")
+
+    def test_empty_or_already_tagged(self):
+        assert not can_merge("  ")
+        assert not can_merge(f'up{{{BATCH_LABEL}="0"}}')
+
+
+class TestBuildBatchQuery:
+    """Tests for build_batch_query."""
+
+    def test_tags_each_expression(self):
+        query = build_batch_query(["up", "sum(x) / sum(y)"])
+
+        assert query == (
+            f'label_replace((up), "{BATCH_LABEL}", "0", "", "")'
+            f' or label_replace((sum(x) / sum(y)), "{BATCH_LABEL}", "1", "", "")'
+        )
+
+
+class TestSplitBatchResult:
+    """Tests for split_batch_result."""
+
+    def test_splits_by_tag(self):
+        result = _vector(
+            ({BATCH_LABEL: "1"}, "0.5"),
+            ({BATCH_LABEL: "0"}, "0.999"),
+        )
+
+        assert split_batch_result(result, 2) == [0.999, 0.5]
+
+    def test_missing_tag_is_no_data(self):
+        result = _vector(({BATCH_LABEL: "0"}, "0.999"))
+
+        assert split_batch_result(result, 2) == [0.999, None]
+
+    def test_first_series_wins(self):
+        result = _vector(
+            ({BATCH_LABEL: "0", "instance": "a"}, "0.9"),
+            ({BATCH_LABEL: "0", "instance": "b"}, "0.1"),
+        )
+
+        assert split_batch_result(result, 1) == [0.9]
+
+    def test_untagged_series_raises(self):
+        result = _vector(({"job": "api"}, "0.999"))
+
+        with pytest.raises(BatchSplitError):
+            split_batch_result(result, 1)
+
+    def test_out_of_range_tag_raises(self):
+        result = _vector(({BATCH_LABEL: "5"}, "0.999"))
+
+        with pytest.raises(BatchSplitError):
+            split_batch_result(result, 2)
+
+
+class TestQueryBatcher:
+    """Tests for QueryBatcher.get_sli_values."""
+
+    @pytest.mark.asyncio
+    async def test_merges_into_one_request(self, provider):
+        provider.query.return_value = _vector(
+            ({BATCH_LABEL: "0"}, "0.99"),
+            ({BATCH_LABEL: "1"}, "0.98"),
+            ({BATCH_LABEL: "2"}, "0.97"),
+        )
+
+        values = await QueryBatcher(provider).get_sli_values({"a": "qa", "b": "qb", "c": "qc"})
+
+        assert values == {"a": 0.99, "b": 0.98, "c": 0.97}
+        provider.query.assert_called_once()
+        provider.get_sli_value.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_expressions(self, provider):
+        provider.get_sli_value.return_value = 0.999
+
+        values = await QueryBatcher(provider).get_sli_values({"a": "same", "b": "same"})
+
+        assert values == {"a": 0.999, "b": 0.999}
+        provider.get_sli_value.assert_called_once_with("same", None, missing=None)
+        provider.query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_respects_max_batch_size(self, provider):
+        async def query(expr, time=None, missing=0.0):
+            count = expr.count("label_replace")
+            return _vector(*(({BATCH_LABEL: str(i)}, "1") for i in range(count)))
+
+        provider.query.side_effect = query
+        provider.get_sli_value.return_value = 1.0
+        queries = {str(i): f"q{i}" for i in range(5)}
+
+        values = await QueryBatcher(provider, max_batch_size=2).get_sli_values(queries)
+
+        assert values == {str(i): 1.0 for i in range(5)}
+        # Two batches of two; the leftover single query is not wrapped
+        assert provider.query.call_count == 2
+        provider.get_sli_value.assert_called_once_with("q4", None, missing=None)
+
+    @pytest.mark.asyncio
+    async def test_unmergeable_queried_individually(self, provider):
+        provider.query.return_value = _vector(
+            ({BATCH_LABEL: "0"}, "0.9"),
+            ({BATCH_LABEL: "1"}, "0.8"),
+        )
+        provider.get_sli_value.return_value = 1.0
+
+        values = await QueryBatcher(provider).get_sli_values(
+            {"a": "qa", "b": "qb", "scalar": "scalar(sum(up))"}
+        )
+
+        assert values == {"a": 0.9, "b": 0.8, "scalar": 1.0}
+        provider.get_sli_value.assert_called_once_with("scalar(sum(up))", None, missing=None)
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_falls_back(self, provider):
+        provider.query.side_effect = PrometheusProviderError("bad_data: vector expected")
+        provider.get_sli_value.side_effect = [0.9, 0.8]
+
+        values = await QueryBatcher(provider).get_sli_values({"a": "qa", "b": "qb"})
+
+        assert values == {"a": 0.9, "b": 0.8}
+        assert provider.get_sli_value.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unsplittable_batch_falls_back(self, provider):
+        provider.query.return_value = _vector(({}, "0.5"))
+        provider.get_sli_value.side_effect = [0.9, 0.8]
+
+        values = await QueryBatcher(provider).get_sli_values({"a": "qa", "b": "qb"})
+
+        assert values == {"a": 0.9, "b": 0.8}
+
+    @pytest.mark.asyncio
+    async def test_individual_errors_are_captured(self, provider):
+        error = PrometheusProviderError("Connection refused")
+        provider.get_sli_value.side_effect = error
+
+        values = await QueryBatcher(provider).get_sli_values({"a": "up[5m]"})
+
+        assert values == {"a": error}
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_captured(self, provider):
+        async def slow(expr, time=None, missing=0.0):
+            await asyncio.sleep(5)
+
+        provider.get_sli_value.side_effect = slow
+
+        values = await QueryBatcher(provider, timeout=0.01).get_sli_values({"a": "qa"})
+
+        assert isinstance(values["a"], TimeoutError)
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self, provider):
+        assert await QueryBatcher(provider).get_sli_values({}) == {}
+        provider.query.assert_not_called()
+
+
+class TestQueryLimits:
+    """Tests for the rate limit, deadline and stats of QueryBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_spaces_requests(self):
+        loop = asyncio.get_running_loop()
+        limiter = RateLimiter(50)
+        starts = []
+
+        async def request():
+            await limiter.acquire()
+            starts.append(loop.time())
+
+        await asyncio.gather(*(request() for _ in range(5)))
+
+        gaps = [b - a for a, b in zip(starts, starts[1:], strict=False)]
+        assert min(gaps) >= 0.015
+
+    def test_rate_limit_must_be_positive(self):
+        with pytest.raises(ValueError, match="positive"):
+            RateLimiter(0)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_take_the_slowest_time(self, provider):
+        async def slow(expr, time=None, missing=0.0):
+            await asyncio.sleep(0.1)
+            return 1.0
+
+        provider.get_sli_value.side_effect = slow
+        queries = {str(i): f"q{i}[5m]" for i in range(8)}
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        batcher = QueryBatcher(provider, concurrency=8)
+        values = await batcher.get_sli_values(queries)
+
+        assert loop.time() - start < 0.5
+        assert values == dict.fromkeys(queries, 1.0)
+        assert batcher.stats.requests == 8
+        assert all(s >= 0.09 for s in batcher.stats.query_seconds.values())
+
+    @pytest.mark.asyncio
+    async def test_deadline_bounds_the_whole_call(self, provider):
+        async def query(expr, time=None, missing=0.0):
+            await asyncio.sleep(0.02 if expr == "fast[5m]" else 5)
+            return 1.0
+
+        provider.get_sli_value.side_effect = query
+        batcher = QueryBatcher(provider, concurrency=1, deadline=0.2)
+
+        values = await batcher.get_sli_values(
+            {"fast": "fast[5m]", "slow": "slow[5m]", "queued": "queued[5m]"}
+        )
+
+        assert values["fast"] == 1.0
+        assert isinstance(values["slow"], DeadlineExceeded)
+        assert isinstance(values["queued"], DeadlineExceeded)
+        # The queued query was never sent
+        assert batcher.stats.requests == 2
+        assert set(batcher.stats.query_seconds) == {"fast", "slow"}
+
+    @pytest.mark.asyncio
+    async def test_timed_out_batch_is_not_retried(self, provider):
+        async def query(expr, time=None, missing=0.0):
+            # One sub-expression hangs, stalling the whole merged request
+            await asyncio.sleep(5)
+
+        provider.query.side_effect = query
+        batcher = QueryBatcher(provider, timeout=0.05)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        values = await batcher.get_sli_values({"a": "qa", "b": "qb", "hang": "qhang"})
+
+        assert loop.time() - start < 0.5
+        assert all(isinstance(v, TimeoutError) for v in values.values())
+        assert batcher.stats.requests == 1
+        assert batcher.stats.fallbacks == 0
+        provider.get_sli_value.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_stats(self, provider):
+        provider.query.side_effect = PrometheusProviderError("bad_data: vector expected")
+        provider.get_sli_value.side_effect = [0.9, 0.8]
+        batcher = QueryBatcher(provider)
+
+        await batcher.get_sli_values({"a": "qa", "b": "qb"})
+
+        assert batcher.stats.batches == 1
+        assert batcher.stats.fallbacks == 1
+        assert batcher.stats.requests == 3
+        assert set(batcher.stats.query_seconds) == {"a", "b"}
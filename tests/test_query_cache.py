@@ -0,0 +1,270 @@
+"""Tests for the Prometheus query-result cache."""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from nthlayer.providers import query_cache
+from nthlayer.providers.prometheus import PrometheusProvider, PrometheusProviderError
+from nthlayer.providers.query_cache import (
+    QUERY_CACHE_ENV,
+    QueryCache,
+    align_range,
+    classify_query,
+    disable_query_cache,
+    get_query_cache,
+    reset_query_cache,
+)
+
+SUCCESS = {"status": "success", "data": {"resultType": "vector", "result": []}}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_process_cache(monkeypatch):
+    monkeypatch.delenv(QUERY_CACHE_ENV, raising=False)
+    reset_query_cache()
+    yield
+    reset_query_cache()
+
+
+class TestClassifyQuery:
+    """Tests for classify_query."""
+
+    def test_instant_now(self):
+        assert classify_query({"query": "up"}) == "instant"
+
+    def test_recent_range(self):
+        now = time.time()
+        assert classify_query({"query": "up", "start": now - 600, "end": now}, now) == "range"
+
+    def test_past_queries_are_historical(self):
+        now = time.time()
+        past = now - 2 * 86400
+
+        assert classify_query({"query": "up", "time": past}, now) == "historical"
+        assert classify_query({"query": "up", "start": past - 600, "end": past}, now) == (
+            "historical"
+        )
+
+
+class TestAlignRange:
+    """Tests for align_range."""
+
+    def test_snaps_to_step(self):
+        assert align_range(1000.0, 4000.0, 300.0) == (900.0, 3900.0)
+
+    def test_runs_within_one_step_align_equally(self):
+        assert align_range(1210.0, 4310.0, 300.0) == align_range(1299.0, 4399.0, 300.0)
+
+    def test_zero_step_unchanged(self):
+        assert align_range(1000.5, 4000.5, 0) == (1000.5, 4000.5)
+
+
+class TestQueryCache:
+    """Tests for the QueryCache tiers and counters."""
+
+    def test_miss_then_hit(self):
+        cache = QueryCache()
+        key = cache.make_key("ns", "/api/v1/query", {"query": "up"})
+
+        assert cache.get(key) is None
+        cache.set(key, SUCCESS)
+        assert cache.get(key) == SUCCESS
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_key_ignores_param_order_but_not_namespace(self):
+        a = QueryCache.make_key("ns", "/p", {"query": "up", "time": 1})
+        b = QueryCache.make_key("ns", "/p", {"time": 1, "query": "up"})
+        c = QueryCache.make_key("other", "/p", {"query": "up", "time": 1})
+
+        assert a == b
+        assert a != c
+
+    def test_entries_expire_per_class(self):
+        now = [1000.0]
+        cache = QueryCache(ttls={"instant": 10.0, "range": 60.0}, timer=lambda: now[0])
+        cache.set("instant", SUCCESS, "instant")
+        cache.set("range", SUCCESS, "range")
+
+        now[0] += 11
+
+        assert cache.get("instant") is None
+        assert cache.get("range") == SUCCESS
+
+    def test_zero_ttl_is_not_stored(self):
+        cache = QueryCache(ttls={"instant": 0})
+        cache.set("k", SUCCESS, "instant")
+
+        assert cache.stats().entries == 0
+
+    def test_lru_eviction(self):
+        cache = QueryCache(max_entries=2)
+        cache.set("a", SUCCESS)
+        cache.set("b", SUCCESS)
+        cache.get("a")
+        cache.set("c", SUCCESS)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == SUCCESS
+
+    def test_disk_tier_survives_new_process(self, tmp_path):
+        path = tmp_path / "cache" / "query-cache.sqlite"
+        first = QueryCache(disk_path=path)
+        first.set("k", SUCCESS, "range")
+        first.close()
+
+        second = QueryCache(disk_path=path)
+        assert second.get("k") == SUCCESS
+        assert second.get("k") == SUCCESS
+        stats = second.stats()
+        assert (stats.hits, stats.disk_hits) == (2, 1)
+        second.close()
+
+    def test_unusable_disk_path_falls_back_to_memory(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = QueryCache(disk_path=blocker / "query-cache.sqlite")
+
+        cache.set("k", SUCCESS)
+
+        assert cache.get("k") == SUCCESS
+
+    def test_clear(self, tmp_path):
+        cache = QueryCache(disk_path=tmp_path / "c.sqlite")
+        cache.set("k", SUCCESS)
+        cache.clear()
+
+        assert cache.get("k") is None
+        cache.close()
+
+
+class TestProcessCache:
+    """Tests for the process-wide cache switches."""
+
+    def test_memory_by_default(self):
+        cache = get_query_cache()
+
+        assert cache is not None
+        assert cache is get_query_cache()
+
+    def test_env_off(self, monkeypatch):
+        monkeypatch.setenv(QUERY_CACHE_ENV, "off")
+
+        assert get_query_cache() is None
+
+    def test_env_disk(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(QUERY_CACHE_ENV, "disk")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        get_query_cache().set("k", SUCCESS)
+
+        assert (tmp_path / "nthlayer" / "query-cache.sqlite").exists()
+
+    def test_disable(self):
+        disable_query_cache()
+
+        assert get_query_cache() is None
+
+    @pytest.mark.parametrize(
+        "module,handler",
+        [
+            ("nthlayer.cli.drift", "handle_drift_command"),
+            ("nthlayer.cli.portfolio", "handle_portfolio_command"),
+            ("nthlayer.cli.scorecard", "handle_scorecard_command"),
+        ],
+    )
+    def test_no_cache_flag(self, module, handler):
+        import importlib
+
+        cli = importlib.import_module(module)
+        command = handler.replace("handle_", "")
+        args = argparse.Namespace(no_cache=True, service_file="svc.yaml")
+
+        with patch.object(cli, command, return_value=0):
+            getattr(cli, handler)(args)
+
+        assert query_cache._query_cache_disabled
+
+
+class TestProviderCaching:
+    """Tests for PrometheusProvider with a cache attached."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_served_from_cache(self):
+        cache = QueryCache()
+        provider = PrometheusProvider("http://prometheus:9090", cache=cache)
+
+        with patch.object(provider, "_request", new=AsyncMock(return_value=SUCCESS)) as request:
+            await provider.query("up")
+            result = await provider.query("up")
+
+        assert result == SUCCESS
+        request.assert_called_once()
+        assert cache.stats().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_shared_between_providers(self):
+        cache = QueryCache()
+        first = PrometheusProvider("http://prometheus:9090", cache=cache)
+        second = PrometheusProvider("http://prometheus:9090/", cache=cache)
+        other = PrometheusProvider("http://other:9090", cache=cache)
+
+        with patch.object(first, "_request", new=AsyncMock(return_value=SUCCESS)):
+            await first.query("up")
+        with patch.object(second, "_request", new=AsyncMock()) as second_request:
+            await second.query("up")
+        with patch.object(other, "_request", new=AsyncMock(return_value=SUCCESS)) as other_req:
+            await other.query("up")
+
+        second_request.assert_not_called()
+        other_req.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_range_aligned_and_reused_within_step(self):
+        cache = QueryCache()
+        provider = PrometheusProvider("http://prometheus:9090", cache=cache)
+        end = datetime.fromtimestamp(3600 * 1000 + 120)
+
+        with patch.object(provider, "_request", new=AsyncMock(return_value=SUCCESS)) as request:
+            await provider.query_range("up", end - timedelta(days=1), end, step="1h")
+            await provider.query_range(
+                "up",
+                end - timedelta(days=1) + timedelta(minutes=5),
+                end + timedelta(minutes=5),
+                step="1h",
+            )
+
+        request.assert_called_once()
+        params = request.call_args.kwargs["params"]
+        assert params["start"] % 3600 == 0
+        assert params["end"] % 3600 == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self):
+        cache = QueryCache()
+        provider = PrometheusProvider("http://prometheus:9090", cache=cache)
+        failing = AsyncMock(side_effect=[PrometheusProviderError("boom"), SUCCESS])
+
+        with patch.object(provider, "_request", new=failing):
+            with pytest.raises(PrometheusProviderError):
+                await provider.query("up")
+            assert await provider.query("up") == SUCCESS
+
+        assert failing.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_no_cache_by_default(self):
+        provider = PrometheusProvider("http://prometheus:9090")
+        end = datetime.fromtimestamp(3600 * 1000 + 120)
+
+        with patch.object(provider, "_request", new=AsyncMock(return_value=SUCCESS)) as request:
+            await provider.query_range("up", end - timedelta(hours=1), end, step="1h")
+            await provider.query_range("up", end - timedelta(hours=1), end, step="1h")
+
+        assert request.call_count == 2
+        assert request.call_args.kwargs["params"]["end"] == end.timestamp()
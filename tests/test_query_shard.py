@@ -0,0 +1,120 @@
+"""Tests for range-query sharding."""
+
+from itertools import pairwise
+
+from nthlayer.providers.query_shard import (
+    MAX_POINTS_PER_QUERY,
+    merge_range_results,
+    plan_shards,
+)
+
+
+def _matrix(*series, warnings=None):
+    """Build a Prometheus matrix response from (labels, [(ts, value), ...]) pairs."""
+    response = {
+        "status": "success",
+        "data": {
+            "resultType": "matrix",
+            "result": [
+                {"metric": labels, "values": [[ts, str(v)] for ts, v in values]}
+                for labels, values in series
+            ],
+        },
+    }
+    if warnings:
+        response["warnings"] = warnings
+    return response
+
+
+def _points(shards, step):
+    return sum(int((end - start) // step) + 1 for start, end in shards)
+
+
+class TestPlanShards:
+    """Tests for plan_shards."""
+
+    def test_short_range_single_shard(self):
+        assert plan_shards(0, 3600, 300) == [(0, 3600)]
+
+    def test_ninety_days_at_five_minutes_respects_point_limit(self):
+        step = 300
+        end = 90 * 86400.0
+        shards = plan_shards(0, end, step)
+
+        assert len(shards) == 3
+        assert all((e - s) / step + 1 <= MAX_POINTS_PER_QUERY for s, e in shards)
+        # Contiguous on the step grid: no gaps, no overlaps
+        assert shards[0][0] == 0 and shards[-1][1] == end
+        for (_, prev_end), (next_start, _) in pairwise(shards):
+            assert next_start - prev_end == step
+        assert _points(shards, step) == end / step + 1
+
+    def test_shard_duration_limits_span(self):
+        shards = plan_shards(0, 30 * 86400.0, 3600, shard_seconds=7 * 86400)
+
+        assert len(shards) == 5
+        assert all(e - s <= 7 * 86400 - 3600 for s, e in shards)
+
+    def test_boundaries_stable_across_runs(self):
+        step = 300
+        first = plan_shards(1000 * step, 5000 * step, step, max_points=1000)
+        later = plan_shards(1200 * step, 5200 * step, step, max_points=1000)
+
+        # Interior shards sit on the same span multiples
+        assert (2000 * step, 2999 * step) in first
+        assert (2000 * step, 2999 * step) in later
+
+    def test_unaligned_start_keeps_step_phase(self):
+        shards = plan_shards(100, 100 + 300 * 20, 300, max_points=10)
+
+        assert all((s - 100) % 300 == 0 for s, _ in shards)
+        assert _points(shards, 300) == 21
+
+    def test_degenerate_inputs(self):
+        assert plan_shards(10, 10, 300) == [(10, 10)]
+        assert plan_shards(0, 86400, 0) == [(0, 86400)]
+
+
+class TestMergeRangeResults:
+    """Tests for merge_range_results."""
+
+    def test_concatenates_series_in_order(self):
+        merged = merge_range_results(
+            [
+                _matrix(({"job": "api"}, [(0, 1), (300, 2)])),
+                _matrix(({"job": "api"}, [(600, 3)]), ({"job": "db"}, [(600, 9)])),
+            ]
+        )
+
+        result = merged["data"]["result"]
+        assert merged["status"] == "success"
+        assert merged["data"]["resultType"] == "matrix"
+        assert [s["metric"] for s in result] == [{"job": "api"}, {"job": "db"}]
+        assert result[0]["values"] == [[0, "1"], [300, "2"], [600, "3"]]
+
+    def test_deduplicates_boundary_samples(self):
+        merged = merge_range_results(
+            [
+                _matrix(({"job": "api"}, [(0, 1), (300, 2)])),
+                _matrix(({"job": "api"}, [(300, 5), (600, 3)])),
+            ]
+        )
+
+        assert merged["data"]["result"][0]["values"] == [[0, "1"], [300, "2"], [600, "3"]]
+
+    def test_out_of_order_shards_sorted(self):
+        merged = merge_range_results(
+            [
+                _matrix(({}, [(600, 3)])),
+                _matrix(({}, [(0, 1)])),
+            ]
+        )
+
+        assert merged["data"]["result"][0]["values"] == [[0, "1"], [600, "3"]]
+
+    def test_keeps_warnings_once(self):
+        merged = merge_range_results(
+            [_matrix(warnings=["partial data"]), _matrix(warnings=["partial data"])]
+        )
+
+        assert merged["warnings"] == ["partial data"]
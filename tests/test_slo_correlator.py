@@ -15,6 +15,7 @@ from nthlayer.slos.correlator import (
     CorrelationResult,
     CorrelationWindow,
     DeploymentCorrelator,
+    window_burn_rates,
 )
 from nthlayer.slos.deployment import Deployment
 from nthlayer.slos.models import SLO, TimeWindow, TimeWindowType
@@ -57,6 +58,8 @@ def mock_repository():
     repo.get_recent_deployments = AsyncMock()
     repo.get_slos_by_service = AsyncMock()
     repo.update_deployment_correlation = AsyncMock()
+    repo.get_burn_history = AsyncMock(return_value=[])
+    repo.update_deployment_correlations = AsyncMock()
     return repo
 
 
@@ -248,7 +251,7 @@ class TestCorrelateService:
             0.03,  # after
         ]
 
-        results = await correlator.correlate_service("payment-api", lookback_hours=24)
+        results = await correlator.correlate_service("payment-api", lookback_hours=24, batch=False)
 
         assert len(results) >= 0  # May be filtered by confidence
 
@@ -301,7 +304,7 @@ class TestCorrelateService:
             0.01,  # deploy-2
         ]
 
-        results = await correlator.correlate_service("payment-api", lookback_hours=24)
+        results = await correlator.correlate_service("payment-api", lookback_hours=24, batch=False)
 
         # Results should be sorted by confidence (highest first)
         if len(results) > 1:
@@ -318,9 +321,127 @@ class TestCorrelateService:
         mock_repository.get_burn_rate_window.side_effect = Exception("DB error")
 
         # Should not raise, should return empty or partial results
+        results = await correlator.correlate_service("payment-api", batch=False)
+
+        assert results == []
+
+
+class TestWindowBurnRates:
+    """Tests for the two-pointer burn rate sweep."""
+
+    def test_matches_window_semantics(self):
+        t0 = datetime(2024, 1, 1)
+        samples = [
+            (t0 + timedelta(minutes=m), burned)
+            for m, burned in [(0, 1.0), (10, 2.0), (20, 4.0), (30, 8.0), (40, 16.0)]
+        ]
+        windows = [
+            (t0 - timedelta(minutes=30), t0),  # one sample: no burn
+            (t0, t0 + timedelta(minutes=20)),  # 1.0 -> 4.0
+            (t0 + timedelta(minutes=5), t0 + timedelta(minutes=35)),  # 2.0 -> 8.0
+            (t0 + timedelta(minutes=41), t0 + timedelta(minutes=60)),  # no samples
+        ]
+
+        rates = window_burn_rates(samples, windows)
+
+        assert rates == pytest.approx([0.0, 3.0 / 20, 6.0 / 30, 0.0])
+
+    def test_zero_length_window(self):
+        t0 = datetime(2024, 1, 1)
+
+        assert window_burn_rates([(t0, 1.0)], [(t0, t0)]) == [0.0]
+
+    def test_empty_samples(self):
+        t0 = datetime(2024, 1, 1)
+
+        assert window_burn_rates([], [(t0, t0 + timedelta(hours=1))]) == [0.0]
+
+
+class TestCorrelateServiceBatch:
+    """Tests for batch correlation of a service."""
+
+    @staticmethod
+    def _deployments(t0, offsets_hours):
+        return [
+            Deployment(
+                id=f"deploy-{i}",
+                service="payment-api",
+                environment="production",
+                deployed_at=t0 + timedelta(hours=h),
+                commit_sha=f"sha{i}",
+            )
+            for i, h in enumerate(offsets_hours)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_one_history_query_and_one_bulk_update(
+        self, correlator, mock_repository, sample_slo
+    ):
+        t0 = datetime(2024, 1, 1)
+        # Newest first, as returned by get_recent_deployments
+        deployments = self._deployments(t0, [6, 3, 0])
+        # Flat budget, then 20 minutes burned within two hours of the 3h deploy
+        mock_repository.get_burn_history.return_value = [
+            (t0 - timedelta(minutes=30), 1.0),
+            (t0 + timedelta(hours=2, minutes=30), 1.0),
+            (t0 + timedelta(hours=3), 1.0),
+            (t0 + timedelta(hours=5), 21.0),
+            (t0 + timedelta(hours=8), 21.0),
+        ]
+        mock_repository.get_recent_deployments.return_value = deployments
+        mock_repository.get_slos_by_service.return_value = [sample_slo]
+
+        results = await correlator.correlate_service("payment-api")
+
+        mock_repository.get_burn_history.assert_called_once_with(
+            slo_id=sample_slo.id,
+            start_time=t0 - timedelta(minutes=30),
+            end_time=t0 + timedelta(hours=8),
+        )
+        mock_repository.get_burn_rate_window.assert_not_called()
+        mock_repository.update_deployment_correlation.assert_not_called()
+
+        assert results[0].deployment_id == "deploy-1"
+        assert results[0].burn_minutes == pytest.approx(20.0)
+        assert results[0].confidence >= HIGH_CONFIDENCE
+        mock_repository.update_deployment_correlations.assert_called_once()
+        (updates,) = mock_repository.update_deployment_correlations.call_args.args
+        assert {u[0] for u in updates} == {"deploy-0", "deploy-1", "deploy-2"}
+
+    @pytest.mark.asyncio
+    async def test_matches_sequential_results(self, mock_repository, sample_slo):
+        t0 = datetime(2024, 1, 1)
+        samples = [(t0 + timedelta(minutes=10 * i), float(i * i) / 10) for i in range(60)]
+        deployments = self._deployments(t0, [1, 2.5, 4, 7])
+
+        async def burn_rate_window(slo_id, start_time, end_time):
+            return window_burn_rates(samples, [(start_time, end_time)])[0]
+
+        mock_repository.get_burn_history.return_value = samples
+        mock_repository.get_burn_rate_window.side_effect = burn_rate_window
+        mock_repository.get_recent_deployments.return_value = deployments
+        mock_repository.get_slos_by_service.return_value = [sample_slo]
+
+        correlator = DeploymentCorrelator(mock_repository)
+        batch = await correlator.correlate_service("payment-api")
+        sequential = await correlator.correlate_service("payment-api", batch=False)
+
+        assert [(r.deployment_id, r.confidence) for r in batch] == [
+            (r.deployment_id, pytest.approx(r.confidence)) for r in sequential
+        ]
+
+    @pytest.mark.asyncio
+    async def test_history_error_skips_slo(
+        self, correlator, mock_repository, sample_deployment, sample_slo
+    ):
+        mock_repository.get_recent_deployments.return_value = [sample_deployment]
+        mock_repository.get_slos_by_service.return_value = [sample_slo]
+        mock_repository.get_burn_history.side_effect = Exception("DB error")
+
         results = await correlator.correlate_service("payment-api")
 
         assert results == []
+        mock_repository.update_deployment_correlations.assert_called_once_with([])
 
 
 class TestBurnRateScoreCalculation:
@@ -8,14 +8,17 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from nthlayer.db.models import Base, ErrorBudgetModel
 from nthlayer.slos.models import (
     SLO,
+    BurnBucket,
     ErrorBudget,
     SLOStatus,
     TimeWindow,
     TimeWindowType,
 )
-from nthlayer.slos.storage import SLORepository
+from nthlayer.slos.storage import SLORepository, select_history_resolution
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 
 @pytest.fixture
@@ -63,6 +66,7 @@ def mock_session():
     session.execute = AsyncMock()
     session.delete = AsyncMock()
     session.flush = AsyncMock()
+    session.add_all = MagicMock()
     return session
 
 
@@ -101,6 +105,7 @@ def mock_error_budget_model():
     model.slo_breach_burn_minutes = 2.0
     model.status = "warning"
     model.burn_rate = 0.35
+    model.evaluated_through = datetime(2024, 1, 15, 11, 55, tzinfo=timezone.utc)
     model.updated_at = datetime(2024, 1, 15, tzinfo=timezone.utc)
     return model
 
@@ -299,6 +304,7 @@ class TestErrorBudget:
         assert budget is not None
         assert budget.slo_id == "slo-test-001"
         assert budget.burned_minutes == 10.5
+        assert budget.evaluated_through == datetime(2024, 1, 15, 11, 55, tzinfo=timezone.utc)
 
     @pytest.mark.asyncio
     async def test_get_current_error_budget_not_found(self, mock_session):
@@ -362,6 +368,223 @@ class TestSLOMeasurement:
         assert history[0]["compliant"] is True
 
 
+class TestBurnBuckets:
+    """Tests for persisted burn buckets."""
+
+    @pytest.mark.asyncio
+    async def test_get_burn_buckets(self, mock_session):
+        model = MagicMock()
+        model.timestamp = datetime(2024, 1, 15, 12, 0)
+        model.budget_burn_minutes = 0.06
+        model.sli_value = 0.999
+        model.extra_data = {"duration_seconds": 3600.0}
+
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [model]
+        mock_session.execute.return_value = mock_result
+
+        repo = SLORepository(mock_session)
+        buckets = await repo.get_burn_buckets("slo-test-001", since=datetime(2024, 1, 1))
+
+        assert buckets == [BurnBucket(datetime(2024, 1, 15, 12, 0), 0.06, 0.999, 3600.0)]
+
+    @pytest.mark.asyncio
+    async def test_save_rollups_merges_inserts_and_prunes(self, mock_session, sample_slo):
+        existing = MagicMock()
+        existing.resolution = "1h"
+        existing.timestamp = datetime(2024, 1, 15, 11, 0)
+        existing.budget_burn_minutes = 0.25
+        existing.sli_value = 1.0
+        existing.extra_data = {
+            "duration_seconds": 1800.0,
+            "min": 1.0,
+            "max": 1.0,
+            "good": 6,
+            "total": 6,
+        }
+
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [existing]
+        mock_session.execute.return_value = mock_result
+
+        repo = SLORepository(mock_session)
+        await repo.save_rollups(
+            sample_slo,
+            {
+                "1h": [BurnBucket(datetime(2024, 1, 15, 11, 0), 0.5, 0.9, 1800.0, 0.9, 0.9, 0, 6)],
+                "1d": [BurnBucket(datetime(2024, 1, 15), 0.5, 0.9, 1800.0, 0.9, 0.9, 0, 6)],
+            },
+            period_start=datetime(2023, 12, 16, 12, 0),
+            period_end=datetime(2024, 1, 15, 12, 0),
+        )
+
+        # Existing 1h row merged in place
+        assert existing.budget_burn_minutes == 0.75
+        assert existing.sli_value == pytest.approx(0.95)
+        assert existing.extra_data["min"] == 0.9
+        assert existing.extra_data["total"] == 12
+        # New 1d row inserted in one bulk add
+        mock_session.add_all.assert_called_once()
+        (added,) = mock_session.add_all.call_args.args[0]
+        assert added.resolution == "1d"
+        assert added.extra_data["good"] == 0
+        # One lookup and one delete of expired rows
+        assert mock_session.execute.call_count == 2
+        mock_session.flush.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_save_rollups_replace_overwrites(self, mock_session, sample_slo):
+        existing = MagicMock()
+        existing.resolution = "1h"
+        existing.timestamp = datetime(2024, 1, 15, 11, 0)
+        existing.budget_burn_minutes = 0.25
+
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [existing]
+        mock_session.execute.return_value = mock_result
+
+        repo = SLORepository(mock_session)
+        await repo.save_rollups(
+            sample_slo,
+            {"1h": [BurnBucket(datetime(2024, 1, 15, 11, 0), 0.5, 0.9, 1800.0)]},
+            period_start=datetime(2023, 12, 16, 12, 0),
+            period_end=datetime(2024, 1, 15, 12, 0),
+            replace=True,
+        )
+
+        assert existing.budget_burn_minutes == 0.5
+        mock_session.add_all.assert_called_once_with([])
+
+    @pytest.mark.asyncio
+    async def test_save_rollups_drops_buckets_past_retention(self, mock_session, sample_slo):
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        period_end = datetime(2024, 1, 31)
+        repo = SLORepository(mock_session)
+        await repo.save_rollups(
+            sample_slo,
+            {
+                "5m": [
+                    BurnBucket(period_end - timedelta(days=20), 0.1, 0.99, 300.0),
+                    BurnBucket(period_end - timedelta(days=1), 0.1, 0.99, 300.0),
+                ],
+                "1h": [BurnBucket(period_end - timedelta(days=20), 0.1, 0.99, 3600.0)],
+            },
+            period_start=period_end - timedelta(days=30),
+            period_end=period_end,
+        )
+
+        added = mock_session.add_all.call_args.args[0]
+        assert sorted((m.resolution, m.timestamp) for m in added) == [
+            ("1h", period_end - timedelta(days=20)),
+            ("5m", period_end - timedelta(days=1)),
+        ]
+
+
+class TestHistoryResolution:
+    """Tests for picking the rollup that serves a history query."""
+
+    @pytest.mark.parametrize(
+        "span,expected",
+        [
+            (timedelta(days=90), "1d"),
+            (timedelta(days=30), "1d"),
+            (timedelta(days=7), "1h"),
+            (timedelta(days=1), "1h"),
+            (timedelta(hours=6), "5m"),
+            (timedelta(minutes=30), "5m"),
+        ],
+    )
+    def test_select_history_resolution(self, span, expected):
+        end = datetime(2024, 1, 31)
+
+        assert select_history_resolution(end - span, end, now=end) == expected
+
+    @pytest.mark.parametrize(
+        "age,expected",
+        [
+            (timedelta(days=14), "1h"),
+            (timedelta(days=120), "1d"),
+            (timedelta(days=1000), "1d"),
+        ],
+    )
+    def test_select_history_resolution_skips_pruned_rollups(self, age, expected):
+        now = datetime(2024, 1, 31)
+        start = now - age
+
+        assert select_history_resolution(start, start + timedelta(hours=6), now=now) == expected
+
+    @pytest.mark.asyncio
+    async def test_get_slo_history_falls_back_to_coarser_rollup(self, mock_session):
+        row = MagicMock()
+        row.timestamp = datetime(2024, 1, 15)
+        row.resolution = "1d"
+        row.sli_value = 0.999
+        row.extra_data = None
+
+        empty, daily = MagicMock(), MagicMock()
+        empty.scalars.return_value.all.return_value = []
+        daily.scalars.return_value.all.return_value = [row]
+        mock_session.execute.side_effect = [empty, daily]
+
+        repo = SLORepository(mock_session)
+        history = await repo.get_slo_history(
+            "slo-test-001", datetime(2024, 1, 15), datetime(2024, 1, 15, 6), resolution="1h"
+        )
+
+        assert mock_session.execute.call_count == 2
+        assert [h["resolution"] for h in history] == ["1d"]
+
+    @pytest.mark.asyncio
+    async def test_get_slo_history_from_rollup(self, mock_session):
+        row = MagicMock()
+        row.timestamp = datetime(2024, 1, 15)
+        row.resolution = "1d"
+        row.sli_value = 0.999
+        row.target_value = 0.99
+        row.compliant = True
+        row.budget_burn_minutes = 1.44
+        row.extra_data = {"min": 0.98, "max": 1.0, "good": 280, "total": 288}
+
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [row]
+        mock_session.execute.return_value = mock_result
+
+        repo = SLORepository(mock_session)
+        history = await repo.get_slo_history(
+            "slo-test-001", datetime(2024, 1, 1), datetime(2024, 1, 31)
+        )
+
+        assert mock_session.execute.call_count == 1
+        assert history[0]["resolution"] == "1d"
+        assert history[0]["min_value"] == 0.98
+        assert history[0]["good_count"] == 280
+        assert history[0]["total_count"] == 288
+
+    @pytest.mark.asyncio
+    async def test_get_slo_history_falls_back_to_raw(self, mock_session):
+        row = MagicMock()
+        row.timestamp = datetime(2024, 1, 15)
+        row.resolution = None
+        row.sli_value = 0.999
+        row.extra_data = None
+
+        empty, raw = MagicMock(), MagicMock()
+        empty.scalars.return_value.all.return_value = []
+        raw.scalars.return_value.all.return_value = [row]
+        mock_session.execute.side_effect = [empty, raw]
+
+        repo = SLORepository(mock_session)
+        history = await repo.get_slo_history(
+            "slo-test-001", datetime(2024, 1, 1), datetime(2024, 1, 31)
+        )
+
+        assert [h["sli_value"] for h in history] == [0.999]
+        assert "resolution" not in history[0]
+
+
 class TestDeployment:
     """Tests for deployment operations."""
 
@@ -541,16 +764,8 @@ class TestBurnRateWindow:
     @pytest.mark.asyncio
     async def test_get_burn_rate_window(self, mock_session):
         """Test calculating burn rate in a window."""
-        oldest_budget = MagicMock()
-        oldest_budget.burned_minutes = 5.0
-        oldest_budget.updated_at = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
-
-        latest_budget = MagicMock()
-        latest_budget.burned_minutes = 15.0
-        latest_budget.updated_at = datetime(2024, 1, 1, 1, 0, tzinfo=timezone.utc)
-
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [oldest_budget, latest_budget]
+        mock_result.one.return_value = (5.0, 15.0)
         mock_session.execute.return_value = mock_result
 
         repo = SLORepository(mock_session)
@@ -562,12 +777,17 @@ class TestBurnRateWindow:
 
         # Burn of 10 minutes over 60 minutes = 1/6 per minute
         assert burn_rate == pytest.approx(10.0 / 60.0)
+        # Earliest and latest are fetched in a single statement
+        mock_session.execute.assert_called_once()
+        sql = str(mock_session.execute.call_args.args[0])
+        assert sql.count("ORDER BY error_budgets.updated_at") == 2
+        assert "LIMIT" in sql
 
     @pytest.mark.asyncio
     async def test_get_burn_rate_window_empty(self, mock_session):
         """Test burn rate with no budget data."""
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.one.return_value = (None, None)
         mock_session.execute.return_value = mock_result
 
         repo = SLORepository(mock_session)
@@ -582,12 +802,8 @@ class TestBurnRateWindow:
     @pytest.mark.asyncio
     async def test_get_burn_rate_window_zero_duration(self, mock_session):
         """Test burn rate with zero duration window."""
-        budget = MagicMock()
-        budget.burned_minutes = 10.0
-        budget.updated_at = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
-
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [budget]
+        mock_result.one.return_value = (10.0, 10.0)
         mock_session.execute.return_value = mock_result
 
         repo = SLORepository(mock_session)
@@ -600,6 +816,96 @@ class TestBurnRateWindow:
 
         assert burn_rate == 0.0
 
+    @pytest.mark.asyncio
+    async def test_get_burn_rate_window_sqlite(self, sample_slo):
+        """Test the earliest/latest lookup against a real database."""
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            repo = SLORepository(session)
+            await repo.create_slo(sample_slo)
+            start = datetime(2024, 1, 1)
+            # Inserted out of order; burn before and after the window is ignored
+            for minutes, burned in [(30, 9.0), (-10, 1.0), (0, 3.0), (70, 50.0), (60, 15.0)]:
+                session.add(
+                    ErrorBudgetModel(
+                        slo_id=sample_slo.id,
+                        service=sample_slo.service,
+                        period_start=start,
+                        period_end=start,
+                        total_budget_minutes=21.6,
+                        burned_minutes=burned,
+                        remaining_minutes=0.0,
+                        status="healthy",
+                        updated_at=start + timedelta(minutes=minutes),
+                    )
+                )
+            await session.flush()
+
+            burn_rate = await repo.get_burn_rate_window(
+                sample_slo.id, start, start + timedelta(minutes=60)
+            )
+            empty = await repo.get_burn_rate_window(
+                "other-slo", start, start + timedelta(minutes=60)
+            )
+
+        await engine.dispose()
+
+        assert burn_rate == pytest.approx(12.0 / 60.0)
+        assert empty == 0.0
+
+    @pytest.mark.asyncio
+    async def test_get_burn_history_and_bulk_correlation_sqlite(self, sample_slo):
+        """Test the batch correlation queries against a real database."""
+        from nthlayer.slos.deployment import Deployment
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            repo = SLORepository(session)
+            await repo.create_slo(sample_slo)
+            start = datetime(2024, 1, 1)
+            for minutes, burned in [(20, 2.0), (0, 1.0), (90, 9.0)]:
+                session.add(
+                    ErrorBudgetModel(
+                        slo_id=sample_slo.id,
+                        service=sample_slo.service,
+                        period_start=start,
+                        period_end=start,
+                        total_budget_minutes=21.6,
+                        burned_minutes=burned,
+                        remaining_minutes=0.0,
+                        status="healthy",
+                        updated_at=start + timedelta(minutes=minutes),
+                    )
+                )
+            for i in range(2):
+                await repo.create_deployment(
+                    Deployment(
+                        id=f"deploy-{i}",
+                        service=sample_slo.service,
+                        environment="production",
+                        deployed_at=start,
+                    )
+                )
+            await session.flush()
+
+            history = await repo.get_burn_history(sample_slo.id, start, start + timedelta(hours=1))
+            await repo.update_deployment_correlations(
+                [("deploy-0", 4.0, 0.8), ("deploy-1", 0.5, 0.3)]
+            )
+            deployment = await repo.get_deployment("deploy-0")
+
+        await engine.dispose()
+
+        assert history == [(start, 1.0), (start + timedelta(minutes=20), 2.0)]
+        assert deployment.correlated_burn_minutes == 4.0
+        assert deployment.correlation_confidence == 0.8
+
 
 class TestModelConversions:
     """Tests for model conversion methods."""
@@ -8,7 +8,14 @@ from datetime import datetime, timedelta
 
 import pytest
 from nthlayer.slos.calculator import ErrorBudgetCalculator
-from nthlayer.slos.models import SLO, ErrorBudget, SLOStatus, TimeWindow, TimeWindowType
+from nthlayer.slos.models import (
+    SLO,
+    BurnBucket,
+    ErrorBudget,
+    SLOStatus,
+    TimeWindow,
+    TimeWindowType,
+)
 from nthlayer.slos.parser import OpenSLOParserError, parse_slo_dict, parse_slo_file
 
 
@@ -667,6 +674,49 @@ class TestErrorBudgetCalculatorCoverage:
         # 1% error rate for 5 minutes = 0.05 minutes
         assert burn == pytest.approx(0.05, rel=0.1)
 
+    def test_calculate_bucket_burn(self):
+        """Test per-hour bucketing matches the total burn."""
+        slo = SLO(
+            id="test",
+            service="test-service",
+            name="Test",
+            description="Test",
+            target=0.9995,
+            time_window=TimeWindow("30d", TimeWindowType.ROLLING),
+            query="up",
+        )
+
+        calculator = ErrorBudgetCalculator(slo)
+        start = datetime(2026, 1, 1, 11, 30)
+        measurements = [
+            {"timestamp": start + timedelta(minutes=5 * i), "sli_value": 0.99 if i < 6 else 1.0}
+            for i in range(12)
+        ]
+
+        buckets = calculator.calculate_bucket_burn(measurements)
+        total = calculator._calculate_burn_from_measurements(
+            measurements, start, start + timedelta(hours=1)
+        )
+
+        assert [b.start for b in buckets] == [datetime(2026, 1, 1, 11), datetime(2026, 1, 1, 12)]
+        assert buckets[0].burned_minutes == pytest.approx(0.3)
+        assert buckets[0].sli_value == pytest.approx(0.99)
+        assert buckets[1].burned_minutes == pytest.approx(0.0)
+        assert sum(b.burned_minutes for b in buckets) == pytest.approx(total)
+        # 0.99 misses the 99.95% target
+        assert (buckets[0].good_count, buckets[0].total_count) == (0, 6)
+        assert (buckets[1].good_count, buckets[1].total_count) == (6, 6)
+        assert buckets[0].min_value == buckets[0].max_value == pytest.approx(0.99)
+
+    def test_burn_bucket_merge(self):
+        """Test merging partial buckets weights the SLI by duration."""
+        start = datetime(2026, 1, 1, 11)
+        merged = BurnBucket(start, 0.3, 0.99, 1800.0).merge(BurnBucket(start, 0.0, 1.0, 600.0))
+
+        assert merged.burned_minutes == pytest.approx(0.3)
+        assert merged.duration_seconds == 2400.0
+        assert merged.sli_value == pytest.approx(0.9925)
+
     def test_calculate_burn_rate_defaults_period_end_to_now(self):
         """Test that calculate_burn_rate defaults period_end to now."""
         slo = SLO(
@@ -7,7 +7,11 @@ from nthlayer.specs import (
     parse_service_file,
     validate_service_file,
 )
-from nthlayer.specs.parser import ServiceParseError, render_resource_spec
+from nthlayer.specs.parser import (
+    ServiceParseError,
+    parse_service,
+    render_resource_spec,
+)
 from nthlayer.specs.template import substitute_variables, validate_template_variables
 
 
@@ -267,6 +271,82 @@ resources:
             parse_service_file(tmp_path / "nonexistent.yaml")
 
 
+class TestParseService:
+    """Test parse_service and ParsedService."""
+
+    SERVICE = """
+service:
+  name: test-service
+  team: test-team
+  tier: critical
+  type: api
+
+resources:
+  - kind: SLO
+    name: availability
+    spec:
+      objective: 99.9
+  - kind: PagerDuty
+    name: primary
+    spec:
+      urgency: high
+"""
+
+    def test_matches_parse_service_file(self, tmp_path):
+        """Test the parsed context and resources equal parse_service_file's."""
+        service_file = tmp_path / "test-service.yaml"
+        service_file.write_text(self.SERVICE)
+
+        parsed = parse_service(service_file)
+        ctx, resources = parse_service_file(service_file)
+
+        assert parsed.context == ctx
+        assert list(parsed.resources) == resources
+        assert parsed.service_name == "test-service"
+        assert [r.name for r in parsed.resources_by_kind("SLO")] == ["availability"]
+
+    def test_environment_applied_but_raw_data_is_base(self, tmp_path):
+        """Test overrides apply to the context while raw_data keeps the base file."""
+        service_file = tmp_path / "test-service.yaml"
+        service_file.write_text(self.SERVICE)
+        env_dir = tmp_path / "environments"
+        env_dir.mkdir()
+        (env_dir / "dev.yaml").write_text("environment: dev\nservice:\n  tier: low\n")
+
+        parsed = parse_service(service_file, environment="dev")
+
+        assert parsed.context.tier == "low"
+        assert parsed.context.environment == "dev"
+        assert parsed.raw_data["service"]["tier"] == "critical"
+
+    def test_manifest_is_built_once(self, tmp_path):
+        """Test the manifest comes from the loaded data and is cached."""
+        service_file = tmp_path / "test-service.yaml"
+        service_file.write_text(self.SERVICE)
+
+        parsed = parse_service(service_file)
+        service_file.unlink()
+
+        assert parsed.manifest.name == "test-service"
+        assert [slo.name for slo in parsed.manifest.slos] == ["availability"]
+        assert parsed.manifest is parsed.manifest
+
+    def test_is_immutable(self, tmp_path):
+        """Test ParsedService fields cannot be reassigned."""
+        service_file = tmp_path / "test-service.yaml"
+        service_file.write_text(self.SERVICE)
+
+        parsed = parse_service(service_file)
+
+        with pytest.raises(AttributeError):
+            parsed.environment = "prod"  # type: ignore[misc]
+
+    def test_errors_match_parse_service_file(self, tmp_path):
+        """Test parse errors are raised as ServiceParseError."""
+        with pytest.raises(ServiceParseError, match="Service file not found"):
+            parse_service(tmp_path / "nonexistent.yaml")
+
+
 class TestRenderResourceSpec:
     """Test rendering resource spec with template substitution."""
 
@@ -0,0 +1,199 @@
+"""Tests for the columnar TimeSeries."""
+
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from nthlayer.core.timeseries import TimeSeries, as_time_series, local_weekdays, to_epoch_ms
+from nthlayer.slos.calculator import ErrorBudgetCalculator
+from nthlayer.slos.models import SLO, TimeWindow, TimeWindowType
+
+BASE = 1609459200
+
+
+@pytest.fixture
+def slo():
+    return SLO(
+        id="test",
+        service="test-service",
+        name="Test",
+        description="Test",
+        target=0.999,
+        time_window=TimeWindow("30d", TimeWindowType.ROLLING),
+        query="up",
+    )
+
+
+class TestFromPrometheus:
+    """Tests for building series from Prometheus JSON."""
+
+    def test_columns_and_dtypes(self):
+        series = TimeSeries.from_prometheus(
+            [[BASE, "0.999"], [BASE + 300, "0.998"], [BASE + 600.5, "NaN"]], step_seconds=300
+        )
+
+        assert series.timestamps_ms.dtype == np.int64
+        assert series.values.dtype == np.float64
+        assert series.timestamps_ms.tolist() == [BASE * 1000, (BASE + 300) * 1000, 1609459800500]
+        assert series.values[:2].tolist() == [0.999, 0.998]
+        assert np.isnan(series.values[2])
+
+    def test_skips_malformed_pairs(self):
+        series = TimeSeries.from_prometheus([[BASE, "1"], [BASE + 300]])
+
+        assert len(series) == 1
+
+    def test_from_query_range_takes_first_series(self):
+        response = {
+            "status": "success",
+            "data": {
+                "resultType": "matrix",
+                "result": [
+                    {"metric": {"a": "1"}, "values": [[BASE, "0.5"]]},
+                    {"metric": {"a": "2"}, "values": [[BASE, "0.9"]]},
+                ],
+            },
+        }
+
+        assert TimeSeries.from_query_range(response).values.tolist() == [0.5]
+        assert len(TimeSeries.from_query_range({"data": {"result": []}})) == 0
+
+    def test_group_query_range_by_label(self):
+        response = {
+            "data": {
+                "result": [
+                    {"metric": {"service": "a"}, "values": [[BASE, "0.5"]]},
+                    {"metric": {"service": "b"}, "values": [[BASE, "0.9"], [BASE + 300, "0.8"]]},
+                    {"metric": {"service": "a"}, "values": [[BASE, "0.1"]]},
+                    {"metric": {}, "values": [[BASE, "1"]]},
+                ],
+            },
+        }
+
+        grouped = TimeSeries.group_query_range(response, "service")
+
+        assert list(grouped) == ["a", "b"]
+        assert grouped["a"].values.tolist() == [0.5]
+        assert grouped["b"].values.tolist() == [0.9, 0.8]
+
+
+def test_local_weekdays_across_dst(monkeypatch):
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    try:
+        # Half-hourly samples across the November 2023 DST change
+        start = int(datetime(2023, 10, 28).timestamp() * 1000)
+        timestamps = start + np.arange(500, dtype=np.int64) * 1_800_000
+
+        expected = [datetime.fromtimestamp(ts / 1000).weekday() for ts in timestamps.tolist()]
+        assert local_weekdays(timestamps).tolist() == expected
+        assert TimeSeries(timestamps, np.zeros(500)).weekdays().tolist() == expected
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+
+class TestDurations:
+    """Tests for per-sample durations."""
+
+    def test_derived_from_spacing_and_step(self):
+        series = TimeSeries.from_prometheus([[BASE, "1"], [BASE + 60, "1"]], step_seconds=30)
+
+        assert series.duration_seconds().tolist() == [60.0, 30.0]
+
+    def test_explicit_durations_win(self):
+        now = datetime(2024, 1, 1)
+        series = TimeSeries.from_records(
+            [
+                {"timestamp": now, "sli_value": 1.0, "duration_seconds": 10},
+                {"timestamp": now + timedelta(minutes=5), "sli_value": 1.0},
+                {"timestamp": now + timedelta(minutes=6), "sli_value": 1.0},
+            ]
+        )
+
+        assert series.duration_seconds().tolist() == [10.0, 60.0, 300.0]
+
+
+class TestAdapters:
+    """Tests for the list-of-dicts and pair adapters."""
+
+    def test_records_round_trip(self):
+        now = datetime(2024, 1, 1, 12, 0, 0)
+        records = [
+            {"timestamp": now + timedelta(minutes=5 * i), "sli_value": v, "duration_seconds": 300.0}
+            for i, v in enumerate([0.999, 0.998])
+        ]
+
+        assert TimeSeries.from_records(records).to_records() == records
+
+    def test_pairs_round_trip(self):
+        now = datetime(2024, 1, 1, 12, 0, 0)
+        pairs = [(now, 0.9), (now + timedelta(hours=1), 0.8)]
+
+        assert TimeSeries.from_pairs(pairs).to_pairs() == pairs
+
+    def test_as_time_series(self):
+        now = datetime(2024, 1, 1)
+        series = TimeSeries.from_pairs([(now, 1.0)])
+
+        assert as_time_series(series) is series
+        assert as_time_series([]).values.size == 0
+        assert as_time_series([{"timestamp": now, "sli_value": 0.5}]).values.tolist() == [0.5]
+        assert as_time_series([(now, 0.5)]).timestamps_ms.tolist() == [to_epoch_ms(now)]
+
+    def test_sorted(self):
+        now = datetime(2024, 1, 1)
+        series = TimeSeries.from_pairs([(now + timedelta(hours=1), 2.0), (now, 1.0)]).sorted()
+
+        assert series.values.tolist() == [1.0, 2.0]
+
+
+class TestCalculatorOnTimeSeries:
+    """The calculator gives the same burn for a TimeSeries and its records."""
+
+    def test_matches_record_api(self, slo):
+        now = datetime(2024, 1, 31)
+        period_start = now - timedelta(days=30)
+        values = [
+            [int((period_start + timedelta(minutes=i)).timestamp()), "0.995"]
+            for i in range(0, 43200, 7)
+        ]
+        series = TimeSeries.from_prometheus(values, step_seconds=60)
+        calculator = ErrorBudgetCalculator(slo)
+
+        from_series = calculator._calculate_burn_from_measurements(series, period_start, now)
+        from_records = calculator._calculate_burn_from_measurements(
+            series.to_records(), period_start, now
+        )
+
+        assert from_series == pytest.approx(from_records)
+        # 0.5% errors for ~30 days
+        assert from_series == pytest.approx(0.005 * 30 * 24 * 60, rel=0.01)
+
+    def test_ignores_samples_outside_period_and_nan(self, slo):
+        now = datetime(2024, 1, 31)
+        series = TimeSeries.from_pairs(
+            [
+                (now - timedelta(days=40), 0.0),
+                (now - timedelta(minutes=10), float("nan")),
+                (now - timedelta(minutes=5), 0.99),
+            ]
+        )
+
+        burn = ErrorBudgetCalculator(slo)._calculate_burn_from_measurements(
+            series, now - timedelta(days=1), now
+        )
+
+        # Only the last sample burns: 1% for the default 5 minute step
+        assert burn == pytest.approx(0.05)
+
+    def test_calculate_budget_accepts_series(self, slo):
+        now = datetime(2024, 1, 31)
+        series = TimeSeries.from_pairs([(now - timedelta(minutes=5), 0.9)])
+
+        budget = ErrorBudgetCalculator(slo).calculate_budget(
+            period_start=now - timedelta(days=1), period_end=now, sli_measurements=series
+        )
+
+        assert budget.burned_minutes == pytest.approx(0.5)
@@ -0,0 +1,134 @@
+"""Tests for compiled variable substitution plans."""
+
+import copy
+
+import pytest
+from nthlayer.specs import parser
+from nthlayer.specs.environment_merger import EnvironmentMerger
+from nthlayer.specs.manifest_cache import (
+    MANIFEST_CACHE_ENV,
+    get_manifest_cache,
+    reset_manifest_cache,
+)
+from nthlayer.specs.parser import parse_service_environments, parse_service_file
+from nthlayer.specs.variable_substitution import (
+    SubstitutionPlan,
+    VariableSubstitutor,
+    compile_substitution_plan,
+    substitute_variables,
+)
+
+CONFIG = {
+    "service": {"name": "api", "team": "core", "metadata": {"env": "${env}", "x": [1, 2]}},
+    "resources": [
+        {"kind": "SLO", "name": "slo-${env}", "spec": {"query": 'up{svc="${service}"}'}},
+        {"kind": "Dependencies", "name": "deps", "spec": {"databases": [{"name": "db"}]}},
+        {"kind": "SLO", "name": "${unknown}-${team}", "spec": {"objective": 99.9}},
+    ],
+}
+
+
+class TestSubstitutionPlan:
+    """Tests for compile_substitution_plan and SubstitutionPlan.apply."""
+
+    def test_same_result_as_recursive_substitution(self):
+        substitutor = VariableSubstitutor(environment="prod", service_name="api", team="core")
+
+        result = substitute_variables(CONFIG, environment="prod", service_name="api", team="core")
+
+        assert result == substitutor.substitute(CONFIG)
+        assert result["resources"][2]["name"] == "${unknown}-core"
+
+    def test_only_paths_with_placeholders_are_copied(self):
+        original = copy.deepcopy(CONFIG)
+
+        result = substitute_variables(CONFIG, environment="prod", service_name="api")
+
+        assert CONFIG == original
+        assert result["service"] is not CONFIG["service"]
+        assert result["service"]["metadata"]["x"] is CONFIG["service"]["metadata"]["x"]
+        assert result["resources"][1] is CONFIG["resources"][1]
+        assert result["resources"][2]["spec"] is CONFIG["resources"][2]["spec"]
+
+    def test_plan_records_placeholder_paths(self):
+        plan = compile_substitution_plan(CONFIG)
+
+        assert [path for path, _ in plan.targets] == [
+            ("service", "metadata", "env"),
+            ("resources", 0, "name"),
+            ("resources", 0, "spec", "query"),
+            ("resources", 2, "name"),
+        ]
+        assert plan.variables == {"env", "service", "unknown", "team"}
+
+    def test_document_without_placeholders_is_returned_as_is(self):
+        data = {"service": {"name": "api"}, "resources": []}
+        assert compile_substitution_plan(data) == SubstitutionPlan()
+        assert substitute_variables(data, environment="prod") is data
+
+    def test_base_plan_reused_for_shared_subtrees(self):
+        overrides = {"resources": [{"kind": "SLO", "name": "slo-${env}", "spec": {"w": "${env}"}}]}
+        merged = EnvironmentMerger.merge_service_config(CONFIG, overrides, copy=False)
+
+        plan = compile_substitution_plan(
+            merged, base=CONFIG, base_plan=compile_substitution_plan(CONFIG)
+        )
+        assert plan == compile_substitution_plan(merged)
+
+        # Shared subtrees take their targets from the base plan without a walk
+        marker = ((("service", "name"), ("", "marker", "")),)
+        plan = compile_substitution_plan(merged, base=CONFIG, base_plan=SubstitutionPlan(marker))
+        assert merged["service"] is CONFIG["service"]
+        assert plan.targets[0] == marker[0]
+        assert ("resources", 0, "spec", "w") in [path for path, _ in plan.targets]
+
+
+class TestParserPlans:
+    """Tests for substitution plans in the service parser."""
+
+    def _write(self, tmp_path):
+        path = tmp_path / "api.yaml"
+        path.write_text(
+            "service:\n  name: api\n  team: core\n  tier: critical\n  type: api\n"
+            "resources:\n  - kind: SLO\n    name: availability\n    spec:\n"
+            "      objective: 99.9\n      query: 'up{env=\"${env}\"}'\n"
+        )
+        return path
+
+    def test_base_plan_compiled_once_per_file(self, tmp_path, monkeypatch):
+        path = self._write(tmp_path)
+        compiled = []
+        original = parser.compile_substitution_plan
+
+        def counting(data, base=None, base_plan=None):
+            if base_plan is None:
+                compiled.append(data)
+            return original(data, base=base, base_plan=base_plan)
+
+        monkeypatch.setattr(parser, "compile_substitution_plan", counting)
+        parsed = parse_service_environments(path, ["dev", "staging", "prod"])
+
+        assert len(compiled) == 1
+        assert parsed["prod"].resources[0].spec["query"] == 'up{env="prod"}'
+
+    def test_plan_persisted_in_manifest_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(MANIFEST_CACHE_ENV, "disk")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        reset_manifest_cache()
+        path = self._write(tmp_path)
+        try:
+            parse_service_file(path, environment="dev")
+            monkeypatch.setattr(
+                parser,
+                "compile_substitution_plan",
+                lambda data, base=None, base_plan=None: (
+                    base_plan if base_plan is not None else pytest.fail("plan recompiled")
+                ),
+            )
+
+            _, resources = parse_service_file(path, environment="prod")
+
+            assert resources[0].spec["query"] == 'up{env="prod"}'
+            assert get_manifest_cache().stats.hits == 1
+        finally:
+            reset_manifest_cache()
@@ -0,0 +1,268 @@
+"""Tests for apply/validate watch mode."""
+
+import json
+import os
+
+import pytest
+from nthlayer.cli.apply import apply_watch_command
+from nthlayer.cli.validate import validate_watch_command
+from nthlayer.fleet import FleetOptions
+from nthlayer.watch import (
+    FileWatcher,
+    WarmTemplates,
+    affected_services,
+    watch,
+    watch_roots,
+)
+
+SERVICE = """
+service:
+  name: {name}
+  team: platform
+  tier: standard
+  type: api
+
+resources:
+  - kind: SLO
+    name: availability
+    spec:
+      objective: {objective}
+      window: 30d
+      indicator:
+        type: availability
+  - kind: Dependencies
+    name: deps
+    spec:
+      databases:
+        - name: main-db
+          type: postgres
+"""
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    # Guarantee a new mtime even on coarse-grained filesystems
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _service(name, objective=99.9):
+    return SERVICE.format(name=name, objective=objective)
+
+
+@pytest.fixture(autouse=True)
+def _in_tmp(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+class TestFileWatcher:
+    """Tests for FileWatcher polling."""
+
+    def test_detects_create_modify_delete(self, tmp_path):
+        root = tmp_path / "services"
+        _write(root / "a.yaml", "a: 1\n")
+        _write(root / "b.yaml", "b: 1\n")
+        watcher = FileWatcher([root])
+        assert watcher.poll() == set()
+
+        _write(root / "a.yaml", "a: 2\n")
+        (root / "b.yaml").unlink()
+        _write(root / "nested" / "c.yml", "c: 1\n")
+
+        assert watcher.poll() == {root / "a.yaml", root / "b.yaml", root / "nested" / "c.yml"}
+        assert watcher.poll() == set()
+
+    def test_ignores_output_hidden_and_other_files(self, tmp_path):
+        _write(tmp_path / "generated" / "svc" / "alerts.yaml", "x: 1\n")
+        watcher = FileWatcher([tmp_path], ignore=[tmp_path / "generated"])
+
+        _write(tmp_path / "generated" / "svc" / "alerts.yaml", "x: 2\n")
+        _write(tmp_path / ".git" / "config.yaml", "x: 1\n")
+        _write(tmp_path / "notes.txt", "hello\n")
+
+        assert watcher.poll() == set()
+
+    def test_watches_nthlayer_environments_below_directories(self, tmp_path):
+        overlay = tmp_path / "services" / ".nthlayer" / "environments" / "checkout-prod.yaml"
+        _write(overlay, "v: 1\n")
+        watcher = FileWatcher([tmp_path / "services"])
+
+        _write(overlay, "v: 2\n")
+
+        assert watcher.poll() == {overlay}
+        assert affected_services(
+            [tmp_path / "services" / "checkout.yaml"], {overlay}, tmp_path / "templates"
+        ) == [tmp_path / "services" / "checkout.yaml"]
+
+    def test_missing_root_is_watched_for_creation(self, tmp_path):
+        templates = tmp_path / ".nthlayer" / "templates"
+        watcher = FileWatcher([templates])
+
+        _write(templates / "api.yaml", "name: api\n")
+
+        assert watcher.poll() == {templates / "api.yaml"}
+
+    def test_wait_debounces_bursts(self, tmp_path):
+        service = tmp_path / "checkout.yaml"
+        _write(service, "v: 0\n")
+        overlay = tmp_path / "environments" / "prod.yaml"
+        watcher = FileWatcher([service, overlay.parent])
+
+        # Edits land on the first two polls, then the tree goes quiet
+        edits = iter([lambda: _write(service, "v: 1\n"), lambda: _write(overlay, "v: 2\n")])
+        clock = iter(range(100))
+        polls = []
+
+        def sleep(_):
+            polls.append(1)
+            next(edits, lambda: None)()
+
+        changed = watcher.wait(debounce=2, sleep=sleep, timer=lambda: next(clock))
+
+        assert changed == {service, overlay}
+        assert len(polls) == 4
+
+
+class TestAffectedServices:
+    """Tests for affected_services."""
+
+    def test_service_and_overlay_changes(self, tmp_path):
+        a = tmp_path / "team-a" / "a.yaml"
+        b = tmp_path / "team-b" / "b.yaml"
+        templates = tmp_path / ".nthlayer" / "templates"
+
+        assert affected_services([a, b], {a}, templates) == [a]
+        assert affected_services([a, b], {b.parent / "environments" / "prod.yaml"}, templates) == [
+            b
+        ]
+        assert affected_services([a, b], {tmp_path / "other.yaml"}, templates) == []
+
+    def test_template_change_affects_every_service(self, tmp_path):
+        a, b = tmp_path / "a.yaml", tmp_path / "b.yaml"
+        templates = tmp_path / ".nthlayer" / "templates"
+
+        assert affected_services([a, b], {templates / "api.yaml"}, templates) == [a, b]
+
+
+def test_watch_roots_for_service_file(tmp_path):
+    service = tmp_path / "checkout.yaml"
+
+    assert watch_roots(service) == [
+        service,
+        tmp_path / "environments",
+        tmp_path / ".nthlayer" / "environments",
+        tmp_path / ".nthlayer" / "templates",
+    ]
+
+
+def test_warm_templates_reload_only_on_template_change(tmp_path, monkeypatch):
+    loads = []
+    monkeypatch.setattr(
+        "nthlayer.specs.custom_templates.CustomTemplateLoader.load_all_templates",
+        lambda: loads.append(1) or object(),
+    )
+    warm = WarmTemplates()
+
+    first = warm.refresh()
+    assert warm.refresh({tmp_path / "checkout.yaml"}) is first
+    assert warm.refresh({warm.templates_dir / "api.yaml"}) is not first
+    assert len(loads) == 2
+
+
+class TestWatchLoop:
+    """Tests for the watch run loop."""
+
+    def test_runs_again_with_changed_files(self, tmp_path):
+        class FakeWatcher:
+            def wait(self, **_):
+                return {tmp_path / "a.yaml"}
+
+        calls = []
+        exit_code = watch(lambda changed: calls.append(changed) or 0, FakeWatcher(), max_runs=3)
+
+        assert exit_code == 0
+        assert calls == [set(), {tmp_path / "a.yaml"}, {tmp_path / "a.yaml"}]
+
+    def test_failed_run_keeps_watching(self):
+        class FakeWatcher:
+            def wait(self, **_):
+                return set()
+
+        results = iter([ValueError("bad yaml"), 0])
+
+        def run(_):
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        assert watch(run, FakeWatcher(), max_runs=1) == 1
+        assert watch(run, FakeWatcher(), max_runs=1) == 0
+
+    def test_ctrl_c_returns_last_exit_code(self):
+        class FakeWatcher:
+            def wait(self, **_):
+                raise KeyboardInterrupt
+
+        assert watch(lambda _: 1, FakeWatcher()) == 1
+
+
+class TestApplyWatch:
+    """Tests for apply --watch."""
+
+    def test_reapplies_only_changed_generators(self, tmp_path, monkeypatch, capsys):
+        service = tmp_path / "checkout.yaml"
+        _write(service, _service("checkout"))
+
+        def edit(self, **_):
+            _write(service, _service("checkout", objective=99.5))
+            return self.poll()
+
+        monkeypatch.setattr(FileWatcher, "wait", edit)
+        exit_code = apply_watch_command(
+            service, FleetOptions(output_root=tmp_path / "out"), output_format="json", max_runs=2
+        )
+
+        first, second = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert exit_code == 0
+        assert first["up_to_date"] == []
+        assert first["output_dir"] == str(tmp_path / "out")
+        # Only generators reading the SLO changed inputs
+        assert "slos" not in second["up_to_date"]
+        assert "alerts" in second["up_to_date"]
+
+    def test_directory_reapplies_changed_services(self, tmp_path, monkeypatch, capsys):
+        root = tmp_path / "services"
+        _write(root / "team-a" / "checkout.yaml", _service("checkout"))
+        _write(root / "search.yaml", _service("search"))
+
+        def edit(self, **_):
+            _write(root / "team-a" / "checkout.yaml", _service("checkout", objective=99.5))
+            return self.poll()
+
+        monkeypatch.setattr(FileWatcher, "wait", edit)
+        apply_watch_command(root, FleetOptions(), output_format="json", max_runs=2)
+
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [r["service_name"] for r in records] == ["search", "checkout", "checkout"]
+        assert (tmp_path / "generated" / "search" / "alerts.yaml").exists()
+
+    def test_rejects_single_shot_flags(self, tmp_path):
+        from nthlayer.cli.apply import apply_command
+
+        assert apply_command(str(tmp_path / "svc.yaml"), watch=True, dry_run=True) == 2
+
+
+def test_validate_watch_revalidates_after_edit(tmp_path, monkeypatch):
+    service = tmp_path / "checkout.yaml"
+    _write(service, "service: {}\n")
+
+    def edit(self, **_):
+        _write(service, _service("checkout"))
+        return self.poll()
+
+    monkeypatch.setattr(FileWatcher, "wait", edit)
+
+    assert validate_watch_command(str(service), max_runs=1) == 1
+    assert validate_watch_command(str(service), max_runs=2) == 0